@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark boundary detection on the largest DITA-derived documents.
+
+Times the single-pass lexer, content-type detection and full chunking on the
+N largest ``source_system == "dita"`` records of a normalized run. Without a
+run, a synthetic DITA-shaped corpus (deep headings, tables, code fences) is
+used instead.
+
+Usage:
+    python benchmarks/chunk/bench_boundaries.py --run-id <RUN_ID> --top 50
+    python benchmarks/chunk/bench_boundaries.py --offline
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import trailblazer.pipeline.steps.chunk.boundaries as boundaries  # noqa: E402
+from trailblazer.pipeline.steps.chunk.boundaries import (  # noqa: E402
+    detect_content_type,
+    lex_markdown,
+    normalize_text,
+)
+from trailblazer.pipeline.steps.chunk.engine import chunk_document  # noqa: E402
+
+
+def load_largest_dita_docs(normalized_file: Path, top: int) -> list[dict]:
+    """Return the ``top`` largest DITA-derived records from a normalized run."""
+    docs = []
+    with open(normalized_file, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("source_system") == "dita" and record.get("text_md"):
+                docs.append(record)
+    docs.sort(key=lambda r: len(r["text_md"]), reverse=True)
+    return docs[:top]
+
+
+def synthetic_dita_docs(count: int) -> list[dict]:
+    """Build DITA-shaped markdown: nested topics with tables and code samples."""
+    docs = []
+    for i in range(count):
+        parts = [f"# Topic {i}"]
+        for section in range(40):
+            depth = 2 + section % 4
+            parts.append("#" * depth + f" Section {i}.{section}")
+            parts.append(f"Configure the {section} setting before running the job. " * 6)
+            if section % 5 == 0:
+                rows = [f"| FIELD_{r} | Value {r} | Description of field {r} |" for r in range(60)]
+                parts.append("\n".join(["| Field | Value | Description |", "|---|---|---|", *rows]))
+            if section % 7 == 0:
+                code = "\n".join(f"# step {r}\nvalue_{r} = compute({r})" for r in range(40))
+                parts.append(f"```python\n{code}\n```")
+        docs.append({"id": f"synthetic-{i}", "title": f"Topic {i}", "text_md": "\n\n".join(parts)})
+    return docs
+
+
+def time_it(label: str, fn, docs: list[dict]) -> float:
+    start = time.perf_counter()
+    for doc in docs:
+        fn(doc)
+    elapsed = time.perf_counter() - start
+    rate = len(docs) / elapsed if elapsed else float("inf")
+    print(f"  {label:<22} {elapsed * 1000:10.1f} ms  {rate:10.1f} docs/sec")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--run-id", help="Run whose normalize/normalized.ndjson to sample")
+    parser.add_argument("--runs-dir", default="var/runs", help="Runs directory")
+    parser.add_argument("--top", type=int, default=50, help="Number of largest DITA docs to benchmark")
+    parser.add_argument("--max-tokens", type=int, default=800, help="Hard max tokens per chunk")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use the character-based token estimate instead of tiktoken",
+    )
+    args = parser.parse_args()
+
+    if args.offline:
+        boundaries.tiktoken = None  # type: ignore[assignment]
+
+    if args.run_id:
+        normalized_file = Path(args.runs_dir) / args.run_id / "normalize" / "normalized.ndjson"
+        docs = load_largest_dita_docs(normalized_file, args.top)
+        source = str(normalized_file)
+    else:
+        docs = synthetic_dita_docs(args.top)
+        source = "synthetic"
+
+    if not docs:
+        print(f"No DITA documents found in {source}")
+        sys.exit(1)
+
+    total_chars = sum(len(d["text_md"]) for d in docs)
+    print(f"Benchmarking {len(docs)} docs ({total_chars:,} chars) from {source}")
+
+    texts = {d["id"]: normalize_text(d["text_md"]) for d in docs}
+    time_it("normalize_text", lambda d: normalize_text(d["text_md"]), docs)
+    time_it("lex_markdown", lambda d: lex_markdown(texts[d["id"]]), docs)
+    time_it("detect_content_type", lambda d: detect_content_type(texts[d["id"]]), docs)
+    time_it(
+        "chunk_document",
+        lambda d: chunk_document(
+            doc_id=d["id"],
+            text_md=d["text_md"],
+            title=d.get("title", ""),
+            hard_max_tokens=args.max_tokens,
+        ),
+        docs,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Throughput and memory benchmark for ``chunk_document`` with a regression gate.
+
+Runs each synthetic corpus kind (see ``corpus.py``) in its own child process so
+peak RSS is attributable to that kind, and reports docs/sec, tokens/sec, peak
+RSS and the resulting ``split_strategy`` mix. Results are written as JSON; when
+``--baseline`` is given, the run fails if any kind regresses by more than
+``--max-regression`` percent.
+
+Usage:
+    python benchmarks/chunk/bench_chunk.py --offline --output var/bench/chunk/latest.json
+    python benchmarks/chunk/bench_chunk.py --offline --baseline var/bench/chunk/baseline.json --max-regression 10
+    make bench.chunk.check BENCH_MAX_REGRESSION=15
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from corpus import KINDS, generate_corpus  # noqa: E402
+
+MODEL = "text-embedding-3-small"
+
+# Higher is better for throughput; lower is better for memory
+GATED_METRICS = {"docs_per_sec": "higher", "tokens_per_sec": "higher", "peak_rss_mb": "lower"}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _tokenizer_mode(offline: bool) -> str:
+    import trailblazer.pipeline.steps.chunk.boundaries as boundaries
+
+    if offline:
+        boundaries.tiktoken = None  # type: ignore[assignment]
+    if boundaries.tiktoken is None or boundaries._get_encoding(MODEL) is None:
+        return "estimate"
+    return "tiktoken"
+
+
+def bench_kind(kind: str, docs: int, seed: int, repeat: int, max_tokens: int, offline: bool) -> dict:
+    """Benchmark one corpus kind; intended to run in a fresh child process."""
+    tokenizer = _tokenizer_mode(offline)
+
+    from trailblazer.pipeline.steps.chunk.boundaries import count_tokens
+    from trailblazer.pipeline.steps.chunk.engine import chunk_document
+
+    corpus = generate_corpus(kind, docs, seed)
+    input_tokens = sum(count_tokens(doc["text_md"], MODEL) for doc in corpus)
+    rss_before = _peak_rss_mb()
+
+    best = float("inf")
+    strategies: Counter[str] = Counter()
+    chunk_count = 0
+    for _ in range(repeat):
+        strategies.clear()
+        chunk_count = 0
+        start = time.perf_counter()
+        for doc in corpus:
+            chunks = chunk_document(
+                doc_id=doc["id"],
+                text_md=doc["text_md"],
+                title=doc["title"],
+                source_system="benchmark",
+                hard_max_tokens=max_tokens,
+                model=MODEL,
+            )
+            chunk_count += len(chunks)
+            strategies.update(chunk.split_strategy for chunk in chunks)
+        best = min(best, time.perf_counter() - start)
+
+    peak_rss = _peak_rss_mb()
+    return {
+        "tokenizer": tokenizer,
+        "docs": len(corpus),
+        "input_tokens": input_tokens,
+        "chunks": chunk_count,
+        "elapsed_s": round(best, 4),
+        "docs_per_sec": round(len(corpus) / best, 2) if best else 0.0,
+        "tokens_per_sec": round(input_tokens / best, 1) if best else 0.0,
+        "peak_rss_mb": round(peak_rss, 1),
+        "rss_delta_mb": round(peak_rss - rss_before, 1),
+        "strategies": dict(sorted(strategies.items())),
+    }
+
+
+def run_suite(kinds: list[str], docs: int, seed: int, repeat: int, max_tokens: int, offline: bool) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    tokenizer = None
+    with ctx.Pool(processes=1, maxtasksperchild=1) as pool:
+        for kind in kinds:
+            result = pool.apply(bench_kind, (kind, docs, seed, repeat, max_tokens, offline))
+            tokenizer = result.pop("tokenizer")
+            results[kind] = result
+            print(
+                f"  {kind:<10} {result['docs_per_sec']:10.2f} docs/sec  {result['tokens_per_sec']:12.1f} tokens/sec"
+                f"  {result['peak_rss_mb']:8.1f} MB peak  {result['chunks']:6d} chunks",
+                file=sys.stderr,
+            )
+
+    return {
+        "schema_version": 1,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tokenizer": tokenizer,
+        "params": {"docs": docs, "seed": seed, "repeat": repeat, "max_tokens": max_tokens},
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Return human-readable regressions beyond ``max_regression`` percent."""
+    if current.get("tokenizer") != baseline.get("tokenizer"):
+        return [f"tokenizer mismatch: baseline={baseline.get('tokenizer')} current={current.get('tokenizer')}"]
+    if current.get("params") != baseline.get("params"):
+        return [f"parameter mismatch: baseline={baseline.get('params')} current={current.get('params')}"]
+
+    failures = []
+    for kind, base in baseline.get("results", {}).items():
+        cur = current["results"].get(kind)
+        if cur is None:
+            continue
+        for metric, direction in GATED_METRICS.items():
+            old, new = base.get(metric), cur.get(metric)
+            if not old or new is None:
+                continue
+            change = (old - new) / old * 100 if direction == "higher" else (new - old) / old * 100
+            if change > max_regression:
+                failures.append(f"{kind}.{metric}: {old} -> {new} ({change:.1f}% worse, limit {max_regression}%)")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kinds", default=",".join(KINDS), help="Comma-separated corpus kinds")
+    parser.add_argument("--docs", type=int, default=50, help="Documents per corpus kind")
+    parser.add_argument("--seed", type=int, default=42, help="Corpus seed")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes per kind (best is kept)")
+    parser.add_argument("--max-tokens", type=int, default=800, help="Hard max tokens per chunk")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="Baseline results JSON to gate against")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="Allowed regression in percent")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use the character-based token estimate instead of tiktoken",
+    )
+    args = parser.parse_args()
+
+    kinds = [k.strip() for k in args.kinds.split(",") if k.strip()]
+    unknown = sorted(set(kinds) - set(KINDS))
+    if unknown:
+        parser.error(f"unknown corpus kinds: {', '.join(unknown)}")
+
+    report = run_suite(kinds, args.docs, args.seed, args.repeat, args.max_tokens, args.offline)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        if not args.baseline.exists():
+            print(f"Baseline not found: {args.baseline} (run 'make bench.chunk.baseline' first)", file=sys.stderr)
+            return 2
+        failures = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.max_regression)
+        if failures:
+            print("Chunk benchmark regressions:", file=sys.stderr)
+            for failure in failures:
+                print(f"  {failure}", file=sys.stderr)
+            return 1
+        print(f"No regressions beyond {args.max_regression}% against {args.baseline}", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
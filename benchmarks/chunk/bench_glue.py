@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark the glue pass on synthetic glossary-style documents.
+
+Each document has 1,000 one-line sections, which is the worst case for the
+glue pass: nearly every chunk is below ``soft_min_tokens``. Reports wall time
+and the number of tokenizer calls made by ``apply_glue_pass``.
+
+Usage:
+    python benchmarks/chunk/bench_glue.py --docs 5 --sections 1000
+    python benchmarks/chunk/bench_glue.py --offline
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import trailblazer.pipeline.steps.chunk.boundaries as boundaries  # noqa: E402
+import trailblazer.pipeline.steps.chunk.engine as engine  # noqa: E402
+from trailblazer.pipeline.steps.chunk.engine import (  # noqa: E402
+    apply_glue_pass,
+    chunk_document,
+    split_with_layered_strategy,
+)
+
+
+def glossary_doc(sections: int) -> str:
+    """One heading and one definition line per term."""
+    return "\n\n".join(f"## Term {i}\nDefinition of term {i} used across the Banner modules." for i in range(sections))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=5, help="Number of synthetic documents")
+    parser.add_argument("--sections", type=int, default=1000, help="Sections per document")
+    parser.add_argument("--max-tokens", type=int, default=800, help="Hard max tokens per chunk")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use the character-based token estimate instead of tiktoken",
+    )
+    args = parser.parse_args()
+
+    if args.offline:
+        boundaries.tiktoken = None  # type: ignore[assignment]
+
+    model = "text-embedding-3-small"
+    text = glossary_doc(args.sections)
+
+    # Pre-split once so the glue pass can be timed on its own
+    pieces = split_with_layered_strategy(text, args.max_tokens, 60, 120, model)
+    chunks = [
+        engine._create_safe_chunk("glossary", piece, n, args.max_tokens, model, strategy, start, end)
+        for n, (piece, strategy, start, end) in enumerate(pieces)
+    ]
+
+    calls = 0
+    real_count_tokens = engine.count_tokens
+
+    def counting_count_tokens(text: str, model: str = model) -> int:
+        nonlocal calls
+        calls += 1
+        return real_count_tokens(text, model)
+
+    engine.count_tokens = counting_count_tokens  # type: ignore[assignment]
+    start = time.perf_counter()
+    glued = apply_glue_pass(chunks, 200, 80, args.max_tokens, True, True, model)
+    glue_elapsed = time.perf_counter() - start
+    engine.count_tokens = real_count_tokens  # type: ignore[assignment]
+
+    print(f"Glue pass over {len(chunks)} chunks -> {len(glued)} chunks")
+    print(f"  apply_glue_pass      {glue_elapsed * 1000:10.1f} ms  {calls} tokenizer calls")
+
+    start = time.perf_counter()
+    for n in range(args.docs):
+        chunk_document(doc_id=f"glossary-{n}", text_md=text, title=f"Glossary {n}", hard_max_tokens=args.max_tokens)
+    elapsed = time.perf_counter() - start
+    rate = args.docs / elapsed if elapsed else float("inf")
+    print(f"  chunk_document       {elapsed * 1000:10.1f} ms  {rate:10.2f} docs/sec ({args.sections} sections each)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Deterministic synthetic corpus for chunking benchmarks.
+
+Each corpus kind stresses a different branch of the layered splitter:
+
+- ``prose``: long paragraphs with no headings (paragraph/sentence splits)
+- ``tables``: giant pipe tables (table-row splits)
+- ``code``: long fenced code blocks (fence-aware splitting and truncation)
+- ``headings``: deep heading trees with short sections (heading splits + glue)
+- ``adf``: Confluence ADF documents rendered through the normalizer's ADF converter
+
+Documents are plain dicts shaped like normalized records (``id``, ``title``,
+``text_md``) so they can be fed straight into ``chunk_document``.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+KINDS = ("prose", "tables", "code", "headings", "adf")
+
+_WORDS = (
+    "student registration term course section faculty advisor banner catalog schedule grade "
+    "transcript enrollment payment account finance aid award budget report query field value "
+    "configure validate process record update release module integration workflow approval"
+).split()
+
+
+def _sentence(rng: random.Random, words: int = 14) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text.capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 6) -> str:
+    return " ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(sentences))
+
+
+def prose_doc(rng: random.Random, n: int) -> str:
+    return "\n\n".join(_paragraph(rng, rng.randint(4, 10)) for _ in range(rng.randint(30, 60)))
+
+
+def tables_doc(rng: random.Random, n: int) -> str:
+    parts = [_paragraph(rng, 3)]
+    for _ in range(rng.randint(2, 4)):
+        header = "| Field | Type | Required | Description |"
+        rows = [
+            f"| {rng.choice(_WORDS).upper()}_{r} | {rng.choice(['VARCHAR2', 'NUMBER', 'DATE'])} | "
+            f"{rng.choice(['Y', 'N'])} | {_sentence(rng, 10)} |"
+            for r in range(rng.randint(150, 400))
+        ]
+        parts.append("\n".join([header, "|---|---|---|---|", *rows]))
+        parts.append(_paragraph(rng, 2))
+    return "\n\n".join(parts)
+
+
+def code_doc(rng: random.Random, n: int) -> str:
+    parts = [_paragraph(rng, 2)]
+    for _ in range(rng.randint(3, 6)):
+        lang = rng.choice(["python", "sql", "java"])
+        lines = []
+        for i in range(rng.randint(80, 250)):
+            if lang == "sql":
+                lines.append(f"SELECT {rng.choice(_WORDS)}_{i} FROM spriden WHERE pidm = :{rng.choice(_WORDS)};")
+            elif lang == "java":
+                lines.append(f"    public void {rng.choice(_WORDS)}{i}() {{ process({i}); }}")
+            else:
+                lines.append(f"def {rng.choice(_WORDS)}_{i}(value):\n    return compute(value, {i})")
+        parts.append(f"```{lang}\n" + "\n".join(lines) + "\n```")
+        parts.append(_paragraph(rng, 2))
+    return "\n\n".join(parts)
+
+
+def headings_doc(rng: random.Random, n: int) -> str:
+    parts = [f"# Guide {n}"]
+    for section in range(rng.randint(150, 300)):
+        depth = 2 + (section % 5)
+        parts.append("#" * depth + f" {rng.choice(_WORDS).title()} {n}.{section}")
+        parts.append(_sentence(rng, rng.randint(6, 30)))
+    return "\n\n".join(parts)
+
+
+def _adf_text(text: str, marks: list[dict] | None = None) -> dict:
+    node: dict = {"type": "text", "text": text}
+    if marks:
+        node["marks"] = marks
+    return node
+
+
+def adf_document(rng: random.Random, n: int) -> dict:
+    """Build a Confluence ADF document mixing headings, lists, panels and code."""
+    content: list[dict] = []
+    for section in range(rng.randint(20, 40)):
+        content.append(
+            {
+                "type": "heading",
+                "attrs": {"level": 1 + section % 4},
+                "content": [_adf_text(f"{rng.choice(_WORDS).title()} {section}")],
+            }
+        )
+        content.append(
+            {
+                "type": "paragraph",
+                "content": [
+                    _adf_text(_sentence(rng) + " "),
+                    _adf_text(rng.choice(_WORDS), [{"type": "strong"}]),
+                    _adf_text(" see "),
+                    _adf_text("docs", [{"type": "link", "attrs": {"href": f"https://example.com/{n}/{section}"}}]),
+                    _adf_text(". " + _paragraph(rng, 3)),
+                ],
+            }
+        )
+        if section % 3 == 0:
+            content.append(
+                {
+                    "type": "bulletList",
+                    "content": [
+                        {"type": "listItem", "content": [{"type": "paragraph", "content": [_adf_text(_sentence(rng))]}]}
+                        for _ in range(rng.randint(3, 12))
+                    ],
+                }
+            )
+        if section % 4 == 0:
+            content.append(
+                {
+                    "type": "panel",
+                    "content": [{"type": "paragraph", "content": [_adf_text(_paragraph(rng, 2))]}],
+                }
+            )
+        if section % 5 == 0:
+            code = "\n".join(f"UPDATE sgbstdn SET {rng.choice(_WORDS)} = {i};" for i in range(rng.randint(10, 40)))
+            content.append(
+                {"type": "codeBlock", "attrs": {"language": "sql"}, "content": [_adf_text(code)]},
+            )
+    return {"type": "doc", "version": 1, "content": content}
+
+
+def adf_doc(rng: random.Random, n: int) -> str:
+    from trailblazer.pipeline.steps.normalize.html_to_md import _to_markdown_from_adf
+
+    return _to_markdown_from_adf(adf_document(rng, n))
+
+
+_GENERATORS = {
+    "prose": prose_doc,
+    "tables": tables_doc,
+    "code": code_doc,
+    "headings": headings_doc,
+    "adf": adf_doc,
+}
+
+
+def generate_corpus(kind: str, count: int, seed: int = 42) -> list[dict]:
+    """Generate ``count`` documents of one kind; identical for identical arguments."""
+    if kind not in _GENERATORS:
+        raise ValueError(f"Unknown corpus kind: {kind} (expected one of {', '.join(KINDS)})")
+
+    rng = random.Random(f"{seed}:{kind}")
+    generator = _GENERATORS[kind]
+    return [{"id": f"{kind}-{n}", "title": f"{kind.title()} {n}", "text_md": generator(rng, n)} for n in range(count)]
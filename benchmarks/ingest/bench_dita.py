@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for ``ingest_dita`` across worker counts.
+
+Generates a synthetic DITA tree (see ``dita_corpus.py``; 20k topics by default),
+then ingests it once per ``--workers`` value and reports files/sec and speedup
+over the first worker count. Every run's ``dita.ndjson`` must be byte-identical,
+so the benchmark also guards output determinism under parallel parsing.
+
+Usage:
+    python benchmarks/ingest/bench_dita.py --output var/bench/ingest/dita.json
+    python benchmarks/ingest/bench_dita.py --topics 2000 --workers 1,4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from dita_corpus import generate_tree  # noqa: E402
+
+
+def bench_workers(root: Path, workdir: Path, workers: int) -> dict:
+    import structlog
+
+    from trailblazer.pipeline.steps.ingest import dita
+
+    # Keep per-file log lines out of the timing
+    dita.log = structlog.wrap_logger(structlog.PrintLogger(open(os.devnull, "w")))
+
+    outdir = workdir / f"workers-{workers}"
+    start = time.perf_counter()
+    summary = dita.ingest_dita(str(outdir), str(root), workers=workers)
+    elapsed = time.perf_counter() - start
+
+    digest = hashlib.sha256((outdir / "dita.ndjson").read_bytes()).hexdigest()
+    return {
+        "files": summary["files_processed"],
+        "elapsed_s": round(elapsed, 3),
+        "files_per_sec": round(summary["files_processed"] / elapsed, 1) if elapsed else 0.0,
+        "ndjson_sha256": digest,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--topics", type=int, default=20_000, help="Synthetic topics to generate")
+    parser.add_argument("--seed", type=int, default=42, help="Corpus seed")
+    parser.add_argument(
+        "--workers",
+        default=",".join(str(n) for n in sorted({1, 2, 4, os.cpu_count() or 1})),
+        help="Comma-separated worker counts (first is the speedup reference)",
+    )
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    worker_counts = [int(n) for n in args.workers.split(",") if n.strip()]
+
+    with tempfile.TemporaryDirectory(prefix="bench-dita-") as tmp:
+        root = Path(tmp) / "tree"
+        files = generate_tree(root, args.topics, args.seed)
+        print(f"Generated {files} DITA files under {root}", file=sys.stderr)
+
+        results = {}
+        for workers in worker_counts:
+            result = bench_workers(root, Path(tmp), workers)
+            results[str(workers)] = result
+            print(
+                f"  workers={workers:<3} {result['files_per_sec']:10.1f} files/sec  {result['elapsed_s']:8.2f}s",
+                file=sys.stderr,
+            )
+
+    reference = results[str(worker_counts[0])]
+    for result in results.values():
+        result["speedup"] = round(reference["elapsed_s"] / result["elapsed_s"], 2) if result["elapsed_s"] else 0.0
+
+    report = {
+        "schema_version": 1,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": {"topics": args.topics, "seed": args.seed, "files": files},
+        "results": results,
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+    digests = {result["ndjson_sha256"] for result in results.values()}
+    if len(digests) != 1:
+        print("dita.ndjson differs between worker counts", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Docs/sec benchmark for Confluence storage-format (XHTML) body processing.
+
+Compares, over a synthetic corpus (see ``storage_corpus.py``):
+
+- ``separate``: links, media, Markdown and hrefs each from their own parse,
+  Markdown via re-serialization into markdownify (as ingest + normalize
+  used to run them)
+- ``parse_once``: the same four results from one ``StorageDoc``
+- ``normalize_cached``: normalize's lookups in ingest's ``storage_extract.jsonl``
+
+Results of ``separate`` and ``parse_once`` must be identical, so the
+benchmark also guards output equivalence.
+
+Usage:
+    python benchmarks/ingest/bench_storage.py --output var/bench/ingest/storage.json
+    python benchmarks/ingest/bench_storage.py --pages 500
+"""
+
+import argparse
+import json
+import platform
+import re
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from storage_corpus import SITE, generate_pages  # noqa: E402
+
+from trailblazer.pipeline.steps.ingest.link_resolver import extract_links_from_storage_with_classification  # noqa: E402
+from trailblazer.pipeline.steps.ingest.media_extractor import extract_media_from_storage  # noqa: E402
+from trailblazer.pipeline.steps.ingest.storage_doc import (  # noqa: E402
+    StorageDoc,
+    StorageExtractCache,
+    storage_sha256,
+)
+from trailblazer.pipeline.steps.normalize.html_to_md import _extract_links_from_storage  # noqa: E402
+
+
+def legacy_markdown(xhtml: str) -> str:
+    """Markdown as normalize produced it before StorageDoc: parse, re-serialize, parse again in markdownify."""
+    from bs4 import BeautifulSoup
+    from markdownify import markdownify as md  # type: ignore
+
+    soup = BeautifulSoup(xhtml, "html.parser")
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    text = md(str(soup), heading_style="ATX", strip=["script", "style", "noscript"])
+    text = re.sub(r"\r\n?", "\n", text)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def _fingerprint(links, media, text_md, hrefs) -> str:
+    return json.dumps(
+        [
+            [vars(link) for link in links],
+            [vars(item) for item in media],
+            text_md,
+            hrefs,
+        ],
+        sort_keys=True,
+    )
+
+
+def run_separate(pages: list[str]) -> list[str]:
+    out = []
+    for xhtml in pages:
+        # One parse per result (two for Markdown), as ingest + normalize used to run them
+        links = extract_links_from_storage_with_classification(xhtml, SITE)
+        media = extract_media_from_storage(xhtml)
+        out.append(_fingerprint(links, media, legacy_markdown(xhtml), _extract_links_from_storage(xhtml)))
+    return out
+
+
+def run_parse_once(pages: list[str]) -> list[str]:
+    out = []
+    for xhtml in pages:
+        doc = StorageDoc(xhtml)
+        links, media = doc.links(SITE), doc.media()
+        extract = doc.extract()
+        out.append(_fingerprint(links, media, extract.text_md, extract.links))
+    return out
+
+
+def run_normalize_cached(pages: list[str], cache_path: Path) -> int:
+    cache = StorageExtractCache(cache_path)
+    hits = sum(cache.get(storage_sha256(xhtml)) is not None for xhtml in pages)
+    cache.close()
+    return hits
+
+
+def _timed(fn, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=1000, help="Synthetic storage pages to generate")
+    parser.add_argument("--seed", type=int, default=42, help="Corpus seed")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    pages = generate_pages(args.pages, args.seed)
+    print(f"Generated {len(pages)} storage pages ({sum(map(len, pages)) // 1024} KiB)", file=sys.stderr)
+
+    separate_s, separate = _timed(run_separate, pages)
+    once_s, once = _timed(run_parse_once, pages)
+
+    with tempfile.TemporaryDirectory(prefix="bench-storage-") as tmp:
+        cache_path = Path(tmp) / "storage_extract.jsonl"
+        with open(cache_path, "w", encoding="utf-8") as f:
+            for xhtml in pages:
+                extract = StorageDoc(xhtml).extract()
+                record = {"content_sha256": storage_sha256(xhtml), "text_md": extract.text_md, "links": extract.links}
+                f.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
+        cached_s, hits = _timed(run_normalize_cached, pages, cache_path)
+
+    results = {
+        name: {"elapsed_s": round(elapsed, 3), "docs_per_sec": round(len(pages) / elapsed, 1) if elapsed else 0.0}
+        for name, elapsed in (("separate", separate_s), ("parse_once", once_s), ("normalize_cached", cached_s))
+    }
+    results["parse_once"]["speedup"] = round(separate_s / once_s, 2) if once_s else 0.0
+    for name, result in results.items():
+        print(f"  {name:<17} {result['docs_per_sec']:10.1f} docs/sec  {result['elapsed_s']:8.2f}s", file=sys.stderr)
+
+    report = {
+        "schema_version": 1,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {"pages": args.pages, "seed": args.seed},
+        "results": results,
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if separate != once:
+        print("parse-once results differ from separate parses", file=sys.stderr)
+        return 1
+    if hits != len(pages):
+        print(f"extract cache missed {len(pages) - hits} pages", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
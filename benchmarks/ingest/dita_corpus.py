@@ -0,0 +1,68 @@
+"""
+Deterministic synthetic DITA tree for ingest benchmarks.
+
+Topics (concept/task/reference) are spread over nested product directories,
+each with a prolog of keywords, a few paragraphs, xrefs to sibling topics and
+image references. One ditamap per product directory references its topics.
+"""
+
+import random
+from pathlib import Path
+
+DOCTYPES = ("concept", "task", "reference")
+BODY_TAG = {"concept": "conbody", "task": "taskbody", "reference": "refbody"}
+
+_WORDS = (
+    "student registration term course section faculty advisor banner catalog schedule grade "
+    "transcript enrollment payment account finance aid award budget report query field value "
+    "configure validate process record update release module integration workflow approval"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def topic_xml(rng: random.Random, doctype: str, topic_id: str, siblings: list[str]) -> str:
+    keywords = "".join(f"<keyword>{rng.choice(_WORDS)}</keyword>" for _ in range(rng.randint(1, 4)))
+    paragraphs = "".join(f"<p>{_text(rng, rng.randint(20, 60))}</p>" for _ in range(rng.randint(2, 8)))
+    xrefs = "".join(f'<p><xref href="{target}.dita">{_text(rng, 3)}</xref></p>' for target in siblings)
+    image = f'<p><image href="../images/{topic_id}.png" alt="{_text(rng, 2)}"/></p>' if rng.random() < 0.3 else ""
+    body = BODY_TAG[doctype]
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<!DOCTYPE {doctype} PUBLIC "-//OASIS//DTD DITA {doctype.capitalize()}//EN" "{doctype}.dtd">\n'
+        f'<{doctype} id="{topic_id}"><title>{_text(rng, 4)}</title>'
+        f"<prolog><metadata><keywords>{keywords}</keywords>"
+        f'<othermeta name="audience" content="{rng.choice(["admin", "student", "faculty"])}"/></metadata></prolog>'
+        f"<{body}>{paragraphs}{xrefs}{image}</{body}></{doctype}>\n"
+    )
+
+
+def map_xml(title: str, hrefs: list[str]) -> str:
+    refs = "".join(f'<topicref href="{href}"/>' for href in hrefs)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<!DOCTYPE map PUBLIC "-//OASIS//DTD DITA Map//EN" "map.dtd">\n'
+        f"<map><title>{title}</title>{refs}</map>\n"
+    )
+
+
+def generate_tree(root: Path, topics: int, seed: int = 42, per_dir: int = 200) -> int:
+    """Write ``topics`` topics (plus one map per directory) under ``root``; returns files written."""
+    rng = random.Random(seed)
+    written = 0
+    for start in range(0, topics, per_dir):
+        directory = root / f"product{start // (per_dir * 10):02d}" / f"module{start // per_dir:03d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        ids = [f"topic{n:06d}" for n in range(start, min(start + per_dir, topics))]
+        for topic_id in ids:
+            siblings = rng.sample(ids, k=min(2, len(ids)))
+            doctype = rng.choice(DOCTYPES)
+            (directory / f"{topic_id}.dita").write_text(topic_xml(rng, doctype, topic_id, siblings), encoding="utf-8")
+            written += 1
+        (directory / f"{directory.name}.ditamap").write_text(
+            map_xml(directory.name, [f"{topic_id}.dita" for topic_id in ids]), encoding="utf-8"
+        )
+        written += 1
+    return written
@@ -0,0 +1,102 @@
+"""
+Deterministic synthetic Confluence storage-format (XHTML) bodies for benchmarks.
+
+Pages mix headings, paragraphs with inline formatting and entities, lists,
+tables, code macros with CDATA bodies, info panels, image macros with
+attachments, page links and plain anchors (internal, external with tracking
+params, attachment downloads), plus the odd script/style block.
+"""
+
+import random
+
+SITE = "https://example.atlassian.net/wiki"
+
+_WORDS = (
+    "student registration term course section faculty advisor banner catalog schedule grade "
+    "transcript enrollment payment account finance aid award budget report query field value "
+    "configure validate process record update release module integration workflow approval"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def _anchor(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.4:
+        page_id = rng.randint(100000, 999999)
+        href = f"{SITE}/spaces/DEV/pages/{page_id}/{_text(rng, 2).replace(' ', '+')}#section-{rng.randint(1, 5)}"
+    elif kind < 0.8:
+        href = f"https://docs.example.com/{rng.choice(_WORDS)}?utm_source=wiki&amp;id={rng.randint(1, 99)}"
+    else:
+        href = f"/download/attachments/{rng.randint(1000, 9999)}/{rng.choice(_WORDS)}.pdf"
+    return f'<a href="{href}">{_text(rng, 2)}</a>'
+
+
+def _paragraph(rng: random.Random) -> str:
+    parts = [_text(rng, rng.randint(8, 30))]
+    if rng.random() < 0.5:
+        parts.append(f"<strong>{_text(rng, 2)}</strong>")
+    if rng.random() < 0.3:
+        parts.append(f"<em>{_text(rng, 3)}</em> &amp; <code>{rng.choice(_WORDS)}_id</code> &lt;= 10")
+    if rng.random() < 0.5:
+        parts.append(_anchor(rng))
+    return f"<p>{' '.join(parts)}.</p>"
+
+
+def _block(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.35:
+        return _paragraph(rng)
+    if kind < 0.5:
+        items = "".join(f"<li>{_text(rng, rng.randint(3, 10))}</li>" for _ in range(rng.randint(2, 6)))
+        tag = rng.choice(["ul", "ol"])
+        return f"<{tag}>{items}</{tag}>"
+    if kind < 0.6:
+        header = "".join(f"<th>{_text(rng, 1)}</th>" for _ in range(3))
+        rows = "".join(
+            "<tr>" + "".join(f"<td>{_text(rng, rng.randint(1, 4))}</td>" for _ in range(3)) + "</tr>"
+            for _ in range(rng.randint(2, 8))
+        )
+        return f"<table><tbody><tr>{header}</tr>{rows}</tbody></table>"
+    if kind < 0.7:
+        code = "\n".join(f"SELECT {rng.choice(_WORDS)} FROM {rng.choice(_WORDS)} WHERE x < 3;" for _ in range(4))
+        return (
+            '<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">sql</ac:parameter>'
+            f"<ac:plain-text-body><![CDATA[{code}]]></ac:plain-text-body></ac:structured-macro>"
+        )
+    if kind < 0.78:
+        return (
+            '<ac:structured-macro ac:name="info"><ac:rich-text-body>'
+            f"{_paragraph(rng)}</ac:rich-text-body></ac:structured-macro>"
+        )
+    if kind < 0.88:
+        name = f"{rng.choice(_WORDS)}-{rng.randint(1, 99)}.{rng.choice(['png', 'jpg', 'pdf'])}"
+        return (
+            f'<p><ac:image ac:alt="{_text(rng, 2)}" ac:width="600">'
+            f'<ri:attachment ri:filename="{name}" /></ac:image></p>'
+        )
+    if kind < 0.95:
+        return (
+            f'<p><ac:link><ri:page ri:content-title="{_text(rng, 3)}" />'
+            f"<ac:plain-text-link-body><![CDATA[{_text(rng, 2)}]]></ac:plain-text-link-body></ac:link></p>"
+        )
+    return f"<style>p {{ color: red; }}</style><script>var {rng.choice(_WORDS)} = 1;</script>{_paragraph(rng)}"
+
+
+def storage_page(rng: random.Random, blocks: int) -> str:
+    """One storage body with ``blocks`` top-level blocks under a few headings."""
+    out = []
+    for n in range(blocks):
+        if n % 6 == 0:
+            level = rng.randint(1, 3)
+            out.append(f"<h{level}>{_text(rng, 3)}</h{level}>")
+        out.append(_block(rng))
+    return "".join(out)
+
+
+def generate_pages(count: int, seed: int = 42, min_blocks: int = 5, max_blocks: int = 60) -> list[str]:
+    """``count`` deterministic storage bodies of varying size."""
+    rng = random.Random(seed)
+    return [storage_page(rng, rng.randint(min_blocks, max_blocks)) for _ in range(count)]
@@ -1,16 +1,54 @@
+import importlib.util
 from collections.abc import Iterable
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
 from httpx import BasicAuth
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from ..core.config import SETTINGS
+from .http_stats import HttpStats, InstrumentedTransport
+from .rate_limit import RateLimitedTransport, get_rate_limiter
 
 V2_PREFIX = "/api/v2"
 
 
+def _not_rate_limited(exc: BaseException) -> bool:
+    # 429s are retried by the transport per Retry-After; don't stack blind backoff on top
+    return not (isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429)
+
+
+_retryable = retry_if_exception(_not_rate_limited)
+
+# Content codings httpx can decode, and the optional package each one needs
+_DECODER_PACKAGES: dict[str, tuple[str, ...]] = {
+    "gzip": (),
+    "deflate": (),
+    "br": ("brotli", "brotlicffi"),
+    "zstd": ("zstandard",),
+}
+
+
+def _installed(*modules: str) -> bool:
+    return any(importlib.util.find_spec(module) is not None for module in modules)
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 if configured and the optional ``h2`` package is installed (see ``http_versions`` in metrics)."""
+    return SETTINGS.CONFLUENCE_HTTP2 and _installed("h2")
+
+
+def _accept_encoding() -> str:
+    """Configured codings, minus any whose decoder package is not installed."""
+    codings = [c.strip() for c in SETTINGS.CONFLUENCE_ACCEPT_ENCODING.split(",") if c.strip()]
+    # Codings with no package listed are decoded by the standard library
+    usable = [
+        c for c in codings if c in _DECODER_PACKAGES and (not _DECODER_PACKAGES[c] or _installed(*_DECODER_PACKAGES[c]))
+    ]
+    return ", ".join(usable) or "identity"
+
+
 class ConfluenceClient:
     def __init__(
         self,
@@ -23,14 +61,30 @@ class ConfluenceClient:
             base = base + "/wiki"
         self.site_base = base  # e.g. https://ellucian.atlassian.net/wiki
         self.api_base = self.site_base  # httpx base_url
+        # Pool sized for the prefetch workers; HTTP/2 multiplexes them over one connection
+        transport: httpx.BaseTransport = httpx.HTTPTransport(
+            http2=_http2_enabled(),
+            limits=httpx.Limits(
+                max_connections=SETTINGS.CONFLUENCE_MAX_CONNECTIONS,
+                max_keepalive_connections=SETTINGS.CONFLUENCE_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=SETTINGS.CONFLUENCE_KEEPALIVE_EXPIRY,
+            ),
+        )
+        # Bytes/latency per endpoint, per attempt (429 retries included); reported in ingest metrics.json
+        self.http_stats = HttpStats()
+        transport = InstrumentedTransport(transport, self.http_stats)
+        # All clients in the process share one token bucket (parallel spaces, prefetch workers);
+        # 429s are retried here per Retry-After even when the bucket is disabled
+        transport = RateLimitedTransport(transport, get_rate_limiter(), max_retries=SETTINGS.CONFLUENCE_MAX_429_RETRIES)
         self._client = httpx.Client(
             base_url=self.api_base,
-            timeout=30.0,
+            timeout=SETTINGS.CONFLUENCE_TIMEOUT,
+            transport=transport,
             auth=BasicAuth(
                 email or SETTINGS.CONFLUENCE_EMAIL or "",
                 token or SETTINGS.CONFLUENCE_API_TOKEN or "",
             ),
-            headers={"Accept": "application/json"},
+            headers={"Accept": "application/json", "Accept-Encoding": _accept_encoding()},
         )
 
     # ---------- pagination helper ----------
@@ -73,28 +127,56 @@ class ConfluenceClient:
             url, params, first = nxt, None, False
 
     # ---------- v2 ----------
-    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(5))
+    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(5), retry=_retryable)
     def get_spaces(self, keys: list[str] | None = None, limit: int = 100) -> Iterable[dict]:
         params: dict[str, Any] = {"limit": limit}
         if keys:
             params["keys"] = ",".join(keys)
         yield from self._paginate(f"{V2_PREFIX}/spaces", params)
 
-    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(5))
+    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(5), retry=_retryable)
     def get_pages(
         self,
         space_id: str | None = None,
         body_format: str | None = None,
         limit: int = 100,
     ) -> Iterable[dict]:
-        params: dict[str, Any] = {"limit": limit}
-        if space_id:
-            params["space-id"] = space_id
-        if body_format:
-            params["body-format"] = body_format
-        yield from self._paginate(f"{V2_PREFIX}/pages", params)
+        for _, results in self.get_page_batches(space_id=space_id, body_format=body_format, limit=limit):
+            yield from results
+
+    def get_page_batches(
+        self,
+        space_id: str | None = None,
+        body_format: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> Iterable[tuple[str | None, list[dict]]]:
+        """
+        Yield ``(cursor, results)`` per API page of ``get_pages``.
+
+        ``cursor`` is the ``_links.next`` URL that fetched the batch (None for the
+        first batch); passing it back resumes pagination at that batch.
+        """
+        url: str = cursor or f"{V2_PREFIX}/pages"
+        params: dict[str, Any] | None = None
+        if not cursor:
+            params = {"limit": limit}
+            if space_id:
+                params["space-id"] = space_id
+            if body_format:
+                params["body-format"] = body_format
+        current = cursor
+        while True:
+            r = self._client.get(url, params=params)
+            r.raise_for_status()
+            data = r.json()
+            yield current, data.get("results", [])
+            nxt = self._next_link(r, data)
+            if not nxt:
+                break
+            url, params, current = nxt, None, nxt
 
-    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(5))
+    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(5), retry=_retryable)
     def get_page_by_id(self, page_id: str, body_format: str | None = None) -> dict:
         params: dict[str, Any] = {}
         if body_format:
@@ -103,13 +185,13 @@ class ConfluenceClient:
         r.raise_for_status()
         return r.json()
 
-    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(5))
+    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(5), retry=_retryable)
     def get_attachments_for_page(self, page_id: str, limit: int = 100) -> Iterable[dict]:
         params: dict[str, Any] = {"limit": limit}
         yield from self._paginate(f"{V2_PREFIX}/pages/{page_id}/attachments", params)
 
     # ---------- v1 CQL (delta prefilter only) ----------
-    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(5))
+    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(5), retry=_retryable)
     def search_cql(
         self,
         cql: str,
@@ -130,7 +212,7 @@ class ConfluenceClient:
             return None
         return rel_or_abs if rel_or_abs.startswith("http") else urljoin(self.site_base + "/", rel_or_abs.lstrip("/"))
 
-    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(3))
+    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(3), retry=_retryable)
     def get_page_labels(self, page_id: str) -> list[dict]:
         """Get labels for a specific page."""
         try:
@@ -142,7 +224,7 @@ class ConfluenceClient:
             # Labels are optional - don't fail the whole ingest
             return []
 
-    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(3))
+    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(3), retry=_retryable)
     def get_page_ancestors(self, page_id: str) -> list[dict]:
         """Get ancestor hierarchy for a page."""
         try:
@@ -154,7 +236,7 @@ class ConfluenceClient:
             # Ancestors are optional - don't fail the whole ingest
             return []
 
-    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(3))
+    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(3), retry=_retryable)
     def get_space_details(self, space_key: str) -> dict:
         """Get detailed space information."""
         try:
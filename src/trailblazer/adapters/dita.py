@@ -9,13 +9,14 @@ Parses DITA topics (concept, task, reference) and ditamaps to extract:
 
 import hashlib
 import urllib.parse
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from lxml import etree  # type: ignore
 
 from ..core.logging import log
+from .dita_markdown import element_to_markdown
 
 
 @dataclass
@@ -60,6 +61,8 @@ class TopicDoc:
     labels: list[str]
     links: list[LinkRef]  # Enhanced link extraction
     enhanced_metadata: dict[str, Any]  # Structured metadata from prolog
+    body_md: str = ""  # Markdown of the body, converted from the parsed tree
+    body_links: list[str] = field(default_factory=list)  # External xref/link hrefs in the body
 
 
 @dataclass
@@ -678,8 +681,12 @@ def parse_topic(file_path: Path) -> TopicDoc:
         if body is None:
             body = root.find("refbody")  # For reference topics
         body_xml = ""
+        body_md = ""
+        body_links: list[str] = []
         if body is not None:
             body_xml = etree.tostring(body, encoding="unicode", pretty_print=True)
+            # Normalize's Markdown, taken from this parse instead of re-parsing body_xml later
+            body_md, body_links = element_to_markdown(body)
 
         # Extract media references
         media_list: list[MediaRef] = []
@@ -726,6 +733,8 @@ def parse_topic(file_path: Path) -> TopicDoc:
             labels=labels,
             links=links,
             enhanced_metadata=enhanced_metadata,
+            body_md=body_md,
+            body_links=body_links,
         )
 
     except Exception as e:
@@ -0,0 +1,144 @@
+"""DITA XML to Markdown in one linear pass.
+
+The converter consumes lxml start/end events: ``dita_to_markdown`` streams
+them from XML text with ``iterparse`` (clearing elements as it goes), and
+``element_to_markdown`` walks a tree ingest already parsed with
+``iterwalk``. Heading levels come from a counter of open section-like
+elements, and each open element buffers its children's Markdown in a list,
+so work is linear in document size whatever the nesting depth.
+
+External (http/https) hrefs of ``xref`` and ``link`` elements are collected
+in the same pass.
+"""
+
+import io
+import re
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from lxml import etree
+
+# Elements whose nesting sets the heading level of the titles inside them
+_SECTION_TAGS = frozenset({"section", "concept", "task", "reference"})
+
+_NOTE_TAGS = frozenset({"note", "important", "warning", "caution"})
+
+_MAX_HEADING_LEVEL = 6
+
+
+class DitaMarkdown(NamedTuple):
+    """Markdown of a DITA body and its external links (sorted, unique)."""
+
+    text_md: str
+    links: list[str]
+
+
+def _localname(element: etree._Element) -> str:
+    return str(etree.QName(element).localname).lower()
+
+
+def _content(element: etree._Element, children: list[tuple[str, str]]) -> str:
+    """Element text, child Markdown and tails in document order, joined by single spaces."""
+    parts = []
+    text = (element.text or "").strip()
+    if text:
+        parts.append(text)
+    converted = iter(children)
+    for child in element:
+        if isinstance(child.tag, str):
+            _, child_md = next(converted)
+            if child_md.strip():
+                parts.append(child_md)
+        # Comments and processing instructions contribute only their tail
+        tail = (child.tail or "").strip()
+        if tail:
+            parts.append(tail)
+    return " ".join(parts)
+
+
+def _element_markdown(element: etree._Element, tag: str, children: list[tuple[str, str]], sections: int) -> str:
+    """Markdown of one element, given its converted children and the number of enclosing section-like elements."""
+    if tag in ("ul", "ol"):
+        # Only direct list items are rendered
+        marker = "-" if tag == "ul" else "1."
+        items = [f"{marker} {child_md.strip()}" for child_tag, child_md in children if child_tag == "li"]
+        return "\n".join(items) + "\n\n"
+
+    content = _content(element, children)
+    if tag in ("title", "navtitle"):
+        return f"{'#' * min(sections + 1, _MAX_HEADING_LEVEL)} {content}\n\n"
+    if tag in ("p", "shortdesc", "fig", "figure", "table", "simpletable"):
+        return f"{content}\n\n"
+    if tag == "codeblock":
+        return f"```\n{content}\n```\n\n"
+    if tag == "codeph":
+        return f"`{content}`"
+    if tag in _NOTE_TAGS:
+        return f"> **{tag.capitalize()}**: {content}\n\n"
+    if tag in ("b", "strong"):
+        return f"**{content}**"
+    if tag in ("i", "em"):
+        return f"*{content}*"
+    if tag == "u":
+        return f"<u>{content}</u>"
+    if tag == "xref":
+        target = element.get("href") or element.get("keyref")
+        return f"[{content or target}]({target})" if target else content
+    if tag == "link":
+        href = element.get("href")
+        return f"[{content or href}]({href})" if href else content
+    if tag == "image":
+        href = element.get("href")
+        alt = element.get("alt") or content or "image"
+        return f"![{alt}]({href or '#'})"
+    # Containers (body, conbody, section, ...) and unknown elements keep their content
+    return content
+
+
+def _convert(events: Iterable[tuple[str, etree._Element]], clear: bool) -> DitaMarkdown:
+    stack: list[list[tuple[str, str]]] = []  # converted children of each open element
+    sections = 0
+    links: list[str] = []
+    result = ""
+    for event, element in events:
+        if not isinstance(element.tag, str):
+            continue
+        tag = _localname(element)
+        if event == "start":
+            stack.append([])
+            if tag in _SECTION_TAGS:
+                sections += 1
+            continue
+
+        children = stack.pop()
+        if tag in _SECTION_TAGS:
+            sections -= 1
+        if tag in ("xref", "link"):
+            href = element.get("href")
+            if href and href.startswith(("http://", "https://")):
+                links.append(href)
+        md = _element_markdown(element, tag, children, sections)
+        if clear:
+            # Children were consumed above; keep the tail for the parent
+            element.clear(keep_tail=True)
+        if stack:
+            stack[-1].append((tag, md))
+        else:
+            result = md
+
+    # Normalize whitespace
+    result = re.sub(r"\r\n?", "\n", result)
+    result = re.sub(r"\n{3,}", "\n\n", result)
+    return DitaMarkdown(result.strip(), sorted(dict.fromkeys(links)))
+
+
+def dita_to_markdown(dita_xml: str | bytes) -> DitaMarkdown:
+    """Convert DITA XML text; raises ``etree.XMLSyntaxError`` when not even a recovering parse finds an element."""
+    data = dita_xml.encode("utf-8") if isinstance(dita_xml, str) else dita_xml
+    events = etree.iterparse(io.BytesIO(data), events=("start", "end"), recover=True, resolve_entities=False)
+    return _convert(events, clear=True)
+
+
+def element_to_markdown(element: etree._Element) -> DitaMarkdown:
+    """Convert an already parsed element (e.g. a topic body) without modifying its tree."""
+    return _convert(etree.iterwalk(element, events=("start", "end")), clear=False)
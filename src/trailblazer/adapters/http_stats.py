@@ -0,0 +1,109 @@
+"""Per-endpoint byte and latency counters for Confluence HTTP traffic."""
+
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import httpx
+
+# Numeric path segments (page/space/attachment ids) collapse into one endpoint
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_key(request: httpx.Request) -> str:
+    """Group a request by method and templated path, e.g. ``GET /api/v2/pages/{id}/labels``."""
+    path = _ID_SEGMENT.sub("/{id}", request.url.path)
+    if path.startswith("/wiki/"):
+        path = path[len("/wiki") :]
+    return f"{request.method} {path}"
+
+
+class HttpStats:
+    """Thread-safe request, byte (on the wire, before decompression) and latency totals per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, dict[str, Any]] = {}
+        self._versions: Counter[str] = Counter()
+
+    def record(self, endpoint: str, status: int, num_bytes: int, seconds: float, http_version: str) -> None:
+        with self._lock:
+            row = self._endpoints.setdefault(
+                endpoint,
+                {"requests": 0, "errors": 0, "bytes": 0, "seconds": 0.0, "max_seconds": 0.0},
+            )
+            row["requests"] += 1
+            row["errors"] += status >= 400
+            row["bytes"] += num_bytes
+            row["seconds"] += seconds
+            row["max_seconds"] = max(row["max_seconds"], seconds)
+            self._versions[http_version] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Totals for metrics.json, endpoints ordered by time spent."""
+        with self._lock:
+            endpoints = {
+                name: {
+                    **row,
+                    "seconds": round(row["seconds"], 3),
+                    "max_seconds": round(row["max_seconds"], 3),
+                    "avg_ms": round(1000 * row["seconds"] / row["requests"], 1),
+                }
+                for name, row in sorted(self._endpoints.items(), key=lambda item: -item[1]["seconds"])
+            }
+            return {
+                "requests": sum(row["requests"] for row in endpoints.values()),
+                "bytes": sum(row["bytes"] for row in endpoints.values()),
+                "http_versions": dict(self._versions),
+                "endpoints": endpoints,
+            }
+
+
+class _CountingStream(httpx.SyncByteStream):
+    """Response stream that reports raw bytes and elapsed time once, when closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, on_close: Callable[[int], None]):
+        self._stream = stream
+        self._on_close: Callable[[int], None] | None = on_close
+        self._bytes = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._bytes += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._on_close is not None:
+                self._on_close(self._bytes)
+                self._on_close = None
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """httpx transport that records every request into ``HttpStats`` when its body is consumed."""
+
+    def __init__(self, transport: httpx.BaseTransport, stats: HttpStats):
+        self._transport = transport
+        self.stats = stats
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        endpoint = endpoint_key(request)
+        http_version = response.extensions.get("http_version", b"HTTP/1.1")
+        if isinstance(http_version, bytes):
+            http_version = http_version.decode("ascii", "replace")
+
+        def on_close(num_bytes: int) -> None:
+            self.stats.record(endpoint, response.status_code, num_bytes, time.perf_counter() - started, http_version)
+
+        response.stream = _CountingStream(response.stream, on_close)  # type: ignore[arg-type]
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
@@ -0,0 +1,151 @@
+"""Process-wide token-bucket rate limiting for Confluence HTTP traffic."""
+
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from ..core.config import SETTINGS
+from ..core.logging import log
+
+
+def parse_retry_after(value: str | None, default: float = 1.0, now: datetime | None = None) -> float:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds to wait."""
+    if not value:
+        return default
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every request in the process.
+
+    ``rate`` tokens are added per second up to ``capacity``. ``pause`` blocks
+    all callers until a deadline, which is how a 429's Retry-After is applied
+    to every concurrent worker rather than just the one that received it.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available; returns seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                else:
+                    delay = (tokens - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds`` from now and drain the bucket."""
+        with self._lock:
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = now
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """httpx transport that takes a token per request and honors Retry-After on 429.
+
+    Without a limiter (rate limiting disabled) requests are not paced, but
+    429s are still retried after their Retry-After delay.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        limiter: TokenBucket | None,
+        max_retries: int = 5,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._transport = transport
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            if self.limiter:
+                self.limiter.acquire()
+            response = self._transport.handle_request(request)
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+
+            attempt += 1
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            response.close()
+            log.warning(
+                "confluence.rate_limited",
+                url=str(request.url),
+                retry_after=delay,
+                attempt=attempt,
+            )
+            if self.limiter:
+                self.limiter.pause(delay)
+            else:
+                self._sleep(delay)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+_limiter: TokenBucket | None = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket | None:
+    """Get the process-wide Confluence limiter, or None when rate limiting is disabled."""
+    global _limiter
+    if SETTINGS.CONFLUENCE_RATE_LIMIT_RPS <= 0:
+        return None
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = TokenBucket(
+                rate=SETTINGS.CONFLUENCE_RATE_LIMIT_RPS,
+                capacity=SETTINGS.CONFLUENCE_RATE_LIMIT_BURST,
+            )
+        return _limiter
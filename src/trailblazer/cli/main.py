@@ -365,10 +365,30 @@ def ingest_confluence_cmd(
     log_format: str = typer.Option("auto", "--log-format", help="Logging format: json|plain|auto"),
     quiet_pretty: bool = typer.Option(False, "--quiet-pretty", help="Suppress banners but keep progress bars"),
     no_color: bool = typer.Option(False, "--no-color", help="Disable colored output"),
+    fetch_workers: int | None = typer.Option(
+        None,
+        "--fetch-workers",
+        help="Concurrent per-page fetches (default: CONFLUENCE_FETCH_WORKERS; 1 = sequential)",
+    ),
+    bulk_metadata: bool | None = typer.Option(
+        None,
+        "--bulk-metadata/--no-bulk-metadata",
+        help="Harvest labels/ancestors via CQL expand instead of per-page calls (default: CONFLUENCE_BULK_METADATA)",
+    ),
+    resume: str | None = typer.Option(
+        None,
+        "--resume",
+        help="Continue an interrupted run (RUN_ID) from its progress checkpoint",
+    ),
+    delta: bool | None = typer.Option(
+        None,
+        "--delta/--no-delta",
+        help="Copy pages with unchanged versions from the previous run instead of refetching (default: CONFLUENCE_DELTA)",
+    ),
 ) -> None:
     from typing import cast
 
-    from ..core.artifacts import new_run_id, phase_dir
+    from ..core.artifacts import new_run_id, phase_dir, runs_dir
     from ..core.logging import LogFormat, setup_logging
     from ..core.progress import init_progress
     from ..pipeline.steps.ingest.confluence import ingest_confluence
@@ -379,7 +399,11 @@ def ingest_confluence_cmd(
     # Initialize progress renderer
     progress_renderer = init_progress(enabled=progress, quiet_pretty=quiet_pretty, no_color=no_color)
 
-    rid = new_run_id()
+    if resume and not (runs_dir() / resume / "ingest").exists():
+        typer.echo(f"❌ No ingest output to resume for run {resume}", err=True)
+        raise typer.Exit(2)
+
+    rid = resume or new_run_id()
     out = str(phase_dir(rid, "ingest"))
 
     try:
@@ -423,6 +447,10 @@ def ingest_confluence_cmd(
             progress=progress,
             progress_every=progress_every,
             run_id=rid,
+            fetch_workers=fetch_workers,
+            bulk_metadata=bulk_metadata,
+            resume=resume is not None,
+            delta=delta,
         )
 
         # Check for empty results
@@ -487,6 +515,16 @@ def ingest_dita_cmd(
     log_format: str = typer.Option("auto", "--log-format", help="Logging format: json|plain|auto"),
     quiet_pretty: bool = typer.Option(False, "--quiet-pretty", help="Suppress banners but keep progress bars"),
     no_color: bool = typer.Option(False, "--no-color", help="Disable colored output"),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        help="Processes parsing DITA files in parallel (default: DITA_WORKERS; 1 = in-process)",
+    ),
+    incremental: bool | None = typer.Option(
+        None,
+        "--incremental/--full",
+        help="Reuse files unchanged since the last run over this root instead of re-parsing (default: DITA_INCREMENTAL)",
+    ),
 ) -> None:
     """Ingest DITA topics and maps from local filesystem."""
     from typing import cast
@@ -521,6 +559,8 @@ def ingest_dita_cmd(
             progress=progress,
             progress_every=progress_every,
             run_id=rid,
+            workers=workers,
+            incremental=incremental,
         )
 
         log.info("cli.ingest.dita.done", run_id=rid, **metrics)
@@ -652,6 +692,16 @@ def normalize_from_ingest_cmd(
         help="Input NDJSON file to normalize (overrides --run-id)",
     ),
     limit: int | None = typer.Option(None, "--limit", help="Limit number of pages to process"),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        help="Processes converting records in parallel (default: NORMALIZE_WORKERS; 1 = in-process)",
+    ),
+    use_cache: bool | None = typer.Option(
+        None,
+        "--cache/--no-cache",
+        help="Reuse bodies earlier runs normalized, keyed by the body hash (default: NORMALIZE_CACHE)",
+    ),
 ) -> None:
     from ..core.artifacts import new_run_id, phase_dir
     from ..pipeline.steps.normalize.html_to_md import normalize_from_ingest
@@ -667,6 +717,8 @@ def normalize_from_ingest_cmd(
         outdir=out,
         input_file=input_file,
         limit=limit,
+        workers=workers,
+        use_cache=use_cache,
     )
     log.info("cli.normalize.from_ingest.done", **metrics)
     typer.echo(f"Normalized to: {out}")
@@ -1529,6 +1581,50 @@ def plan(
     typer.echo("📝 No files will be written in this preview")
 
 
+def _ingest_spaces_in_process(
+    spaces: list[str],
+    workers: int,
+    index_file: Path,
+    progress: bool,
+    progress_every: int,
+    no_color: bool,
+    since: str | None,
+    auto_since: bool,
+    max_pages: int | None,
+) -> int:
+    """Ingest Confluence spaces concurrently in this process; returns the number of successful runs."""
+    from ..core.progress import init_progress
+    from ..pipeline.steps.ingest.confluence import ingest_confluence_spaces
+
+    init_progress(enabled=progress, no_color=no_color)
+    typer.echo(f"▶️  Ingesting {len(spaces)} spaces, {workers} at a time (shared rate limit)")
+
+    results = ingest_confluence_spaces(
+        spaces,
+        max_parallel=workers,
+        since=datetime.fromisoformat(since.replace("Z", "+00:00")) if since else None,
+        auto_since=auto_since,
+        body_format="atlas_doc_format",  # Enforce ADF
+        max_pages=max_pages,
+        progress=progress,
+        progress_every=progress_every,
+    )
+
+    successful = 0
+    with open(index_file, "a") as f:
+        for space, result in results.items():
+            f.write(f"### Confluence Space: {space}\n")
+            f.write(f"- Run: `{result['run_id']}` (in-process, {workers} parallel spaces)\n")
+            if result["error"]:
+                f.write(f"- Failed: {result['error']}\n")
+                typer.echo(f"❌ Failed space: {space} ({result['error']})", err=True)
+            else:
+                successful += 1
+                typer.echo(f"✅ Completed space: {space} ({result['metrics'].get('pages', 0)} pages)")
+            f.write("\n")
+    return successful
+
+
 @app.command()
 def ingest_all(
     confluence: bool = typer.Option(True, "--confluence/--no-confluence", help="Ingest Confluence"),
@@ -1540,6 +1636,11 @@ def ingest_all(
     auto_since: bool = typer.Option(False, "--auto-since", help="Auto-detect since from state"),
     max_pages: int | None = typer.Option(None, "--max-pages", help="Debug: limit pages"),
     from_scratch: bool = typer.Option(False, "--from-scratch", help="Clear var/state before starting"),
+    parallel_spaces: int | None = typer.Option(
+        None,
+        "--parallel-spaces",
+        help="Confluence spaces to ingest concurrently, sharing one rate limiter (default: CONFLUENCE_PARALLEL_SPACES)",
+    ),
 ) -> None:
     """
     Ingest all Confluence spaces and DITA files with enforced ADF format.
@@ -1558,6 +1659,7 @@ def ingest_all(
         trailblazer ingest-all --from-scratch     # Clear state first
         trailblazer ingest-all --no-dita          # Confluence only
         trailblazer ingest-all --since 2025-01-01T00:00:00Z  # Delta mode
+        trailblazer ingest-all --parallel-spaces 4  # 4 spaces at once
     """
     _validate_workspace_only()
 
@@ -1589,48 +1691,62 @@ def ingest_all(
     if confluence:
         typer.echo("\n📋 Ingesting Confluence spaces...")
         spaces = _get_confluence_spaces()
+        workers = parallel_spaces if parallel_spaces is not None else SETTINGS.CONFLUENCE_PARALLEL_SPACES
+
+        if workers > 1 and spaces:
+            total_runs += _ingest_spaces_in_process(
+                spaces,
+                workers,
+                index_file,
+                progress=progress,
+                progress_every=progress_every,
+                no_color=no_color,
+                since=since,
+                auto_since=auto_since,
+                max_pages=max_pages,
+            )
+        else:
+            for space in spaces:
+                # Build command
+                cmd = [
+                    sys.executable,
+                    "-m",
+                    "trailblazer.cli.main",
+                    "ingest",
+                    "confluence",
+                    "--space",
+                    space,
+                    "--body-format",
+                    "atlas_doc_format",  # Enforce ADF
+                ]
+
+                if progress:
+                    cmd.append("--progress")
+                if progress_every != 10:
+                    cmd.extend(["--progress-every", str(progress_every)])
+                if no_color:
+                    cmd.append("--no-color")
+                if since:
+                    cmd.extend(["--since", since])
+                if auto_since:
+                    cmd.append("--auto-since")
+                if max_pages:
+                    cmd.extend(["--max-pages", str(max_pages)])
+
+                # Log to session index
+                with open(index_file, "a") as f:
+                    f.write(f"### Confluence Space: {space}\n")
+                    f.write(f"```bash\n{' '.join(cmd)}\n```\n\n")
+
+                typer.echo(f"▶️  Ingesting space: {space}")
+                typer.echo(f"   Command: {' '.join(cmd)}", err=True)
 
-        for space in spaces:
-            # Build command
-            cmd = [
-                sys.executable,
-                "-m",
-                "trailblazer.cli.main",
-                "ingest",
-                "confluence",
-                "--space",
-                space,
-                "--body-format",
-                "atlas_doc_format",  # Enforce ADF
-            ]
-
-            if progress:
-                cmd.append("--progress")
-            if progress_every != 10:
-                cmd.extend(["--progress-every", str(progress_every)])
-            if no_color:
-                cmd.append("--no-color")
-            if since:
-                cmd.extend(["--since", since])
-            if auto_since:
-                cmd.append("--auto-since")
-            if max_pages:
-                cmd.extend(["--max-pages", str(max_pages)])
-
-            # Log to session index
-            with open(index_file, "a") as f:
-                f.write(f"### Confluence Space: {space}\n")
-                f.write(f"```bash\n{' '.join(cmd)}\n```\n\n")
-
-            typer.echo(f"▶️  Ingesting space: {space}")
-            typer.echo(f"   Command: {' '.join(cmd)}", err=True)
-
-            try:
-                subprocess.run(cmd, check=True)
-                total_runs += 1
-                typer.echo(f"✅ Completed space: {space}")
-            except subprocess.CalledProcessError as e:
-                typer.echo(f"❌ Failed space: {space} (exit {e.returncode})", err=True)
+                try:
+                    subprocess.run(cmd, check=True)
+                    total_runs += 1
+                    typer.echo(f"✅ Completed space: {space}")
+                except subprocess.CalledProcessError as e:
+                    typer.echo(f"❌ Failed space: {space} (exit {e.returncode})", err=True)
 
     if dita:
         typer.echo("\n📄 Ingesting DITA files...")
@@ -1684,6 +1800,16 @@ def ingest_all(
 @app.command()
 def normalize_all(
     progress: bool = typer.Option(True, "--progress/--no-progress", help="Show progress"),
+    parallel_runs: int | None = typer.Option(
+        None,
+        "--parallel-runs",
+        help="Runs normalized concurrently (default: NORMALIZE_PARALLEL_RUNS)",
+    ),
+    max_workers: int | None = typer.Option(
+        None,
+        "--max-workers",
+        help="Worker processes shared by all concurrent runs (default: NORMALIZE_MAX_WORKERS, else one per run)",
+    ),
 ) -> None:
     """
     Normalize all runs that are missing normalized output.
@@ -1694,10 +1820,17 @@ def normalize_all(
     This is typically run after 'trailblazer ingest-all' to complete the pipeline.
     Normalization converts raw ingested data to the unified format used downstream.
 
+    With --parallel-runs N, up to N runs are normalized at once and the
+    --max-workers processes are split evenly between them (default: one
+    per run).
+
     Examples:
         trailblazer normalize-all           # Normalize everything needed
         trailblazer normalize-all --no-progress  # Quiet mode
+        trailblazer normalize-all --parallel-runs 2 --max-workers 8
     """
+    import concurrent.futures
+
     _validate_workspace_only()
 
     runs_to_normalize = _get_runs_needing_normalization()
@@ -1712,8 +1845,14 @@ def normalize_all(
 
     typer.echo()
 
-    successful = 0
-    for run_id in runs_to_normalize:
+    # Global cap: concurrent runs x workers per run never exceeds max_workers
+    concurrent_runs, workers_per_run = _split_worker_cap(
+        parallel_runs if parallel_runs is not None else SETTINGS.NORMALIZE_PARALLEL_RUNS,
+        max_workers if max_workers is not None else SETTINGS.NORMALIZE_MAX_WORKERS,
+        len(runs_to_normalize),
+    )
+
+    def normalize_run(run_id: str) -> None:
         cmd = [
             sys.executable,
             "-m",
@@ -1722,18 +1861,32 @@ def normalize_all(
             "from-ingest",
             "--run-id",
             run_id,
+            "--workers",
+            str(workers_per_run),
         ]
 
         typer.echo(f"▶️  Normalizing: {run_id}")
         if progress:
             typer.echo(f"   Command: {' '.join(cmd)}", err=True)
 
-        try:
-            subprocess.run(cmd, check=True, capture_output=not progress)
-            successful += 1
-            typer.echo(f"✅ Completed: {run_id}")
-        except subprocess.CalledProcessError as e:
-            typer.echo(f"❌ Failed: {run_id} (exit {e.returncode})", err=True)
+        # Concurrent runs would interleave their output, so only a lone run streams it
+        subprocess.run(cmd, check=True, capture_output=not progress or concurrent_runs > 1, text=True)
+
+    successful = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_runs) as executor:
+        future_to_run = {executor.submit(normalize_run, run_id): run_id for run_id in runs_to_normalize}
+        for future in concurrent.futures.as_completed(future_to_run):
+            run_id = future_to_run[future]
+            try:
+                future.result()
+                successful += 1
+                typer.echo(f"✅ Completed: {run_id}")
+            except subprocess.CalledProcessError as e:
+                typer.echo(f"❌ Failed: {run_id} (exit {e.returncode})", err=True)
+                # Captured output is otherwise lost; streamed output has already been shown
+                output = e.stderr or e.stdout
+                if output:
+                    typer.echo(output.rstrip(), err=True)
 
     typer.echo(f"\n📊 Normalization complete: {successful}/{len(runs_to_normalize)} successful")
 
@@ -1756,6 +1909,16 @@ def enrich(
     ),
     progress: bool = typer.Option(True, "--progress/--no-progress", help="Show progress output"),
     no_color: bool = typer.Option(False, "--no-color", help="Disable colored output"),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        help="Worker processes enriching documents (default: ENRICH_WORKERS; 1 = in-process)",
+    ),
+    previous_run: str | None = typer.Option(
+        None,
+        "--previous-run",
+        help="Reuse this run's enrichment for unchanged documents and list the changed ones in changed_docs.jsonl",
+    ),
 ) -> None:
     """
     Enrich normalized documents with metadata and quality signals.
@@ -1777,6 +1940,8 @@ def enrich(
         trailblazer enrich RUN_ID_HERE                    # Rule-based only
         trailblazer enrich RUN_ID_HERE --llm             # Include LLM enrichment
         trailblazer enrich RUN_ID_HERE --max-docs 100    # Limit processing
+        trailblazer enrich RUN_ID_HERE --workers 4       # Enrich on 4 processes
+        trailblazer enrich RUN_ID_HERE --previous-run OLD_RUN_ID  # Only enrich changed docs
     """
     import json
     import time
@@ -1847,6 +2012,8 @@ def enrich(
             max_below_threshold_pct=max_below_threshold_pct,
             progress_callback=progress_callback if progress else None,
             emit_event=emit_event,
+            workers=workers,
+            previous_run_id=previous_run,
         )
         duration = time.time() - start_time
 
@@ -1865,6 +2032,14 @@ def enrich(
             typer.echo("", err=True)
             typer.echo("✅ ENRICH COMPLETE", err=True)
             typer.echo(f"📊 Documents processed: {stats['docs_total']:,}", err=True)
+            if "incremental" in stats:
+                incremental = stats["incremental"]
+                typer.echo(
+                    f"♻️  Reused from {incremental['previous_run']}: {incremental['docs_reused']:,} "
+                    f"(new {incremental['docs_new']:,}, changed {incremental['docs_changed']:,}, "
+                    f"removed {incremental['docs_removed']:,})",
+                    err=True,
+                )
             if llm:
                 typer.echo(f"🧠 LLM enriched: {stats['docs_llm']:,}", err=True)
                 typer.echo(
@@ -1954,6 +2129,11 @@ def chunk(
     ),
     max_tokens: int = typer.Option(800, "--max-tokens", help="Maximum tokens per chunk"),
     min_tokens: int = typer.Option(120, "--min-tokens", help="Minimum tokens per chunk"),
+    compress: bool = typer.Option(
+        SETTINGS.CHUNK_COMPRESS,
+        "--compress/--no-compress",
+        help="Write chunks.ndjson.gz (one gzip member per document) instead of chunks.ndjson",
+    ),
     progress: bool = typer.Option(True, "--progress/--no-progress", help="Show progress output"),
 ) -> None:
     """
@@ -2019,16 +2199,17 @@ def chunk(
     try:
         # Run chunking via pipeline runner
         start_time = time.time()
-        _execute_phase("chunk", str(chunk_dir))
+        _execute_phase("chunk", str(chunk_dir), compress_chunks=compress)
         duration = time.time() - start_time
 
         # Read results
-        chunks_file = chunk_dir / "chunks.ndjson"
+        from ..core.chunk_store import iter_chunks, resolve_chunks_file
+
+        chunks_file = resolve_chunks_file(chunk_dir)
         assurance_file = chunk_dir / "chunk_assurance.json"
 
         if chunks_file.exists():
-            with open(chunks_file) as f:
-                chunk_count = sum(1 for line in f if line.strip())
+            chunk_count = sum(1 for _ in iter_chunks(chunks_file))
         else:
             chunk_count = 0
 
@@ -2056,7 +2237,7 @@ def chunk(
 
         typer.echo(f"\n📁 Artifacts written to: {chunk_dir}", err=True)
         typer.echo(
-            f"   • chunks.ndjson - {chunk_count} chunks ready for embedding",
+            f"   • {chunks_file.name} - {chunk_count} chunks ready for embedding",
             err=True,
         )
         typer.echo(
@@ -2154,6 +2335,39 @@ def status() -> None:
     typer.echo(f"   Disk free: {free / (1024**3):.1f} GB")
 
 
+def _split_worker_cap(parallel_runs: int, max_workers: int | None, total_runs: int) -> tuple[int, int]:
+    """Concurrent runs and worker processes per run under a global worker cap.
+
+    Without a cap each concurrent run gets one worker. A cap smaller than
+    ``parallel_runs`` lowers the concurrency, which is reported rather than
+    applied silently.
+    """
+    parallel_runs = max(1, parallel_runs)
+    worker_cap = max(1, max_workers if max_workers is not None else parallel_runs)
+    concurrent_runs = min(parallel_runs, worker_cap, total_runs)
+    if concurrent_runs < min(parallel_runs, total_runs):
+        typer.echo(
+            f"⚠️  Worker cap {worker_cap} allows only {concurrent_runs} of {parallel_runs} parallel runs",
+            err=True,
+        )
+    return concurrent_runs, worker_cap // concurrent_runs
+
+
+def _enrich_run_in_process(run_id: str, llm_enabled: bool, progress: bool, workers: int) -> None:
+    """Enrich one run for enrich-all; runs in its own process so runs never share an interpreter."""
+    from ..pipeline.steps.enrich.enricher import enrich_from_normalized
+
+    enrich_from_normalized(
+        run_id=run_id,
+        llm_enabled=llm_enabled,
+        max_docs=None,
+        budget=None,
+        progress_callback=(lambda *args: None) if progress else None,
+        emit_event=None,
+        workers=workers,
+    )
+
+
 @app.command("enrich-all")
 def enrich_all(
     pattern: str = typer.Option("2025-08-*", "--pattern", help="Pattern to match run directories"),
@@ -2164,8 +2378,25 @@ def enrich_all(
         "--no-progress",
         help="Disable progress output (default: disabled)",
     ),
+    parallel_runs: int | None = typer.Option(
+        None,
+        "--parallel-runs",
+        help="Runs enriched concurrently (default: ENRICH_PARALLEL_RUNS)",
+    ),
+    max_workers: int | None = typer.Option(
+        None,
+        "--max-workers",
+        help="Worker processes shared by all concurrent runs (default: ENRICH_MAX_WORKERS, else one per run)",
+    ),
 ) -> None:
-    """Enrich all runs that need enrichment in bulk."""
+    """Enrich all runs that need enrichment in bulk.
+
+    With --parallel-runs N, up to N runs are enriched at once, each in its
+    own process, and the --max-workers processes are split evenly between
+    them (default: one per run).
+    """
+    import concurrent.futures
+
     from ..core.artifacts import runs_dir
 
     base_dir = runs_dir()
@@ -2194,32 +2425,36 @@ def enrich_all(
     total_runs = len(runs_to_enrich)
     typer.echo(f"📊 Total runs to enrich: {total_runs}")
 
-    # Process each run
-    counter = 0
-    for run_id in runs_to_enrich:
-        counter += 1
-        typer.echo(f"[{counter}/{total_runs}] ENRICHING: {run_id}")
+    # Global cap: concurrent runs x workers per run never exceeds max_workers
+    concurrent_runs, workers_per_run = _split_worker_cap(
+        parallel_runs if parallel_runs is not None else SETTINGS.ENRICH_PARALLEL_RUNS,
+        max_workers if max_workers is not None else SETTINGS.ENRICH_MAX_WORKERS,
+        total_runs,
+    )
 
-        # Call the existing enrich function directly
-        try:
-            from ..pipeline.steps.enrich.enricher import enrich_from_normalized
+    # Process the runs, up to concurrent_runs at a time
+    counter = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=concurrent_runs) as executor:
+        future_to_run = {}
+        for run_id in runs_to_enrich:
+            typer.echo(f"ENRICHING: {run_id}")
+            future = executor.submit(_enrich_run_in_process, run_id, not no_llm, not no_progress, workers_per_run)
+            future_to_run[future] = run_id
 
-            enrich_from_normalized(
-                run_id=run_id,
-                llm_enabled=not no_llm,
-                max_docs=None,
-                budget=None,
-                progress_callback=None if no_progress else lambda *args: None,
-                emit_event=None,
-            )
+        for future in concurrent.futures.as_completed(future_to_run):
+            run_id = future_to_run[future]
+            counter += 1
+            try:
+                future.result()
+            except Exception as e:
+                typer.echo(f"❌ Failed to enrich {run_id}: {e}", err=True)
+                continue
 
-        except Exception as e:
-            typer.echo(f"❌ Failed to enrich {run_id}: {e}", err=True)
-            continue
+            typer.echo(f"[{counter}/{total_runs}] ENRICHED: {run_id}")
 
-        # Progress update
-        if counter % batch_size == 0:
-            typer.echo(f"📈 Progress: {counter}/{total_runs} runs enriched")
+            # Progress update
+            if counter % batch_size == 0:
+                typer.echo(f"📈 Progress: {counter}/{total_runs} runs enriched")
 
     typer.echo("✅ MASSIVE ENRICHMENT COMPLETE")
     typer.echo(f"📊 All {total_runs} runs have been enriched!")
@@ -2978,6 +3213,7 @@ def embed_corpus_cmd(
 
     from datetime import datetime, timezone
 
+    from ..core.chunk_store import resolve_chunks_file
     from ..core.paths import runs
     from ..pipeline.steps.embed.simple_loader import simple_embed_run
 
@@ -2989,7 +3225,7 @@ def embed_corpus_cmd(
     runs_with_chunks = []
 
     for run_dir in runs_dir.iterdir():
-        if run_dir.is_dir() and (run_dir / "chunk" / "chunks.ndjson").exists():
+        if run_dir.is_dir() and resolve_chunks_file(run_dir / "chunk").exists():
             runs_with_chunks.append(run_dir.name)
 
     runs_with_chunks.sort()
@@ -3308,6 +3544,16 @@ def embed_plan_preflight_cmd(
         "--quality-advisory/--no-quality-advisory",
         help="Quality is advisory only (always True per requirements)",
     ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        help="Runs checked concurrently (default: PREFLIGHT_WORKERS)",
+    ),
+    cache: bool | None = typer.Option(
+        None,
+        "--cache/--no-cache",
+        help="Reuse each run's cached preflight scan while its artifacts are unchanged (default: PREFLIGHT_CACHE)",
+    ),
 ) -> None:
     """
     Run preflight checks for all runs in a plan file.
@@ -3342,6 +3588,8 @@ def embed_plan_preflight_cmd(
             min_embed_docs=min_embed_docs,
             quality_advisory=quality_advisory,
             out_dir=out_dir,
+            workers=workers,
+            use_cache=cache,
         )
 
         # Report results
@@ -3356,6 +3604,7 @@ def embed_plan_preflight_cmd(
             f"📄 Total skipped docs: {result['total_skipped_docs']:,}",
             err=True,
         )
+        typer.echo(f"♻️  Cached runs: {result['cached_runs']}", err=True)
 
         # Find the output directory from the result
         output_dirs = list(Path(out_dir).glob("*"))
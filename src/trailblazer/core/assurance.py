@@ -2,6 +2,7 @@
 
 import json
 from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -74,12 +75,16 @@ class AssuranceReportGenerator:
             log.warning("assurance.main_file_missing", file=str(main_file))
             return
 
-        records = []
+        # Analyze records as they are read rather than holding every page body at once
+        self._analyze_records(self._iter_records(main_file))
+
+    def _iter_records(self, main_file: Path) -> Iterator[dict]:
+        """Records of the main NDJSON file, skipping (and logging) lines that do not parse."""
         try:
             with open(main_file, encoding="utf-8") as f:
                 for line_num, line in enumerate(f, 1):
                     try:
-                        records.append(json.loads(line.strip()))
+                        record = json.loads(line.strip())
                     except json.JSONDecodeError as e:
                         log.warning(
                             "assurance.json_decode_error",
@@ -87,14 +92,12 @@ class AssuranceReportGenerator:
                             line=line_num,
                             error=str(e),
                         )
+                        continue
+                    yield record
         except Exception as e:
             log.error("assurance.read_error", file=str(main_file), error=str(e))
-            return
-
-        # Analyze records
-        self._analyze_records(records)
 
-    def _analyze_records(self, records: list[dict]):
+    def _analyze_records(self, records: Iterable[dict]):
         """Analyze individual records for quality issues."""
         space_stats: dict[str, dict[str, Any]] = defaultdict(
             lambda: {
@@ -107,11 +110,12 @@ class AssuranceReportGenerator:
             }
         )
 
-        total_pages = len(records)
+        total_pages = 0
         total_attachments = 0
         total_chars = 0
 
         for record in records:
+            total_pages += 1
             space_key = record.get("space_key", "unknown")
             page_id = record.get("id") or record.get("page_id", "unknown")
             title = record.get("title", "")
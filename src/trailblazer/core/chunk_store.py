@@ -0,0 +1,274 @@
+"""Chunk artifact storage with an optional compressed layout and a per-document offset index.
+
+Two on-disk layouts are supported under ``runs/<RID>/chunk/``:
+
+- ``chunks.ndjson`` (default): one full chunk record per line.
+- ``chunks.ndjson.gz``: one gzip member per document. The first line of each
+  member carries the document-level traceability fields present on the first
+  chunk once, with that chunk's key order; the following lines carry only
+  chunk-level fields (plus their own key order when it differs). Readers
+  restore records equal to the plain layout's, key order included.
+  Concatenated members are still a valid gzip stream, so ``zcat`` and
+  ``gzip.open`` read the whole file.
+
+Both layouts write ``chunks.index.ndjson`` mapping each ``doc_id`` to the byte
+range of its chunks so readers can seek straight to a document instead of
+scanning the whole file.
+
+This module lives in ``core`` rather than the chunk package so the embed step
+can read chunk artifacts without importing the chunking engine.
+"""
+
+import gzip
+import json
+from collections.abc import Generator, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+CHUNKS_FILE = "chunks.ndjson"
+CHUNKS_GZ_FILE = "chunks.ndjson.gz"
+CHUNKS_INDEX_FILE = "chunks.index.ndjson"
+
+# Fields identical for every chunk of a document; stored once per doc when compressed
+DOC_FIELDS = ("doc_id", "title", "url", "source_system", "labels", "space", "media_refs")
+
+_DOC_HEADER_KEY = "_doc"
+_KEYS_KEY = "_keys"
+
+
+class ChunkWriter:
+    """Write chunks one document at a time, recording each document's byte range."""
+
+    def __init__(self, chunk_dir: Path, compress: bool = False, compresslevel: int = 6):
+        self.chunk_dir = Path(chunk_dir)
+        self.compress = compress
+        self.compresslevel = compresslevel
+        self.path = self.chunk_dir / (CHUNKS_GZ_FILE if compress else CHUNKS_FILE)
+        self.index_path = self.chunk_dir / CHUNKS_INDEX_FILE
+        self.docs_written = 0
+        self.chunks_written = 0
+        self._offset = 0
+
+        self.chunk_dir.mkdir(parents=True, exist_ok=True)
+        # Remove the other layout so readers never pick up a stale artifact
+        stale = self.chunk_dir / (CHUNKS_FILE if compress else CHUNKS_GZ_FILE)
+        if stale.exists():
+            stale.unlink()
+
+        self._fh = open(self.path, "wb")
+        self._index_fh = open(self.index_path, "w", encoding="utf-8")
+
+    def write_doc(self, doc_id: str, chunks: list[dict[str, Any]]) -> None:
+        """Write all chunks of one document as a contiguous byte range."""
+        if not chunks:
+            return
+
+        if self.compress:
+            header = {field: chunks[0][field] for field in DOC_FIELDS if field in chunks[0]}
+            keys = list(chunks[0])
+            lines = [json.dumps({_DOC_HEADER_KEY: header, _KEYS_KEY: keys})]
+            for chunk in chunks:
+                # Keep a doc-level field on the chunk only if it differs from the header
+                slim = {k: v for k, v in chunk.items() if not (k in header and v == header[k])}
+                if list(_restore(header, keys, slim)) != list(chunk):
+                    # Other keys or order than the first chunk: record this chunk's own
+                    slim[_KEYS_KEY] = list(chunk)
+                lines.append(json.dumps(slim))
+            payload = gzip.compress(
+                ("\n".join(lines) + "\n").encode("utf-8"),
+                compresslevel=self.compresslevel,
+                mtime=0,
+            )
+        else:
+            payload = "".join(json.dumps(chunk) + "\n" for chunk in chunks).encode("utf-8")
+
+        self._fh.write(payload)
+        self._index_fh.write(
+            json.dumps(
+                {
+                    "doc_id": doc_id,
+                    "offset": self._offset,
+                    "length": len(payload),
+                    "chunks": len(chunks),
+                }
+            )
+            + "\n"
+        )
+        self._offset += len(payload)
+        self.docs_written += 1
+        self.chunks_written += len(chunks)
+
+    def close(self) -> None:
+        self._fh.close()
+        self._index_fh.close()
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def resolve_chunks_file(chunk_dir: Path) -> Path:
+    """Return the chunks artifact in ``chunk_dir``, preferring plain NDJSON.
+
+    If neither layout exists, the plain ``chunks.ndjson`` path is returned so
+    callers can report it as missing.
+    """
+    chunk_dir = Path(chunk_dir)
+    plain = chunk_dir / CHUNKS_FILE
+    if plain.exists():
+        return plain
+    compressed = chunk_dir / CHUNKS_GZ_FILE
+    if compressed.exists():
+        return compressed
+    return plain
+
+
+def is_compressed(path: Path) -> bool:
+    return Path(path).name.endswith(".gz")
+
+
+def _load_index_entries(chunks_path: Path) -> list[dict[str, Any]]:
+    """Load index entries for ``chunks_path`` in file order, or [] if missing or stale."""
+    chunks_path = Path(chunks_path)
+    index_path = chunks_path.parent / CHUNKS_INDEX_FILE
+    if not index_path.exists() or not chunks_path.exists():
+        return []
+
+    entries: list[dict[str, Any]] = []
+    expected_offset = 0
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                # Entries must tile the chunks file exactly, in order
+                if entry["offset"] != expected_offset or not isinstance(entry["chunks"], int):
+                    return []
+                expected_offset += entry["length"]
+                entries.append(entry)
+    except (OSError, ValueError, KeyError):
+        return []
+
+    if expected_offset != chunks_path.stat().st_size:
+        return []
+    return entries
+
+
+def load_chunk_index(chunk_dir: Path, chunks_path: Path | None = None) -> dict[str, dict[str, Any]]:
+    """Load the doc_id -> {offset, length, chunks} index for a chunk directory.
+
+    ``chunks_path`` defaults to the artifact picked by ``resolve_chunks_file``.
+    Returns an empty dict if the index is missing or does not cover that file
+    byte-for-byte (e.g. the file was rewritten by an older writer).
+    """
+    chunks_path = Path(chunks_path) if chunks_path else resolve_chunks_file(chunk_dir)
+    return {entry["doc_id"]: entry for entry in _load_index_entries(chunks_path)}
+
+
+def _decode_doc_payload(payload: bytes, compressed: bool) -> list[dict[str, Any]]:
+    if not compressed:
+        return [json.loads(line) for line in payload.decode("utf-8").splitlines() if line.strip()]
+    return list(_iter_compressed_lines(gzip.decompress(payload).decode("utf-8").splitlines()))
+
+
+def _restore(header: dict[str, Any], keys: list[str] | None, record: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild a full chunk record from its slimmed line and the document header."""
+    keys = record.pop(_KEYS_KEY, keys)
+    if keys is None:
+        return {**header, **record}
+    restored = {k: record[k] if k in record else header[k] for k in keys if k in record or k in header}
+    restored.update(record)
+    return restored
+
+
+def _iter_compressed_lines(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    header: dict[str, Any] = {}
+    keys: list[str] | None = None
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if _DOC_HEADER_KEY in record:
+            header = record[_DOC_HEADER_KEY]
+            keys = record.get(_KEYS_KEY)
+            continue
+        yield _restore(header, keys, record)
+
+
+def read_doc_chunks(chunks_path: Path, entry: dict[str, Any]) -> list[dict[str, Any]]:
+    """Read one document's chunks by seeking to its indexed byte range."""
+    with open(chunks_path, "rb") as f:
+        f.seek(entry["offset"])
+        payload = f.read(entry["length"])
+    return _decode_doc_payload(payload, is_compressed(chunks_path))
+
+
+def iter_chunks(chunks_path: Path) -> Iterator[dict[str, Any]]:
+    """Yield full chunk records from either layout in file order."""
+    chunks_path = Path(chunks_path)
+    if is_compressed(chunks_path):
+        with gzip.open(chunks_path, "rt", encoding="utf-8") as f:
+            yield from _iter_compressed_lines(f)
+        return
+
+    with open(chunks_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_chunk_lines(chunks_path: Path, skip_doc_ids: set[str] | None = None) -> Generator[str, None, None]:
+    """Yield one JSON line per chunk, without its line terminator, skipping whole documents via the index.
+
+    Plain files yield their lines as stored so callers can report per-line
+    decode errors. When ``skip_doc_ids`` is given and a valid index exists,
+    skipped documents are never read from disk; otherwise every line is
+    yielded and filtering is left to the caller.
+    """
+    for _, line in iter_numbered_chunk_lines(chunks_path, skip_doc_ids):
+        yield line
+
+
+def iter_numbered_chunk_lines(
+    chunks_path: Path, skip_doc_ids: set[str] | None = None
+) -> Generator[tuple[int, str], None, None]:
+    """Like ``iter_chunk_lines``, but each line comes with its 1-based line number.
+
+    Numbers count the lines of skipped documents too (from the index), so they
+    match the file however many documents are skipped. For the compressed
+    layout a line number is the chunk's position, as in the plain layout.
+    """
+    chunks_path = Path(chunks_path)
+    compressed = is_compressed(chunks_path)
+    entries = _load_index_entries(chunks_path) if skip_doc_ids else []
+
+    if skip_doc_ids and entries:
+        line_num = 0
+        with open(chunks_path, "rb") as f:
+            for entry in entries:
+                if entry["doc_id"] in skip_doc_ids:
+                    line_num += entry["chunks"]
+                    continue
+                f.seek(entry["offset"])
+                payload = f.read(entry["length"])
+                if compressed:
+                    for record in _decode_doc_payload(payload, compressed=True):
+                        line_num += 1
+                        yield line_num, json.dumps(record)
+                else:
+                    for line in payload.decode("utf-8").splitlines():
+                        line_num += 1
+                        yield line_num, line
+        return
+
+    if compressed:
+        for line_num, record in enumerate(iter_chunks(chunks_path), 1):
+            yield line_num, json.dumps(record)
+        return
+
+    with open(chunks_path, encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            yield line_num, line.rstrip("\r\n")
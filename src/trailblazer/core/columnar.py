@@ -0,0 +1,200 @@
+"""Optional Parquet copies of row-oriented phase artifacts.
+
+NDJSON stays the artifact of record for every phase. With
+``ARTIFACTS_PARQUET`` on (and ``pyarrow`` installed, ``pip install .[parquet]``)
+normalize, enrich and chunk also write the scalar fields of each record to a
+Parquet file next to it:
+
+- ``normalize/normalized.parquet`` beside ``normalized.ndjson``
+- ``enrich/enriched.parquet`` beside ``enriched.jsonl``
+- ``chunk/chunks.parquet`` beside ``chunks.ndjson`` / ``chunks.ndjson.gz``
+
+Quality, assurance and preflight passes that need one or two fields read just
+those columns (and row counts from the Parquet footer) instead of parsing
+every line, and fall back to the NDJSON when the copy or ``pyarrow`` is
+missing. Each writer removes an earlier copy first, so a run with the option
+off never leaves a stale Parquet file behind.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, cast
+
+from .chunk_store import CHUNKS_FILE, CHUNKS_GZ_FILE
+from .config import SETTINGS
+from .logging import log
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+NORMALIZED_PARQUET_FILE = "normalized.parquet"
+ENRICHED_PARQUET_FILE = "enriched.parquet"
+CHUNKS_PARQUET_FILE = "chunks.parquet"
+
+# Parquet copy written next to each row-oriented artifact
+PARQUET_COPIES = {
+    "normalized.ndjson": NORMALIZED_PARQUET_FILE,
+    "enriched.jsonl": ENRICHED_PARQUET_FILE,
+    CHUNKS_FILE: CHUNKS_PARQUET_FILE,
+    CHUNKS_GZ_FILE: CHUNKS_PARQUET_FILE,
+}
+
+# Columns copied from each artifact's records (field -> type); missing or mistyped values become null
+NORMALIZED_COLUMNS = {
+    "id": "string",
+    "title": "string",
+    "space_key": "string",
+    "url": "string",
+    "source_system": "string",
+    "body_repr": "string",
+    "content_sha256": "string",
+    "updated_at": "string",
+}
+ENRICHED_COLUMNS = {
+    "id": "string",
+    "title": "string",
+    "space_key": "string",
+    "source_system": "string",
+    "collection": "string",
+    "quality_score": "float",
+    "media_density": "float",
+    "link_density": "float",
+    "quality_flags": "strings",
+}
+CHUNK_COLUMNS = {
+    "chunk_id": "string",
+    "doc_id": "string",
+    "ord": "int",
+    "token_count": "int",
+    "char_count": "int",
+    "chunk_type": "string",
+    "split_strategy": "string",
+    "source_system": "string",
+}
+
+# Records buffered per Parquet row group
+ROW_GROUP_ROWS = 10_000
+
+
+def parquet_copy(artifact: Path) -> Path | None:
+    """Where the Parquet copy of an NDJSON artifact lives (None for artifacts without one)."""
+    name = PARQUET_COPIES.get(Path(artifact).name)
+    return Path(artifact).with_name(name) if name else None
+
+
+def _coerce(kind: str, value: Any) -> Any:
+    if kind == "string":
+        return value if isinstance(value, str) else None
+    if kind == "strings":
+        return [item for item in value if isinstance(item, str)] if isinstance(value, list) else None
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return float(value) if kind == "float" else int(value)
+
+
+class ColumnarWriter:
+    """Write selected fields of each record to a Parquet file, one row group per ``ROW_GROUP_ROWS`` records.
+
+    The file is written under a temporary name and renamed on a clean close,
+    so readers never see a partial copy.
+    """
+
+    def __init__(self, path: Path, columns: dict[str, str]):
+        if pa is None:
+            raise RuntimeError("Parquet artifacts need pyarrow: pip install .[parquet]")
+        types = {"string": pa.string(), "strings": pa.list_(pa.string()), "int": pa.int64(), "float": pa.float64()}
+        self.path = Path(path)
+        self.columns = columns
+        self.schema = pa.schema([(name, types[kind]) for name, kind in columns.items()])
+        self.rows_written = 0
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._rows: dict[str, list[Any]] = {name: [] for name in columns}
+        self._writer = pq.ParquetWriter(self._tmp_path, self.schema, compression="zstd")
+
+    def write(self, record: dict[str, Any]) -> None:
+        for name, kind in self.columns.items():
+            self._rows[name].append(_coerce(kind, record.get(name)))
+        if len(self._rows[next(iter(self.columns))]) >= ROW_GROUP_ROWS:
+            self._flush()
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        """Write records given as NDJSON lines (blank lines are skipped)."""
+        for line in lines:
+            if line.strip():
+                self.write(json.loads(line))
+
+    def _flush(self) -> None:
+        count = len(self._rows[next(iter(self.columns))])
+        if count:
+            self._writer.write_table(pa.Table.from_pydict(self._rows, schema=self.schema))
+            self.rows_written += count
+            self._rows = {name: [] for name in self.columns}
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+        self._tmp_path.replace(self.path)
+
+    def abort(self) -> None:
+        self._writer.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def open_columnar(artifact: Path, columns: dict[str, str], enabled: bool | None = None) -> ColumnarWriter | None:
+    """A writer for the Parquet copy of ``artifact`` when enabled, after removing any earlier copy.
+
+    Args:
+        artifact: The NDJSON artifact being written
+        columns: Fields to copy and their types
+        enabled: Write the copy (default: ARTIFACTS_PARQUET)
+    """
+    path = parquet_copy(artifact)
+    if path is None:
+        raise ValueError(f"No Parquet copy defined for {artifact}")
+    path.unlink(missing_ok=True)
+
+    if not (SETTINGS.ARTIFACTS_PARQUET if enabled is None else enabled):
+        return None
+    if pa is None:
+        log.warning("columnar.pyarrow_missing", artifact=str(artifact))
+        return None
+    return ColumnarWriter(path, columns)
+
+
+def read_columns(artifact: Path, columns: list[str]) -> dict[str, list[Any]] | None:
+    """Just ``columns`` of ``artifact``'s Parquet copy, or None when there is no usable copy."""
+    path = parquet_copy(artifact)
+    if pq is None or path is None or not path.exists():
+        return None
+    return cast(dict[str, list[Any]], pq.read_table(path, columns=columns).to_pydict())
+
+
+def iter_column_batches(artifact: Path, columns: list[str]) -> Iterator[dict[str, list[Any]]] | None:
+    """``columns`` of ``artifact``'s Parquet copy one row group at a time, or None when there is no usable copy."""
+    path = parquet_copy(artifact)
+    if pq is None or path is None or not path.exists():
+        return None
+    batches = pq.ParquetFile(path).iter_batches(batch_size=ROW_GROUP_ROWS, columns=columns)
+    return (batch.to_pydict() for batch in batches)
+
+
+def count_rows(artifact: Path) -> int | None:
+    """Records in ``artifact`` from its Parquet footer, or None when there is no usable copy."""
+    path = parquet_copy(artifact)
+    if pq is None or path is None or not path.exists():
+        return None
+    return cast(int, pq.ParquetFile(path).metadata.num_rows)
@@ -16,15 +16,41 @@ class Settings(BaseSettings):
     CONFLUENCE_AUTO_SINCE: bool = True  # Auto-read since from state
     CONFLUENCE_MAX_PAGES: int | None = None  # Limit for testing
     CONFLUENCE_ALLOW_EMPTY: bool = False  # Allow zero pages without error
+    CONFLUENCE_FETCH_WORKERS: int = 8  # Concurrent per-page fetches (labels/ancestors/attachments)
+    CONFLUENCE_PREFETCH_PAGES: int = 32  # Pages fetched ahead of the one being written
+    CONFLUENCE_BULK_METADATA: bool = True  # Harvest labels/ancestors via CQL expand, not per page
+    CONFLUENCE_RATE_LIMIT_RPS: float = 10.0  # Process-wide request rate (0 disables the limiter)
+    CONFLUENCE_RATE_LIMIT_BURST: int = 20  # Token-bucket capacity
+    CONFLUENCE_MAX_429_RETRIES: int = 5  # Retries per request honoring Retry-After
+    CONFLUENCE_PARALLEL_SPACES: int = 1  # Spaces ingested concurrently by ingest-all
+    CONFLUENCE_DELTA: bool = False  # Carry unchanged page versions forward instead of refetching bodies
+    # Delta lists a space without bodies only if this share of its stored pages can still be carried
+    CONFLUENCE_DELTA_MIN_CARRYABLE: float = 0.5
+    CONFLUENCE_TIMEOUT: float = 30.0  # Per-request timeout (seconds)
+    CONFLUENCE_HTTP2: bool = True  # Use HTTP/2 when the optional h2 package is installed
+    CONFLUENCE_MAX_CONNECTIONS: int = 20  # Connection pool size
+    CONFLUENCE_MAX_KEEPALIVE_CONNECTIONS: int = 10  # Idle connections kept open
+    CONFLUENCE_KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle connection is kept
+    CONFLUENCE_ACCEPT_ENCODING: str = "br, gzip"  # Response compression (br needs brotli installed)
 
     # DITA configuration
     DITA_ROOT: str = "data/raw/dita/ellucian-documentation"
     DITA_INCLUDE: list[str] = []  # Default: **/*.dita, **/*.xml, **/*.ditamap
     DITA_EXCLUDE: list[str] = []  # Exclude patterns
+    DITA_WORKERS: int = 1  # Processes parsing/hashing DITA files (1 = in-process)
+    DITA_INCREMENTAL: bool = False  # Reuse parsed files unchanged since the last run (var/state/dita manifest)
+
+    # Normalize configuration
+    NORMALIZE_WORKERS: int = 1  # Processes converting records per run (1 = in-process)
+    NORMALIZE_PARALLEL_RUNS: int = 1  # Runs normalized concurrently by normalize-all
+    NORMALIZE_MAX_WORKERS: int | None = None  # Worker processes normalize-all splits across runs (None = one per run)
+    NORMALIZE_CACHE: bool = True  # Reuse bodies normalized by earlier runs (var/cache/normalize)
+    NORMALIZE_CACHE_MAX_MB: int = 1024  # LRU size budget of the normalize cache
 
     # Pipeline configuration
     PIPELINE_PHASES: list[str] = ["ingest", "normalize", "enrich", "embed"]
     PIPELINE_WORKERS: int = 2  # Default concurrency
+    ARTIFACTS_PARQUET: bool = False  # Also write Parquet copies of normalized/enriched/chunk artifacts (needs pyarrow)
 
     # Database (required for embed/ask)
     TRAILBLAZER_DB_URL: str | None = None
@@ -38,6 +64,8 @@ class Settings(BaseSettings):
     EMBED_MAX_DOCS: int | None = None  # Limit for testing
     EMBED_MAX_CHUNKS: int | None = None  # Limit for testing
     EMBED_DRY_RUN_COST: bool = False  # Show cost estimates
+    PREFLIGHT_WORKERS: int = 1  # Runs checked concurrently by embed plan-preflight
+    PREFLIGHT_CACHE: bool = True  # Reuse a run's preflight scan while its artifacts keep their size and mtime
     OPENAI_API_KEY: str | None = None
 
     # Retrieval/Ask configuration
@@ -50,6 +78,9 @@ class Settings(BaseSettings):
     ENRICH_LLM: bool = False  # Enable LLM-based enrichment
     ENRICH_MAX_DOCS: int | None = None  # Limit for testing
     ENRICH_BUDGET: str | None = None  # Budget limit for LLM usage
+    ENRICH_WORKERS: int = 1  # Processes enriching documents per run (1 = in-process)
+    ENRICH_PARALLEL_RUNS: int = 1  # Runs enriched concurrently by enrich-all
+    ENRICH_MAX_WORKERS: int | None = None  # Worker processes enrich-all splits across its runs (None = one per run)
 
     # Chunking configuration (v2.2 bottom-end controls)
     CHUNK_SOFT_MIN_TOKENS: int = 200  # Target minimum after glue
@@ -58,6 +89,7 @@ class Settings(BaseSettings):
     CHUNK_OVERLAP_TOKENS: int = 60  # Overlap tokens when splitting
     CHUNK_ORPHAN_HEADING_MERGE: bool = True  # Merge orphan headings
     CHUNK_SMALL_TAIL_MERGE: bool = True  # Merge small tail chunks
+    CHUNK_COMPRESS: bool = False  # Write gzip-framed chunks.ndjson.gz instead of chunks.ndjson
 
     # Workspace paths
     TRAILBLAZER_DATA_DIR: str = "data"  # Human-managed inputs
@@ -11,19 +11,19 @@ from ..core.logging import log
 class EventLogger:
     """NDJSON event logger for structured observability."""
 
-    def __init__(self, log_path: str | Path, run_id: str):
+    def __init__(self, log_path: str | Path, run_id: str, append: bool = False):
         """Initialize event logger.
 
         Args:
             log_path: Path to write NDJSON events (e.g., var/logs/<run_id>.ndjson)
             run_id: Run identifier for all events
+            append: Keep existing events (resumed runs) instead of truncating
         """
         self.log_path = Path(log_path)
         self.run_id = run_id
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Open file in append mode for continuous writing
-        self._file = open(self.log_path, "w", encoding="utf-8")
+        self._file = open(self.log_path, "a" if append else "w", encoding="utf-8")
 
         # Track metrics for rollup
         self.metrics = {
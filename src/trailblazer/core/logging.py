@@ -43,7 +43,9 @@ def setup_logging(format_type: LogFormat = "auto") -> None:
 
     structlog.configure(
         processors=processors,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+        # No explicit file: print to sys.stdout as it is at each call, not at configure
+        # time, so cached loggers survive stdout being swapped (e.g. by CliRunner)
+        logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
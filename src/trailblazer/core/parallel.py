@@ -0,0 +1,65 @@
+"""Order-preserving fan-out over a thread or process pool.
+
+Phases that spread work over a pool still write their artifacts in input
+order, so the output of N workers is byte-identical to that of one. The
+helpers here submit work while keeping at most ``window`` items in flight
+(bounding memory however long the input is) and yield results in
+submission order, whichever finishes first.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from typing import TypeVar
+
+_T = TypeVar("_T")
+_A = TypeVar("_A")
+_R = TypeVar("_R")
+
+
+def iter_line_chunks(lines: Iterable[str], size: int, limit: int | None = None) -> Iterator[list[str]]:
+    """Non-blank ``lines`` (at most ``limit``) in chunks of ``size``."""
+    chunk: list[str] = []
+    taken = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        if limit and taken >= limit:
+            break
+        chunk.append(line)
+        taken += 1
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def ordered_map_tagged(
+    pool: Executor, fn: Callable[[_A], _R], items: Iterable[tuple[_T, _A]], window: int
+) -> Iterator[tuple[_T, _R]]:
+    """Each ``(tag, arg)`` item's tag with ``fn(arg)`` run on ``pool``, in submission order.
+
+    Only ``arg`` is sent to the pool; tags stay with the caller. At most
+    ``window`` items are in flight, and queued work is cancelled when the
+    consumer stops early.
+    """
+    pending: deque[tuple[_T, Future[_R]]] = deque()
+    try:
+        for tag, arg in items:
+            pending.append((tag, pool.submit(fn, arg)))
+            if len(pending) >= window:
+                done_tag, future = pending.popleft()
+                yield done_tag, future.result()
+        while pending:
+            done_tag, future = pending.popleft()
+            yield done_tag, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def ordered_map(pool: Executor, fn: Callable[[_A], _R], items: Iterable[_A], window: int) -> Iterator[_R]:
+    """``fn(item)`` for each of ``items``, run on ``pool`` and yielded in input order."""
+    for _, result in ordered_map_tagged(pool, fn, ((None, item) for item in items), window):
+        yield result
@@ -2,7 +2,10 @@
 
 import os
 import sys
+import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, TextIO
 
@@ -82,6 +85,10 @@ class ProgressRenderer:
         # Live display
         self.live_display: Live | None = None
 
+        # Per-space throughput for concurrent multi-space ingests
+        self.space_throughput: dict[str, dict[str, Any]] = {}
+        self._throughput_lock = threading.Lock()
+
         # Heartbeat interval (30 seconds)
         self.heartbeat_interval = 30.0
 
@@ -331,6 +338,69 @@ class ProgressRenderer:
         self.console.print(table)
         self.console.print()
 
+    def _space_row(self, space_key: str) -> dict[str, Any]:
+        row = self.space_throughput.get(space_key)
+        if row is None:
+            row = {"status": "running", "pages": 0, "attachments": 0, "started": time.time(), "finished": None}
+            self.space_throughput[space_key] = row
+        return row
+
+    def space_started(self, space_key: str):
+        """Register a space in the live throughput table."""
+        with self._throughput_lock:
+            self._space_row(space_key).update(status="running", started=time.time(), finished=None)
+
+    def space_finished(self, space_key: str, status: str = "done"):
+        """Mark a space finished (``done`` or ``failed``) in the live throughput table."""
+        with self._throughput_lock:
+            self._space_row(space_key).update(status=status, finished=time.time())
+
+    def throughput_table(self) -> Table:
+        """Build the per-space throughput table shown during concurrent ingests."""
+        table = Table(title="⚡ Space Throughput", show_header=True, header_style="bold blue")
+        table.add_column("Space", style="cyan", width=12)
+        table.add_column("Status", width=8)
+        table.add_column("Pages", justify="right", style="green")
+        table.add_column("Attachments", justify="right", style="blue")
+        table.add_column("Pages/s", justify="right", style="magenta")
+        table.add_column("Elapsed", justify="right", style="yellow")
+
+        now = time.time()
+        status_style = {"running": "yellow", "done": "green", "failed": "red"}
+        with self._throughput_lock:
+            rows = sorted(self.space_throughput.items())
+            for space_key, row in rows:
+                elapsed = (row["finished"] or now) - row["started"]
+                rate = row["pages"] / elapsed if elapsed > 0 else 0
+                style = status_style.get(row["status"], "white")
+                table.add_row(
+                    space_key,
+                    f"[{style}]{row['status']}[/{style}]",
+                    str(row["pages"]),
+                    str(row["attachments"]),
+                    f"{rate:.1f}",
+                    f"{elapsed:.0f}s",
+                )
+        return table
+
+    @contextmanager
+    def live_throughput(self, refresh_per_second: float = 2.0) -> Iterator[None]:
+        """Show a live per-space throughput table; per-page lines are suppressed meanwhile."""
+        if not self.enabled:
+            yield
+            return
+
+        with Live(
+            get_renderable=self.throughput_table,
+            console=self.console,
+            refresh_per_second=refresh_per_second,
+        ) as live:
+            self.live_display = live
+            try:
+                yield
+            finally:
+                self.live_display = None
+
     def progress_update(
         self,
         space_key: str,
@@ -342,6 +412,11 @@ class ProgressRenderer:
         _content_bytes: int | None = None,
     ):
         """Show enhanced progress update for a page with Rich formatting."""
+        with self._throughput_lock:
+            row = self._space_row(space_key)
+            row["pages"] += 1
+            row["attachments"] += attachments
+
         if not self.enabled:
             return
 
@@ -349,8 +424,8 @@ class ProgressRenderer:
         self.attachment_count += attachments
         self.current_space = space_key
 
-        # Throttle updates
-        if self.page_count % throttle_every != 0:
+        # Throttle updates; the live throughput table replaces per-page lines
+        if self.page_count % throttle_every != 0 or self.live_display is not None:
             return
 
         current_time = time.time()
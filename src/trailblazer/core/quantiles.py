@@ -0,0 +1,108 @@
+"""Quantiles of a stream of numbers in bounded memory.
+
+``StreamingQuantiles`` keeps the values themselves while there are at most
+``EXACT_MAX_VALUES`` of them, so small inputs get exact quantiles, and
+feeds every value to one P² estimator (Jain & Chlamtac, 1985) per tracked
+quantile. Each estimator keeps five markers whose heights are adjusted with
+piecewise-parabolic interpolation as values arrive, so memory stays
+constant however long the stream is.
+"""
+
+from bisect import bisect_right, insort
+from collections.abc import Iterable
+
+# Values kept verbatim (for exact quantiles) before relying on the P² estimates
+EXACT_MAX_VALUES = 10_000
+
+
+class P2Quantile:
+    """P² estimate of the ``p`` quantile of the values added so far."""
+
+    def __init__(self, p: float):
+        if not 0 < p < 1:
+            raise ValueError(f"Quantile must be between 0 and 1: {p}")
+        self.p = p
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        heights = self._heights
+        if len(heights) < 5:
+            insort(heights, value)
+            return
+
+        # Cell the value falls in, stretching the extreme markers if needed
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect_right(heights, value) - 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the middle markers one step towards their desired positions
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> float | None:
+        """The current estimate (None before any value was added)."""
+        if not self._heights:
+            return None
+        if self.count < 5:
+            # Too few values for the markers: nearest rank of the sorted values
+            return self._heights[min(len(self._heights) - 1, int(self.p * len(self._heights)))]
+        return self._heights[2]
+
+
+class StreamingQuantiles:
+    """Exact values while few, P² estimates of the given quantiles beyond that."""
+
+    def __init__(self, quantiles: Iterable[float]):
+        self.count = 0
+        self._estimators = {p: P2Quantile(p) for p in quantiles}
+        self._values: list[float] | None = []
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        for estimator in self._estimators.values():
+            estimator.add(value)
+        if self._values is not None:
+            if len(self._values) < EXACT_MAX_VALUES:
+                self._values.append(value)
+            else:
+                self._values = None
+
+    def values(self) -> list[float] | None:
+        """All values added, while no more than ``EXACT_MAX_VALUES`` were."""
+        return self._values
+
+    def estimate(self, p: float) -> float | None:
+        """P² estimate of a tracked quantile."""
+        return self._estimators[p].value()
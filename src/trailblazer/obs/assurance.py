@@ -2,17 +2,29 @@
 
 import json
 from collections import Counter
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from sqlalchemy import text
 
+from ..core.columnar import count_rows, read_columns
+
 
 class QualityGateError(Exception):
     """Raised when quality gates fail."""
 
 
+def _count_records(path: Path) -> int:
+    """Records in an artifact, from its Parquet footer when there is a copy, else its line count."""
+    rows = count_rows(path)
+    if rows is not None:
+        return rows
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for _ in f)
+
+
 class PhaseAssurance:
     """Base class for phase-specific assurance checks."""
 
@@ -172,8 +184,8 @@ class EnrichAssurance(PhaseAssurance):
             return
 
         # Count inputs and outputs
-        input_count = sum(1 for _ in open(input_file))
-        output_count = sum(1 for _ in open(output_file))
+        input_count = _count_records(input_file)
+        output_count = _count_records(output_file)
 
         self.metrics.update(
             {
@@ -195,7 +207,7 @@ class EnrichAssurance(PhaseAssurance):
 
         # Check fingerprints
         if fingerprints_file.exists():
-            fingerprint_count = sum(1 for _ in open(fingerprints_file))
+            fingerprint_count = _count_records(fingerprints_file)
             self.metrics["fingerprints_generated"] = fingerprint_count
 
             if fingerprint_count != output_count:
@@ -243,22 +255,16 @@ class ChunkAssurance(PhaseAssurance):
         orphan_chunks = []
         token_counts = []
 
-        with open(output_file, encoding="utf-8") as f:
-            for line in f:
-                chunk = json.loads(line.strip())
-                doc_id = chunk.get("document_id")
-                chunk_id = chunk.get("chunk_id")
-                tokens = chunk.get("token_count", 0)
-
-                if not doc_id:
-                    orphan_chunks.append(chunk_id or "unknown")
-                else:
-                    if doc_id not in doc_chunks:
-                        doc_chunks[doc_id] = 0
-                    doc_chunks[doc_id] += 1
+        for doc_id, chunk_id, tokens in self._chunk_fields(output_file):
+            if not doc_id:
+                orphan_chunks.append(chunk_id or "unknown")
+            else:
+                if doc_id not in doc_chunks:
+                    doc_chunks[doc_id] = 0
+                doc_chunks[doc_id] += 1
 
-                if tokens > 0:
-                    token_counts.append(tokens)
+            if tokens and tokens > 0:
+                token_counts.append(tokens)
 
         total_chunks = len(doc_chunks) + len(orphan_chunks)
         avg_chunks_per_doc = sum(doc_chunks.values()) / len(doc_chunks) if doc_chunks else 0
@@ -293,6 +299,19 @@ class ChunkAssurance(PhaseAssurance):
                     f"Found {len(outliers)} chunks with >10x average tokens ({outlier_threshold:.0f})",
                 )
 
+    @staticmethod
+    def _chunk_fields(output_file: Path) -> Iterator[tuple[Any, Any, Any]]:
+        """(doc_id, chunk_id, token_count) of each chunk, projected from the Parquet copy when there is one."""
+        columns = read_columns(output_file, ["doc_id", "chunk_id", "token_count"])
+        if columns is not None:
+            yield from zip(columns["doc_id"], columns["chunk_id"], columns["token_count"], strict=True)
+            return
+
+        with open(output_file, encoding="utf-8") as f:
+            for line in f:
+                chunk = json.loads(line.strip())
+                yield chunk.get("doc_id", chunk.get("document_id")), chunk.get("chunk_id"), chunk.get("token_count", 0)
+
     def check_quality_gates(self) -> bool:
         """Check chunking quality gates."""
         # Gate: No orphan chunks
@@ -7,6 +7,7 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from ..core.chunk_store import load_chunk_index, read_doc_chunks, resolve_chunks_file
 from ..core.logging import log
 
 
@@ -153,6 +154,66 @@ class DataIntegrityChecker:
 
         return results
 
+    def validate_chunk_sampling(self, sample_size: int = 10) -> dict[str, Any]:
+        """Sample documents from the chunk artifact via its doc_id offset index."""
+        results: dict[str, Any] = {
+            "indexed_docs": 0,
+            "sampled_docs": 0,
+            "sampled_chunks": 0,
+            "count_mismatches": 0,
+            "missing_traceability": 0,
+        }
+
+        chunks_file = resolve_chunks_file(self.run_dir / "chunk")
+        if not chunks_file.exists():
+            return results
+
+        index = load_chunk_index(chunks_file.parent, chunks_file)
+        if not index:
+            self.add_issue(
+                "chunk_index_missing",
+                f"No valid chunk index for {chunks_file.name}; chunk sampling skipped",
+                severity="warning",
+            )
+            return results
+
+        # Evenly spaced documents, read by seeking instead of scanning the file
+        doc_ids = list(index)
+        results["indexed_docs"] = len(doc_ids)
+        step = max(1, len(doc_ids) // sample_size)
+        for doc_id in doc_ids[::step][:sample_size]:
+            entry = index[doc_id]
+            try:
+                chunks = read_doc_chunks(chunks_file, entry)
+            except (OSError, ValueError) as e:
+                self.add_issue("chunk_read_error", f"Failed to read chunks for {doc_id}: {e}", doc_id=doc_id)
+                continue
+
+            results["sampled_docs"] += 1
+            results["sampled_chunks"] += len(chunks)
+
+            if len(chunks) != entry["chunks"] or any(c.get("doc_id") != doc_id for c in chunks):
+                results["count_mismatches"] += 1
+                self.add_issue(
+                    "chunk_index_mismatch",
+                    f"Chunk index entry for {doc_id} does not match the chunks on disk",
+                    doc_id=doc_id,
+                    indexed=entry["chunks"],
+                    found=len(chunks),
+                )
+
+            for chunk in chunks:
+                if not chunk.get("source_system") or not (chunk.get("title") or chunk.get("url")):
+                    results["missing_traceability"] += 1
+                    self.add_issue(
+                        "chunk_missing_traceability",
+                        f"Chunk {chunk.get('chunk_id', '')} is missing traceability fields",
+                        severity="warning",
+                        chunk_id=chunk.get("chunk_id", ""),
+                    )
+
+        return results
+
     def validate_json_schemas(self) -> dict[str, Any]:
         """Validate JSON structure against schemas."""
         results = {
@@ -300,6 +361,7 @@ class DataIntegrityChecker:
 
         # Run all checks
         traceability_results = self.validate_traceability_chain(sample_size)
+        chunk_results = self.validate_chunk_sampling(sample_size)
         schema_results = self.validate_json_schemas()
         format_results = self.check_format_compliance()
         sampling_results = self.create_sample_artifacts()
@@ -313,6 +375,7 @@ class DataIntegrityChecker:
             ),
             "checks": {
                 "traceability": traceability_results,
+                "chunks": chunk_results,
                 "schema_validation": schema_results,
                 "format_compliance": format_results,
                 "sampling": sampling_results,
@@ -392,6 +455,19 @@ class DataIntegrityChecker:
             status = "✅" if rate >= 95 else "⚠️"
             lines.append(f"- {status} **{field}:** {rate}%")
 
+        chunks = report["checks"]["chunks"]
+        lines.extend(
+            [
+                "",
+                "## Chunk Sampling",
+                "",
+                f"- **Indexed Docs:** {chunks['indexed_docs']}",
+                f"- **Sampled Docs:** {chunks['sampled_docs']} ({chunks['sampled_chunks']} chunks)",
+                f"- **Index Mismatches:** {chunks['count_mismatches']}",
+                f"- **Missing Traceability:** {chunks['missing_traceability']}",
+            ]
+        )
+
         lines.extend(
             [
                 "",
@@ -141,9 +141,13 @@ def _execute_phase(phase: str, out: str, settings: Optional["Settings"] = None,
         # Chunk phase: process enriched or normalized docs into chunks using new chunking package
         import hashlib
         import json
+        from contextlib import ExitStack
         from datetime import datetime, timezone
         from pathlib import Path
 
+        from ..core.chunk_store import ChunkWriter
+        from ..core.columnar import CHUNK_COLUMNS, open_columnar
+        from ..core.config import SETTINGS
         from .steps.chunk.assurance import build_chunk_assurance
         from .steps.chunk.engine import (
             chunk_document,
@@ -161,6 +165,7 @@ def _execute_phase(phase: str, out: str, settings: Optional["Settings"] = None,
         hard_min_tokens = kwargs.get("hard_min_tokens", 80)
         orphan_heading_merge = kwargs.get("orphan_heading_merge", True)
         small_tail_merge = kwargs.get("small_tail_merge", True)
+        compress_chunks = kwargs.get("compress_chunks", SETTINGS.CHUNK_COMPRESS)
 
         # Prefer enriched input if available, otherwise use normalized
         enriched_file = Path(out).parent / "enrich" / "enriched.jsonl"
@@ -176,7 +181,6 @@ def _execute_phase(phase: str, out: str, settings: Optional["Settings"] = None,
         chunk_dir = Path(out)
         chunk_dir.mkdir(parents=True, exist_ok=True)
 
-        chunks_file = chunk_dir / "chunks.ndjson"
         skipped_file = chunk_dir / "skipped_docs.jsonl"
         total_chunks = 0
         total_docs = 0
@@ -205,7 +209,13 @@ def _execute_phase(phase: str, out: str, settings: Optional["Settings"] = None,
             with open(input_file, "rb") as f:
                 input_hash = hashlib.sha256(f.read()).hexdigest()
 
-        with open(input_file) as fin, open(chunks_file, "w") as fout:
+        with ExitStack() as stack:
+            fin = stack.enter_context(open(input_file))
+            writer = stack.enter_context(ChunkWriter(chunk_dir, compress=compress_chunks))
+            chunks_file = writer.path
+            columnar = open_columnar(chunks_file, CHUNK_COLUMNS)
+            if columnar is not None:
+                stack.enter_context(columnar)
             for line_num, line in enumerate(fin, 1):
                 if not line.strip():
                     continue
@@ -277,7 +287,8 @@ def _execute_phase(phase: str, out: str, settings: Optional["Settings"] = None,
                         section_map=section_map,
                     )
 
-                    # Write chunks
+                    # Write chunks (one contiguous, indexed range per document)
+                    doc_chunks = []
                     for chunk in chunks:
                         chunk_data = {
                             "chunk_id": chunk.chunk_id,
@@ -296,13 +307,18 @@ def _execute_phase(phase: str, out: str, settings: Optional["Settings"] = None,
                             "space": chunk.space,
                             "media_refs": chunk.media_refs,
                         }
-                        fout.write(json.dumps(chunk_data) + "\n")
+                        doc_chunks.append(chunk_data)
 
                         total_chunks += 1
                         token_counts.append(chunk.token_count)
                         char_counts.append(chunk.char_count)
                         split_strategies.append(chunk.split_strategy)
 
+                    writer.write_doc(doc_id, doc_chunks)
+                    if columnar is not None:
+                        for chunk_data in doc_chunks:
+                            columnar.write(chunk_data)
+
                 except Exception as e:
                     skipped_docs.append(
                         {
@@ -335,6 +351,7 @@ def _execute_phase(phase: str, out: str, settings: Optional["Settings"] = None,
                 "inputHash": input_hash,
                 "artifacts": {
                     "chunks_file": str(chunks_file),
+                    "chunks_index": str(writer.index_path),
                     "input_file": str(input_file),
                     "normalized_file": str(normalized_file),
                     "enriched_file": (str(enriched_file) if enriched_file.exists() else None),
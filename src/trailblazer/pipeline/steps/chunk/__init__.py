@@ -12,9 +12,13 @@ This package provides document chunking functionality with:
 
 from .assurance import build_chunk_assurance
 from .boundaries import (
+    Block,
     ChunkType,
     count_tokens,
+    count_tokens_batch,
     detect_content_type,
+    heading_sections,
+    lex_markdown,
     normalize_text,
     split_by_headings,
     split_by_paragraphs,
@@ -24,15 +28,20 @@ from .boundaries import (
     split_table_by_rows,
 )
 from .engine import Chunk, chunk_document
-from .verify import verify_chunks
+from .verify import coverage_columns, verify_chunks
 
 __all__ = [
+    "Block",
     "Chunk",
     "ChunkType",
     "build_chunk_assurance",
     "chunk_document",
     "count_tokens",
+    "count_tokens_batch",
+    "coverage_columns",
     "detect_content_type",
+    "heading_sections",
+    "lex_markdown",
     "normalize_text",
     "split_by_headings",
     "split_by_paragraphs",
@@ -2,10 +2,10 @@
 Chunk assurance and quality reporting.
 """
 
-import json
 import statistics
 from pathlib import Path
 
+from ....core.chunk_store import iter_chunks, resolve_chunks_file
 from .boundaries import count_tokens
 from .engine import Chunk, calculate_coverage
 
@@ -22,7 +22,7 @@ def build_chunk_assurance(run_dir: Path, cfg: dict, tokenizer: str = "text-embed
     Returns:
         Assurance report dictionary
     """
-    chunks_file = run_dir / "chunk" / "chunks.ndjson"
+    chunks_file = resolve_chunks_file(run_dir / "chunk")
     if not chunks_file.exists():
         return {
             "tokenCap": {
@@ -71,11 +71,7 @@ def build_chunk_assurance(run_dir: Path, cfg: dict, tokenizer: str = "text-embed
         }
 
     # Load all chunks
-    chunks = []
-    with open(chunks_file) as f:
-        for line in f:
-            if line.strip():
-                chunks.append(json.loads(line))
+    chunks = list(iter_chunks(chunks_file))
 
     if not chunks:
         return {
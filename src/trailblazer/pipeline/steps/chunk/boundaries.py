@@ -2,8 +2,12 @@
 Boundary detection and splitting strategies for chunking.
 """
 
+import functools
 import re
 from enum import Enum
+from typing import Any, NamedTuple
+
+from ....core.logging import log
 
 try:
     import tiktoken  # type: ignore
@@ -21,62 +25,232 @@ class ChunkType(Enum):
     DIGEST = "digest"
 
 
+# Patterns are compiled once at import; the layered splitter calls into this
+# module at every recursion level, so per-call compilation adds up quickly.
+_CRLF_RE = re.compile(r"\r\n?")
+_MULTI_BLANK_RE = re.compile(r"\n{3,}")
+_HEADING_RE = re.compile(r"^#+\s")
+_FENCE_OPEN_RE = re.compile(r"^\s{0,3}```")
+_FENCE_CLOSE_RE = re.compile(r"^\s{0,3}```\s*$")
+_LIST_ITEM_RE = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_CODE_FENCE_BODY_RE = re.compile(r"^```(\w*)\n(.*?)\n```$", re.DOTALL)
+_HTML_TABLE_RE = re.compile(r"<table[\s\S]*?</table>", re.IGNORECASE)
+_CODE_BLOCK_RE = re.compile(r"^```\w*\n[\s\S]*?^```$", re.MULTILINE)
+_CODE_LANGUAGE_RE = re.compile(r"^```(\w+)", re.MULTILINE)
+_MACRO_PATTERNS = [
+    re.compile(r"\{[^}]+\}"),  # {macro-name}
+    re.compile(r"<ac:[^>]+[/>]", re.IGNORECASE),  # <ac:structured-macro>
+    re.compile(r"\[\w+:[^\]]+\]"),  # [info:text]
+    re.compile(r"<!-- .* -->"),  # HTML comments
+]
+
+
+class Block(NamedTuple):
+    """A top-level markdown block with character offsets into the lexed text."""
+
+    kind: str  # heading | paragraph | fence | table | list
+    start: int
+    end: int
+
+
+def lex_markdown(text: str) -> list[Block]:
+    """
+    Lex markdown into top-level blocks in a single pass over its lines.
+
+    Blocks are separated by blank lines or by a change of block kind. Fenced
+    code is tracked so that lines inside a fence (e.g. ``# comment``) are never
+    mistaken for headings, tables or lists.
+
+    Args:
+        text: Markdown text (LF line endings)
+
+    Returns:
+        List of Block(kind, start, end) with ``text[start:end]`` covering the
+        block without its trailing newline
+    """
+    blocks: list[Block] = []
+    kind: str | None = None
+    block_start = 0
+    block_end = 0
+    in_fence = False
+    pos = 0
+
+    for line in text.split("\n"):
+        line_start = pos
+        line_end = pos + len(line)
+        pos = line_end + 1
+
+        if in_fence:
+            block_end = line_end
+            if _FENCE_CLOSE_RE.match(line):
+                blocks.append(Block("fence", block_start, block_end))
+                kind = None
+                in_fence = False
+            continue
+
+        if _FENCE_OPEN_RE.match(line):
+            line_kind = "fence"
+        elif not line.strip():
+            line_kind = ""
+        elif _HEADING_RE.match(line):
+            line_kind = "heading"
+        elif "|" in line:
+            line_kind = "table"
+        elif _LIST_ITEM_RE.match(line) or (kind == "list" and line[:1].isspace()):
+            line_kind = "list"
+        else:
+            line_kind = "paragraph"
+
+        # Headings and fences always open a new block; other kinds extend a
+        # run of the same kind until a blank line or a kind change.
+        if kind is not None and (line_kind != kind or line_kind == "heading"):
+            blocks.append(Block(kind, block_start, block_end))
+            kind = None
+
+        if line_kind == "fence":
+            in_fence = True
+            block_start = line_start
+            block_end = line_end
+        elif line_kind:
+            if kind is None:
+                kind = line_kind
+                block_start = line_start
+            block_end = line_end
+
+    if in_fence:
+        # Unterminated fence runs to the end of the text
+        blocks.append(Block("fence", block_start, block_end))
+    elif kind is not None:
+        blocks.append(Block(kind, block_start, block_end))
+
+    return blocks
+
+
+def heading_sections(text: str, blocks: list[Block] | None = None) -> list[tuple[int, int]]:
+    """
+    Compute heading-delimited sections from a block list.
+
+    Each section runs from a heading block to the next heading block; any
+    text before the first heading forms its own section.
+
+    Returns:
+        List of (start, end) character ranges covering the whole text
+    """
+    if blocks is None:
+        blocks = lex_markdown(text)
+
+    starts = [0]
+    for block in blocks:
+        if block.kind == "heading" and block.start > 0:
+            starts.append(block.start)
+
+    ends = [*starts[1:], len(text)]
+    return list(zip(starts, ends, strict=True))
+
+
 def normalize_text(text: str) -> str:
     """Normalize text for consistent chunking."""
     # Normalize line endings CRLF -> LF
-    text = re.sub(r"\r\n?", "\n", text)
+    if "\r" in text:
+        text = _CRLF_RE.sub("\n", text)
     # Remove any triple+ blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _MULTI_BLANK_RE.sub("\n\n", text)
     return text.strip()
 
 
-def count_tokens(text: str, model: str = "text-embedding-3-small") -> int:
-    """Count tokens using tiktoken for accurate OpenAI token counting."""
-    if tiktoken is None:
-        # Fallback to rough estimation: 4 chars per token
-        return len(text) // 4  # type: ignore[unreachable]
+# Estimate len(text) // 4 tokens when tiktoken is installed but cannot load an
+# encoding (no network, no TIKTOKEN_CACHE_DIR). Off by default so production
+# chunking fails loudly instead of undercounting code or CJK text; offline
+# benchmarks and tests opt in.
+ALLOW_TOKEN_ESTIMATE = False
+
+# Models already reported as estimated, so the warning is logged once per model
+_estimated_models: set[str] = set()
 
+
+@functools.lru_cache(maxsize=8)
+def _load_encoding(model: str) -> Any:
+    """Load the tiktoken encoding for a model, falling back to cl100k_base; raises if neither loads."""
     try:
-        encoding = tiktoken.encoding_for_model(model)  # type: ignore[attr-defined]
-        return len(encoding.encode(text))
+        return tiktoken.encoding_for_model(model)  # type: ignore[attr-defined]
     except Exception:
         # Fallback if model not found
-        encoding = tiktoken.get_encoding("cl100k_base")  # type: ignore[attr-defined]
-        return len(encoding.encode(text))
+        return tiktoken.get_encoding("cl100k_base")  # type: ignore[attr-defined]
+
+
+def _get_encoding(model: str) -> Any | None:
+    """Resolve the tiktoken encoding for a model, or None when tokens are estimated.
+
+    Tokens are estimated when tiktoken is not installed, or when it cannot
+    load its BPE files and ``ALLOW_TOKEN_ESTIMATE`` is set; otherwise the
+    load error propagates. A warning is logged the first time a model is
+    estimated.
+    """
+    if tiktoken is not None:
+        if ALLOW_TOKEN_ESTIMATE and model in _estimated_models:
+            # Already failed to load; do not retry the download on every call
+            return None
+        try:
+            return _load_encoding(model)
+        except Exception as e:
+            if not ALLOW_TOKEN_ESTIMATE:
+                raise
+            reason = f"{type(e).__name__}: {e}"
+    else:
+        reason = "tiktoken not installed"  # type: ignore[unreachable]
+
+    if model not in _estimated_models:
+        _estimated_models.add(model)
+        log.warning("chunk.token_count_estimated", model=model, reason=reason, chars_per_token=4)
+    return None
 
 
-def split_by_headings(text: str) -> list[tuple[str, str]]:
-    """Split text by headings, returning (content, strategy) tuples."""
-    lines = text.split("\n")
-    chunks = []
-    current_chunk: list[str] = []
+def count_tokens(text: str, model: str = "text-embedding-3-small") -> int:
+    """Count tokens using tiktoken for accurate OpenAI token counting."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        # Fallback to rough estimation: 4 chars per token
+        return len(text) // 4
 
-    for line in lines:
-        if re.match(r"^#+\s", line) and current_chunk:
-            # Found a heading, finish current chunk
-            chunks.append(("\n".join(current_chunk).strip(), "heading"))
-            current_chunk = [line]
-        else:
-            current_chunk.append(line)
+    return len(encoding.encode(text))
 
-    # Add final chunk
-    if current_chunk:
-        chunks.append(("\n".join(current_chunk).strip(), "heading"))
 
-    return [(chunk, strategy) for chunk, strategy in chunks if chunk.strip()]
+def count_tokens_batch(texts: list[str], model: str = "text-embedding-3-small") -> list[int]:
+    """Count tokens for many texts at once; same results as calling ``count_tokens`` per text.
+
+    tiktoken encodes batches on a thread pool, which is much faster than a
+    Python loop when verifying whole runs.
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return [len(text) // 4 for text in texts]
+
+    return [len(tokens) for tokens in encoding.encode_batch(texts)]
+
+
+def split_by_headings(text: str) -> list[tuple[str, str]]:
+    """Split text by headings, returning (content, strategy) tuples."""
+    chunks = []
+    for start, end in heading_sections(text):
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append((chunk, "heading"))
+    return chunks
 
 
 def split_by_paragraphs(text: str) -> list[tuple[str, str]]:
     """Split text by paragraph boundaries."""
     # Split on double newlines (paragraph breaks)
-    paragraphs = re.split(r"\n\s*\n", text)
+    paragraphs = _PARAGRAPH_SPLIT_RE.split(text)
     return [(p.strip(), "paragraph") for p in paragraphs if p.strip()]
 
 
 def split_by_sentences(text: str) -> list[tuple[str, str]]:
     """Split text by sentence boundaries using simple heuristics."""
     # Simple sentence splitting on period, question mark, exclamation
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     return [(s.strip(), "sentence") for s in sentences if s.strip()]
 
 
@@ -85,7 +259,7 @@ def split_code_fence_by_lines(
 ) -> list[tuple[str, str]]:
     """Split code fences by line blocks, never cutting mid-line."""
     # Extract language and code content
-    match = re.match(r"^```(\w*)\n(.*?)\n```$", text, re.DOTALL)
+    match = _CODE_FENCE_BODY_RE.match(text)
     if not match:
         return [(text, "code-fence-lines")]
 
@@ -198,22 +372,25 @@ def split_by_token_window(text: str, hard_max_tokens: int, overlap_tokens: int,
 def detect_content_type(text: str) -> tuple[ChunkType, dict]:
     """Detect content type and extract metadata."""
     text_stripped = text.strip()
+    lines = text_stripped.split("\n")
 
-    # Tables (markdown or HTML) - check before code blocks
-    table_patterns = [
-        r"\|.*\|.*\|",  # Markdown table with pipes
-        r"<table[\s\S]*?</table>",  # HTML table
-    ]
-
-    for pattern in table_patterns:
-        if re.search(pattern, text_stripped, re.IGNORECASE):
-            # Count rows/columns
-            table_rows = len(re.findall(r"\|.*\|", text_stripped))
-            return ChunkType.TABLE, {"estimated_rows": table_rows}
+    # Tables (markdown or HTML) - check before code blocks.
+    # A markdown table line has 3+ pipes; rows are counted as lines with 2+.
+    has_pipe_table = False
+    table_rows = 0
+    if "|" in text_stripped:
+        for line in lines:
+            pipes = line.count("|")
+            if pipes >= 2:
+                table_rows += 1
+                if pipes >= 3:
+                    has_pipe_table = True
+
+    if has_pipe_table or ("<" in text_stripped and _HTML_TABLE_RE.search(text_stripped)):
+        return ChunkType.TABLE, {"estimated_rows": table_rows}
 
     # Detect structured data that looks like tables (common in AWS/config data)
     # Look for patterns like repeated column headers followed by data rows
-    lines = text_stripped.split("\n")
     if len(lines) > 10:  # Must have enough lines to be a data table
         # Check for repeated patterns that indicate tabular data
         non_empty_lines = [line.strip() for line in lines if line.strip()]
@@ -233,21 +410,14 @@ def detect_content_type(text: str) -> tuple[ChunkType, dict]:
                 }
 
     # Code blocks - check after tables to avoid false positives
-    if re.search(r"^```\w*\n[\s\S]*?^```$", text_stripped, re.MULTILINE):
+    if "```" in text_stripped and _CODE_BLOCK_RE.search(text_stripped):
         # Extract language if present
-        match = re.search(r"^```(\w+)", text_stripped, re.MULTILINE)
+        match = _CODE_LANGUAGE_RE.search(text_stripped)
         language = match.group(1) if match else "unknown"
         return ChunkType.CODE, {"language": language}
 
     # Confluence macros and boilerplate
-    macro_patterns = [
-        r"\{[^}]+\}",  # {macro-name}
-        r"<ac:[^>]+[/>]",  # <ac:structured-macro>
-        r"\[\w+:[^\]]+\]",  # [info:text]
-        r"<!-- .* -->",  # HTML comments
-    ]
-
-    macro_count = sum(len(re.findall(pattern, text_stripped, re.IGNORECASE)) for pattern in macro_patterns)
+    macro_count = sum(len(pattern.findall(text_stripped)) for pattern in _MACRO_PATTERNS)
     if macro_count > 3:  # Threshold for macro-heavy content
         return ChunkType.MACRO, {"macro_count": macro_count}
 
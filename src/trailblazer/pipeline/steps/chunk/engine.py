@@ -24,8 +24,9 @@ from .boundaries import (
     ChunkType,
     count_tokens,
     detect_content_type,
+    heading_sections,
+    lex_markdown,
     normalize_text,
-    split_by_headings,
     split_by_paragraphs,
     split_by_sentences,
     split_by_token_window,
@@ -33,6 +34,18 @@ from .boundaries import (
     split_table_by_rows,
 )
 
+_WHOLE_FENCE_RE = re.compile(r"^```\w*\n.*\n```$", re.DOTALL)
+_CODE_DIGEST_LANGUAGE_RE = re.compile(r"^```(\w+)", re.MULTILINE)
+_CODE_DIGEST_BODY_RE = re.compile(r"^```\w*\n([\s\S]*?)^```$", re.MULTILINE)
+_CODE_SYMBOL_PATTERNS = [
+    re.compile(r"def\s+(\w+)"),  # Function definitions
+    re.compile(r"function\s+(\w+)"),
+    re.compile(r"class\s+(\w+)"),  # Class definitions
+    re.compile(r"^(\w+)\s*=", re.MULTILINE),  # Variable assignments (top-level)
+]
+_GLUE_SEPARATOR = "\n\n"
+_BOILERPLATE_LINES = frozenset({"references", "see also", "notes", "todo", "tbd"})
+
 
 class Chunk(NamedTuple):
     """A text chunk with complete traceability metadata."""
@@ -186,23 +199,25 @@ def split_with_layered_strategy(
         except Exception:
             pass  # Fall through to next strategy
 
-    # Strategy 2: Try heading-based splitting without section_map
+    # Strategy 2: Try heading-based splitting without section_map.
+    # Sections come from the lexed block list, so offsets are exact and
+    # headings inside code fences are not treated as split points.
     if prefer_headings:
         try:
-            heading_chunks = split_by_headings(text)
+            heading_chunks = []
+            for section_start, section_end in heading_sections(text, lex_markdown(text)):
+                raw_section = text[section_start:section_end]
+                chunk_text = raw_section.strip()
+                if chunk_text:
+                    chunk_start = section_start + len(raw_section) - len(raw_section.lstrip())
+                    heading_chunks.append((chunk_text, chunk_start, chunk_start + len(chunk_text)))
+
             if len(heading_chunks) > 1:  # Only if we actually split
                 result_chunks = []
-                current_pos = 0
-
-                for chunk_text, strategy in heading_chunks:
-                    # Find the position of this chunk in the original text
-                    chunk_start = text.find(chunk_text, current_pos)
-                    if chunk_start == -1:
-                        chunk_start = current_pos
-                    chunk_end = chunk_start + len(chunk_text)
 
+                for chunk_text, chunk_start, chunk_end in heading_chunks:
                     if count_tokens(chunk_text, model) <= hard_max_tokens:
-                        result_chunks.append((chunk_text, strategy, chunk_start, chunk_end))
+                        result_chunks.append((chunk_text, "heading", chunk_start, chunk_end))
                     else:
                         # Recursively split oversized heading chunks
                         sub_chunks = split_with_layered_strategy(
@@ -230,14 +245,12 @@ def split_with_layered_strategy(
                                 )
                             )
 
-                    current_pos = chunk_end
-
                 return result_chunks
         except Exception:
             pass  # Fall through to next strategy
 
     # Strategy 3: Special handling for code fences
-    if content_type == ChunkType.CODE and re.search(r"^```\w*\n.*\n```$", text, re.DOTALL):
+    if content_type == ChunkType.CODE and _WHOLE_FENCE_RE.search(text):
         try:
             code_chunks = split_code_fence_by_lines(text, hard_max_tokens, overlap_tokens, model)
             # Add char positions for code chunks
@@ -449,28 +462,21 @@ def create_table_digest(text: str, max_rows: int = 5) -> str:
 def create_code_digest(text: str) -> str:
     """Create a digest of large code blocks with language + key symbols."""
     # Extract language
-    match = re.search(r"^```(\w+)", text.strip(), re.MULTILINE)
+    stripped = text.strip()
+    match = _CODE_DIGEST_LANGUAGE_RE.search(stripped)
     language = match.group(1) if match else "code"
 
     # Extract code content
-    code_match = re.search(r"^```\w*\n([\s\S]*?)^```$", text.strip(), re.MULTILINE)
+    code_match = _CODE_DIGEST_BODY_RE.search(stripped)
     if not code_match:
         return text
 
     code_content = code_match.group(1)
 
-    # Extract key symbols (functions, classes, etc.)
+    # Extract key symbols (functions, classes, variable assignments)
     symbols = []
-
-    # Function definitions
-    symbols.extend(re.findall(r"def\s+(\w+)", code_content))
-    symbols.extend(re.findall(r"function\s+(\w+)", code_content))
-
-    # Class definitions
-    symbols.extend(re.findall(r"class\s+(\w+)", code_content))
-
-    # Variable assignments (top-level)
-    symbols.extend(re.findall(r"^(\w+)\s*=", code_content, re.MULTILINE))
+    for pattern in _CODE_SYMBOL_PATTERNS:
+        symbols.extend(pattern.findall(code_content))
 
     # Limit symbols
     symbols = symbols[:10]
@@ -622,6 +628,10 @@ def apply_glue_pass(
     """
     Apply glue pass to merge small chunks according to v2.2 bottom-end controls.
 
+    Merge decisions use the token counts already on each chunk plus the cost of
+    the separator; merged groups are only joined and re-tokenized once, after
+    all decisions are made, so cascading merges stay linear in chunk count.
+
     Args:
         chunks: List of chunks to process
         soft_min_tokens: Target minimum tokens after glue
@@ -637,7 +647,12 @@ def apply_glue_pass(
     if not chunks:
         return chunks
 
-    glued_chunks: list[Chunk] = []
+    separator_tokens = count_tokens(_GLUE_SEPARATOR, model)
+
+    # Each entry is a run of input chunks to be merged left-to-right, with the
+    # estimated token count of the merged result alongside it.
+    groups: list[list[Chunk]] = []
+    group_tokens: list[int] = []
     i = 0
 
     while i < len(chunks):
@@ -652,60 +667,50 @@ def apply_glue_pass(
 
         if needs_glue or is_orphan_heading:
             # Try to merge with next chunk first
-            merged_chunk = None
             if i + 1 < len(chunks):
                 next_chunk = chunks[i + 1]
-                merged_tokens = current_tokens + next_chunk.token_count
+                merged_tokens = current_tokens + separator_tokens + next_chunk.token_count
                 if merged_tokens <= hard_max_tokens:
-                    merged_chunk = _merge_chunks(current_chunk, next_chunk, model)
+                    groups.append([current_chunk, next_chunk])
+                    group_tokens.append(merged_tokens)
                     i += 2  # Skip both chunks
-                else:
-                    # Try merging with previous chunk
-                    if i > 0 and glued_chunks:
-                        prev_chunk = glued_chunks[-1]
-                        merged_tokens = prev_chunk.token_count + current_tokens
-                        if merged_tokens <= hard_max_tokens:
-                            # Replace the last chunk in glued_chunks with merged version
-                            glued_chunks[-1] = _merge_chunks(prev_chunk, current_chunk, model)
-                            i += 1
-                            continue
-
-                    # Can't merge, keep as is but flag if it's a small tail
-                    if small_tail_merge and i == len(chunks) - 1 and current_tokens < hard_min_tokens:
-                        # Mark as small tail
-                        meta = dict(current_chunk.meta) if current_chunk.meta else {}
-                        meta["tail_small"] = True
-                        merged_chunk = current_chunk._replace(meta=meta)
-                    else:
-                        merged_chunk = current_chunk
-                    i += 1
+                    continue
+
+                # Try merging with previous chunk
+                if groups:
+                    merged_tokens = group_tokens[-1] + separator_tokens + current_tokens
+                    if merged_tokens <= hard_max_tokens:
+                        groups[-1].append(current_chunk)
+                        group_tokens[-1] = merged_tokens
+                        i += 1
+                        continue
+
+                # Can't merge, keep as is but flag if it's a small tail
+                is_small_tail = small_tail_merge and i == len(chunks) - 1 and current_tokens < hard_min_tokens
             else:
                 # Last chunk - try to merge with previous
-                if i > 0 and glued_chunks:
-                    prev_chunk = glued_chunks[-1]
-                    merged_tokens = prev_chunk.token_count + current_tokens
+                if groups:
+                    merged_tokens = group_tokens[-1] + separator_tokens + current_tokens
                     if merged_tokens <= hard_max_tokens:
-                        glued_chunks[-1] = _merge_chunks(prev_chunk, current_chunk, model)
+                        groups[-1].append(current_chunk)
+                        group_tokens[-1] = merged_tokens
                         i += 1
                         continue
 
                 # Can't merge, mark as small tail if needed
-                if small_tail_merge and current_tokens < hard_min_tokens:
-                    meta = dict(current_chunk.meta) if current_chunk.meta else {}
-                    meta["tail_small"] = True
-                    merged_chunk = current_chunk._replace(meta=meta)
-                else:
-                    merged_chunk = current_chunk
-                i += 1
+                is_small_tail = small_tail_merge and current_tokens < hard_min_tokens
 
-            if merged_chunk:
-                glued_chunks.append(merged_chunk)
-        else:
-            # Chunk is fine as is
-            glued_chunks.append(current_chunk)
-            i += 1
+            if is_small_tail:
+                meta = dict(current_chunk.meta) if current_chunk.meta else {}
+                meta["tail_small"] = True
+                current_chunk = current_chunk._replace(meta=meta)
+
+        # Chunk stays on its own (fine as is, or could not be merged)
+        groups.append([current_chunk])
+        group_tokens.append(current_tokens)
+        i += 1
 
-    return glued_chunks
+    return [_merge_chunk_group(group, model) for group in groups]
 
 
 def _is_orphan_heading(text_md: str) -> bool:
@@ -714,44 +719,39 @@ def _is_orphan_heading(text_md: str) -> bool:
     if not text:
         return True
 
-    lines = text.split("\n")
-    non_empty_lines = [line.strip() for line in lines if line.strip()]
-
-    if len(non_empty_lines) <= 1:
-        # Single line - check if it's just a heading
-        if non_empty_lines and non_empty_lines[0].startswith("#"):
-            return True
-        # Check for common boilerplate
-        if text.lower() in ["references", "see also", "notes", "todo", "tbd"]:
-            return True
+    # Stripped text containing a newline has non-empty first and last lines,
+    # so it can never be a single-line heading or boilerplate marker.
+    if "\n" in text:
+        return False
 
-    return False
+    # Single line - check if it's just a heading or common boilerplate
+    return text.startswith("#") or text.lower() in _BOILERPLATE_LINES
 
 
-def _merge_chunks(chunk1: Chunk, chunk2: Chunk, model: str) -> Chunk:
-    """Merge two chunks into one, updating all metadata appropriately."""
-    # Combine text
-    combined_text = chunk1.text_md + "\n\n" + chunk2.text_md
-    combined_tokens = count_tokens(combined_text, model)
+def _merge_chunk_group(group: list[Chunk], model: str) -> Chunk:
+    """Merge a run of chunks left-to-right into one, tokenizing the result once."""
+    base = group[0]
+    if len(group) == 1:
+        return base
 
-    # Update split strategy
-    new_strategy = chunk1.split_strategy + "+glue"
+    # Fold metadata exactly as successive pairwise merges would
+    new_strategy = base.split_strategy
+    combined_meta = dict(base.meta or {})
+    for chunk in group[1:]:
+        new_strategy += "+glue"
+        combined_meta.update(chunk.meta or {})
+        combined_meta["glued_from"] = [base.chunk_id, chunk.chunk_id]
 
-    # Combine metadata
-    meta1 = chunk1.meta or {}
-    meta2 = chunk2.meta or {}
-    combined_meta = dict(meta1)
-    combined_meta.update(meta2)
-    combined_meta["glued_from"] = [chunk1.chunk_id, chunk2.chunk_id]
+    combined_text = _GLUE_SEPARATOR.join(chunk.text_md for chunk in group)
 
-    # Create merged chunk (use chunk1 as base)
-    return chunk1._replace(
+    # Create merged chunk (use first chunk as base)
+    return base._replace(
         text_md=combined_text,
         char_count=len(combined_text),
-        token_count=combined_tokens,
+        token_count=count_tokens(combined_text, model),
         split_strategy=new_strategy,
-        char_end=chunk2.char_end,  # Extend to end of second chunk
-        token_end=chunk2.token_end,
+        char_end=group[-1].char_end,  # Extend to end of last chunk
+        token_end=group[-1].token_end,
         meta=combined_meta,
     )
 
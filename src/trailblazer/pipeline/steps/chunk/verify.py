@@ -1,15 +1,171 @@
 """
 Corpus-wide chunk verification utilities.
+
+Chunks are streamed once into compact per-chunk columns (offsets, token
+counts, traceability flags). Cap breaches, small chunks, coverage, gaps and
+overlap are then computed for the whole corpus with NumPy, and per-chunk
+report rows are only built for the violations that are actually reported.
 """
 
 import glob
 import json
-import statistics
+from array import array
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from ....core.chunk_store import iter_chunks, resolve_chunks_file
+from .boundaries import count_tokens_batch
+
+# Texts are re-tokenized in batches so tiktoken can use its thread pool
+_TOKENIZE_BATCH = 2048
+
+_INT_COLUMNS = ("run_idx", "doc_idx", "char_start", "char_end", "char_count", "token_count", "actual_tokens")
+_FLAG_COLUMNS = ("has_title", "has_url", "has_source_system", "tail_small", "tiny")
+
+
+class _ChunkColumns:
+    """Accumulate per-chunk columns while streaming chunk records."""
+
+    def __init__(self) -> None:
+        self.run_names: list[str] = []
+        self.doc_ids: list[str] = []
+        self.doc_runs: list[int] = []
+        self.chunk_ids: list[str] = []
+        self.strategies: list[str] = []
+        self._doc_index: dict[str, int] = {}
+        self._ints = {name: array("q") for name in _INT_COLUMNS}
+        self._flags = {name: array("b") for name in _FLAG_COLUMNS}
+        self._pending_texts: list[str] = []
+
+    def add_run(self, run_name: str) -> int:
+        self.run_names.append(run_name)
+        return len(self.run_names) - 1
+
+    def append(self, chunk: dict, run_idx: int, tokenizer: str) -> None:
+        # Chunks without a doc_id are checked individually but not grouped for coverage
+        doc_id = chunk.get("doc_id", "")
+        doc_idx = -1
+        if doc_id:
+            doc_idx = self._doc_index.setdefault(doc_id, len(self.doc_ids))
+            if doc_idx == len(self.doc_ids):
+                self.doc_ids.append(doc_id)
+                self.doc_runs.append(run_idx)
+
+        text_md = chunk.get("text_md", "")
+        meta = chunk.get("meta") or {}
+
+        self.chunk_ids.append(chunk.get("chunk_id", ""))
+        self.strategies.append(chunk.get("split_strategy", "unknown"))
+
+        ints = self._ints
+        ints["run_idx"].append(run_idx)
+        ints["doc_idx"].append(doc_idx)
+        ints["char_start"].append(chunk.get("char_start") or 0)
+        ints["char_end"].append(chunk.get("char_end") or 0)
+        ints["char_count"].append(chunk.get("char_count") or 0)
+        ints["token_count"].append(chunk.get("token_count") or 0)
+
+        flags = self._flags
+        flags["has_title"].append(bool((chunk.get("title") or "").strip()))
+        flags["has_url"].append(bool((chunk.get("url") or "").strip()))
+        flags["has_source_system"].append(bool((chunk.get("source_system") or "").strip()))
+        flags["tail_small"].append(bool(meta.get("tail_small")))
+        flags["tiny"].append(len(text_md.strip()) < 50)
+
+        self._pending_texts.append(text_md)
+        if len(self._pending_texts) >= _TOKENIZE_BATCH:
+            self._flush_tokens(tokenizer)
+
+    def _flush_tokens(self, tokenizer: str) -> None:
+        if self._pending_texts:
+            self._ints["actual_tokens"].extend(count_tokens_batch(self._pending_texts, tokenizer))
+            self._pending_texts = []
+
+    def finish(self, tokenizer: str) -> dict[str, np.ndarray]:
+        """Flush pending tokenization and return the columns as NumPy arrays."""
+        self._flush_tokens(tokenizer)
+        columns = {name: np.frombuffer(values, dtype=np.int64) for name, values in self._ints.items()}
+        columns.update(
+            {name: np.frombuffer(values, dtype=np.int8).astype(bool) for name, values in self._flags.items()}
+        )
+        return columns
+
+
+class CoverageColumns(NamedTuple):
+    """Per-document coverage results plus the merged ranges needed to list gaps."""
+
+    coverage_pct: np.ndarray
+    overlap_ratio: np.ndarray
+    merged_start: np.ndarray
+    merged_end: np.ndarray
+    doc_bounds: np.ndarray
+
+    def gaps(self, doc: int, length: int) -> list[tuple[int, int]]:
+        """Uncovered (start, end) ranges of one document, as ``calculate_coverage`` reports them."""
+        lo, hi = self.doc_bounds[doc], self.doc_bounds[doc + 1]
+        gaps = []
+        last_end = 0
+        for start, end in zip(self.merged_start[lo:hi].tolist(), self.merged_end[lo:hi].tolist(), strict=True):
+            if start > last_end:
+                gaps.append((last_end, start))
+            last_end = end
+        if last_end < length:
+            gaps.append((last_end, length))
+        return gaps
+
+
+def coverage_columns(
+    doc_idx: np.ndarray, starts: np.ndarray, ends: np.ndarray, doc_lengths: np.ndarray
+) -> CoverageColumns:
+    """
+    Vectorized ``calculate_coverage`` for many documents at once.
 
-from .boundaries import count_tokens
-from .engine import Chunk, calculate_coverage
+    Args:
+        doc_idx: Document index (0..len(doc_lengths)-1) of each chunk
+        starts: Chunk char_start values
+        ends: Chunk char_end values
+        doc_lengths: Original length of each document
+
+    Returns:
+        CoverageColumns with coverage percentage and overlap ratio per document.
+        The overlap ratio is characters covered more than once divided by
+        characters covered at least once.
+    """
+    n_docs = len(doc_lengths)
+    valid = starts < ends
+    order = np.lexsort((starts[valid], doc_idx[valid]))
+    doc_idx, starts, ends = doc_idx[valid][order], starts[valid][order], ends[valid][order]
+
+    # Shift each document into its own disjoint band so one running maximum
+    # merges overlapping or adjacent ranges without crossing document borders.
+    span = int(max(ends.max(initial=0), doc_lengths.max(initial=0))) + 1
+    offset = doc_idx * span
+    running_end = np.maximum.accumulate(ends + offset) if ends.size else ends
+    is_new = np.ones(starts.size, dtype=bool)
+    is_new[1:] = starts[1:] + offset[1:] > running_end[:-1]
+
+    first = np.flatnonzero(is_new)
+    merged_doc = doc_idx[first]
+    merged_start = starts[first]
+    merged_end = np.maximum.reduceat(ends, first) if first.size else ends
+
+    covered = np.bincount(merged_doc, weights=merged_end - merged_start, minlength=n_docs)
+    total = np.bincount(doc_idx, weights=ends - starts, minlength=n_docs)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coverage_pct = np.where(doc_lengths > 0, covered / doc_lengths * 100, 0.0)
+        overlap_ratio = np.where(covered > 0, (total - covered) / covered, 0.0)
+
+    return CoverageColumns(
+        coverage_pct=coverage_pct,
+        overlap_ratio=overlap_ratio,
+        merged_start=merged_start,
+        merged_end=merged_end,
+        doc_bounds=np.searchsorted(merged_doc, np.arange(n_docs + 1)),
+    )
 
 
 def verify_chunks(
@@ -43,173 +199,137 @@ def verify_chunks(
     # Find all chunk files
     run_dirs = glob.glob(runs_glob)
 
-    all_chunks = []
-    oversize_chunks = []
-    missing_traceability_chunks = []
-    small_chunks = []
-    gaps_by_doc: list[dict] = []
+    columns = _ChunkColumns()
     run_count = 0
-    coverage_percentages = []
-
-    # Group chunks by document for coverage analysis
-    chunks_by_doc: dict[str, dict] = {}
 
     for run_dir_str in run_dirs:
         run_dir = Path(run_dir_str)
-        chunks_file = run_dir / "chunk" / "chunks.ndjson"
+        chunks_file = resolve_chunks_file(run_dir / "chunk")
 
         if not chunks_file.exists():
             continue
 
         run_count += 1
+        run_idx = columns.add_run(run_dir.name)
+        for chunk in iter_chunks(chunks_file):
+            columns.append(chunk, run_idx, tokenizer)
+
+    cols = columns.finish(tokenizer)
+    run_names = columns.run_names
+    actual_tokens = cols["actual_tokens"]
+
+    # Row-level checks as boolean masks; example rows are materialized afterwards
+    oversize_rows = np.flatnonzero(actual_tokens > max_tokens)
+    small_rows = np.flatnonzero(actual_tokens < hard_min)
+    missing_source = ~cols["has_source_system"]
+    missing_title = ~cols["has_title"]
+    missing_url = ~cols["has_url"]
+    if require_traceability:
+        missing_rows = np.flatnonzero(missing_source | (missing_title & missing_url))
+    else:
+        missing_rows = np.empty(0, dtype=np.int64)
+
+    oversize_chunks = [
+        {
+            "chunk_id": columns.chunk_ids[i],
+            "run_id": run_names[cols["run_idx"][i]],
+            "token_count": int(actual_tokens[i]),
+            "reported_token_count": int(cols["token_count"][i]),
+            "char_count": int(cols["char_count"][i]),
+            "split_strategy": columns.strategies[i],
+        }
+        for i in oversize_rows
+    ]
 
-        with open(chunks_file) as f:
-            for line in f:
-                if not line.strip():
-                    continue
-
-                chunk = json.loads(line)
-                all_chunks.append(chunk)
-
-                # Group by document for coverage analysis
-                doc_id = chunk.get("doc_id", "")
-                if doc_id:
-                    if doc_id not in chunks_by_doc:
-                        chunks_by_doc[doc_id] = {
-                            "run_id": run_dir.name,
-                            "chunks": [],
-                        }
-                    chunks_by_doc[doc_id]["chunks"].append(chunk)
-
-                # Re-tokenize to verify
-                text_md = chunk.get("text_md", "")
-                actual_tokens = count_tokens(text_md, tokenizer)
-
-                # Check for oversize
-                if actual_tokens > max_tokens:
-                    oversize_chunks.append(
-                        {
-                            "chunk_id": chunk.get("chunk_id", ""),
-                            "run_id": run_dir.name,
-                            "token_count": actual_tokens,
-                            "reported_token_count": chunk.get("token_count", 0),
-                            "char_count": chunk.get("char_count", 0),
-                            "split_strategy": chunk.get("split_strategy", "unknown"),
-                        }
-                    )
-
-                # Check for small chunks (v2.2)
-                if actual_tokens < hard_min:
-                    reason = "unknown"
-                    meta = chunk.get("meta", {})
-                    if meta.get("tail_small"):
-                        reason = "tail_small"
-                    elif len(text_md.strip()) < 50:
-                        reason = "tiny_doc"
-                    elif "fence" in chunk.get("split_strategy", ""):
-                        reason = "fence_forced"
-                    elif "table" in chunk.get("split_strategy", ""):
-                        reason = "table_forced"
-
-                    small_chunks.append(
-                        {
-                            "chunk_id": chunk.get("chunk_id", ""),
-                            "run_id": run_dir.name,
-                            "token_count": actual_tokens,
-                            "reason": reason,
-                            "split_strategy": chunk.get("split_strategy", "unknown"),
-                        }
-                    )
-
-                # Check traceability if required
-                if require_traceability:
-                    has_title = bool(chunk.get("title", "").strip())
-                    has_url = bool(chunk.get("url", "").strip())
-                    has_source_system = bool(chunk.get("source_system", "").strip())
-
-                    if not has_source_system or (not has_title and not has_url):
-                        missing_traceability_chunks.append(
-                            {
-                                "chunk_id": chunk.get("chunk_id", ""),
-                                "run_id": run_dir.name,
-                                "missing_fields": {
-                                    "source_system": not has_source_system,
-                                    "title": not has_title,
-                                    "url": not has_url,
-                                },
-                            }
-                        )
-
-    # Analyze coverage for each document
-    for doc_id, doc_data in chunks_by_doc.items():
-        doc_chunks = doc_data["chunks"]
-        run_id = doc_data["run_id"]
-
-        if not doc_chunks:
-            continue
+    small_chunks = []
+    for i in map(int, small_rows):
+        strategy = columns.strategies[i]
+        reason = "unknown"
+        if cols["tail_small"][i]:
+            reason = "tail_small"
+        elif cols["tiny"][i]:
+            reason = "tiny_doc"
+        elif "fence" in strategy:
+            reason = "fence_forced"
+        elif "table" in strategy:
+            reason = "table_forced"
+        small_chunks.append(
+            {
+                "chunk_id": columns.chunk_ids[i],
+                "run_id": run_names[cols["run_idx"][i]],
+                "token_count": int(actual_tokens[i]),
+                "reason": reason,
+                "split_strategy": strategy,
+            }
+        )
 
-        # Convert chunks to Chunk objects for coverage calculation
-        chunk_objects = []
-        for chunk_data in doc_chunks:
-            chunk_obj = Chunk(
-                chunk_id=chunk_data.get("chunk_id", ""),
-                text_md=chunk_data.get("text_md", ""),
-                char_count=chunk_data.get("char_count", 0),
-                token_count=chunk_data.get("token_count", 0),
-                ord=chunk_data.get("ord", 0),
-                char_start=chunk_data.get("char_start", 0),
-                char_end=chunk_data.get("char_end", 0),
-            )
-            chunk_objects.append(chunk_obj)
-
-        # Estimate original document length
-        max_char_end = max((chunk.get("char_end", 0) for chunk in doc_chunks), default=0)
-        if max_char_end == 0:
-            # Fallback: estimate from chunk char counts
-            max_char_end = sum(chunk.get("char_count", 0) for chunk in doc_chunks)
-
-        if max_char_end > 0:
-            coverage_pct, gaps = calculate_coverage(chunk_objects, max_char_end)
-            coverage_percentages.append(coverage_pct)
-
-            if coverage_pct < 99.5:
-                gaps_by_doc.append(
-                    {
-                        "doc_id": doc_id,
-                        "run_id": run_id,
-                        "coverage_pct": coverage_pct,
-                        "gaps": gaps[:10],  # Limit to first 10 gaps
-                        "gaps_count": len(gaps),
-                        "original_length": max_char_end,
-                    }
-                )
+    missing_traceability_chunks = [
+        {
+            "chunk_id": columns.chunk_ids[i],
+            "run_id": run_names[cols["run_idx"][i]],
+            "missing_fields": {
+                "source_system": bool(missing_source[i]),
+                "title": bool(missing_title[i]),
+                "url": bool(missing_url[i]),
+            },
+        }
+        for i in missing_rows
+    ]
 
-    # Calculate statistics
-    token_counts = []
-    for chunk in all_chunks:
-        actual_tokens = count_tokens(chunk.get("text_md", ""), tokenizer)
-        token_counts.append(actual_tokens)
+    # Coverage, gaps and overlap for every document in one vectorized pass
+    grouped = cols["doc_idx"] >= 0
+    doc_idx = cols["doc_idx"][grouped]
+    n_docs = len(columns.doc_ids)
+    max_char_end = np.zeros(n_docs, dtype=np.int64)
+    np.maximum.at(max_char_end, doc_idx, cols["char_end"][grouped])
+    char_count_sum = np.bincount(doc_idx, weights=cols["char_count"][grouped], minlength=n_docs).astype(np.int64)
+    # Fallback: estimate from chunk char counts
+    doc_lengths = np.where(max_char_end > 0, max_char_end, char_count_sum)
+
+    coverage = coverage_columns(doc_idx, cols["char_start"][grouped], cols["char_end"][grouped], doc_lengths)
+    analyzed = doc_lengths > 0
+    coverage_percentages = coverage.coverage_pct[analyzed]
+    overlap_ratios = coverage.overlap_ratio[analyzed]
 
+    gaps_by_doc: list[dict] = []
+    for d in np.flatnonzero(analyzed & (coverage.coverage_pct < 99.5)):
+        gaps = coverage.gaps(int(d), int(doc_lengths[d]))
+        gaps_by_doc.append(
+            {
+                "doc_id": columns.doc_ids[d],
+                "run_id": run_names[columns.doc_runs[d]],
+                "coverage_pct": float(coverage.coverage_pct[d]),
+                "gaps": gaps[:10],  # Limit to first 10 gaps
+                "gaps_count": len(gaps),
+                "original_length": int(doc_lengths[d]),
+            }
+        )
+
+    # Calculate statistics
+    has_tokens = actual_tokens.size > 0
     stats: dict = {
         "total_runs": run_count,
-        "total_chunks": len(all_chunks),
-        "total_documents": len(chunks_by_doc),
+        "total_chunks": int(actual_tokens.size),
+        "total_documents": n_docs,
         "token_stats": {
-            "min": min(token_counts) if token_counts else 0,
-            "median": (int(statistics.median(token_counts)) if token_counts else 0),
+            "min": int(actual_tokens.min()) if has_tokens else 0,
+            "median": int(np.median(actual_tokens)) if has_tokens else 0,
             "p95": (
-                int(statistics.quantiles(token_counts, n=20)[18])
-                if len(token_counts) > 20
-                else (max(token_counts) if token_counts else 0)
+                # Same estimator as statistics.quantiles(n=20)[18] (exclusive method)
+                int(np.percentile(actual_tokens, 95, method="weibull"))
+                if actual_tokens.size > 20
+                else (int(actual_tokens.max()) if has_tokens else 0)
             ),
-            "max": max(token_counts) if token_counts else 0,
-            "mean": int(statistics.mean(token_counts)) if token_counts else 0,
+            "max": int(actual_tokens.max()) if has_tokens else 0,
+            "mean": int(actual_tokens.mean()) if has_tokens else 0,
         },
         "coverage_stats": {
-            "avg_coverage_pct": (statistics.mean(coverage_percentages) if coverage_percentages else 100.0),
-            "min_coverage_pct": (min(coverage_percentages) if coverage_percentages else 100.0),
+            "avg_coverage_pct": (float(coverage_percentages.mean()) if coverage_percentages.size else 100.0),
+            "min_coverage_pct": (float(coverage_percentages.min()) if coverage_percentages.size else 100.0),
+            "avg_overlap_ratio": (float(overlap_ratios.mean()) if overlap_ratios.size else 0.0),
+            "max_overlap_ratio": (float(overlap_ratios.max()) if overlap_ratios.size else 0.0),
             "docs_with_gaps": len(gaps_by_doc),
-            "docs_analyzed": len(chunks_by_doc),
+            "docs_analyzed": n_docs,
         },
         "violations": {
             "oversize_count": len(oversize_chunks),
@@ -295,6 +415,7 @@ def verify_chunks(
         f"- **Documents Analyzed:** {stats['coverage_stats']['docs_analyzed']}",
         f"- **Average Coverage:** {stats['coverage_stats']['avg_coverage_pct']:.1f}%",
         f"- **Minimum Coverage:** {stats['coverage_stats']['min_coverage_pct']:.1f}%",
+        f"- **Average Overlap Ratio:** {stats['coverage_stats']['avg_overlap_ratio']:.3f}",
         f"- **Documents with Gaps:** {stats['coverage_stats']['docs_with_gaps']}",
         "",
         "## Violations",
@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from ....core.chunk_store import resolve_chunks_file
 from ....obs.events import emit_event
 
 
@@ -84,7 +85,7 @@ def diagnose_blocked_runs(plan_bundle_dir: str) -> dict[str, Any]:
                 primary_reason = "RUN_NOT_FOUND"
             elif not (run_dir / "enrich" / "enriched.jsonl").exists():
                 primary_reason = "MISSING_ENRICH"
-            elif not (run_dir / "chunk" / "chunks.ndjson").exists():
+            elif not resolve_chunks_file(run_dir / "chunk").exists():
                 primary_reason = "MISSING_CHUNKS"
             else:
                 primary_reason = "NO_PREFLIGHT_RUN"
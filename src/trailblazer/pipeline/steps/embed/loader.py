@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+from contextlib import closing
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -14,6 +15,7 @@ from rich.progress import (
 )
 from sqlalchemy.orm import Session
 
+from ....core.chunk_store import iter_chunk_lines, iter_numbered_chunk_lines, load_chunk_index, resolve_chunks_file
 from ....core.logging import log
 from ....core.progress import get_progress
 from ....db.engine import (  # type: ignore[import-untyped]
@@ -24,6 +26,7 @@ from ....db.engine import (  # type: ignore[import-untyped]
     upsert_document,
 )
 from ....obs.events import EventEmitter
+from ..enrich.incremental import CHANGED_DOCS_FILE
 
 # Embed step reads pre-chunked data from chunks.ndjson files
 from .provider import EmbeddingProvider, get_embedding_provider
@@ -62,7 +65,7 @@ def _validate_materialized_chunks(run_id: str) -> None:
     if not run_id or run_id == "unknown":
         return  # Skip validation for direct file input
 
-    chunks_file = runs() / run_id / "chunk" / "chunks.ndjson"
+    chunks_file = resolve_chunks_file(runs() / run_id / "chunk")
     if not chunks_file.exists():
         raise FileNotFoundError(
             f"embed requires materialized chunks; run 'trailblazer chunk run {run_id}' first; missing: {chunks_file}"
@@ -70,8 +73,8 @@ def _validate_materialized_chunks(run_id: str) -> None:
 
     # Check that chunks file is not empty
     try:
-        with open(chunks_file) as f:
-            first_line = f.readline().strip()
+        with closing(iter_chunk_lines(chunks_file)) as lines:
+            first_line = next(lines, "").strip()
             if not first_line:
                 raise ValueError(
                     f"embed requires materialized chunks; run 'trailblazer chunk run {run_id}' first; "
@@ -87,10 +90,10 @@ def _validate_materialized_chunks(run_id: str) -> None:
 
 
 def _default_chunks_path(run_id: str) -> Path:
-    """Get default path to chunks.ndjson for a run."""
+    """Get default path to chunks.ndjson (or chunks.ndjson.gz) for a run."""
     from ....core.paths import runs
 
-    return runs() / run_id / "chunk" / "chunks.ndjson"
+    return resolve_chunks_file(runs() / run_id / "chunk")
 
 
 def _default_enriched_path(run_id: str) -> Path:
@@ -134,8 +137,9 @@ def _load_fingerprints(fingerprints_path: Path) -> dict[str, str]:
             for line in f:
                 if line.strip():
                     data = json.loads(line.strip())
-                    doc_id = data.get("doc_id")
-                    fingerprint = data.get("fingerprint")
+                    # enrich writes id/fingerprint_sha256
+                    doc_id = data.get("doc_id") or data.get("id")
+                    fingerprint = data.get("fingerprint") or data.get("fingerprint_sha256")
                     if doc_id and fingerprint:
                         fingerprints[doc_id] = fingerprint
     except Exception as e:
@@ -148,6 +152,18 @@ def _load_fingerprints(fingerprints_path: Path) -> dict[str, str]:
     return fingerprints
 
 
+def _load_changed_docs(changed_docs_path: Path) -> set[str]:
+    """Load the new and changed doc_ids listed by an incremental enrich run."""
+    changed_docs = set()
+    with open(changed_docs_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                data = json.loads(line)
+                if data.get("change") in ("new", "changed") and data.get("id"):
+                    changed_docs.add(data["id"])
+    return changed_docs
+
+
 def _determine_changed_docs(run_id: str, changed_only: bool) -> set[str] | None:
     """
     Determine which documents have changed based on enrichment fingerprints.
@@ -177,6 +193,9 @@ def _determine_changed_docs(run_id: str, changed_only: bool) -> set[str] | None:
     # Load previous fingerprints if they exist
     if prev_fingerprints_path.exists():
         prev_fingerprints = _load_fingerprints(prev_fingerprints_path)
+    elif (enrich_dir / CHANGED_DOCS_FILE).exists():
+        # Incremental enrichment listed what differs from the run it reused records from
+        return _load_changed_docs(enrich_dir / CHANGED_DOCS_FILE)
     else:
         # No previous fingerprints, treat all as changed
         return set(current_fingerprints.keys())
@@ -426,6 +445,14 @@ def load_chunks_to_db(
             # Track processed documents
             processed_docs = set()
 
+            # Skiplisted docs are seeked past via the chunk index, so count them up front
+            if skipped_doc_ids:
+                for doc_id, entry in load_chunk_index(chunks_path.parent, chunks_path).items():
+                    if doc_id in skipped_doc_ids:
+                        docs_skipped += 1
+                        chunks_skipped += entry["chunks"]
+                        processed_docs.add(doc_id)
+
             # Use standardized progress display
             with Progress(
                 SpinnerColumn(),
@@ -440,8 +467,9 @@ def load_chunks_to_db(
                     else None
                 )
 
-            with chunks_path.open("r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
+            # Line numbers come from the store so errors point at the file's lines even when docs are skipped
+            with closing(iter_numbered_chunk_lines(chunks_path, skip_doc_ids=skipped_doc_ids)) as chunk_lines:
+                for line_num, line in chunk_lines:
                     if not line.strip():
                         continue
 
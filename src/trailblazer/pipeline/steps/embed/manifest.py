@@ -174,26 +174,24 @@ def load_chunks_for_manifest(run_id: str) -> list[dict[str, Any]]:
     Returns:
         List of chunk dictionaries with chunk_id, token_count, content_hash
     """
+    from ....core.chunk_store import iter_chunks, resolve_chunks_file
     from ....core.paths import runs
 
-    chunks_file = runs() / run_id / "chunk" / "chunks.ndjson"
+    chunks_file = resolve_chunks_file(runs() / run_id / "chunk")
     if not chunks_file.exists():
         log.warning("embed.manifest.no_chunks", run_id=run_id)
         return []
 
     chunks = []
     try:
-        with open(chunks_file, encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    chunk = json.loads(line.strip())
-                    chunks.append(
-                        {
-                            "chunk_id": chunk.get("chunk_id", ""),
-                            "token_count": chunk.get("token_count", 0),
-                            "content_hash": chunk.get("content_hash", ""),
-                        }
-                    )
+        for chunk in iter_chunks(chunks_file):
+            chunks.append(
+                {
+                    "chunk_id": chunk.get("chunk_id", ""),
+                    "token_count": chunk.get("token_count", 0),
+                    "content_hash": chunk.get("content_hash", ""),
+                }
+            )
     except Exception as e:
         log.error("embed.manifest.chunks_read_error", run_id=run_id, error=str(e))
         return []
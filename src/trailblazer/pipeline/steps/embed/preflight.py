@@ -5,12 +5,21 @@ Preflight validation for embedding with advisory quality gates and doc skiplists
 import json
 import statistics
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from ....core.chunk_store import iter_chunks, resolve_chunks_file
+from ....core.columnar import iter_column_batches
+from ....core.config import SETTINGS
 from ....core.logging import log
+from ....core.parallel import ordered_map
 from ....core.paths import runs
+from ....core.quantiles import StreamingQuantiles
 from ....obs.events import EventEmitter
 
 
@@ -33,7 +42,7 @@ def validate_preflight_artifacts(run_id: str) -> tuple[bool, list[str]]:
         missing.append("enriched.jsonl")
 
     # Check chunks.ndjson
-    chunks_file = run_dir / "chunk" / "chunks.ndjson"
+    chunks_file = resolve_chunks_file(run_dir / "chunk")
     if not chunks_file.exists() or chunks_file.stat().st_size == 0:
         missing.append("chunks.ndjson")
 
@@ -73,6 +82,73 @@ def validate_tokenizer_config(provider: str, model: str, dimension: int) -> tupl
     return len(issues) == 0, issues
 
 
+# Per-run cache of the artifact scans behind a preflight result, reused while the artifacts are unchanged
+PREFLIGHT_CACHE_FILE = "preflight_cache.json"
+PREFLIGHT_CACHE_VERSION = 2
+
+
+def _iter_quality_scores(enriched_file: Path) -> Iterator[tuple[str, float]]:
+    """(id, quality_score) of each enriched doc, projected from the Parquet copy when there is one."""
+    batches = iter_column_batches(enriched_file, ["id", "quality_score"])
+    if batches is not None:
+        for batch in batches:
+            for doc_id, quality_score in zip(batch["id"], batch["quality_score"], strict=True):
+                yield doc_id or "", 1.0 if quality_score is None else quality_score
+        return
+
+    with open(enriched_file, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                doc = json.loads(line.strip())
+                yield doc.get("id", ""), doc.get("quality_score", 1.0)
+
+
+def _scan_quality(
+    enriched_file: Path,
+    min_quality: float,
+    max_below_threshold_pct: float,
+    on_skip: Callable[[str], None],
+) -> tuple[int, int, dict[str, Any]]:
+    """
+    Stream a run's quality scores in constant memory.
+
+    The id of each doc below ``min_quality`` is passed to ``on_skip``;
+    p50/p90 are exact for small runs and P² estimates for large ones.
+
+    Returns:
+        Tuple of (total_docs, skipped_docs, quality_stats)
+    """
+    quantiles = StreamingQuantiles((0.5, 0.9))
+    skipped = 0
+    for doc_id, quality_score in _iter_quality_scores(enriched_file):
+        quantiles.add(quality_score)
+        if quality_score < min_quality:
+            skipped += 1
+            on_skip(doc_id)
+
+    total_docs = quantiles.count
+    if not total_docs:
+        return 0, 0, {}
+
+    values = quantiles.values()
+    if values is not None:
+        p50 = statistics.median(values)
+        p90 = statistics.quantiles(values, n=10)[8] if len(values) >= 10 else max(values)
+    else:
+        # Estimates are only missing before any value was added, which total_docs rules out
+        estimates = [quantiles.estimate(p) for p in (0.5, 0.9)]
+        p50, p90 = (0.0 if estimate is None else estimate for estimate in estimates)
+
+    quality_stats = {
+        "p50": p50,
+        "p90": p90,
+        "belowThresholdPct": skipped / total_docs,
+        "minQuality": min_quality,
+        "maxBelowThresholdPct": max_below_threshold_pct,
+    }
+    return total_docs, skipped, quality_stats
+
+
 def compute_embeddable_docs(
     run_id: str,
     min_quality: float = 0.60,
@@ -95,40 +171,148 @@ def compute_embeddable_docs(
     if not enriched_file.exists():
         return 0, 0, [], {}
 
-    all_docs = []
-    skipped_doc_ids = []
+    skipped_doc_ids: list[str] = []
+    total_docs, skipped, quality_stats = _scan_quality(
+        enriched_file, min_quality, max_below_threshold_pct, skipped_doc_ids.append
+    )
+    return total_docs, total_docs - skipped, skipped_doc_ids, quality_stats
 
-    # Load enriched documents
-    with open(enriched_file, encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                doc = json.loads(line.strip())
-                all_docs.append(doc)
-
-                # Check if doc should be skipped based on quality
-                quality_score = doc.get("quality_score", 1.0)
-                if quality_score < min_quality:
-                    skipped_doc_ids.append(doc.get("id", ""))
-
-    total_docs = len(all_docs)
-    embeddable_docs = total_docs - len(skipped_doc_ids)
-
-    # Compute quality statistics
-    quality_scores = [doc.get("quality_score", 1.0) for doc in all_docs]
-    quality_stats = {}
-
-    if quality_scores:
-        quality_stats = {
-            "p50": statistics.median(quality_scores),
-            "p90": (
-                statistics.quantiles(quality_scores, n=10)[8] if len(quality_scores) >= 10 else max(quality_scores)
-            ),
-            "belowThresholdPct": (len(skipped_doc_ids) / total_docs if total_docs > 0 else 0.0),
-            "minQuality": min_quality,
-            "maxBelowThresholdPct": max_below_threshold_pct,
+
+class _SkiplistWriter:
+    """Writes doc_skiplist.json as skipped ids are found, laid out as ``json.dump(..., indent=2)`` would.
+
+    Nothing is written (and an earlier skiplist is removed) when no doc is skipped.
+    """
+
+    def __init__(self, path: Path, min_quality: float):
+        self.path = path
+        self.min_quality = min_quality
+        self.count = 0
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        self._fh: Any = None
+
+    def add(self, doc_id: str) -> None:
+        if self._fh is None:
+            self._fh = open(self._tmp_path, "w")
+            self._fh.write('{\n  "skip": [\n    ')
+        else:
+            self._fh.write(",\n    ")
+        self._fh.write(json.dumps(doc_id))
+        self.count += 1
+
+    def close(self, total_docs: int) -> None:
+        if self._fh is None:
+            self.path.unlink(missing_ok=True)
+            return
+        tail = {
+            "reason": "quality_below_min",
+            "min_quality": self.min_quality,
+            "total_docs": total_docs,
+            "skipped_count": self.count,
         }
+        self._fh.write("\n  ],\n" + ",\n".join(f"  {json.dumps(k)}: {json.dumps(v)}" for k, v in tail.items()))
+        self._fh.write("\n}")
+        self._fh.close()
+        self._tmp_path.replace(self.path)
+
+    def abort(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._tmp_path.unlink(missing_ok=True)
+
+
+def _chunk_tokens(chunks_file: Path) -> int:
+    """Total token_count of a run's chunks, projected from the Parquet copy when there is one."""
+    run_tokens = 0
+    if chunks_file.exists():
+        try:
+            batches = iter_column_batches(chunks_file, ["token_count"])
+            if batches is not None:
+                for batch in batches:
+                    run_tokens += sum(tokens or 0 for tokens in batch["token_count"])
+            else:
+                for chunk in iter_chunks(chunks_file):
+                    run_tokens += chunk.get("token_count", 0)
+        except Exception:
+            pass
+    return run_tokens
+
 
-    return total_docs, embeddable_docs, skipped_doc_ids, quality_stats
+def _artifact_entry(path: Path) -> dict[str, Any] | None:
+    """Name, size and mtime of an artifact (None when missing); any change to them invalidates a cached scan."""
+    if not path.exists():
+        return None
+    stats = path.stat()
+    return {"name": path.name, "size": stats.st_size, "mtime_ns": stats.st_mtime_ns}
+
+
+def _scan_run(run_id: str, min_quality: float, max_below_threshold_pct: float, use_cache: bool) -> dict[str, Any]:
+    """
+    Doc totals, quality statistics and chunk tokens of a run, writing its doc_skiplist.json.
+
+    With ``use_cache`` the result is kept in ``preflight/preflight_cache.json``
+    keyed by the size and mtime of enriched.jsonl and the chunks file, and
+    returned from there while both are unchanged. Nothing is read to check
+    that, so a rewritten or merely touched artifact means a fresh scan.
+    """
+    run_dir = runs() / run_id
+    preflight_dir = run_dir / "preflight"
+    preflight_dir.mkdir(parents=True, exist_ok=True)
+    enriched_file = run_dir / "enrich" / "enriched.jsonl"
+    chunks_file = resolve_chunks_file(run_dir / "chunk")
+    skiplist_file = preflight_dir / "doc_skiplist.json"
+    cache_file = preflight_dir / PREFLIGHT_CACHE_FILE
+    params = {
+        "version": PREFLIGHT_CACHE_VERSION,
+        "min_quality": min_quality,
+        "max_below_threshold_pct": max_below_threshold_pct,
+    }
+
+    cached: dict[str, Any] = {}
+    if use_cache and cache_file.exists():
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            cached = {}
+    artifacts = {"enriched": _artifact_entry(enriched_file), "chunks": _artifact_entry(chunks_file)}
+
+    scan: dict[str, Any] | None = cached.get("scan")
+    if (
+        scan is not None
+        and cached.get("params") == params
+        and cached.get("artifacts") == artifacts
+        and (not scan["skipped_docs"] or skiplist_file.exists())
+    ):
+        log.info("preflight.cache_hit", run_id=run_id)
+        return scan | {"cached": True}
+
+    skiplist = _SkiplistWriter(skiplist_file, min_quality)
+    try:
+        if enriched_file.exists():
+            total_docs, skipped, quality_stats = _scan_quality(
+                enriched_file, min_quality, max_below_threshold_pct, skiplist.add
+            )
+        else:
+            total_docs, skipped, quality_stats = 0, 0, {}
+    except Exception:
+        skiplist.abort()
+        raise
+    skiplist.close(total_docs)
+
+    scan = {
+        "total_docs": total_docs,
+        "embeddable_docs": total_docs - skipped,
+        "skipped_docs": skipped,
+        "quality": quality_stats,
+        "tokens": _chunk_tokens(chunks_file),
+    }
+    if use_cache:
+        cache_file.write_text(
+            json.dumps({"params": params, "artifacts": artifacts, "scan": scan}, indent=2), encoding="utf-8"
+        )
+    else:
+        cache_file.unlink(missing_ok=True)
+    return scan | {"cached": False}
 
 
 def run_preflight_check(
@@ -140,10 +324,15 @@ def run_preflight_check(
     quality_advisory: bool = True,
     min_quality: float = 0.60,
     max_below_threshold_pct: float = 0.20,
+    use_cache: bool | None = None,
 ) -> dict[str, Any]:
     """
     Run preflight validation for a single run with advisory quality gates.
 
+    The run's enriched docs are streamed in constant memory, and with
+    ``use_cache`` (default: PREFLIGHT_CACHE) the scan is reused from an
+    earlier check while the run's artifacts are unchanged.
+
     Args:
         run_id: Run identifier
         provider: Embedding provider
@@ -153,6 +342,7 @@ def run_preflight_check(
         quality_advisory: Whether quality is advisory only (always True now)
         min_quality: Minimum quality threshold
         max_below_threshold_pct: Maximum below threshold percentage
+        use_cache: Reuse the cached scan of unchanged artifacts
 
     Returns:
         Preflight validation results
@@ -165,10 +355,13 @@ def run_preflight_check(
     # Validate config
     config_valid, config_issues = validate_tokenizer_config(provider, model, dimension)
 
-    # Compute embeddable docs
-    total_docs, embeddable_docs, skipped_doc_ids, quality_stats = compute_embeddable_docs(
-        run_id, min_quality, max_below_threshold_pct
-    )
+    # Compute embeddable docs (writes doc_skiplist.json as skipped docs are found)
+    use_cache = SETTINGS.PREFLIGHT_CACHE if use_cache is None else use_cache
+    scan = _scan_run(run_id, min_quality, max_below_threshold_pct, use_cache)
+    total_docs = scan["total_docs"]
+    embeddable_docs = scan["embeddable_docs"]
+    skipped_docs = scan["skipped_docs"]
+    quality_stats = scan["quality"]
 
     with EventEmitter(run_id=run_id, phase="embed", component="preflight") as ee:
         ee.embed_start(provider=provider, model=model, embedding_dims=dimension)
@@ -200,8 +393,10 @@ def run_preflight_check(
             "docTotals": {
                 "all": total_docs,
                 "embeddable": embeddable_docs,
-                "skipped": len(skipped_doc_ids),
+                "skipped": skipped_docs,
             },
+            "tokens": scan["tokens"],
+            "cached": scan["cached"],
             "quality": quality_stats,
             "advisory": {"quality": quality_advisory},
             "artifacts": {
@@ -217,30 +412,11 @@ def run_preflight_check(
             "dimension": dimension,
         }
 
-        # Write preflight results
-        run_dir = runs() / run_id
-        preflight_dir = run_dir / "preflight"
-        preflight_dir.mkdir(parents=True, exist_ok=True)
-
         # Write preflight.json
-        preflight_file = preflight_dir / "preflight.json"
+        preflight_file = runs() / run_id / "preflight" / "preflight.json"
         with open(preflight_file, "w") as f:
             json.dump(result, f, indent=2)
 
-        # Write doc_skiplist.json if there are skipped docs
-        if skipped_doc_ids:
-            skiplist = {
-                "skip": skipped_doc_ids,
-                "reason": "quality_below_min",
-                "min_quality": min_quality,
-                "total_docs": total_docs,
-                "skipped_count": len(skipped_doc_ids),
-            }
-
-            skiplist_file = preflight_dir / "doc_skiplist.json"
-            with open(skiplist_file, "w") as f:
-                json.dump(skiplist, f, indent=2)
-
         # Emit completion event with timing
         duration_ms = int((time.time() - start_time) * 1000)
         ee.embed_complete(
@@ -248,7 +424,7 @@ def run_preflight_check(
             duration_ms=duration_ms,
             status=status,
             total_docs=total_docs,
-            skipped_docs=len(skipped_doc_ids),
+            skipped_docs=skipped_docs,
         )
 
     return result
@@ -262,10 +438,18 @@ def run_plan_preflight(
     min_embed_docs: int = 1,
     quality_advisory: bool = True,
     out_dir: str = "var/plan_preflight/",
+    workers: int | None = None,
+    use_cache: bool | None = None,
 ) -> dict[str, Any]:
     """
     Run plan-preflight validation for all runs in a plan file.
 
+    With ``workers`` > 1 (default: PREFLIGHT_WORKERS) runs are checked on a
+    process pool. Results are taken in plan order, and ready.txt/blocked.txt
+    are appended to as each run's result comes in. Runs whose artifacts are
+    unchanged since their last check reuse its cached scan (see
+    ``run_preflight_check``).
+
     Args:
         plan_file: Path to plan file
         provider: Embedding provider
@@ -274,6 +458,8 @@ def run_plan_preflight(
         min_embed_docs: Minimum embeddable docs required
         quality_advisory: Whether quality is advisory only (always True now)
         out_dir: Output directory
+        workers: Runs checked concurrently
+        use_cache: Reuse cached scans of unchanged runs
 
     Returns:
         Plan preflight results
@@ -310,16 +496,8 @@ def run_plan_preflight(
                         continue
                 elif line.startswith("var/runs/"):
                     run_id = Path(line).name
-                    # Auto-detect chunk count
-                    chunks_file = runs() / run_id / "chunk" / "chunks.ndjson"
-                    if chunks_file.exists():
-                        try:
-                            with open(chunks_file) as cf:
-                                chunk_count = sum(1 for cline in cf if cline.strip())
-                        except Exception:
-                            chunk_count = 0
-                    else:
-                        chunk_count = 0
+                    # Chunk counts are informational; tokens are summed by each run's check
+                    chunk_count = None
                 else:
                     log.warning(
                         "plan_preflight.unsupported_format",
@@ -345,61 +523,70 @@ def run_plan_preflight(
         total_embeddable_docs = 0
         total_skipped_docs = 0
         total_tokens = 0
+        cached_runs = 0
 
-        for run_id, _expected_chunk_count in run_entries:
-            # Run preflight for this run
-            preflight_result = run_preflight_check(
-                run_id=run_id,
-                provider=provider,
-                model=model,
-                dimension=dimension,
-                min_embed_docs=min_embed_docs,
-                quality_advisory=quality_advisory,
-            )
-
-            # Aggregate results
-            doc_totals = preflight_result["docTotals"]
-            embeddable_docs = doc_totals["embeddable"]
-            skipped_docs = doc_totals["skipped"]
-
-            total_embeddable_docs += embeddable_docs
-            total_skipped_docs += skipped_docs
-
-            # Calculate tokens for this run
-            chunks_file = runs() / run_id / "chunk" / "chunks.ndjson"
-            run_tokens = 0
-            if chunks_file.exists():
-                try:
-                    with open(chunks_file) as f:
-                        for line in f:
-                            if line.strip():
-                                chunk = json.loads(line.strip())
-                                run_tokens += chunk.get("token_count", 0)
-                except Exception:
-                    pass
-
-            total_tokens += run_tokens
-
-            # Classify run
-            if preflight_result["status"] == "READY":
-                ready_runs.append(run_id)
+        check_kwargs: dict[str, Any] = {
+            "provider": provider,
+            "model": model,
+            "dimension": dimension,
+            "min_embed_docs": min_embed_docs,
+            "quality_advisory": quality_advisory,
+            "use_cache": use_cache,
+        }
+        run_ids = [run_id for run_id, _expected_chunk_count in run_entries]
+        workers = max(1, workers if workers is not None else SETTINGS.PREFLIGHT_WORKERS)
+
+        with ExitStack() as stack:
+            # Written progressively, so a long plan can be followed (and its ready runs started) while it runs
+            ready_fh = stack.enter_context(open(output_dir / "ready.txt", "w"))
+            blocked_fh = stack.enter_context(open(output_dir / "blocked.txt", "w"))
+
+            results: Iterator[dict[str, Any]]
+            if workers > 1 and len(run_ids) > 1:
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                check = partial(_check_run, check_kwargs=check_kwargs)
+                results = ordered_map(pool, check, run_ids, window=workers * 2)
             else:
-                blocked_runs.append(run_id)
-
-            # Store detailed data
-            runs_data.append(
-                {
-                    "rid": run_id,
-                    "status": preflight_result["status"],
-                    "reason": (", ".join(preflight_result["reasons"]) if preflight_result["reasons"] else ""),
-                    "docs_total": doc_totals["all"],
-                    "docs_embeddable": embeddable_docs,
-                    "docs_skipped": skipped_docs,
-                    "tokens": run_tokens,
-                    "quality_p50": preflight_result["quality"].get("p50", 0),
-                    "quality_below_threshold_pct": preflight_result["quality"].get("belowThresholdPct", 0),
-                }
-            )
+                results = (run_preflight_check(run_id=run_id, **check_kwargs) for run_id in run_ids)
+
+            for run_id, preflight_result in zip(run_ids, results, strict=True):
+                # Aggregate results
+                doc_totals = preflight_result["docTotals"]
+                embeddable_docs = doc_totals["embeddable"]
+                skipped_docs = doc_totals["skipped"]
+                run_tokens = preflight_result.get("tokens", 0)
+
+                total_embeddable_docs += embeddable_docs
+                total_skipped_docs += skipped_docs
+                total_tokens += run_tokens
+                cached_runs += bool(preflight_result.get("cached"))
+
+                reason = ", ".join(preflight_result["reasons"]) if preflight_result["reasons"] else ""
+
+                # Classify run
+                if preflight_result["status"] == "READY":
+                    ready_runs.append(run_id)
+                    ready_fh.write(f"var/runs/{run_id}\n")
+                    ready_fh.flush()
+                else:
+                    blocked_runs.append(run_id)
+                    blocked_fh.write(f"var/runs/{run_id} # {reason}\n")
+                    blocked_fh.flush()
+
+                # Store detailed data
+                runs_data.append(
+                    {
+                        "rid": run_id,
+                        "status": preflight_result["status"],
+                        "reason": reason,
+                        "docs_total": doc_totals["all"],
+                        "docs_embeddable": embeddable_docs,
+                        "docs_skipped": skipped_docs,
+                        "tokens": run_tokens,
+                        "quality_p50": preflight_result["quality"].get("p50", 0),
+                        "quality_below_threshold_pct": preflight_result["quality"].get("belowThresholdPct", 0),
+                    }
+                )
 
         # Create plan result
         plan_result = {
@@ -413,6 +600,7 @@ def run_plan_preflight(
             "total_embeddable_docs": total_embeddable_docs,
             "total_skipped_docs": total_skipped_docs,
             "total_tokens": total_tokens,
+            "cached_runs": cached_runs,
             "runs_detail": runs_data,
             "parameters": {
                 "min_embed_docs": min_embed_docs,
@@ -436,6 +624,10 @@ def run_plan_preflight(
     return plan_result
 
 
+def _check_run(run_id: str, check_kwargs: dict[str, Any]) -> dict[str, Any]:
+    return run_preflight_check(run_id=run_id, **check_kwargs)
+
+
 def _write_plan_preflight_outputs(
     output_dir: Path,
     plan_result: dict[str, Any],
@@ -443,7 +635,7 @@ def _write_plan_preflight_outputs(
     blocked_runs: list[str],
     runs_data: list[dict[str, Any]],
 ) -> None:
-    """Write all plan-preflight output files."""
+    """Write the plan-preflight reports (ready.txt and blocked.txt are written as runs finish)."""
 
     # Write plan_preflight.json
     with open(output_dir / "plan_preflight.json", "w") as f:
@@ -511,17 +703,6 @@ def _write_plan_preflight_outputs(
         else:
             f.write("*No blocked runs*\n")
 
-    # Write ready.txt
-    with open(output_dir / "ready.txt", "w") as f:
-        for run_id in ready_runs:
-            f.write(f"var/runs/{run_id}\n")
-
-    # Write blocked.txt
-    with open(output_dir / "blocked.txt", "w") as f:
-        for run_data in runs_data:
-            if run_data["status"] == "BLOCKED":
-                f.write(f"var/runs/{run_data['rid']} # {run_data['reason']}\n")
-
     # Write log.out
     with open(output_dir / "log.out", "w") as f:
         f.write(f"Plan preflight completed at {plan_result['timestamp']}\n")
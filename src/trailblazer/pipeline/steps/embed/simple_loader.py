@@ -11,6 +11,7 @@ from typing import Any
 import openai
 import psycopg2
 
+from ....core.chunk_store import iter_chunks, resolve_chunks_file
 from ....core.logging import log
 from ....obs.events import EventEmitter
 
@@ -62,7 +63,7 @@ def simple_embed_run(
 
     # Paths
     run_dir = runs() / run_id
-    chunks_file = run_dir / "chunk" / "chunks.ndjson"
+    chunks_file = resolve_chunks_file(run_dir / "chunk")
     embed_dir = run_dir / "embed"
     embed_dir.mkdir(parents=True, exist_ok=True)
 
@@ -101,12 +102,7 @@ def simple_embed_run(
 
         try:
             # Read all chunks
-            chunks = []
-            with open(chunks_file, encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        chunk = json.loads(line.strip())
-                        chunks.append(chunk)
+            chunks = list(iter_chunks(chunks_file))
 
             chunks_total = len(chunks)
             log.info("embed.chunks_loaded", run_id=run_id, count=chunks_total)
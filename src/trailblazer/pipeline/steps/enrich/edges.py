@@ -0,0 +1,158 @@
+"""
+Candidate generation for suggested edges between documents.
+
+Comparing every pair of documents is quadratic, so suggested edges are
+found in two indexed passes instead:
+
+- REFERENCES: an Aho-Corasick automaton over all (lowercased) titles finds
+  every title mentioned in a document's text in one pass over that text.
+  ``pyahocorasick`` is used when installed (``pip install .[edges]``),
+  otherwise a pure-Python automaton with the same results.
+- RELATES_TO: an inverted index from each keyword to the documents using it
+  counts, for every document, the keywords it shares with each later one;
+  pairs reaching ``MIN_SHARED_KEYWORDS`` become edges.
+
+Two bounds keep RELATES_TO linear in the number of documents. Keywords used
+by more than ``KEYWORD_MAX_DOCS`` documents ("with", "that", "this", ...)
+are too common to relate anything and are not counted, so no posting list
+is longer than that; and each document keeps only its
+``MAX_RELATED_PER_DOC`` best related later documents (most shared keywords
+first). Inputs no larger than both bounds get exactly the pairwise result.
+
+Only ids, titles and keyword sets are held for the whole input; texts are
+streamed once more for the title pass.
+"""
+
+import re
+from bisect import bisect_right
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Keywords compared between documents (words of 4+ characters)
+KEYWORD_RE = re.compile(r"\b\w{4,}\b")
+
+# Keywords two documents must share for a RELATES_TO edge
+MIN_SHARED_KEYWORDS = 3
+
+# Keywords found in more documents than this are not counted as shared
+KEYWORD_MAX_DOCS = 100
+
+# RELATES_TO edges kept per document (to later documents, most shared keywords first)
+MAX_RELATED_PER_DOC = 50
+
+
+def keyword_set(text_lower: str) -> set[str]:
+    """Keywords of lowercased text, as used for RELATES_TO overlap."""
+    return set(KEYWORD_RE.findall(text_lower))
+
+
+class TitleMatcher:
+    """Finds which of a fixed set of titles occur as substrings of a text."""
+
+    def __init__(self, titles: Iterable[str]):
+        self.titles = list(dict.fromkeys(t for t in titles if t))
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for index, title in enumerate(self.titles):
+                self._automaton.add_word(title, index)
+            if self.titles:
+                self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            self._build()
+
+    def _build(self) -> None:
+        # Trie transitions, failure links and the titles ending at each state
+        self._goto: list[dict[str, int]] = [{}]
+        self._output: list[list[int]] = [[]]
+        for index, title in enumerate(self.titles):
+            state = 0
+            for char in title:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._output.append([])
+                state = nxt
+            self._output[state].append(index)
+
+        # Breadth-first failure links (children of the root keep failing back to it)
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(char, 0)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def matches(self, text: str) -> set[str]:
+        """Titles that occur in ``text``."""
+        if not self.titles or not text:
+            return set()
+        if self._automaton is not None:
+            return {self.titles[index] for _, index in self._automaton.iter(text)}
+
+        found: set[int] = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return {self.titles[index] for index in found}
+
+
+class EdgeDoc(NamedTuple):
+    """What edge generation keeps of a document between the keyword and title passes."""
+
+    id: Any
+    title: str | None
+    keywords: frozenset[str]
+
+
+def edge_doc(doc: dict[str, Any]) -> EdgeDoc:
+    """The id, title and keyword set of a normalized document."""
+    return EdgeDoc(doc.get("id"), doc.get("title"), frozenset(keyword_set((doc.get("text_md") or "").lower())))
+
+
+class KeywordIndex:
+    """Inverted index from keyword to the (ascending) positions of the documents that use it.
+
+    Keywords used by more than ``max_docs`` documents are left out and listed in ``common``.
+    """
+
+    def __init__(self, keyword_sets: Iterable[frozenset[str]], max_docs: int = KEYWORD_MAX_DOCS):
+        postings: dict[str, list[int]] = defaultdict(list)
+        for index, keywords in enumerate(keyword_sets):
+            for keyword in keywords:
+                postings[keyword].append(index)
+        self.common = frozenset(keyword for keyword, docs in postings.items() if len(docs) > max_docs)
+        self._postings = {keyword: docs for keyword, docs in postings.items() if keyword not in self.common}
+
+    def related_later(self, index: int, keywords: Iterable[str], min_shared: int, limit: int) -> list[int]:
+        """Up to ``limit`` positions after ``index`` sharing at least ``min_shared`` indexed ``keywords``.
+
+        When more qualify, those sharing the most keywords (then the earliest) are kept. Positions are ascending.
+        """
+        shared: Counter[int] = Counter()
+        for keyword in keywords:
+            postings = self._postings.get(keyword)
+            if postings:
+                shared.update(postings[bisect_right(postings, index) :])
+        related = [other for other, count in shared.items() if count >= min_shared]
+        if len(related) > limit:
+            related = sorted(related, key=lambda other: (-shared[other], other))[:limit]
+        return sorted(related)
@@ -11,11 +11,28 @@ import hashlib
 import json
 import re
 import time
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Set
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from typing import Any
 
+from ....core.columnar import ENRICHED_COLUMNS, open_columnar
+from ....core.config import SETTINGS
 from ....core.logging import log
+from ....core.parallel import iter_line_chunks, ordered_map_tagged
+from .edges import (
+    MAX_RELATED_PER_DOC,
+    MIN_SHARED_KEYWORDS,
+    EdgeDoc,
+    KeywordIndex,
+    TitleMatcher,
+    edge_doc,
+    keyword_set,
+)
+from .incremental import CHANGED_DOCS_FILE, PreviousEnrichment, input_sha256
+from .text_scan import MarkdownScan, scan_markdown
 
 
 class DocumentEnricher:
@@ -66,21 +83,24 @@ class DocumentEnricher:
         collection = self._extract_collection(doc)
         path_tags = self._extract_path_tags(doc)
 
+        # One pass over text_md collects the counts and offsets every metric below needs
+        scan = scan_markdown(text_md)
+
         # Compute readability metrics
-        readability = self._compute_readability(text_md)
+        readability = self._compute_readability(text_md, scan)
 
         # Compute media and link densities
-        media_density = self._compute_media_density(text_md, attachments)
-        link_density = self._compute_link_density(text_md, links)
+        media_density = self._compute_media_density(text_md, attachments, scan)
+        link_density = self._compute_link_density(text_md, links, scan)
 
         # Determine quality flags
-        quality_flags = self._determine_quality_flags(doc, text_md, attachments)
+        quality_flags = self._determine_quality_flags(doc, text_md, attachments, scan)
 
         # Compute new schema fields
-        fingerprint = self._compute_document_fingerprint(doc)
-        section_map = self._extract_section_map(text_md)
-        chunk_hints = self._generate_chunk_hints(doc, text_md)
-        quality_metrics = self._compute_quality_metrics(doc, text_md, attachments, quality_flags, readability)
+        fingerprint = self._compute_document_fingerprint(doc, scan)
+        section_map = self._extract_section_map(text_md, scan)
+        chunk_hints = self._generate_chunk_hints(doc, text_md, scan)
+        quality_metrics = self._compute_quality_metrics(doc, text_md, attachments, quality_flags, readability, scan)
         quality_score = self._compute_quality_score(quality_metrics, quality_flags)
 
         # Update statistics
@@ -184,7 +204,7 @@ class DocumentEnricher:
 
         return list(dict.fromkeys(tags))  # Remove duplicates, preserve order
 
-    def _compute_readability(self, text_md: str) -> dict[str, float]:
+    def _compute_readability(self, text_md: str, scan: MarkdownScan | None = None) -> dict[str, float]:
         """Compute readability metrics."""
         if not text_md or not text_md.strip():
             return {
@@ -192,21 +212,15 @@ class DocumentEnricher:
                 "words_per_paragraph": 0.0,
                 "heading_ratio": 0.0,
             }
+        scan = scan or scan_markdown(text_md)
 
-        # Remove markdown formatting for word/char counting
-        clean_text = re.sub(r"[#*`\[\]()_]", "", text_md)
-        clean_text = re.sub(r"\n+", " ", clean_text)
-
-        words = clean_text.split()
-        word_count = len(words)
-        char_count = len("".join(words))
+        # Words and characters with markdown formatting removed
+        word_count = scan.clean_words
+        char_count = scan.clean_chars
 
-        # Count paragraphs (double newlines or headings)
-        paragraphs = re.split(r"\n\s*\n|^#", text_md)
-        paragraph_count = len([p for p in paragraphs if p.strip()])
-
-        # Count headings
-        heading_count = len(re.findall(r"^#+\s", text_md, re.MULTILINE))
+        # Paragraphs (blank-line separated) and headings
+        paragraph_count = scan.paragraphs
+        heading_count = scan.headings
 
         # Ensure we don't divide by zero
         chars_per_word = char_count / word_count if word_count > 0 else 0.0
@@ -219,13 +233,13 @@ class DocumentEnricher:
             "heading_ratio": round(heading_ratio, 3),
         }
 
-    def _compute_media_density(self, text_md: str, attachments: list[dict]) -> float:
+    def _compute_media_density(self, text_md: str, attachments: list[dict], scan: MarkdownScan | None = None) -> float:
         """Compute media density (media refs per 1000 chars)."""
         if not text_md:
             return 0.0
 
         # Count image references in markdown
-        image_refs = len(re.findall(r"!\[.*?\]", text_md))
+        image_refs = (scan or scan_markdown(text_md)).images
 
         # Add attachment count
         media_count = image_refs + len(attachments)
@@ -235,13 +249,13 @@ class DocumentEnricher:
 
         return round(density, 2)
 
-    def _compute_link_density(self, text_md: str, links: list[str]) -> float:
+    def _compute_link_density(self, text_md: str, links: list[str], scan: MarkdownScan | None = None) -> float:
         """Compute link density (links per 1000 chars)."""
         if not text_md:
             return 0.0
 
         # Count markdown link references
-        link_refs = len(re.findall(r"\[.*?\]\(.*?\)", text_md))
+        link_refs = (scan or scan_markdown(text_md)).md_links
 
         # Use the higher of detected links or provided links
         link_count = max(link_refs, len(links))
@@ -251,16 +265,19 @@ class DocumentEnricher:
 
         return round(density, 2)
 
-    def _determine_quality_flags(self, _doc: dict[str, Any], text_md: str, attachments: list[dict]) -> list[str]:
+    def _determine_quality_flags(
+        self, _doc: dict[str, Any], text_md: str, attachments: list[dict], scan: MarkdownScan | None = None
+    ) -> list[str]:
         """Determine quality flags for the document."""
         flags = []
+        scan = scan or scan_markdown(text_md)
 
         # Empty body check
         if not text_md.strip():
             flags.append("empty_body")
 
         # Length checks
-        word_count = len(text_md.split()) if text_md else 0
+        word_count = scan.words
         if word_count < 10:
             flags.append("too_short")
         elif word_count > 10000:
@@ -269,34 +286,28 @@ class DocumentEnricher:
         # Image-only check
         if attachments and word_count < 50:
             # Check if most content is just image references
-            image_refs = len(re.findall(r"!\[.*?\]", text_md))
-            if image_refs >= len(attachments) and word_count < 100:
+            if scan.images >= len(attachments) and word_count < 100:
                 flags.append("image_only")
 
         # No content structure
-        if text_md and not re.search(r"^#+\s", text_md, re.MULTILINE):
+        if text_md and not scan.headings:
             if word_count > 200:  # Only flag longer docs without headings
                 flags.append("no_structure")
 
-        # Broken links (basic check)
-        broken_link_patterns = [r"\[.*?\]\(\s*\)", r"\[.*?\]\(#\)"]
-        for pattern in broken_link_patterns:
-            if re.search(pattern, text_md):
-                flags.append("broken_links")
-                break
+        # Broken links (empty or "#" targets)
+        if scan.broken_links:
+            flags.append("broken_links")
 
         return flags
 
-    def _compute_document_fingerprint(self, doc: dict[str, Any]) -> dict[str, str]:
+    def _compute_document_fingerprint(self, doc: dict[str, Any], scan: MarkdownScan | None = None) -> dict[str, str]:
         """Compute document fingerprint with doc and version info."""
         # Create stable hash of document content for change detection
         # Normalize whitespace in text_md to make fingerprint stable
         text_md = doc.get("text_md", "")
         if text_md:
             # Normalize whitespace: strip leading/trailing, collapse multiple whitespace
-            import re
-
-            text_md = re.sub(r"\s+", " ", text_md.strip())
+            text_md = scan.collapsed if scan is not None else " ".join(text_md.split())
 
         content_fields = {
             "id": doc.get("id"),
@@ -311,78 +322,26 @@ class DocumentEnricher:
 
         return {"doc": doc_hash, "version": self.enrichment_version}
 
-    def _extract_section_map(self, text_md: str) -> list[dict[str, Any]]:
+    def _extract_section_map(self, text_md: str, scan: MarkdownScan | None = None) -> list[dict[str, Any]]:
         """Extract section map with heading, level, and character/token positions."""
         if not text_md:
             return []
 
-        sections = []
-        lines = text_md.split("\n")
-        current_pos = 0
-
-        for line_num, line in enumerate(lines):
-            line_with_newline = line + "\n" if line_num < len(lines) - 1 else line
-
-            # Match markdown headings
-            heading_match = re.match(r"^(#{1,6})\s+(.+)", line.strip())
-            if heading_match:
-                level = len(heading_match.group(1))
-                heading_text = heading_match.group(2).strip()
-
-                # Estimate token positions (rough approximation)
-                token_start = max(0, current_pos // 4)  # Rough chars-to-tokens ratio
-
-                sections.append(
-                    {
-                        "heading": heading_text,
-                        "level": level,
-                        "startChar": current_pos,
-                        "endChar": current_pos + len(line_with_newline),
-                        "tokenStart": token_start,
-                        "tokenEnd": token_start + max(1, len(line_with_newline) // 4),
-                    }
-                )
-
-            current_pos += len(line_with_newline)
+        # Markdown headings (levels 1-6); token positions use a rough 4 chars-per-token ratio
+        return (scan or scan_markdown(text_md)).sections
 
-        return sections
-
-    def _generate_chunk_hints(self, _doc: dict[str, Any], text_md: str) -> dict[str, Any]:
+    def _generate_chunk_hints(
+        self, _doc: dict[str, Any], text_md: str, scan: MarkdownScan | None = None
+    ) -> dict[str, Any]:
         """Generate chunking hints for the document."""
-        # Default chunk hints
-        chunk_hints = {
+        # Soft boundaries (good places to split): headings, blank lines between paragraphs, list items
+        return {
             "maxTokens": 800,
             "minTokens": 120,
             "preferHeadings": True,
-            "softBoundaries": [],
+            "softBoundaries": (scan or scan_markdown(text_md)).soft_boundaries,
         }
 
-        # Find soft boundaries (good places to split)
-        soft_boundaries = []
-        lines = text_md.split("\n")
-        current_pos = 0
-
-        for line_num, line in enumerate(lines):
-            line_with_newline = line + "\n" if line_num < len(lines) - 1 else line
-
-            # Headings are good boundaries
-            if re.match(r"^#{1,6}\s+", line.strip()):
-                soft_boundaries.append(current_pos)
-
-            # Double line breaks (paragraph boundaries)
-            elif line.strip() == "" and line_num > 0 and line_num < len(lines) - 1:
-                if lines[line_num - 1].strip() and lines[line_num + 1].strip():
-                    soft_boundaries.append(current_pos)
-
-            # List item boundaries
-            elif re.match(r"^[\s]*[-*+]\s+", line) or re.match(r"^[\s]*\d+\.\s+", line):
-                soft_boundaries.append(current_pos)
-
-            current_pos += len(line_with_newline)
-
-        chunk_hints["softBoundaries"] = soft_boundaries
-        return chunk_hints
-
     def _compute_quality_metrics(
         self,
         _doc: dict[str, Any],
@@ -390,19 +349,21 @@ class DocumentEnricher:
         attachments: list[dict],
         _quality_flags: list[str],
         readability: dict[str, float],
+        scan: MarkdownScan | None = None,
     ) -> dict[str, Any]:
         """Compute detailed quality metrics."""
-        word_count = len(text_md.split()) if text_md else 0
+        scan = scan or scan_markdown(text_md or "")
+        word_count = scan.words
         char_count = len(text_md) if text_md else 0
 
         # Count structural elements
-        heading_count = len(re.findall(r"^#+\s", text_md, re.MULTILINE))
-        list_count = len(re.findall(r"^[\s]*[-*+]\s+", text_md, re.MULTILINE))
-        link_count = len(re.findall(r"\[.*?\]\(.*?\)", text_md))
+        heading_count = scan.headings
+        list_count = scan.list_items
+        link_count = scan.md_links
 
         # Content type analysis
-        code_blocks = len(re.findall(r"```", text_md)) // 2
-        tables = len(re.findall(r"\|.*\|", text_md))
+        code_blocks = scan.fences // 2
+        tables = scan.tables
 
         return {
             "word_count": word_count,
@@ -477,6 +438,28 @@ class DocumentEnricher:
             "maxBelowThresholdPct": self.max_below_threshold_pct,
         }
 
+    def take_stats(self) -> dict[str, Any]:
+        """Return the per-document statistics gathered so far and reset them (a worker's partial)."""
+        stats = {
+            "docs_processed": self.docs_processed,
+            "docs_llm": self.docs_llm,
+            "quality_flags_counts": self.quality_flags_counts,
+            "quality_scores": self.quality_scores,
+        }
+        self.docs_processed = 0
+        self.docs_llm = 0
+        self.quality_flags_counts = {}
+        self.quality_scores = []
+        return stats
+
+    def merge_stats(self, stats: dict[str, Any]) -> None:
+        """Add statistics returned by ``take_stats`` (of this or another enricher)."""
+        self.docs_processed += stats["docs_processed"]
+        self.docs_llm += stats["docs_llm"]
+        for flag, count in stats["quality_flags_counts"].items():
+            self.quality_flags_counts[flag] = self.quality_flags_counts.get(flag, 0) + count
+        self.quality_scores.extend(stats["quality_scores"])
+
     def _generate_summary(self, text_md: str) -> str:
         """Generate a short summary (mocked)."""
         # Mock summary generation - in real implementation would use LLM
@@ -534,21 +517,49 @@ class DocumentEnricher:
         return labels[:5]  # Limit to 5 labels
 
     def generate_suggested_edges(self, docs: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Generate suggested edges between documents (mocked LLM)."""
+        """Generate suggested edges between documents held in memory (mocked LLM)."""
         if not self.llm_enabled or len(docs) < 2:
             return []
-
-        edges = []
-
-        # Simple heuristic-based edge suggestions
-        for i, doc1 in enumerate(docs):
-            for doc2 in docs[i + 1 :]:
-                edge = self._suggest_edge_between_docs(doc1, doc2)
-                if edge:
-                    edges.append(edge)
-                    self.suggested_edges_count += 1
-
-        return edges
+        texts = ((doc.get("text_md") or "") for doc in docs)
+        return list(self.iter_suggested_edges([edge_doc(doc) for doc in docs], texts))
+
+    def iter_suggested_edges(self, docs: list[EdgeDoc], texts: Iterable[str]) -> Iterator[dict[str, Any]]:
+        """Suggested edges from documents' ids, titles and keywords, yielded as found (mocked LLM).
+
+        Each document gets edges to the later documents it mentions by title
+        (REFERENCES) or shares at least MIN_SHARED_KEYWORDS keywords with
+        (RELATES_TO). ``texts`` yields each document's Markdown in the order
+        of ``docs`` and is read once, for one Aho-Corasick pass per text;
+        keyword overlap is counted through an inverted keyword index, which
+        ignores keywords more common than KEYWORD_MAX_DOCS and keeps at most
+        MAX_RELATED_PER_DOC related documents per document.
+        """
+        if not self.llm_enabled or len(docs) < 2:
+            return
+
+        docs_by_title: dict[str, list[int]] = defaultdict(list)
+        for index, doc in enumerate(docs):
+            title = (doc.title or "").lower()
+            if title:
+                docs_by_title[title].append(index)
+        matcher = TitleMatcher(docs_by_title)
+        index_by_keyword = KeywordIndex(doc.keywords for doc in docs)
+
+        for i, (doc1, text) in enumerate(zip(docs, texts, strict=True)):
+            references = {j for title in matcher.matches(text.lower()) for j in docs_by_title[title] if j > i}
+            related = index_by_keyword.related_later(i, doc1.keywords, MIN_SHARED_KEYWORDS, MAX_RELATED_PER_DOC)
+            for j in sorted(references.union(related)):
+                doc2 = docs[j]
+                # Skip if same document
+                if doc1.id == doc2.id:
+                    continue
+                if j in references:
+                    edge = self._references_edge(doc1.id, doc2.id, doc2.title)
+                else:
+                    overlap = (doc1.keywords & doc2.keywords) - index_by_keyword.common
+                    edge = self._relates_to_edge(doc1.id, doc2.id, overlap)
+                self.suggested_edges_count += 1
+                yield edge
 
     def _suggest_edge_between_docs(self, doc1: dict[str, Any], doc2: dict[str, Any]) -> dict[str, Any] | None:
         """Suggest an edge between two documents."""
@@ -562,31 +573,36 @@ class DocumentEnricher:
         # Check for explicit references
         doc2_title = doc2.get("title", "").lower()
         if doc2_title and doc2_title in text1:
-            return {
-                "from": doc1.get("id"),
-                "to": doc2.get("id"),
-                "type": "REFERENCES",
-                "confidence": 0.8,
-                "evidence": f"Document mentions '{doc2.get('title')}'",
-            }
+            return self._references_edge(doc1.get("id"), doc2.get("id"), doc2.get("title"))
 
         # Check for topical similarity (simple keyword overlap)
-        words1 = set(re.findall(r"\b\w{4,}\b", text1))
-        words2 = set(re.findall(r"\b\w{4,}\b", text2))
-
-        overlap = words1.intersection(words2)
-        if len(overlap) >= 3:  # Lower threshold for testing
-            confidence = min(0.7, len(overlap) / 20)
-            return {
-                "from": doc1.get("id"),
-                "to": doc2.get("id"),
-                "type": "RELATES_TO",
-                "confidence": round(confidence, 2),
-                "evidence": f"Shared keywords: {', '.join(sorted(list(overlap))[:5])}",
-            }
+        overlap = keyword_set(text1) & keyword_set(text2)
+        if len(overlap) >= MIN_SHARED_KEYWORDS:  # Lower threshold for testing
+            return self._relates_to_edge(doc1.get("id"), doc2.get("id"), overlap)
 
         return None
 
+    @staticmethod
+    def _references_edge(from_id: Any, to_id: Any, to_title: str | None) -> dict[str, Any]:
+        return {
+            "from": from_id,
+            "to": to_id,
+            "type": "REFERENCES",
+            "confidence": 0.8,
+            "evidence": f"Document mentions '{to_title}'",
+        }
+
+    @staticmethod
+    def _relates_to_edge(from_id: Any, to_id: Any, overlap: Set[str]) -> dict[str, Any]:
+        confidence = min(0.7, len(overlap) / 20)
+        return {
+            "from": from_id,
+            "to": to_id,
+            "type": "RELATES_TO",
+            "confidence": round(confidence, 2),
+            "evidence": f"Shared keywords: {', '.join(sorted(list(overlap))[:5])}",
+        }
+
     def compute_enrichment_fingerprint(self, enriched_doc: dict[str, Any]) -> str:
         """Compute a stable SHA256 fingerprint for enrichment state."""
         # Select fields that should trigger re-embedding if changed
@@ -613,6 +629,83 @@ class DocumentEnricher:
         return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
 
 
+# Input lines per worker task; large enough to amortize pickling, small enough to keep workers busy
+ENRICH_CHUNK_LINES = 256
+
+
+def _enrich_lines(enricher: DocumentEnricher, lines: list[str]) -> tuple[list[str], list[str], dict[str, Any]]:
+    """Enrich a chunk of normalized NDJSON lines into enriched and fingerprint lines plus partial statistics."""
+    enriched_lines = []
+    fingerprint_lines = []
+    for line in lines:
+        doc = json.loads(line.strip())
+
+        # Enrich document
+        enriched = enricher.enrich_document(doc)
+
+        # Compute fingerprint
+        fingerprint = enricher.compute_enrichment_fingerprint(enriched)
+
+        enriched_lines.append(json.dumps(enriched, ensure_ascii=False) + "\n")
+        fingerprint_rec = {
+            "id": doc.get("id"),
+            "enrichment_version": enricher.enrichment_version,
+            "fingerprint_sha256": fingerprint,
+            # What the enrichment was computed from, for reuse by later runs
+            "input_sha256": input_sha256(line),
+            "llm_enabled": enricher.llm_enabled,
+        }
+        fingerprint_lines.append(json.dumps(fingerprint_rec, ensure_ascii=False) + "\n")
+    return enriched_lines, fingerprint_lines, enricher.take_stats()
+
+
+# Set in each pool worker by _init_enrich_worker
+_worker_enricher: DocumentEnricher | None = None
+
+
+def _init_enrich_worker(enricher_kwargs: dict[str, Any]) -> None:
+    global _worker_enricher
+    _worker_enricher = DocumentEnricher(**enricher_kwargs)
+
+
+def _enrich_lines_in_worker(lines: list[str]) -> tuple[list[str], list[str], dict[str, Any]]:
+    assert _worker_enricher is not None, "enrich worker not initialized"
+    return _enrich_lines(_worker_enricher, lines)
+
+
+def _reuse_batches(
+    chunks: Iterator[list[str]], previous: PreviousEnrichment, changes: list[dict[str, Any]]
+) -> Iterator[tuple[tuple[list[str], list[tuple[str, str] | None]], list[str]]]:
+    """Tag each chunk with the earlier (enriched, fingerprint) lines of its unchanged documents (None for the
+    others) and batch only the other lines for enrichment, recording them in ``changes`` as new or changed."""
+    for chunk in chunks:
+        reused = []
+        pending = []
+        for line in chunk:
+            doc_id = json.loads(line).get("id")
+            found = previous.get(doc_id, input_sha256(line))
+            reused.append(found)
+            if found is None:
+                pending.append(line)
+                changes.append({"id": doc_id, "change": "changed" if doc_id in previous.doc_ids else "new"})
+        yield (chunk, reused), pending
+
+
+def _reused_stats(enriched_lines: list[str]) -> dict[str, Any]:
+    """Statistics of reused enriched records, in the form of ``DocumentEnricher.take_stats``."""
+    stats: dict[str, Any] = {"docs_processed": 0, "docs_llm": 0, "quality_flags_counts": {}, "quality_scores": []}
+    for line in enriched_lines:
+        enriched = json.loads(line)
+        stats["docs_processed"] += 1
+        # LLM enrichment adds its fields exactly when it counts a document
+        if "summary" in enriched:
+            stats["docs_llm"] += 1
+        for flag in enriched.get("quality_flags", []):
+            stats["quality_flags_counts"][flag] = stats["quality_flags_counts"].get(flag, 0) + 1
+        stats["quality_scores"].append(enriched.get("quality_score", 0.0))
+    return stats
+
+
 def enrich_from_normalized(
     run_id: str,
     llm_enabled: bool = False,
@@ -622,6 +715,8 @@ def enrich_from_normalized(
     max_below_threshold_pct: float = 0.20,
     progress_callback: Callable | None = None,
     emit_event: Callable | None = None,
+    workers: int | None = None,
+    previous_run_id: str | None = None,
 ) -> dict[str, Any]:
     """
     Enrich normalized documents with metadata and quality signals.
@@ -633,6 +728,12 @@ def enrich_from_normalized(
         budget: Budget limit for LLM usage (soft limit)
         progress_callback: Optional callback for progress updates
         emit_event: Optional callback for NDJSON events
+        workers: Worker processes, each with its own enricher (default: ENRICH_WORKERS).
+            Output is written in input order and statistics are merged, so the
+            result matches a single-process run.
+        previous_run_id: Earlier run whose enriched records are copied for documents
+            whose normalized record and enrichment settings are unchanged; the
+            documents enriched anew (and those removed) are listed in changed_docs.jsonl.
 
     Returns:
         Dict with enrichment statistics
@@ -653,14 +754,30 @@ def enrich_from_normalized(
     fingerprints_file = enrich_dir / "fingerprints.jsonl"
     suggested_edges_file = enrich_dir / "suggested_edges.jsonl"
 
-    # Initialize enricher
-    enricher = DocumentEnricher(
-        llm_enabled=llm_enabled,
-        max_docs=max_docs,
-        budget=budget,
-        min_quality=min_quality,
-        max_below_threshold_pct=max_below_threshold_pct,
-    )
+    enricher_kwargs: dict[str, Any] = {
+        "llm_enabled": llm_enabled,
+        "max_docs": max_docs,
+        "budget": budget,
+        "min_quality": min_quality,
+        "max_below_threshold_pct": max_below_threshold_pct,
+    }
+    # Initialize enricher; it accumulates the statistics of every chunk
+    enricher = DocumentEnricher(**enricher_kwargs)
+
+    workers = max(1, workers if workers is not None else SETTINGS.ENRICH_WORKERS)
+
+    previous = None
+    changes: list[dict[str, Any]] = []
+    if previous_run_id:
+        from ....core.paths import runs
+
+        previous_dir = runs() / previous_run_id / "enrich"
+        if previous_run_id == run_id or not (previous_dir / "fingerprints.jsonl").exists():
+            raise FileNotFoundError(f"Previous enrichment not found: {previous_dir}")
+        previous = PreviousEnrichment(previous_dir, enricher.enrichment_version, llm_enabled)
+    else:
+        # A full run supersedes the change list of an earlier incremental one
+        (enrich_dir / CHANGED_DOCS_FILE).unlink(missing_ok=True)
 
     start_time = time.time()
 
@@ -672,67 +789,113 @@ def enrich_from_normalized(
             max_docs=max_docs,
         )
 
-    # Process documents
-    docs_for_edges: list[dict[str, Any]] = []
-
-    with (
-        open(input_file, encoding="utf-8") as fin,
-        open(enriched_file, "w", encoding="utf-8") as fout_enriched,
-        open(fingerprints_file, "w", encoding="utf-8") as fout_fingerprints,
-    ):
-        for line_num, line in enumerate(fin, 1):
-            if max_docs and line_num > max_docs:
-                break
-
-            doc = json.loads(line.strip())
-
-            # Enrich document
-            enriched = enricher.enrich_document(doc)
-
-            # Compute fingerprint
-            fingerprint = enricher.compute_enrichment_fingerprint(enriched)
-
-            # Write enriched document
-            fout_enriched.write(json.dumps(enriched, ensure_ascii=False) + "\n")
-
-            # Write fingerprint
-            fingerprint_rec = {
-                "id": doc.get("id"),
-                "enrichment_version": enricher.enrichment_version,
-                "fingerprint_sha256": fingerprint,
-            }
-            fout_fingerprints.write(json.dumps(fingerprint_rec, ensure_ascii=False) + "\n")
-
-            # Collect docs for edge generation
-            if llm_enabled and len(docs_for_edges) < 1000:  # Limit for performance
-                docs_for_edges.append(doc)
-
-            # Emit progress
-            if emit_event and line_num % 100 == 0:
-                emit_event(
-                    "enrich.doc",
-                    doc_id=doc.get("id"),
-                    docs_processed=line_num,
-                    quality_flags=enriched.get("quality_flags", []),
+    # Process documents, keeping only what edges are built from (texts are read again for titles)
+    docs_for_edges: list[EdgeDoc] = []
+
+    with ExitStack() as stack:
+        fin = stack.enter_context(open(input_file, encoding="utf-8"))
+        fout_enriched = stack.enter_context(open(enriched_file, "w", encoding="utf-8"))
+        fout_fingerprints = stack.enter_context(open(fingerprints_file, "w", encoding="utf-8"))
+        columnar = open_columnar(enriched_file, ENRICHED_COLUMNS)
+        if columnar is not None:
+            stack.enter_context(columnar)
+        chunks = iter_line_chunks(fin, ENRICH_CHUNK_LINES, max_docs)
+
+        # Each chunk is tagged with the earlier lines reused for it (None when nothing can be reused)
+        batches: Iterator[tuple[tuple[list[str], list | None], list[str]]]
+        if previous is not None:
+            stack.callback(previous.close)
+            batches = _reuse_batches(chunks, previous, changes)
+        else:
+            batches = (((chunk, None), chunk) for chunk in chunks)
+
+        results: Iterator[tuple[tuple[list[str], list | None], tuple[list[str], list[str], dict[str, Any]]]]
+        if workers > 1:
+            pool = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_enrich_worker,
+                    initargs=(enricher_kwargs,),
                 )
-
-            if progress_callback and line_num % 50 == 0:
-                elapsed = time.time() - start_time
-                rate = line_num / elapsed if elapsed > 0 else 0
-                progress_callback(line_num, rate, elapsed, enricher.docs_llm)
+            )
+            results = ordered_map_tagged(pool, _enrich_lines_in_worker, batches, window=workers * 2)
+        else:
+            local = DocumentEnricher(**enricher_kwargs)
+            results = ((tag, _enrich_lines(local, lines)) for tag, lines in batches)
+
+        line_num = 0
+        docs_reused = 0
+        for (chunk, reused), (enriched_lines, fingerprint_lines, chunk_stats) in results:
+            enricher.merge_stats(chunk_stats)
+            if reused is not None:
+                # Interleave the earlier lines of unchanged documents with the newly enriched ones
+                fresh = iter(zip(enriched_lines, fingerprint_lines, strict=True))
+                merged = [found or next(fresh) for found in reused]
+                enriched_lines = [enriched_line for enriched_line, _ in merged]
+                fingerprint_lines = [fingerprint_line for _, fingerprint_line in merged]
+                copied = [found[0] for found in reused if found]
+                docs_reused += len(copied)
+                enricher.merge_stats(_reused_stats(copied))
+
+            fout_enriched.writelines(enriched_lines)
+            fout_fingerprints.writelines(fingerprint_lines)
+            if columnar is not None:
+                columnar.write_lines(enriched_lines)
+
+            for offset, line in enumerate(chunk):
+                line_num += 1
+
+                if llm_enabled:
+                    docs_for_edges.append(edge_doc(json.loads(line)))
+
+                # Emit progress
+                if emit_event and line_num % 100 == 0:
+                    enriched = json.loads(enriched_lines[offset])
+                    emit_event(
+                        "enrich.doc",
+                        doc_id=enriched.get("id"),
+                        docs_processed=line_num,
+                        quality_flags=enriched.get("quality_flags", []),
+                    )
+
+                if progress_callback and line_num % 50 == 0:
+                    elapsed = time.time() - start_time
+                    rate = line_num / elapsed if elapsed > 0 else 0
+                    progress_callback(line_num, rate, elapsed, enricher.docs_llm)
+
+    incremental = None
+    if previous is not None:
+        seen_ids = {rec.get("id") for rec in changes} | previous.reused_ids
+        removed = sorted(doc_id for doc_id in previous.doc_ids - seen_ids if doc_id is not None)
+        changes.extend({"id": doc_id, "change": "removed"} for doc_id in removed)
+        with open(enrich_dir / CHANGED_DOCS_FILE, "w", encoding="utf-8") as fout_changes:
+            for rec in changes:
+                fout_changes.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        incremental = {
+            "previous_run": previous_run_id,
+            "docs_reused": docs_reused,
+            "docs_new": sum(1 for rec in changes if rec["change"] == "new"),
+            "docs_changed": sum(1 for rec in changes if rec["change"] == "changed"),
+            "docs_removed": len(removed),
+        }
 
     # Generate suggested edges if LLM is enabled
     if llm_enabled:
         if emit_event:
             emit_event("enrich.edges_begin", total_docs=len(docs_for_edges))
 
-        edges = enricher.generate_suggested_edges(docs_for_edges)
-
-        with open(suggested_edges_file, "w", encoding="utf-8") as fout_edges:
-            for edge in edges:
-                fout_edges.write(json.dumps(edge, ensure_ascii=False) + "\n")
-                if emit_event:
-                    emit_event("enrich.suggested_edge", **edge)
+        with open(input_file, encoding="utf-8") as fin:
+            texts = (
+                json.loads(line).get("text_md") or ""
+                for chunk in iter_line_chunks(fin, ENRICH_CHUNK_LINES, max_docs)
+                for line in chunk
+            )
+            # Written as found, so the edges of a large corpus are never all held at once
+            with open(suggested_edges_file, "w", encoding="utf-8") as fout_edges:
+                for edge in enricher.iter_suggested_edges(docs_for_edges, texts):
+                    fout_edges.write(json.dumps(edge, ensure_ascii=False) + "\n")
+                    if emit_event:
+                        emit_event("enrich.suggested_edge", **edge)
 
     duration = time.time() - start_time
 
@@ -751,6 +914,8 @@ def enrich_from_normalized(
         "llm_enabled": llm_enabled,
         "completed_at": datetime.now(timezone.utc).isoformat(),
     }
+    if incremental is not None:
+        stats["incremental"] = incremental
 
     if emit_event:
         emit_event("enrich.end", **stats)
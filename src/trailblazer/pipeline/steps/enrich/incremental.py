@@ -0,0 +1,75 @@
+"""
+Reuse of an earlier run's enrichment for unchanged documents.
+
+Enrichment depends only on the normalized record, ``enrichment_version``
+and whether LLM enrichment is on. Each fingerprint record therefore keeps
+the sha256 of the normalized input line (``input_sha256``) and the LLM
+flag, and a later run can copy the enriched and fingerprint lines of every
+document whose input hash still matches instead of enriching it again.
+
+``enriched.jsonl`` and ``fingerprints.jsonl`` are written in the same
+order, so the earlier run's enriched lines are located by line number and
+read back only when reused.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+# Sidecar listing the documents enriched (not reused) by an incremental run, and those removed
+CHANGED_DOCS_FILE = "changed_docs.jsonl"
+
+
+def input_sha256(line: str) -> str:
+    """Hash of a normalized NDJSON line, the input enrichment is a function of."""
+    return hashlib.sha256(line.strip().encode("utf-8")).hexdigest()
+
+
+class PreviousEnrichment:
+    """Enriched records of an earlier run, looked up by document id and input hash."""
+
+    def __init__(self, enrich_dir: Path, enrichment_version: str, llm_enabled: bool):
+        self.enriched_path = enrich_dir / "enriched.jsonl"
+        fingerprints_path = enrich_dir / "fingerprints.jsonl"
+        # doc id -> (input hash, line number in both files, fingerprint line)
+        self._records: dict[str, tuple[str, int, str]] = {}
+        self.doc_ids: set[str] = set()
+        self.reused_ids: set[str] = set()
+        self._offsets: list[int] = []
+        self._file: Any = None
+
+        if not (fingerprints_path.exists() and self.enriched_path.exists()):
+            return
+        with fingerprints_path.open("r", encoding="utf-8") as fin:
+            for line_num, line in enumerate(fin):
+                rec = json.loads(line)
+                self.doc_ids.add(rec.get("id"))
+                if (
+                    rec.get("input_sha256")
+                    and rec.get("enrichment_version") == enrichment_version
+                    and rec.get("llm_enabled") == llm_enabled
+                ):
+                    self._records[rec["id"]] = (rec["input_sha256"], line_num, line)
+
+        offset = 0
+        with self.enriched_path.open("rb") as fin:
+            for raw in fin:
+                self._offsets.append(offset)
+                offset += len(raw)
+
+    def get(self, doc_id: str, input_hash: str) -> tuple[str, str] | None:
+        """The earlier enriched and fingerprint lines of ``doc_id``, if its input is unchanged."""
+        found = self._records.get(doc_id)
+        if found is None or found[0] != input_hash or found[1] >= len(self._offsets):
+            return None
+        if self._file is None:
+            self._file = self.enriched_path.open("rb")
+        self._file.seek(self._offsets[found[1]])
+        self.reused_ids.add(doc_id)
+        return self._file.readline().decode("utf-8"), found[2]
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
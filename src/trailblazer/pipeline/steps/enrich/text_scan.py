@@ -0,0 +1,155 @@
+"""
+Single-pass structural scan of a document's Markdown for rule-based enrichment.
+
+``scan_markdown`` walks ``text_md`` line by line once and collects every
+count the enricher's metrics need (words, paragraphs, headings, list items,
+links, images, tables, code fences) together with the section map and the
+chunking soft boundaries. Each count reproduces what the enricher's
+original per-metric regular expressions returned over the whole text, so
+enrichment output and fingerprints are unchanged.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+# Applied only when the text contains their opening token
+_MD_LINK_RE = re.compile(r"\[.*?\]\(.*?\)")
+_IMAGE_RE = re.compile(r"!\[.*?\]")
+_TABLE_RE = re.compile(r"\|.*\|")
+_BROKEN_LINK_RE = re.compile(r"\[.*?\]\((?:\s*|#)\)")  # empty or "#" targets
+
+_ORDERED_ITEM_RE = re.compile(r"\d+\.\s")
+
+# Markdown punctuation dropped before counting words for readability
+_READABILITY_DROP = str.maketrans("", "", "#*`[]()_")
+
+_LIST_MARKERS = "-*+"
+
+_MAX_SECTION_LEVEL = 6
+
+
+@dataclass
+class MarkdownScan:
+    """Counts and offsets collected from one pass over a document's Markdown."""
+
+    collapsed: str = ""  # the text with every whitespace run collapsed to one space
+    words: int = 0  # whitespace-separated words
+    clean_words: int = 0  # words once Markdown punctuation is dropped (readability)
+    clean_chars: int = 0  # characters in those words
+    paragraphs: int = 0  # runs of non-blank lines
+    headings: int = 0  # lines matching ^#+\s
+    list_items: int = 0  # matches of ^[\s]*[-*+]\s+ over the whole text
+    images: int = 0
+    md_links: int = 0
+    tables: int = 0  # lines with at least two pipes
+    fences: int = 0  # ``` occurrences
+    broken_links: bool = False
+    sections: list[dict[str, Any]] = field(default_factory=list)
+    soft_boundaries: list[int] = field(default_factory=list)
+
+
+def _leading(line: str, char: str) -> int:
+    return len(line) - len(line.lstrip(char))
+
+
+def scan_markdown(text_md: str) -> MarkdownScan:
+    """Scan ``text_md`` once; see ``MarkdownScan`` for what is collected."""
+    scan = MarkdownScan()
+    if not text_md:
+        return scan
+
+    # Flat counts: one C-level call each over the whole text
+    tokens = text_md.split()
+    scan.collapsed = " ".join(tokens)
+    scan.words = len(tokens)
+    clean_tokens = text_md.translate(_READABILITY_DROP).split()
+    scan.clean_words = len(clean_tokens)
+    scan.clean_chars = len("".join(clean_tokens))
+    scan.fences = text_md.count("```")
+    if "![" in text_md:
+        scan.images = len(_IMAGE_RE.findall(text_md))
+    if "](" in text_md:
+        scan.md_links = len(_MD_LINK_RE.findall(text_md))
+        scan.broken_links = _BROKEN_LINK_RE.search(text_md) is not None
+    if "|" in text_md:
+        scan.tables = len(_TABLE_RE.findall(text_md))
+
+    # Line structure: one pass over the lines
+    lines = text_md.split("\n")
+    last = len(lines) - 1
+    pos = 0
+    # Paragraph runs; the original also split off a "#" opening the text
+    prev_para_blank = True
+    # A list match whose marker ends its line swallows the following whitespace, including
+    # the next non-blank line's indentation, so that line cannot start a match of its own
+    swallowing = False
+    # A blank line between two non-blank lines is a soft boundary, known once the next line is seen
+    prev_blank = False
+    blank_boundary = False
+    blank_pos = 0
+
+    for i, line in enumerate(lines):
+        line_len = len(line) + 1 if i < last else len(line)
+        stripped = line.strip()
+
+        if not stripped:
+            prev_para_blank = True
+            blank_boundary = i > 0 and not prev_blank
+            blank_pos = pos
+            prev_blank = True
+            pos += line_len
+            continue
+
+        if i == 0 and line[0] == "#":
+            para_blank = not line[1:].strip()
+        else:
+            para_blank = False
+        if prev_para_blank and not para_blank:
+            scan.paragraphs += 1
+        prev_para_blank = para_blank
+
+        if prev_blank and blank_boundary:
+            scan.soft_boundaries.append(blank_pos)
+        prev_blank = blank_boundary = False
+
+        first = stripped[0]
+        item_end = False
+        if first == "#":
+            # ^#+\s (the whitespace may be the newline ending the line)
+            if line[0] == "#":
+                hashes = _leading(line, "#")
+                if (hashes < len(line) and line[hashes].isspace()) or (hashes == len(line) and i < last):
+                    scan.headings += 1
+            # Section heading (levels 1-6, on the stripped line)
+            level = _leading(stripped, "#")
+            if level <= _MAX_SECTION_LEVEL and level < len(stripped) and stripped[level].isspace():
+                token_start = pos // 4
+                scan.sections.append(
+                    {
+                        "heading": stripped[level:].strip(),
+                        "level": level,
+                        "startChar": pos,
+                        "endChar": pos + line_len,
+                        "tokenStart": token_start,
+                        "tokenEnd": token_start + max(1, line_len // 4),
+                    }
+                )
+                scan.soft_boundaries.append(pos)
+        elif first in _LIST_MARKERS:
+            item = line.lstrip()
+            rest = item[1:]
+            marker_spaced = bool(rest) and rest[0].isspace()
+            # ^[\s]*[-*+]\s+ over the whole text
+            if not (swallowing and line[0].isspace()) and (marker_spaced or (not rest and i < last)):
+                scan.list_items += 1
+                item_end = not rest.strip() and i < last
+            if marker_spaced:
+                scan.soft_boundaries.append(pos)
+        elif first.isdecimal() and _ORDERED_ITEM_RE.match(line.lstrip()):
+            scan.soft_boundaries.append(pos)
+        swallowing = item_end
+
+        pos += line_len
+
+    return scan
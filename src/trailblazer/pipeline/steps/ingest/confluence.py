@@ -1,26 +1,29 @@
-import csv
 import json
 import re
 import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timezone
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple, TypeVar
 
 from ....adapters.confluence_api import ConfluenceClient
+from ....adapters.http_stats import HttpStats
 from ....core.assurance import generate_assurance_report
-from ....core.event_log import get_event_logger, init_event_logger
+from ....core.config import SETTINGS
+from ....core.event_log import EventLogger
 from ....core.logging import log
 from ....core.models import Attachment, ConfluenceUser, Page, PageAncestor
+from ....core.parallel import ordered_map
 from .content_hash import compute_content_sha256
-from .link_resolver import (
-    extract_links_from_adf_with_classification,
-    extract_links_from_storage_with_classification,
-)
-from .media_extractor import (
-    extract_media_from_adf,
-    extract_media_from_storage,
-    resolve_attachment_ids,
-)
+from .link_resolver import extract_links_from_adf_with_classification
+from .media_extractor import extract_media_from_adf, resolve_attachment_ids
+from .page_versions import PageVersion, PageVersionStore, listed_version
+from .sidecars import JsonlSidecar, SortedCsvSidecar, iter_jsonl, truncate_to
+from .storage_doc import STORAGE_EXTRACT_FILE, StorageDoc, storage_sha256
 
 
 def _iso(dt: datetime | None) -> str | None:
@@ -74,6 +77,10 @@ def _extract_body_adf(obj: dict) -> dict | None:
     return None
 
 
+PAGES_CSV_FIELDS = ["space_key", "page_id", "title", "version", "updated_at", "attachments_count", "url"]
+ATTACHMENTS_CSV_FIELDS = ["page_id", "filename", "media_type", "file_size", "download_url"]
+
+
 def _page_url(site_base: str, page_obj: dict) -> str | None:
     webui = (page_obj.get("_links") or {}).get("webui")
     if not webui:
@@ -96,6 +103,18 @@ def _map_attachment(site_base: str, att: dict) -> Attachment:
     )
 
 
+def _label_names(labels_data: list[dict] | None) -> list[str]:
+    return [label.get("name", "") for label in labels_data or [] if label.get("name")]
+
+
+def _page_ancestors(site_base: str, ancestors_data: list[dict] | None) -> list[PageAncestor]:
+    return [
+        PageAncestor(id=str(ancestor["id"]), title=ancestor.get("title", ""), url=_page_url(site_base, ancestor))
+        for ancestor in ancestors_data or []
+        if str(ancestor.get("id", ""))
+    ]
+
+
 def _map_page(
     site_base: str,
     space_key_by_id: dict[str, str],
@@ -103,6 +122,8 @@ def _map_page(
     client: ConfluenceClient | None = None,
     space_key_unknown_count: dict[str, int] | None = None,
     space_details_cache: dict[str, dict] | None = None,
+    labels_data: list[dict] | None = None,
+    ancestors_data: list[dict] | None = None,
 ) -> Page:
     version = obj.get("version") or {}
     space_id = str(obj.get("spaceId")) if obj.get("spaceId") is not None else None
@@ -161,38 +182,16 @@ def _map_page(
             display_name=version_author.get("displayName"),
         )
 
-    # Get labels and ancestors if client is available
-    labels = []
-    ancestors = []
+    # Use prefetched labels and ancestors, else fetch them if client is available
     page_id = str(obj.get("id"))
 
-    if client:
-        # Fetch labels
-        try:
-            if hasattr(client, "get_page_labels"):
-                label_data = client.get_page_labels(page_id)
-                labels = [label.get("name", "") for label in label_data if label.get("name")]
-        except Exception:
-            pass  # Labels are optional
+    if labels_data is None and client:
+        labels_data = _fetch_optional(client, "get_page_labels", page_id)
+    if ancestors_data is None and client:
+        ancestors_data = _fetch_optional(client, "get_page_ancestors", page_id)
 
-        # Fetch ancestors
-        try:
-            if hasattr(client, "get_page_ancestors"):
-                ancestor_data = client.get_page_ancestors(page_id)
-                for ancestor in ancestor_data:
-                    ancestor_id = str(ancestor.get("id", ""))
-                    ancestor_title = ancestor.get("title", "")
-                    ancestor_url = _page_url(site_base, ancestor)
-                    if ancestor_id:
-                        ancestors.append(
-                            PageAncestor(
-                                id=ancestor_id,
-                                title=ancestor_title,
-                                url=ancestor_url,
-                            )
-                        )
-        except Exception:
-            pass  # Ancestors are optional
+    labels = _label_names(labels_data)
+    ancestors = _page_ancestors(site_base, ancestors_data)
 
     page = Page(
         id=page_id,
@@ -223,6 +222,195 @@ def _map_page(
     return page
 
 
+def _fetch_optional(client: Any, method: str, page_id: str) -> list[dict]:
+    """Call an optional per-page client method, returning [] if missing or failing."""
+    try:
+        if hasattr(client, method):
+            return list(getattr(client, method)(page_id))
+    except Exception:
+        pass  # Labels and ancestors are optional
+    return []
+
+
+class _PageFetch(NamedTuple):
+    """A page object plus the per-page data fetched for it off the main thread."""
+
+    obj: dict
+    labels: list[dict] | None  # on carried pages: harvested labels to refresh, None if not harvested
+    ancestors: list[dict] | None
+    attachments: list[dict]
+    attachment_error: str | None
+    attachment_retries: int
+    cursor: str | None = None
+    carried: str | None = None  # previous run's NDJSON line for an unchanged page (nothing was fetched)
+
+
+class _PageMetadata(NamedTuple):
+    """Labels and ancestors harvested in bulk; None means "not covered, fetch per page"."""
+
+    labels: list[dict] | None
+    ancestors: list[dict] | None
+    version: int | None = None
+
+
+def _fetch_attachments(client: Any, page_id: str, max_retries: int = 3) -> tuple[list[dict], str | None, int]:
+    """Fetch a page's attachments with retry; returns (attachments, last_error, retry_count)."""
+    retry_count = 0
+    while True:
+        try:
+            return list(client.get_attachments_for_page(page_id)), None, retry_count
+        except Exception as e:
+            retry_count += 1
+            if retry_count > max_retries:
+                return [], str(e), retry_count
+
+            # Exponential backoff: 1s, 2s, 4s
+            time.sleep(2 ** (retry_count - 1))
+            log.warning(
+                "confluence.attachments.fetch_retry",
+                page_id=page_id,
+                retry_count=retry_count,
+                error=str(e),
+            )
+
+
+def _fetch_page(
+    client: Any,
+    page: dict | str,
+    body_format: str | None = None,
+    metadata: dict[str, _PageMetadata] | None = None,
+) -> _PageFetch:
+    """
+    Fetch everything a page needs beyond its listing: body (by id), labels, ancestors, attachments.
+
+    Labels and ancestors come from ``metadata`` (a bulk CQL harvest) when present,
+    falling back to per-page calls for pages the harvest did not cover.
+    """
+    obj = client.get_page_by_id(page, body_format=body_format) if isinstance(page, str) else page
+    page_id = str(obj.get("id"))
+    meta = (metadata or {}).get(page_id) or _PageMetadata(labels=None, ancestors=None)
+    attachments, error, retries = _fetch_attachments(client, page_id)
+    return _PageFetch(
+        obj=obj,
+        labels=meta.labels if meta.labels is not None else _fetch_optional(client, "get_page_labels", page_id),
+        ancestors=(
+            meta.ancestors if meta.ancestors is not None else _fetch_optional(client, "get_page_ancestors", page_id)
+        ),
+        attachments=attachments,
+        attachment_error=error,
+        attachment_retries=retries,
+    )
+
+
+def _fetch_listed(
+    client: Any,
+    listed: tuple[str | None, dict | str],
+    metadata: dict[str, _PageMetadata] | None = None,
+    versions: PageVersionStore | None = None,
+    body_format: str | None = None,
+) -> _PageFetch:
+    """
+    Fetch a ``(cursor, page)`` pair from ``_list_pages`` (or ``(None, page_id)``), keeping the cursor.
+
+    With a version store, a page whose listed version is unchanged is carried
+    forward from the previous run instead. A page listed without a body, or
+    given by id, is fetched by id.
+    """
+    cursor, page = listed
+    if versions is not None:
+        if isinstance(page, str):
+            page_id, version = page, (metadata or {}).get(page, _PageMetadata(None, None)).version
+        else:
+            page_id, version = str(page.get("id")), listed_version(page)
+        carried = versions.carry_forward(page_id, version)
+        if carried is not None:
+            # Label and ancestor changes don't bump the page version; refresh them when harvested in bulk
+            meta = (metadata or {}).get(page_id)
+            return _PageFetch(
+                obj={"id": page_id},
+                labels=meta.labels if meta else None,
+                ancestors=meta.ancestors if meta else None,
+                attachments=[],
+                attachment_error=None,
+                attachment_retries=0,
+                cursor=cursor,
+                carried=carried,
+            )
+        if isinstance(page, dict) and "body" not in page:
+            page = page_id
+    return _fetch_page(client, page, body_format, metadata)._replace(cursor=cursor)
+
+
+def _body_obj_from_record(record: dict) -> dict:
+    """Rebuild the body of a page object from its NDJSON record (for carried-forward pages)."""
+    if record.get("body_repr") == "storage":
+        return {"body": {"storage": {"value": record.get("body_storage")}}}
+    if record.get("body_repr") == "adf":
+        return {"body": {"atlas_doc_format": {"value": record.get("body_adf")}}}
+    return {}
+
+
+def _list_pages(
+    client: Any, space_id: str | None, body_format: str | None, cursor: str | None = None
+) -> Iterator[tuple[str | None, dict]]:
+    """List pages as ``(cursor, page)``, where cursor fetched the page's API batch; starts at ``cursor``."""
+    if not hasattr(client, "get_page_batches"):
+        for page in client.get_pages(space_id=space_id, body_format=body_format):
+            yield None, page
+        return
+    for batch_cursor, results in client.get_page_batches(space_id=space_id, body_format=body_format, cursor=cursor):
+        for page in results:
+            yield batch_cursor, page
+
+
+def _count_link(link_stats: dict[str, int], target_type: str | None, target_page_id: str | None) -> None:
+    """Add one link to the run's link statistics."""
+    link_stats["total"] += 1
+    if target_type == "confluence":
+        if target_page_id:
+            link_stats["internal"] += 1
+        else:
+            link_stats["unresolved"] += 1
+    elif target_type == "external":
+        link_stats["external"] += 1
+    elif target_type == "attachment":
+        link_stats["attachment_refs"] += 1
+
+
+def _load_resume_checkpoint(progress_json_path: Path) -> dict | None:
+    """Load a resumable progress.json; None (start over) when missing or written before resume support."""
+    try:
+        checkpoint = json.loads(progress_json_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        log.warning("ingest.confluence.resume.no_checkpoint", path=str(progress_json_path), error=str(e))
+        return None
+    if not isinstance(checkpoint, dict) or "offsets" not in checkpoint:
+        log.warning("ingest.confluence.resume.no_checkpoint", path=str(progress_json_path), error="no offsets")
+        return None
+    return checkpoint
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _prefetch_in_order(items: Iterable[_T], fetch: Callable[[_T], _R], workers: int, window: int) -> Iterator[_R]:
+    """
+    Run ``fetch`` over ``items`` on a thread pool and yield results in input order.
+
+    At most ``window`` fetches are in flight, so the caller processes page N
+    while pages N+1..N+window are being fetched. Output order never depends on
+    which request finishes first.
+    """
+    if workers <= 1:
+        for item in items:
+            yield fetch(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="confluence-fetch") as pool:
+        yield from ordered_map(pool, fetch, items, window)
+
+
 def _resolve_space_map(
     client: ConfluenceClient,
     space_keys: list[str] | None,
@@ -314,6 +502,70 @@ def _cql_for_since(space_keys: list[str], since: datetime) -> str:
     return f'type=page AND lastModified > "{iso}" ORDER BY lastmodified ASC'
 
 
+def _cql_for_pages(space_keys: list[str]) -> str:
+    if space_keys:
+        keys = " OR ".join([f'space="{k}"' for k in space_keys])
+        return f"type=page AND ({keys})"
+    return "type=page"
+
+
+CQL_PAGE_SIZE = 50
+CQL_METADATA_EXPAND = "metadata.labels,ancestors"
+
+
+def _page_metadata_from_result(result: dict) -> _PageMetadata:
+    """Extract expanded labels/ancestors from a v1 search result, if the expansion is complete."""
+    labels = None
+    label_page = (result.get("metadata") or {}).get("labels")
+    # Expanded labels are themselves paginated; only trust a complete first page
+    if isinstance(label_page, dict) and not (label_page.get("_links") or {}).get("next"):
+        labels = label_page.get("results") or []
+
+    ancestors = result.get("ancestors")
+    return _PageMetadata(
+        labels=labels,
+        ancestors=ancestors if isinstance(ancestors, list) else None,
+        version=listed_version(result),
+    )
+
+
+def _search_pages(
+    client: Any, cql: str, with_metadata: bool = True, with_versions: bool = False
+) -> tuple[list[str], dict[str, _PageMetadata]]:
+    """
+    Page through a CQL search, optionally with labels and ancestors (and versions) expanded.
+
+    Returns page ids in result order plus a page_id -> metadata map (empty when
+    neither expansion is requested). With metadata this replaces two per-page
+    requests with one request per ``CQL_PAGE_SIZE`` pages.
+    """
+    ids: list[str] = []
+    metadata: dict[str, _PageMetadata] = {}
+    expand = ",".join(([CQL_METADATA_EXPAND] if with_metadata else []) + (["version"] if with_versions else []))
+    start = 0
+    while True:
+        data = client.search_cql(
+            cql=cql,
+            start=start,
+            limit=CQL_PAGE_SIZE,
+            expand=expand or None,
+        )
+        results = data.get("results", [])
+        if not results:
+            break
+        for result in results:
+            if result.get("id") is None:
+                continue
+            page_id = str(result.get("id"))
+            ids.append(page_id)
+            if with_metadata or with_versions:
+                metadata[page_id] = _page_metadata_from_result(result)
+        if len(results) < CQL_PAGE_SIZE:
+            break
+        start += CQL_PAGE_SIZE
+    return ids, metadata
+
+
 def ingest_confluence(
     outdir: str,
     space_keys: list[str] | None = None,
@@ -325,11 +577,30 @@ def ingest_confluence(
     progress: bool = False,
     progress_every: int = 1,
     run_id: str | None = None,
+    fetch_workers: int | None = None,
+    bulk_metadata: bool | None = None,
+    resume: bool = False,
+    delta: bool | None = None,
 ) -> dict:
     """
     Fetch pages via v2 (bodies + attachments). If since is provided, prefilter ids with v1 CQL.
     Write one Page per line to confluence.ndjson and emit metrics/manifest.
     Enhanced with progress logging, sidecars, auto-since, and seen IDs tracking.
+
+    With ``resume``, an interrupted run in ``outdir`` continues from its last
+    progress.json checkpoint instead of starting over.
+
+    With ``delta`` (default: CONFLUENCE_DELTA; needs ``run_id``), pages whose
+    version matches the page-version store are copied from the previous run's
+    NDJSON instead of being downloaded again. A space is listed without bodies
+    only when at least CONFLUENCE_DELTA_MIN_CARRYABLE of its stored pages can
+    still be carried. Label, ancestor and attachment changes don't bump a page's
+    version: carried pages get fresh labels and ancestors when bulk metadata is
+    harvested, but keep the previous run's attachments.
+
+    Bulk metadata (default: CONFLUENCE_BULK_METADATA) is harvested for a whole
+    space, so it is skipped when ``max_pages`` leaves fewer than CQL_PAGE_SIZE
+    pages to write; those pages fetch their labels and ancestors one by one.
     """
     outdir_path = Path(outdir)
     outdir_path.mkdir(parents=True, exist_ok=True)
@@ -349,6 +620,7 @@ def ingest_confluence(
     edges_jsonl_path = outdir_path / "edges.jsonl"
     labels_jsonl_path = outdir_path / "labels.jsonl"
     breadcrumbs_jsonl_path = outdir_path / "breadcrumbs.jsonl"
+    storage_extract_path = outdir_path / STORAGE_EXTRACT_FILE
 
     # Progress checkpoint file
     progress_json_path = outdir_path / "progress.json"
@@ -356,6 +628,14 @@ def ingest_confluence(
 
     started_at = datetime.now(timezone.utc)
 
+    checkpoint: dict | None = None
+    if resume:
+        if manifest_path.exists() and metrics_path.exists():
+            log.info("ingest.confluence.resume.already_complete", outdir=str(outdir_path))
+            completed: dict = json.loads(metrics_path.read_text(encoding="utf-8"))
+            return completed
+        checkpoint = _load_resume_checkpoint(progress_json_path)
+
     client = ConfluenceClient()
     site_base = client.site_base
 
@@ -364,9 +644,8 @@ def ingest_confluence(
 
     progress_renderer = get_progress()
 
-    # Initialize event logging
+    # Event log for this run; opened with the sidecars below so it is closed on every exit path
     event_log_path = outdir_path.parent.parent / "logs" / f"{run_id}.ndjson"
-    event_logger = init_event_logger(event_log_path, run_id or "unknown")
 
     # Resolve spaces
     space_id_list, space_key_by_id = _resolve_space_map(client, space_keys, space_ids)
@@ -402,7 +681,9 @@ def ingest_confluence(
         progress_renderer.spaces_table(spaces_info)
 
     # Check for previous progress checkpoint
-    if auto_since and progress_json_path.exists():
+    if checkpoint is not None:
+        progress_renderer.resume_indicator(checkpoint.get("last_page_id", ""), checkpoint.get("timestamp", ""))
+    elif auto_since and progress_json_path.exists():
         try:
             with open(progress_json_path) as f:
                 progress_data = json.load(f)
@@ -455,36 +736,28 @@ def ingest_confluence(
                 )
 
     # Determine candidate page IDs if since provided
+    use_bulk_metadata = SETTINGS.CONFLUENCE_BULK_METADATA if bulk_metadata is None else bulk_metadata
+    # Delta mode: the store records where each page was last written, keyed by run
+    use_delta = (SETTINGS.CONFLUENCE_DELTA if delta is None else delta) and run_id is not None
+    version_store = PageVersionStore() if use_delta else None
+    page_metadata: dict[str, _PageMetadata] = {}
+    metadata_harvested = 0
     candidate_ids: list[str] | None = None
     if effective_since:
         cql = _cql_for_since(space_keys or list(space_key_by_id.values()), effective_since)
-        start, ids = 0, []
-        while True:
-            data = client.search_cql(cql=cql, start=start, limit=50)
-            results = data.get("results", [])
-            if not results:
-                break
-            ids.extend([str(r.get("id")) for r in results if r.get("id") is not None])
-            if len(results) < 50:
-                break
-            start += 50
-        candidate_ids = ids
+        # The since-prefilter search already returns every candidate, so expanding
+        # labels/ancestors on it harvests their metadata at no extra request cost
+        candidate_ids, page_metadata = _search_pages(
+            client, cql, with_metadata=use_bulk_metadata, with_versions=version_store is not None
+        )
+        if use_bulk_metadata:
+            metadata_harvested += len(page_metadata)
 
     # Initialize tracking data
     written_pages = 0
     written_attachments = 0
     # Content size tracking removed - we use actual file size for reporting
     seen_page_ids: dict[str, set[str]] = {}  # space_key -> set of page IDs
-    pages_data = []  # For CSV export
-    attachments_data = []  # For CSV export
-
-    # Traceability tracking
-    links_data = []  # For links.jsonl export
-    attachments_manifest_data = []  # For attachments_manifest.jsonl export
-    media_data = []  # For ingest_media.jsonl export
-    edges_data = []  # For edges.jsonl export (hierarchy, labels)
-    labels_data = []  # For labels.jsonl export
-    breadcrumbs_data = []  # For breadcrumbs.jsonl export
 
     link_stats = {
         "total": 0,
@@ -504,43 +777,164 @@ def ingest_confluence(
     last_highwater: datetime | None = None
     space_key_unknown_count: dict[str, int] = {}  # Track failed space_key resolutions
 
-    # Open CSV writers
-    with (
-        ndjson_path.open("w", encoding="utf-8") as out,
-        pages_csv_path.open("w", newline="", encoding="utf-8") as pages_csv_file,
-        attachments_csv_path.open("w", newline="", encoding="utf-8") as att_csv_file,
-    ):
-        pages_csv = csv.DictWriter(
-            pages_csv_file,
-            fieldnames=[
-                "space_key",
-                "page_id",
-                "title",
-                "version",
-                "updated_at",
-                "attachments_count",
-                "url",
-            ],
+    # Resuming: cut every streamed file back to the checkpoint so they agree with each other
+    if checkpoint is not None:
+        for name, size in checkpoint["offsets"].items():
+            truncate_to(outdir_path / name, size)
+
+    # Position of the page being written, persisted in progress.json for resume
+    position: dict[str, str | None] = {"space_id": None, "cursor": None}
+
+    # Delta bookkeeping: where each page lands in this run's NDJSON, for the version store
+    ndjson_offset = 0
+    written_versions: dict[str, PageVersion] = {}
+    delta_carried = 0
+    delta_fetched = 0
+
+    # Sidecars stream to disk as pages are written; CSVs are sorted at close
+    with ExitStack() as sidecars:
+        # Owned by this run (not the global logger) so concurrent space ingests don't share a file
+        event_logger = sidecars.enter_context(
+            EventLogger(event_log_path, run_id or "unknown", append=checkpoint is not None)
         )
-        pages_csv.writeheader()
-
-        attachments_csv = csv.DictWriter(
-            att_csv_file,
-            fieldnames=[
-                "page_id",
-                "filename",
-                "media_type",
-                "file_size",
-                "download_url",
-            ],
+        out = sidecars.enter_context(ndjson_path.open("a" if checkpoint else "w", encoding="utf-8"))
+        pages_csv = SortedCsvSidecar(
+            pages_csv_path,
+            fieldnames=PAGES_CSV_FIELDS,
+            key=lambda row: (row["space_key"], row["page_id"]),
         )
-        attachments_csv.writeheader()
+        sidecars.callback(pages_csv.close)
+        attachments_csv = SortedCsvSidecar(
+            attachments_csv_path,
+            fieldnames=ATTACHMENTS_CSV_FIELDS,
+            key=lambda row: (row["page_id"], row["filename"]),
+        )
+        sidecars.callback(attachments_csv.close)
+
+        append = checkpoint is not None
+        links_jsonl = JsonlSidecar(links_jsonl_path, append=append)
+        attachments_manifest_jsonl = JsonlSidecar(attachments_manifest_path, append=append)
+        media_jsonl = JsonlSidecar(ingest_media_path, append=append)
+        edges_jsonl = JsonlSidecar(edges_jsonl_path, append=append)
+        labels_jsonl = JsonlSidecar(labels_jsonl_path, append=append)
+        breadcrumbs_jsonl = JsonlSidecar(breadcrumbs_jsonl_path, append=append)
+        # Markdown/links for normalize, derived from the same parse as links and media
+        storage_extract_jsonl = JsonlSidecar(storage_extract_path, append=append)
+        storage_extracted: set[str] = set()
+        jsonl_sidecars = [
+            links_jsonl,
+            attachments_manifest_jsonl,
+            media_jsonl,
+            edges_jsonl,
+            labels_jsonl,
+            breadcrumbs_jsonl,
+            storage_extract_jsonl,
+        ]
+        for sidecar in jsonl_sidecars:
+            sidecars.callback(sidecar.close)
+        if version_store is not None:
+            sidecars.callback(version_store.close)
+
+        def track_page(p: Page) -> None:
+            """Account a written page: seen ids, per-space stats, highwater, CSV rows and totals."""
+            nonlocal written_pages, written_attachments, last_highwater, labels_total, ancestors_total
+
+            # Track seen IDs
+            space_key = p.space_key or "__unknown__"
+            if space_key not in seen_page_ids:
+                seen_page_ids[space_key] = set()
+            seen_page_ids[space_key].add(p.id)
+
+            # Track stats
+            if space_key not in space_stats:
+                space_stats[space_key] = {
+                    "pages": 0,
+                    "attachments": 0,
+                    "empty_bodies": 0,
+                    "total_chars": 0,
+                }
+            space_stats[space_key]["pages"] += 1
+            space_stats[space_key]["attachments"] += len(p.attachments)
+
+            body_content = p.body_html or ""
+            if not body_content.strip():
+                space_stats[space_key]["empty_bodies"] += 1
+            space_stats[space_key]["total_chars"] += len(body_content)
+
+            # Track highwater mark
+            if p.updated_at:
+                if last_highwater is None or p.updated_at > last_highwater:
+                    last_highwater = p.updated_at
+
+            # CSV data
+            pages_csv.write(
+                {
+                    "space_key": space_key,
+                    "page_id": p.id,
+                    "title": p.title,
+                    "version": str(p.version) if p.version else "",
+                    "updated_at": _iso(p.updated_at) if p.updated_at else "",
+                    "attachments_count": len(p.attachments),
+                    "url": p.url or "",
+                }
+            )
+
+            for att in p.attachments:
+                attachments_csv.write(
+                    {
+                        "page_id": p.id,
+                        "filename": att.filename or "",
+                        "media_type": att.media_type or "",
+                        "file_size": (str(att.file_size) if att.file_size else ""),
+                        "download_url": att.download_url or "",
+                    }
+                )
+
+            labels_total += len(p.labels)
+            ancestors_total += len(p.ancestors)
+            written_pages += 1
+            written_attachments += len(p.attachments)
+
+        def remember_offset(p: Page, content_sha256: str | None, nbytes: int) -> None:
+            """Record where a page's NDJSON line starts in this run, then advance past it."""
+            nonlocal ndjson_offset
+            if version_store is not None:
+                written_versions[p.id] = PageVersion(
+                    version=p.version,
+                    content_sha256=content_sha256,
+                    run_id=run_id,
+                    space_key=p.space_key,
+                    path=str(ndjson_path.resolve()),
+                    offset=ndjson_offset,
+                    length=nbytes,
+                )
+            ndjson_offset += nbytes
+
+        # Replay the kept partial output so counters, CSVs and seen ids continue where they stopped
+        if checkpoint is not None:
+            with ndjson_path.open("rb") as kept:
+                for raw in kept:
+                    if raw.strip():
+                        record = json.loads(raw)
+                        page = Page.model_validate(record)
+                        track_page(page)
+                        remember_offset(page, record.get("content_sha256"), len(raw))
+                    else:
+                        ndjson_offset += len(raw)
+            for link in iter_jsonl(links_jsonl_path):
+                _count_link(link_stats, link.get("target_type"), link.get("target_page_id"))
+            media_refs_total = sum(1 for _ in iter_jsonl(ingest_media_path))
+            log.info(
+                "ingest.confluence.resume",
+                pages=written_pages,
+                space_id=checkpoint.get("space_id"),
+                cursor=checkpoint.get("cursor"),
+            )
+        resumed_ids = {page_id for ids in seen_page_ids.values() for page_id in ids}
 
-        def write_page_obj(p: Page, obj: dict):
-            nonlocal written_pages, written_attachments, last_highwater
-            nonlocal link_stats, links_data, attachments_manifest_data
-            nonlocal media_data, edges_data, labels_data, breadcrumbs_data
-            nonlocal content_hash_collisions, media_refs_total, labels_total, ancestors_total
+        def write_page_obj(p: Page, obj: dict, carried: str | None = None):
+            """Write a page and its sidecar rows; ``carried`` is its unchanged NDJSON line from a previous run."""
+            nonlocal content_hash_collisions, media_refs_total, delta_carried, delta_fetched
             page_dict = p.model_dump(mode="json")
 
             # Add new body representation fields
@@ -566,29 +960,22 @@ def ingest_confluence(
             page_dict["attachment_count"] = len(p.attachments)
             p.attachment_count = len(p.attachments)
 
+            # Storage bodies are parsed once for links, media and normalize's Markdown
+            storage_doc = StorageDoc(body_storage) if repr_ == "storage" and body_storage else None
+
             # Extract links for traceability
             page_links = []
-            if repr_ == "storage":
-                page_links = extract_links_from_storage_with_classification(page_dict.get("body_storage"), site_base)
+            if storage_doc is not None:
+                page_links = storage_doc.links(site_base)
             elif repr_ == "adf":
                 page_links = extract_links_from_adf_with_classification(page_dict.get("body_adf"), site_base)
 
             # Process links for sidecars
             for link in page_links:
-                link_stats["total"] += 1
-
-                if link.target_type == "confluence":
-                    if link.target_page_id:
-                        link_stats["internal"] += 1
-                    else:
-                        link_stats["unresolved"] += 1
-                elif link.target_type == "external":
-                    link_stats["external"] += 1
-                elif link.target_type == "attachment":
-                    link_stats["attachment_refs"] += 1
+                _count_link(link_stats, link.target_type, link.target_page_id)
 
                 # Add to links sidecar data
-                links_data.append(
+                links_jsonl.write(
                     {
                         "from_page_id": p.id,
                         "from_url": p.url,
@@ -602,7 +989,7 @@ def ingest_confluence(
 
             # Process attachments for manifest
             for attachment in p.attachments:
-                attachments_manifest_data.append(
+                attachments_manifest_jsonl.write(
                     {
                         "page_id": p.id,
                         "filename": attachment.filename,
@@ -616,8 +1003,8 @@ def ingest_confluence(
             page_media = []
             if repr_ == "adf" and body_adf:
                 page_media = extract_media_from_adf(body_adf)
-            elif repr_ == "storage" and body_storage:
-                page_media = extract_media_from_storage(body_storage)
+            elif storage_doc is not None:
+                page_media = storage_doc.media()
 
             # Resolve attachment IDs for media
             if page_media and p.attachments:
@@ -626,7 +1013,7 @@ def ingest_confluence(
 
             # Add media to sidecar data
             for media in page_media:
-                media_data.append(
+                media_jsonl.write(
                     {
                         "page_id": p.id,
                         "order": media.order,
@@ -639,12 +1026,22 @@ def ingest_confluence(
                 )
                 media_refs_total += 1
 
+            # One extract per distinct body; normalize looks it up by the body's sha256
+            if storage_doc is not None:
+                extract_key = storage_sha256(storage_doc.xhtml)
+                if extract_key not in storage_extracted:
+                    storage_extracted.add(extract_key)
+                    extract = storage_doc.extract()
+                    storage_extract_jsonl.write(
+                        {"content_sha256": extract_key, "text_md": extract.text_md, "links": extract.links}
+                    )
+
             # Process labels
             for label in p.labels:
-                labels_data.append({"page_id": p.id, "label": label})
+                labels_jsonl.write({"page_id": p.id, "label": label})
 
                 # Add label edge
-                edges_data.append(
+                edges_jsonl.write(
                     {
                         "type": "LABELED_AS",
                         "src": p.id,
@@ -652,17 +1049,13 @@ def ingest_confluence(
                     }
                 )
 
-            labels_total += len(p.labels)
-
             # Process hierarchy (ancestors and containment)
             for ancestor in p.ancestors:
-                edges_data.append({"type": "PARENT_OF", "src": ancestor.id, "dst": p.id})
-
-            ancestors_total += len(p.ancestors)
+                edges_jsonl.write({"type": "PARENT_OF", "src": ancestor.id, "dst": p.id})
 
             # Add space containment edge
             if p.space_key:
-                edges_data.append(
+                edges_jsonl.write(
                     {
                         "type": "CONTAINS",
                         "src": f"space:{p.space_key}",
@@ -678,68 +1071,44 @@ def ingest_confluence(
                 breadcrumb_items.append(ancestor.title)
             breadcrumb_items.append(p.title)
 
-            breadcrumbs_data.append({"page_id": p.id, "breadcrumbs": breadcrumb_items})
-
-            # Write NDJSON
-            out.write(json.dumps(page_dict, ensure_ascii=False, sort_keys=True) + "\n")
+            breadcrumbs_jsonl.write({"page_id": p.id, "breadcrumbs": breadcrumb_items})
 
-            # Track seen IDs
+            # Write NDJSON (carried-forward pages are copied byte for byte)
+            line = carried or json.dumps(page_dict, ensure_ascii=False, sort_keys=True) + "\n"
+            out.write(line)
+            nbytes = len(line.encode("utf-8"))
+            remember_offset(p, page_dict.get("content_sha256"), nbytes)
+            track_page(p)
             space_key = p.space_key or "__unknown__"
-            if space_key not in seen_page_ids:
-                seen_page_ids[space_key] = set()
-            seen_page_ids[space_key].add(p.id)
 
-            # Track stats
-            if space_key not in space_stats:
-                space_stats[space_key] = {
-                    "pages": 0,
-                    "attachments": 0,
-                    "empty_bodies": 0,
-                    "total_chars": 0,
-                }
-            space_stats[space_key]["pages"] += 1
-            space_stats[space_key]["attachments"] += len(p.attachments)
-
-            body_content = p.body_html or ""
-            if not body_content.strip():
-                space_stats[space_key]["empty_bodies"] += 1
-            space_stats[space_key]["total_chars"] += len(body_content)
-
-            # Track highwater mark
-            if p.updated_at:
-                if last_highwater is None or p.updated_at > last_highwater:
-                    last_highwater = p.updated_at
-
-            # CSV data
-            pages_data.append(
-                {
-                    "space_key": space_key,
-                    "page_id": p.id,
-                    "title": p.title,
-                    "version": str(p.version) if p.version else "",
-                    "updated_at": _iso(p.updated_at) if p.updated_at else "",
-                    "attachments_count": len(p.attachments),
-                    "url": p.url or "",
-                }
-            )
-
-            for att in p.attachments:
-                attachments_data.append(
-                    {
-                        "page_id": p.id,
-                        "filename": att.filename or "",
-                        "media_type": att.media_type or "",
-                        "file_size": (str(att.file_size) if att.file_size else ""),
-                        "download_url": att.download_url or "",
-                    }
-                )
+            if version_store is not None:
+                previous = version_store.get(p.id)
+                if carried is not None:
+                    delta_carried += 1
+                    event_logger.delta_skip(
+                        source="confluence",
+                        space_key=space_key,
+                        page_id=p.id,
+                        reason="version_unchanged",
+                        last_modified=_iso(p.updated_at),
+                        current_version=p.version,
+                    )
+                else:
+                    delta_fetched += 1
+                    event_logger.delta_fetch(
+                        source="confluence",
+                        space_key=space_key,
+                        page_id=p.id,
+                        reason="new" if previous is None else "version_changed",
+                        last_modified=_iso(p.updated_at),
+                        current_version=p.version,
+                        previous_version=previous.version if previous else None,
+                    )
 
             # Event logging for page write
-            event_logger = get_event_logger()
             if event_logger:
-                # Calculate bytes written (rough estimate)
-                page_json = json.dumps(page_dict, ensure_ascii=False, sort_keys=True)
-                bytes_written = len(page_json.encode("utf-8"))
+                # Bytes written, excluding the newline
+                bytes_written = nbytes - 1
 
                 event_logger.page_write(
                     source="confluence",
@@ -787,19 +1156,27 @@ def ingest_confluence(
                 throttle_every=progress_every,
             )
 
-            written_pages += 1
-            written_attachments += len(p.attachments)
-
             # Content size tracking removed - we use actual file size instead
 
             # Write progress checkpoint every progress_every pages
             if written_pages % progress_every == 0:
+                # Flush data before the checkpoint so progress.json never points past what's on disk
+                out.flush()
+                for sidecar in jsonl_sidecars:
+                    sidecar.flush()
                 checkpoint_data = {
                     "last_page_id": p.id,
                     "pages_processed": written_pages,
                     "attachments_processed": written_attachments,
                     "timestamp": _iso(datetime.now(timezone.utc)),
                     "progress_checkpoints": written_pages // progress_every,
+                    # Resume state: where listing continues and how much of each file is valid
+                    "space_id": position["space_id"],
+                    "cursor": position["cursor"],
+                    "offsets": {
+                        ndjson_path.name: ndjson_path.stat().st_size,
+                        **{sidecar.path.name: sidecar.size() for sidecar in jsonl_sidecars},
+                    },
                 }
                 try:
                     with open(progress_json_path, "w") as f:
@@ -817,6 +1194,81 @@ def ingest_confluence(
                         error=str(e),
                     )
 
+        def write_carried(fetched: _PageFetch) -> Page:
+            """
+            Write an unchanged page carried forward from the previous run; sidecars are rebuilt from it.
+
+            Labels and ancestors harvested in bulk replace the previous run's (the
+            record is re-serialized only if they changed); attachments are carried
+            as they were.
+            """
+            line = fetched.carried or ""
+            record = json.loads(line)
+            refreshed = dict(record)
+            if fetched.labels is not None:
+                labels = _label_names(fetched.labels)
+                refreshed.update(labels=labels, label_count=len(labels))
+            if fetched.ancestors is not None:
+                ancestors = [a.model_dump(mode="json") for a in _page_ancestors(site_base, fetched.ancestors)]
+                refreshed.update(ancestors=ancestors, ancestor_count=len(ancestors))
+            if refreshed != record:
+                record = refreshed
+                line = json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n"
+            page = Page.model_validate(record)
+            write_page_obj(page, _body_obj_from_record(record), carried=line)
+            return page
+
+        def add_attachments(page: Page, fetched: _PageFetch) -> None:
+            """Attach prefetched attachments to the page, logging fetch failures and count mismatches."""
+            if fetched.attachment_error is not None:
+                log.error(
+                    "confluence.attachments.fetch_failed",
+                    page_id=page.id,
+                    retry_count=fetched.attachment_retries,
+                    error=fetched.attachment_error,
+                )
+                event_logger.error(
+                    message=f"Failed to fetch attachments for page {page.id}",
+                    error_type="attachment_fetch_failed",
+                    context={"page_id": page.id},
+                    retry_count=fetched.attachment_retries,
+                )
+
+            for att in fetched.attachments:
+                page.attachments.append(_map_attachment(site_base, att))
+                event_logger.attachment_fetch(
+                    source="confluence",
+                    page_id=page.id,
+                    attachment_id=att.get("id"),
+                    attachment_title=att.get("title"),
+                    mime=att.get("mediaType"),
+                    download_url=att.get("downloadLink"),
+                    file_size=att.get("fileSize"),
+                )
+
+            # Verify attachment count
+            expected_count = len(fetched.attachments)
+            actual_count = len(page.attachments)
+            if expected_count != actual_count:
+                progress_renderer.attachment_verification_error(
+                    page_id=page.id,
+                    expected=expected_count,
+                    actual=actual_count,
+                )
+                event_logger.warning(
+                    message=f"Attachment count mismatch for page {page.id}",
+                    context={
+                        "page_id": page.id,
+                        "expected": expected_count,
+                        "actual": actual_count,
+                    },
+                )
+
+        # Labels, ancestors and attachments for upcoming pages are fetched on a
+        # thread pool while the current page is written; output order is unchanged.
+        workers = fetch_workers if fetch_workers is not None else SETTINGS.CONFLUENCE_FETCH_WORKERS
+        prefetch_window = max(SETTINGS.CONFLUENCE_PREFETCH_PAGES, workers)
+
         if candidate_ids is not None:
             # Single space since mode - log space begin/end
             first_space_key = (
@@ -835,95 +1287,39 @@ def ingest_confluence(
             space_pages = 0
             space_attachments = 0
 
-            for pid in candidate_ids:
+            remaining = max_pages - written_pages if max_pages else None
+            for fetched in _prefetch_in_order(
+                islice(((None, pid) for pid in candidate_ids if pid not in resumed_ids), remaining),
+                partial(_fetch_listed, client, metadata=page_metadata, versions=version_store, body_format=body_format),
+                workers,
+                prefetch_window,
+            ):
+                if fetched.carried is not None:
+                    page = write_carried(fetched)
+                    space_pages += 1
+                    space_attachments += len(page.attachments)
+                    continue
                 event_logger.page_fetch(
                     source="confluence",
                     space_key=first_space_key,
-                    page_id=pid,
+                    page_id=str(fetched.obj.get("id")),
                     since_mode=True,
                 )
-
-                obj = client.get_page_by_id(pid, body_format=body_format)
                 page = _map_page(
                     site_base,
                     space_key_by_id,
-                    obj,
+                    fetched.obj,
                     client,
                     space_key_unknown_count,
                     space_details_cache,
+                    labels_data=fetched.labels,
+                    ancestors_data=fetched.ancestors,
                 )
-                # attachments with retry logic
-                attachments_fetched = []
-                attachment_retry_count = 0
-                max_attachment_retries = 3
-
-                while attachment_retry_count <= max_attachment_retries:
-                    try:
-                        attachments_fetched = list(client.get_attachments_for_page(page.id))
-                        break
-                    except Exception as e:
-                        attachment_retry_count += 1
-                        if attachment_retry_count > max_attachment_retries:
-                            log.error(
-                                "confluence.attachments.fetch_failed",
-                                page_id=page.id,
-                                retry_count=attachment_retry_count,
-                                error=str(e),
-                            )
-                            event_logger.error(
-                                message=f"Failed to fetch attachments for page {page.id}",
-                                error_type="attachment_fetch_failed",
-                                context={"page_id": page.id},
-                                retry_count=attachment_retry_count,
-                            )
-                            break
-
-                        # Exponential backoff: 1s, 2s, 4s
-                        time.sleep(2 ** (attachment_retry_count - 1))
-                        log.warning(
-                            "confluence.attachments.fetch_retry",
-                            page_id=page.id,
-                            retry_count=attachment_retry_count,
-                            error=str(e),
-                        )
-
-                for att in attachments_fetched:
-                    page.attachments.append(_map_attachment(site_base, att))
-                    event_logger.attachment_fetch(
-                        source="confluence",
-                        page_id=page.id,
-                        attachment_id=att.get("id"),
-                        attachment_title=att.get("title"),
-                        mime=att.get("mediaType"),
-                        download_url=att.get("downloadLink"),
-                        file_size=att.get("fileSize"),
-                    )
-
-                # Verify attachment count
-                expected_count = len(attachments_fetched)
-                actual_count = len(page.attachments)
-                if expected_count != actual_count:
-                    progress_renderer.attachment_verification_error(
-                        page_id=page.id,
-                        expected=expected_count,
-                        actual=actual_count,
-                    )
-                    event_logger.warning(
-                        message=f"Attachment count mismatch for page {page.id}",
-                        context={
-                            "page_id": page.id,
-                            "expected": expected_count,
-                            "actual": actual_count,
-                        },
-                    )
-
-                write_page_obj(page, obj)
+                add_attachments(page, fetched)
+                write_page_obj(page, fetched.obj)
                 space_pages += 1
                 space_attachments += len(page.attachments)
 
-                if max_pages and written_pages >= max_pages:
-                    break
-
             # Log space completion
             event_logger.space_end(
                 source="confluence",
@@ -941,6 +1337,12 @@ def ingest_confluence(
             else:
                 target_spaces = [None]  # None => all pages
 
+            # Resuming: spaces before the checkpointed one are already complete
+            resume_cursor = None
+            if checkpoint is not None and checkpoint.get("space_id") in target_spaces:
+                target_spaces = target_spaces[target_spaces.index(checkpoint["space_id"]) :]
+                resume_cursor = checkpoint.get("cursor")
+
             for sid in target_spaces:
                 # Get space key for logging
                 space_key = space_key_by_id.get(sid, "unknown") if sid else "all_spaces"
@@ -956,14 +1358,61 @@ def ingest_confluence(
                 space_pages = 0
                 space_attachments = 0
 
-                for obj in client.get_pages(space_id=sid, body_format=body_format):
+                remaining = max_pages - written_pages if max_pages else None
+                page_metadata = {}
+                # The harvest costs one request per CQL_PAGE_SIZE pages of the whole space; a run
+                # capped below that fetches labels and ancestors per page (two requests each) instead
+                harvest = remaining is None or remaining >= CQL_PAGE_SIZE
+                if use_bulk_metadata and harvest and (sid is None or sid in space_key_by_id):
+                    harvest_keys = [space_key_by_id[sid]] if sid else []
+                    _, page_metadata = _search_pages(client, _cql_for_pages(harvest_keys))
+                    metadata_harvested += len(page_metadata)
+
+                # List without bodies (fetching only changed pages by id) only when most of this
+                # space's stored pages can still be carried; otherwise each page would cost a GET
+                list_format: str | None = body_format
+                if version_store is not None:
+                    carryable = version_store.carryable_share(space_key_by_id.get(sid) if sid else None)
+                    if carryable >= SETTINGS.CONFLUENCE_DELTA_MIN_CARRYABLE:
+                        list_format = None
+                    log.info(
+                        "confluence.delta.listing",
+                        space_key=space_key,
+                        carryable_share=round(carryable, 3),
+                        with_bodies=list_format is not None,
+                    )
+                # Already-written pages are dropped before prefetch so a resume never refetches them
+                listed = (
+                    (cursor, obj)
+                    for cursor, obj in _list_pages(client, sid, list_format, resume_cursor)
+                    if str(obj.get("id")) not in resumed_ids
+                )
+                resume_cursor = None
+                position["space_id"] = sid
+
+                for fetched in _prefetch_in_order(
+                    islice(listed, remaining),
+                    partial(
+                        _fetch_listed, client, metadata=page_metadata, versions=version_store, body_format=body_format
+                    ),
+                    workers,
+                    prefetch_window,
+                ):
+                    position["cursor"] = fetched.cursor
+                    if fetched.carried is not None:
+                        page = write_carried(fetched)
+                        space_pages += 1
+                        space_attachments += len(page.attachments)
+                        continue
                     page = _map_page(
                         site_base,
                         space_key_by_id,
-                        obj,
+                        fetched.obj,
                         client,
                         space_key_unknown_count,
                         space_details_cache,
+                        labels_data=fetched.labels,
+                        ancestors_data=fetched.ancestors,
                     )
 
                     # Log page fetch
@@ -977,78 +1426,11 @@ def ingest_confluence(
                         version=page.version,
                     )
 
-                    # Process attachments with retry logic
-                    attachments_fetched = []
-                    attachment_retry_count = 0
-                    max_attachment_retries = 3
-
-                    while attachment_retry_count <= max_attachment_retries:
-                        try:
-                            attachments_fetched = list(client.get_attachments_for_page(page.id))
-                            break
-                        except Exception as e:
-                            attachment_retry_count += 1
-                            if attachment_retry_count > max_attachment_retries:
-                                log.error(
-                                    "confluence.attachments.fetch_failed",
-                                    page_id=page.id,
-                                    retry_count=attachment_retry_count,
-                                    error=str(e),
-                                )
-                                event_logger.error(
-                                    message=f"Failed to fetch attachments for page {page.id}",
-                                    error_type="attachment_fetch_failed",
-                                    context={"page_id": page.id},
-                                    retry_count=attachment_retry_count,
-                                )
-                                break
-
-                            # Exponential backoff: 1s, 2s, 4s
-                            time.sleep(2 ** (attachment_retry_count - 1))
-                            log.warning(
-                                "confluence.attachments.fetch_retry",
-                                page_id=page.id,
-                                retry_count=attachment_retry_count,
-                                error=str(e),
-                            )
-
-                    for att in attachments_fetched:
-                        page.attachments.append(_map_attachment(site_base, att))
-                        event_logger.attachment_fetch(
-                            source="confluence",
-                            page_id=page.id,
-                            attachment_id=att.get("id"),
-                            attachment_title=att.get("title"),
-                            mime=att.get("mediaType"),
-                            download_url=att.get("downloadLink"),
-                            file_size=att.get("fileSize"),
-                        )
-
-                    # Verify attachment count
-                    expected_count = len(attachments_fetched)
-                    actual_count = len(page.attachments)
-                    if expected_count != actual_count:
-                        progress_renderer.attachment_verification_error(
-                            page_id=page.id,
-                            expected=expected_count,
-                            actual=actual_count,
-                        )
-                        event_logger.warning(
-                            message=f"Attachment count mismatch for page {page.id}",
-                            context={
-                                "page_id": page.id,
-                                "expected": expected_count,
-                                "actual": actual_count,
-                            },
-                        )
-
-                    write_page_obj(page, obj)
+                    add_attachments(page, fetched)
+                    write_page_obj(page, fetched.obj)
                     space_pages += 1
                     space_attachments += len(page.attachments)
 
-                    if max_pages and written_pages >= max_pages:
-                        break
-
                 # Log space completion
                 event_logger.space_end(
                     source="confluence",
@@ -1063,39 +1445,9 @@ def ingest_confluence(
                 if max_pages and written_pages >= max_pages:
                     break
 
-    # Write deterministic CSV data
-    pages_data.sort(key=lambda x: (x["space_key"], x["page_id"]))
-    attachments_data.sort(key=lambda x: (x["page_id"], x["filename"]))
-
-    with pages_csv_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "space_key",
-                "page_id",
-                "title",
-                "version",
-                "updated_at",
-                "attachments_count",
-                "url",
-            ],
-        )
-        writer.writeheader()
-        writer.writerows(pages_data)
-
-    with attachments_csv_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "page_id",
-                "filename",
-                "media_type",
-                "file_size",
-                "download_url",
-            ],
-        )
-        writer.writeheader()
-        writer.writerows(attachments_data)
+    # Point the version store at this run's copies (carried pages included), so older runs can go
+    if version_store is not None:
+        version_store.save(written_versions)
 
     # Write seen page IDs per space
     for space_key, page_ids in seen_page_ids.items():
@@ -1135,7 +1487,7 @@ def ingest_confluence(
         "labels_total": labels_total,
         "ancestors_total": ancestors_total,
         "content_hash_collisions": content_hash_collisions,
-        "resume_from": None,  # For future use
+        "resume_from": checkpoint.get("last_page_id") if checkpoint else None,
         "checkpoints_written": (written_pages // progress_every if progress_every > 0 else 0),
         "spaces": {},
     }
@@ -1156,32 +1508,6 @@ def ingest_confluence(
     with open(summary_json_path, "w") as f:
         json.dump(summary_data, f, indent=2, sort_keys=True)
 
-    # Write traceability sidecar files
-    with open(links_jsonl_path, "w", encoding="utf-8") as f:
-        for link_record in links_data:
-            f.write(json.dumps(link_record, ensure_ascii=False, sort_keys=True) + "\n")
-
-    with open(attachments_manifest_path, "w", encoding="utf-8") as f:
-        for attachment_record in attachments_manifest_data:
-            f.write(json.dumps(attachment_record, ensure_ascii=False, sort_keys=True) + "\n")
-
-    # Write new sidecar files
-    with open(ingest_media_path, "w", encoding="utf-8") as f:
-        for media_record in media_data:
-            f.write(json.dumps(media_record, ensure_ascii=False, sort_keys=True) + "\n")
-
-    with open(edges_jsonl_path, "w", encoding="utf-8") as f:
-        for edge_record in edges_data:
-            f.write(json.dumps(edge_record, ensure_ascii=False, sort_keys=True) + "\n")
-
-    with open(labels_jsonl_path, "w", encoding="utf-8") as f:
-        for label_record in labels_data:
-            f.write(json.dumps(label_record, ensure_ascii=False, sort_keys=True) + "\n")
-
-    with open(breadcrumbs_jsonl_path, "w", encoding="utf-8") as f:
-        for breadcrumb_record in breadcrumbs_data:
-            f.write(json.dumps(breadcrumb_record, ensure_ascii=False, sort_keys=True) + "\n")
-
     # Write final one-line summary for humans
     final_summary = progress_renderer.one_line_summary(
         run_id=run_id or "unknown",
@@ -1230,14 +1556,21 @@ def ingest_confluence(
             )
 
     # metrics + manifest
-    metrics = {
+    metrics: dict[str, Any] = {
         "spaces": num_spaces,
         "pages": written_pages,
         "attachments": written_attachments,
         "since": _iso(effective_since),
         "body_format": body_format,
         "space_key_unknown_count": total_unknown_count,
+        "bulk_metadata_pages": metadata_harvested,
     }
+    if version_store is not None:
+        metrics["delta"] = {"carried_forward": delta_carried, "fetched": delta_fetched}
+    # Where HTTP time and bytes went, per endpoint (clients without counters, e.g. fakes, skip it)
+    http_stats = getattr(client, "http_stats", None)
+    if isinstance(http_stats, HttpStats):
+        metrics["http"] = http_stats.snapshot()
     metrics_path.write_text(json.dumps(metrics, indent=2, sort_keys=True), encoding="utf-8")
     manifest = {
         "phase": "ingest",
@@ -1265,9 +1598,6 @@ def ingest_confluence(
     except Exception as e:
         log.error("ingest.confluence.assurance_failed", error=str(e))
 
-    # Close event logger
-    event_logger.close()
-
     # Human-friendly completion summary with actual data volume written
     if ndjson_path.exists():
         file_size_bytes = ndjson_path.stat().st_size
@@ -1292,6 +1622,52 @@ def ingest_confluence(
     return metrics
 
 
+def ingest_confluence_spaces(
+    space_keys: list[str],
+    max_parallel: int | None = None,
+    **kwargs: Any,
+) -> dict[str, dict]:
+    """
+    Ingest several spaces concurrently, each into its own run directory.
+
+    Every space gets a fresh run id and its own NDJSON, sidecars and event
+    log. All spaces share the process-wide Confluence rate limiter, so raising
+    ``max_parallel`` overlaps latency without exceeding the request budget.
+    Remaining keyword arguments are passed to ``ingest_confluence``.
+
+    Returns ``{space_key: {"run_id", "metrics", "error"}}`` in input order.
+    """
+    from ....core.artifacts import new_run_id, phase_dir
+    from ....core.progress import get_progress
+
+    progress_renderer = get_progress()
+    workers = max(1, max_parallel if max_parallel is not None else SETTINGS.CONFLUENCE_PARALLEL_SPACES)
+
+    def run_space(space_key: str) -> dict:
+        run_id = new_run_id()
+        progress_renderer.space_started(space_key)
+        try:
+            metrics = ingest_confluence(
+                outdir=str(phase_dir(run_id, "ingest")),
+                space_keys=[space_key],
+                run_id=run_id,
+                **kwargs,
+            )
+        except Exception as e:
+            progress_renderer.space_finished(space_key, status="failed")
+            log.error("ingest.confluence.space_failed", space=space_key, run_id=run_id, error=str(e))
+            return {"run_id": run_id, "metrics": None, "error": str(e)}
+        progress_renderer.space_finished(space_key)
+        return {"run_id": run_id, "metrics": metrics, "error": None}
+
+    with (
+        progress_renderer.live_throughput(),
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="confluence-space") as pool,
+    ):
+        futures = {space_key: pool.submit(run_space, space_key) for space_key in space_keys}
+        return {space_key: future.result() for space_key, future in futures.items()}
+
+
 def ingest_confluence_minimal(outdir: str) -> None:
     """
     Minimal placeholder that writes an empty NDJSON to prove pathing works.
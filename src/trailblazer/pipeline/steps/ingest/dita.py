@@ -10,19 +10,32 @@ import json
 import os
 import re
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from ....adapters.dita import (
+    LinkRef,
     MapDoc,
+    MapRef,
+    MediaRef,
     TopicDoc,
+    _resolve_dita_reference,
     compute_file_sha256,
     is_dita_file,
     parse_map,
     parse_topic,
 )
+from ....core.config import SETTINGS
 from ....core.logging import log
+from .dita_manifest import DITA_DOCS_FORMAT, DitaFileEntry, DitaFileManifest
+
+# (doc, record, error) for one file, as returned from a parse worker
+_ParsedFile = tuple[TopicDoc | MapDoc | None, dict[str, Any] | None, str | None]
 
 
 def _iso(dt: datetime | None) -> str | None:
@@ -127,6 +140,9 @@ def _create_dita_record(
                 "body_dita_xml": (
                     doc.body_xml[:10000] if len(doc.body_xml) > 10000 else doc.body_xml
                 ),  # Truncate if huge
+                # Converted from the full body at parse time; normalize uses these as they are
+                "body_dita_md": doc.body_md,
+                "body_dita_links": doc.body_links,
                 "ancestors": [],  # Will be populated from maps
                 "attachments": [ref.filename for ref in doc.images],
             }
@@ -156,6 +172,91 @@ def _create_dita_record(
     return record
 
 
+def _parse_dita_file(file_path: Path, root_dir: Path) -> _ParsedFile:
+    """Parse and hash one file into (doc, record, error). Runs in pool workers, so it never raises."""
+    try:
+        # Update relative path in adapter for stable IDs
+        rel_path = str(file_path.relative_to(root_dir))
+        file_stats = file_path.stat()
+        file_sha256 = compute_file_sha256(file_path)
+
+        doc: TopicDoc | MapDoc
+        if file_path.suffix.lower() == ".ditamap" or "map" in file_path.stem.lower():
+            # Parse as map
+            doc = parse_map(file_path)
+            # Update ID with correct relative path
+            doc.id = f"map:{Path(rel_path).with_suffix('').as_posix().lower()}"
+        else:
+            # Parse as topic
+            doc = parse_topic(file_path)
+            # Update ID with correct relative path
+            base_id = f"topic:{Path(rel_path).with_suffix('').as_posix().lower()}"
+            if "#" in doc.id:
+                element_id = doc.id.split("#")[1]
+                doc.id = f"{base_id}#{element_id}"
+            else:
+                doc.id = base_id
+
+        # Update link resolution with correct root_dir context
+        for link in doc.links:
+            if link.target_type == "dita" and link.href and not link.target_page_id:
+                link.target_page_id = _resolve_dita_reference(link.href, file_path, root_dir)
+
+        return doc, _create_dita_record(doc, file_path, root_dir, file_stats, file_sha256), None
+    except Exception as e:
+        return None, None, str(e)
+
+
+def _doc_line(rel_path: str, doc: TopicDoc | MapDoc, record: dict[str, Any]) -> str:
+    """dita_docs.jsonl line: a parsed document and its record as created (before map hierarchy updates)."""
+    cached = {
+        "format": DITA_DOCS_FORMAT,
+        "source_path": rel_path,
+        "source_file_sha256": record["source_file_sha256"],
+        "kind": "map" if isinstance(doc, MapDoc) else "topic",
+        "doc": asdict(doc),
+        "record": record,
+    }
+    # skipkeys: prolog metadata may be keyed by lxml comment/PI tags, which nothing downstream reads
+    return json.dumps(cached, skipkeys=True) + "\n"
+
+
+def _doc_from_cached(cached: dict[str, Any], file_stats: os.stat_result) -> tuple[TopicDoc | MapDoc, dict[str, Any]]:
+    """Rebuild (doc, record) from a decoded dita_docs.jsonl line, with timestamps from the file as it is now."""
+    fields = cached["doc"]
+    fields["links"] = [LinkRef(**link) for link in fields["links"]]
+    doc: TopicDoc | MapDoc
+    if cached["kind"] == "map":
+        fields["hierarchy"] = [MapRef(**ref) for ref in fields["hierarchy"]]
+        doc = MapDoc(**fields)
+    else:
+        fields["images"] = [MediaRef(**image) for image in fields["images"]]
+        doc = TopicDoc(**fields)
+
+    record = cached["record"]
+    record["created_at"] = _iso(datetime.fromtimestamp(file_stats.st_ctime, tz=timezone.utc))
+    record["updated_at"] = _iso(datetime.fromtimestamp(file_stats.st_mtime, tz=timezone.utc))
+    return doc, record
+
+
+def _topic_path(topic_id: str) -> str:
+    """Normalized path of a topic id (relative, no extension, lowercase), without its element id."""
+    return topic_id.removeprefix("topic:").split("#", 1)[0]
+
+
+def _href_path(href: str) -> str:
+    """Normalize a map/link href the same way topic ids are keyed."""
+    return str(Path(href).with_suffix("")).lower()
+
+
+def _index_topics_by_path(topics: list[TopicDoc]) -> dict[str, list[TopicDoc]]:
+    """Normalized topic path -> topics at that path (input order). Built once; hrefs resolve by lookup."""
+    index: dict[str, list[TopicDoc]] = {}
+    for topic in topics:
+        index.setdefault(_topic_path(topic.id), []).append(topic)
+    return index
+
+
 def _write_media_sidecars(outdir: Path, topics: list[TopicDoc], topic_records: list[dict[str, Any]]) -> int:
     """Write media-related sidecar files."""
     media_jsonl_path = outdir / "ingest_media.jsonl"
@@ -207,19 +308,19 @@ def _build_hierarchy_and_write_edges(
     topics: list[TopicDoc],
     topic_records: list[dict[str, Any]],
     root_dir: Path,
+    topic_index: dict[str, list[TopicDoc]] | None = None,
 ) -> int:
     """Build hierarchy from maps and write edges/breadcrumbs."""
     edges_path = outdir / "edges.jsonl"
     breadcrumbs_path = outdir / "breadcrumbs.jsonl"
 
-    # Create topic lookup by relative path
-    topic_by_path = {}
-    for topic in topics:
-        # Extract relative path from topic ID
-        topic_path = topic.id.replace("topic:", "")
-        if "#" in topic_path:
-            topic_path = topic_path.split("#")[0]
-        topic_by_path[topic_path] = topic
+    # Topic lookup by relative path (the last topic at a path wins) and record lookup by id
+    if topic_index is None:
+        topic_index = _index_topics_by_path(topics)
+    topic_by_path = {path: path_topics[-1] for path, path_topics in topic_index.items()}
+    record_by_id: dict[str, dict[str, Any]] = {}
+    for record in topic_records:
+        record_by_id.setdefault(record["id"], record)
 
     ancestors_total = 0
 
@@ -236,7 +337,7 @@ def _build_hierarchy_and_write_edges(
                     continue
 
                 # Resolve href to topic
-                href_path = str(Path(ref.href).with_suffix("")).lower()
+                href_path = _href_path(ref.href)
                 if href_path in topic_by_path:
                     topic = topic_by_path[href_path]
 
@@ -262,12 +363,11 @@ def _build_hierarchy_and_write_edges(
                     breadcrumbs_f.write(json.dumps(breadcrumb_entry) + "\n")
 
                     # Update topic record with ancestors
-                    for record in topic_records:
-                        if record["id"] == topic.id:
-                            record["ancestors"] = breadcrumbs[:-1]  # Exclude self
-                            record["ancestor_count"] = len(record["ancestors"])
-                            ancestors_total += 1
-                            break
+                    topic_record = record_by_id.get(topic.id)
+                    if topic_record is not None:
+                        topic_record["ancestors"] = breadcrumbs[:-1]  # Exclude self
+                        topic_record["ancestor_count"] = len(topic_record["ancestors"])
+                        ancestors_total += 1
 
     return ancestors_total
 
@@ -386,9 +486,21 @@ def _aggregate_labels_and_metadata(
     }
 
 
-def _write_links_sidecar(outdir: Path, all_docs: list[TopicDoc | MapDoc], root_dir: Path) -> dict[str, int]:
-    """Write links.jsonl with classified and normalized links."""
+def _write_links_sidecar(
+    outdir: Path,
+    all_docs: list[TopicDoc | MapDoc],
+    root_dir: Path,
+    topic_index: dict[str, list[TopicDoc]] | None = None,
+) -> dict[str, int]:
+    """Write links.jsonl with classified and normalized links.
+
+    Topic targets without an element id are resolved through the topic path
+    index, so a link to ``a.dita`` points at ``topic:a#<root id>`` when that
+    is the ingested topic's id.
+    """
     links_path = outdir / "links.jsonl"
+    if topic_index is None:
+        topic_index = _index_topics_by_path([doc for doc in all_docs if isinstance(doc, TopicDoc)])
 
     stats = {
         "total": 0,
@@ -417,12 +529,18 @@ def _write_links_sidecar(outdir: Path, all_docs: list[TopicDoc | MapDoc], root_d
                 else:
                     stats[link.target_type] += 1
 
+                target_page_id = link.target_page_id
+                if target_page_id and target_page_id.startswith("topic:") and "#" not in target_page_id:
+                    path_topics = topic_index.get(_topic_path(target_page_id))
+                    if path_topics:
+                        target_page_id = path_topics[-1].id
+
                 # Create link record
                 link_record = {
                     "from_page_id": doc.id,
                     "from_url": None,
                     "target_type": link.target_type,
-                    "target_page_id": link.target_page_id,
+                    "target_page_id": target_page_id,
                     "target_url": link.target_url,
                     "anchor": link.anchor,
                     "text": link.text,
@@ -496,8 +614,16 @@ def ingest_dita(
     progress: bool = False,
     progress_every: int = 1,
     run_id: str | None = None,
+    workers: int | None = None,
+    incremental: bool | None = None,
 ) -> dict[str, Any]:
-    """Ingest DITA topics and maps from filesystem."""
+    """Ingest DITA topics and maps from filesystem.
+
+    Files are parsed and hashed on ``workers`` processes (default: DITA_WORKERS)
+    and assembled in sorted path order. With ``incremental`` (default:
+    DITA_INCREMENTAL), files unchanged since the last run over the same root
+    are reused from that run's ``dita_docs.jsonl`` instead of being parsed.
+    """
     outdir_path = Path(outdir)
     outdir_path.mkdir(parents=True, exist_ok=True)
 
@@ -513,8 +639,8 @@ def ingest_dita(
 
     log.info("dita.ingest.start", run_id=run_id, root=root, outdir=outdir)
 
-    # Collect all DITA files
-    dita_files = list(_find_dita_files(root_dir, include, exclude))
+    # Collect all DITA files (sorted, so output order doesn't depend on the filesystem)
+    dita_files = sorted(_find_dita_files(root_dir, include, exclude))
     log.info("dita.scan.complete", files_found=len(dita_files))
 
     if not dita_files:
@@ -528,52 +654,79 @@ def ingest_dita(
 
     processed_count = 0
 
-    for file_path in dita_files:
-        try:
-            # Update relative path in adapter for stable IDs
+    # Incremental mode: reuse parsed documents of files unchanged since the last run over this root
+    use_incremental = incremental if incremental is not None else SETTINGS.DITA_INCREMENTAL
+    manifest = DitaFileManifest(root_dir) if use_incremental else None
+    docs_path = outdir_path / "dita_docs.jsonl"
+    manifest_updates: dict[str, DitaFileEntry] = {}
+    file_stats: dict[Path, os.stat_result] = {}
+    reused: dict[Path, tuple[str, dict[str, Any]]] = {}
+    if manifest is not None:
+        for file_path in dita_files:
             rel_path = str(file_path.relative_to(root_dir))
-            file_stats = file_path.stat()
-            file_sha256 = compute_file_sha256(file_path)
-
-            if file_path.suffix.lower() == ".ditamap" or "map" in file_path.stem.lower():
-                # Parse as map
-                map_doc = parse_map(file_path)
-                # Update ID with correct relative path
-                map_doc.id = f"map:{Path(rel_path).with_suffix('').as_posix().lower()}"
-
-                # Update link resolution with correct root_dir context
-                for link in map_doc.links:
-                    if link.target_type == "dita" and link.href and not link.target_page_id:
-                        from ....adapters.dita import _resolve_dita_reference
-
-                        link.target_page_id = _resolve_dita_reference(link.href, file_path, root_dir)
-
-                maps.append(map_doc)
+            stats = file_stats[file_path] = file_path.stat()
+            entry = manifest.get(rel_path)
+            if entry is None or entry.size != stats.st_size:
+                continue
+            # Same size, new mtime: only the hash can tell whether the content changed
+            if entry.mtime_ns != stats.st_mtime_ns and compute_file_sha256(file_path) != entry.sha256:
+                continue
+            hit = manifest.read(rel_path, entry)
+            if hit is not None:
+                reused[file_path] = hit
+        log.info("dita.incremental", manifest_files=len(manifest), reused=len(reused), files=len(dita_files))
+
+    # Parse + hash on a process pool; map() yields in input (sorted path) order, so output is deterministic
+    to_parse = [file_path for file_path in dita_files if file_path not in reused]
+    reused_count = len(reused)
+    workers = max(1, workers if workers is not None else SETTINGS.DITA_WORKERS)
+    parse = partial(_parse_dita_file, root_dir=root_dir)
+    parallel = workers > 1 and len(to_parse) > 1
+    with (
+        ProcessPoolExecutor(max_workers=workers) if parallel else nullcontext() as pool,
+        open(docs_path, "wb") if manifest is not None else nullcontext() as docs_f,
+    ):
+        if pool is not None:
+            chunksize = max(1, min(64, len(to_parse) // (workers * 8)))
+            results: Iterator[_ParsedFile] = pool.map(parse, to_parse, chunksize=chunksize)
+        else:
+            results = map(parse, to_parse)
+
+        docs_path_str = str(docs_path.resolve())
+        docs_offset = 0
+        for file_path in dita_files:
+            line: str | None = None
+            if file_path in reused:
+                line, cached = reused.pop(file_path)
+                doc, record = _doc_from_cached(cached, file_stats[file_path])
+            else:
+                parsed_doc, parsed_record, error = next(results)
+                if error is not None or parsed_doc is None or parsed_record is None:
+                    log.error("dita.parse.error", file=str(file_path), error=error)
+                    continue
+                doc, record = parsed_doc, parsed_record
+
+            if docs_f is not None:
+                rel_path = str(file_path.relative_to(root_dir))
+                data = (line if line is not None else _doc_line(rel_path, doc, record)).encode("utf-8")
+                docs_f.write(data)
+                stats = file_stats[file_path]
+                manifest_updates[rel_path] = DitaFileEntry(
+                    size=stats.st_size,
+                    mtime_ns=stats.st_mtime_ns,
+                    sha256=record["source_file_sha256"],
+                    run_id=run_id,
+                    path=docs_path_str,
+                    offset=docs_offset,
+                    length=len(data),
+                )
+                docs_offset += len(data)
 
-                record = _create_dita_record(map_doc, file_path, root_dir, file_stats, file_sha256)
+            if isinstance(doc, MapDoc):
+                maps.append(doc)
                 map_records.append(record)
-
             else:
-                # Parse as topic
-                topic_doc = parse_topic(file_path)
-                # Update ID with correct relative path
-                base_id = f"topic:{Path(rel_path).with_suffix('').as_posix().lower()}"
-                if "#" in topic_doc.id:
-                    element_id = topic_doc.id.split("#")[1]
-                    topic_doc.id = f"{base_id}#{element_id}"
-                else:
-                    topic_doc.id = base_id
-
-                # Update link resolution with correct root_dir context
-                for link in topic_doc.links:
-                    if link.target_type == "dita" and link.href and not link.target_page_id:
-                        from ....adapters.dita import _resolve_dita_reference
-
-                        link.target_page_id = _resolve_dita_reference(link.href, file_path, root_dir)
-
-                topics.append(topic_doc)
-
-                record = _create_dita_record(topic_doc, file_path, root_dir, file_stats, file_sha256)
+                topics.append(doc)
                 topic_records.append(record)
 
             processed_count += 1
@@ -585,9 +738,9 @@ def ingest_dita(
                     total=len(dita_files),
                 )
 
-        except Exception as e:
-            log.error("dita.parse.error", file=str(file_path), error=str(e))
-            continue
+    if manifest is not None:
+        manifest.close()
+        manifest.save(manifest_updates)
 
     # Write main NDJSON file
     all_records = topic_records + map_records
@@ -599,21 +752,14 @@ def ingest_dita(
     all_docs = topics + maps
     aggregated_metadata = []
 
-    # Build map context for topics (map titles from breadcrumbs)
+    # Build map context for topics (map titles from breadcrumbs), resolving hrefs through the path index
+    topic_index = _index_topics_by_path(topics)
     map_context_by_topic: dict[str, Any] = {}
     for map_doc in maps:
         for ref in map_doc.hierarchy:
             if ref.href:
-                # Try to match with topic paths
-                href_path = str(Path(ref.href).with_suffix("")).lower()
-                for topic in topics:
-                    topic_path = topic.id.replace("topic:", "")
-                    if "#" in topic_path:
-                        topic_path = topic_path.split("#")[0]
-                    if topic_path == href_path:
-                        if topic.id not in map_context_by_topic:
-                            map_context_by_topic[topic.id] = {"map_titles": []}
-                        map_context_by_topic[topic.id]["map_titles"].append(map_doc.title)
+                for topic in topic_index.get(_href_path(ref.href), ()):
+                    map_context_by_topic.setdefault(topic.id, {"map_titles": []})["map_titles"].append(map_doc.title)
 
     # Aggregate metadata for each document
     for doc in all_docs:
@@ -629,10 +775,12 @@ def ingest_dita(
 
     # Write sidecar files
     media_refs_total = _write_media_sidecars(outdir_path, topics, topic_records)
-    ancestors_total = _build_hierarchy_and_write_edges(outdir_path, maps, topics, topic_records, root_dir)
+    ancestors_total = _build_hierarchy_and_write_edges(
+        outdir_path, maps, topics, topic_records, root_dir, topic_index=topic_index
+    )
 
     # Write enhanced links sidecar
-    links_stats = _write_links_sidecar(outdir_path, all_docs, root_dir)
+    links_stats = _write_links_sidecar(outdir_path, all_docs, root_dir, topic_index=topic_index)
 
     # Write metadata sidecar
     meta_records = _write_metadata_sidecar(outdir_path, all_docs, aggregated_metadata, root_dir)
@@ -664,7 +812,7 @@ def ingest_dita(
 
     # Write summary
     ended_at = datetime.now(timezone.utc)
-    summary = {
+    summary: dict[str, Any] = {
         "started_at": _iso(started_at),
         "ended_at": _iso(ended_at),
         "duration_seconds": (ended_at - started_at).total_seconds(),
@@ -684,7 +832,10 @@ def ingest_dita(
         "maps": len(maps),
         "files_processed": processed_count,
         "files_found": len(dita_files),
+        "workers": workers,
     }
+    if manifest is not None:
+        summary["incremental"] = {"reused": reused_count, "parsed": len(to_parse)}
 
     with open(summary_path, "w") as f:
         json.dump(summary, f, indent=2)
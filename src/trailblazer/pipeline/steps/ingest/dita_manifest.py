@@ -0,0 +1,101 @@
+"""
+Persistent file manifest for incremental DITA ingest.
+
+One manifest per DITA root, keyed by relative path: size, mtime_ns and sha256
+of the file last ingested, plus where its parsed document lives (the run's
+``dita_docs.jsonl``, byte offset, length). Files whose size and mtime are
+unchanged, or whose hash still matches, are reused from that line instead of
+being parsed again.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ....core.paths import state
+
+# Layout version of dita_docs.jsonl lines; lines of any other version (or none) are misses and re-parsed.
+# 2: records carry body_dita_md / body_dita_links
+DITA_DOCS_FORMAT = 2
+
+
+class DitaFileEntry(NamedTuple):
+    """Stat/hash of a source file and where its parsed document was written."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    run_id: str | None
+    path: str
+    offset: int
+    length: int
+
+
+class DitaFileManifest:
+    """File manifest backed by ``var/state/dita/manifest-<root key>.json``."""
+
+    def __init__(self, root_dir: Path, path: Path | None = None):
+        self.root = str(root_dir.resolve())
+        key = hashlib.sha256(self.root.encode()).hexdigest()[:16]
+        self.path = path or state() / "dita" / f"manifest-{key}.json"
+        self._entries = self._load(self.path, self.root)
+        self._fds: dict[str, int] = {}
+
+    @staticmethod
+    def _load(path: Path, root: str) -> dict[str, DitaFileEntry]:
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if raw.get("root") != root:
+            return {}
+        return {relpath: DitaFileEntry(**entry) for relpath, entry in raw.get("files", {}).items()}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, relpath: str) -> DitaFileEntry | None:
+        return self._entries.get(relpath)
+
+    def read(self, relpath: str, entry: DitaFileEntry) -> tuple[str, dict[str, Any]] | None:
+        """
+        The previous ``dita_docs.jsonl`` line for ``relpath`` and its decoded form, or None.
+
+        None also when that run's file is gone, the bytes at the recorded
+        offset are not this file at this hash, or the line was written in an
+        older ``DITA_DOCS_FORMAT``.
+        """
+        try:
+            fd = self._fds.get(entry.path)
+            if fd is None:
+                fd = self._fds[entry.path] = os.open(entry.path, os.O_RDONLY)
+            line = os.pread(fd, entry.length, entry.offset).decode("utf-8")
+            cached = json.loads(line)
+        except (OSError, ValueError):
+            return None
+        if (
+            cached.get("format") != DITA_DOCS_FORMAT
+            or cached.get("source_path") != relpath
+            or cached.get("source_file_sha256") != entry.sha256
+        ):
+            return None
+        return (line if line.endswith("\n") else line + "\n"), cached
+
+    def close(self) -> None:
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+
+    def save(self, entries: dict[str, DitaFileEntry]) -> None:
+        """Replace the manifest with ``entries`` (files gone from the tree drop out)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        data: dict[str, Any] = {
+            "root": self.root,
+            "files": {relpath: entry._asdict() for relpath, entry in sorted(entries.items())},
+        }
+        tmp.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._entries = dict(entries)
@@ -1,6 +1,7 @@
 """Link resolution helpers for traceability."""
 
 import re
+from typing import Any
 from urllib.parse import parse_qs, urlparse, urlunparse
 
 
@@ -149,25 +150,52 @@ def extract_confluence_page_id(url: str) -> str | None:
     return None
 
 
-def extract_links_from_storage_with_classification(xhtml: str | None, confluence_base_url: str) -> list[LinkInfo]:
+def classify_link(raw_url: str, text: str | None, confluence_base_url: str) -> LinkInfo:
     """
-    Extract and classify links from Confluence Storage format.
+    Build a classified LinkInfo for one raw link URL.
 
     Args:
-        xhtml: Storage format HTML content
+        raw_url: Link URL as found in the body
+        text: Link text, if any
         confluence_base_url: Base URL of Confluence instance
 
     Returns:
-        List of LinkInfo objects with classification
+        LinkInfo with normalized URL, anchor and target classification
     """
-    if not xhtml:
-        return []
+    anchor = None
 
-    from bs4 import BeautifulSoup
+    # Extract anchor from URL
+    if "#" in raw_url:
+        anchor = raw_url.split("#", 1)[1]
 
-    soup = BeautifulSoup(xhtml, "html.parser")
-    links = []
+    normalized_url = normalize_url(raw_url)
+    target_type = classify_link_type(raw_url, confluence_base_url)
+    target_page_id = None
+
+    if target_type == "confluence":
+        target_page_id = extract_confluence_page_id(raw_url)
 
+    return LinkInfo(
+        raw_url=raw_url,
+        normalized_url=normalized_url,
+        anchor=anchor,
+        text=text,
+        target_type=target_type,
+        target_page_id=target_page_id,
+    )
+
+
+def extract_anchors_from_soup(soup: Any) -> list[tuple[str, str]]:
+    """
+    (href, text) of every ``<a href>`` in a parsed storage body, in document order.
+
+    Args:
+        soup: BeautifulSoup tree of a storage format body
+
+    Returns:
+        List of (raw_url, stripped link text) tuples
+    """
+    anchors = []
     for a in soup.find_all("a", href=True):
         if not hasattr(a, "get"):
             continue
@@ -176,32 +204,28 @@ def extract_links_from_storage_with_classification(xhtml: str | None, confluence
         if not raw_url or not isinstance(raw_url, str):
             continue
 
-        text = a.get_text(strip=True) if a else None
-        anchor = None
+        anchors.append((raw_url, a.get_text(strip=True)))
 
-        # Extract anchor from URL
-        if "#" in raw_url:
-            anchor = raw_url.split("#", 1)[1]
+    return anchors
 
-        normalized_url = normalize_url(raw_url)
-        target_type = classify_link_type(raw_url, confluence_base_url)
-        target_page_id = None
 
-        if target_type == "confluence":
-            target_page_id = extract_confluence_page_id(raw_url)
+def extract_links_from_storage_with_classification(xhtml: str | None, confluence_base_url: str) -> list[LinkInfo]:
+    """
+    Extract and classify links from Confluence Storage format.
 
-        links.append(
-            LinkInfo(
-                raw_url=raw_url,
-                normalized_url=normalized_url,
-                anchor=anchor,
-                text=text,
-                target_type=target_type,
-                target_page_id=target_page_id,
-            )
-        )
+    Args:
+        xhtml: Storage format HTML content
+        confluence_base_url: Base URL of Confluence instance
 
-    return links
+    Returns:
+        List of LinkInfo objects with classification
+    """
+    if not xhtml:
+        return []
+
+    from .storage_doc import StorageDoc
+
+    return StorageDoc(xhtml).links(confluence_base_url)
 
 
 def extract_links_from_adf_with_classification(adf: dict | None, confluence_base_url: str) -> list[LinkInfo]:
@@ -138,7 +138,19 @@ def extract_media_from_storage(storage_html: str | None) -> list[MediaInfo]:
     if not storage_html:
         return []
 
-    soup = BeautifulSoup(storage_html, "html.parser")
+    return extract_media_from_soup(BeautifulSoup(storage_html, "html.parser"))
+
+
+def extract_media_from_soup(soup: BeautifulSoup) -> list[MediaInfo]:
+    """
+    Extract media from an already parsed Storage format body.
+
+    Args:
+        soup: BeautifulSoup tree of a storage format body (``html.parser``)
+
+    Returns:
+        List of MediaInfo objects in document order
+    """
     media_items = []
     order_counter = 0
 
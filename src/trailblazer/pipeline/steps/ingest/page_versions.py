@@ -0,0 +1,121 @@
+"""
+Persistent page-version store for delta Confluence ingest.
+
+Maps page_id to the version and content hash last ingested, plus where that
+page's NDJSON record lives (run file, byte offset, length). A page whose
+listed version still matches is carried forward by copying those bytes into
+the new run instead of downloading its body again.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ....core.paths import state
+
+# Parallel space ingests in one process share the store file
+_save_lock = threading.Lock()
+
+
+class PageVersion(NamedTuple):
+    """Where and at which version a page was last written."""
+
+    version: int | None
+    content_sha256: str | None
+    run_id: str | None
+    space_key: str | None
+    path: str
+    offset: int
+    length: int
+
+
+def listed_version(obj: dict) -> int | None:
+    """Version number from a v2 page listing or an expanded v1 search result."""
+    try:
+        return int((obj.get("version") or {})["number"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class PageVersionStore:
+    """Page-version store backed by ``var/state/confluence/page_versions.json``."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or state() / "confluence" / "page_versions.json"
+        self._entries = self._load(self.path)
+        self._fds: dict[str, int] = {}
+        self._fds_lock = threading.Lock()
+
+    @staticmethod
+    def _load(path: Path) -> dict[str, PageVersion]:
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return {page_id: PageVersion(**entry) for page_id, entry in raw.items()}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def carryable_share(self, space_key: str | None = None) -> float:
+        """
+        Share of a space's stored pages (all pages if ``space_key`` is None) whose run file still exists.
+
+        0.0 for a space the store has never seen. Carrying forward can still
+        fail for a page whose file exists; this only rules out pruned runs.
+        """
+        paths = [entry.path for entry in self._entries.values() if space_key is None or entry.space_key == space_key]
+        if not paths:
+            return 0.0
+        exists = {path: os.path.exists(path) for path in set(paths)}
+        return sum(exists[path] for path in paths) / len(paths)
+
+    def get(self, page_id: str) -> PageVersion | None:
+        return self._entries.get(page_id)
+
+    def _read(self, path: str, offset: int, length: int) -> bytes:
+        with self._fds_lock:
+            fd = self._fds.get(path)
+            if fd is None:
+                fd = self._fds[path] = os.open(path, os.O_RDONLY)
+        # pread: no shared file position, safe from prefetch threads
+        return os.pread(fd, length, offset)
+
+    def carry_forward(self, page_id: str, version: int | None) -> str | None:
+        """
+        The page's previous NDJSON line if ``version`` is unchanged, else None.
+
+        None also when the previous run's file is gone or the bytes at the
+        recorded offset are not that page at that version.
+        """
+        entry = self._entries.get(page_id)
+        if entry is None or version is None or entry.version != version:
+            return None
+        try:
+            line = self._read(entry.path, entry.offset, entry.length).decode("utf-8")
+            record = json.loads(line)
+        except (OSError, ValueError):
+            return None
+        if record.get("id") != page_id or record.get("version") != version:
+            return None
+        return line if line.endswith("\n") else line + "\n"
+
+    def close(self) -> None:
+        with self._fds_lock:
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+
+    def save(self, updates: dict[str, PageVersion]) -> None:
+        """Merge ``updates`` into the on-disk store (re-read first, so concurrent runs keep each other's pages)."""
+        with _save_lock:
+            entries = self._load(self.path)
+            entries.update(updates)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".json.tmp")
+            data: dict[str, Any] = {page_id: entry._asdict() for page_id, entry in sorted(entries.items())}
+            tmp.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._entries = entries
@@ -0,0 +1,134 @@
+"""
+Streaming writers for ingest sidecar files.
+
+Sidecars are written as pages are processed rather than accumulated for the
+whole run, so memory stays flat in page count and a crash keeps everything up
+to the last flush. CSV sidecars that must be sorted use bounded-memory sorted
+runs merged at close.
+"""
+
+import csv
+import heapq
+import json
+import tempfile
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+# Write buffer per sidecar; flushed explicitly at progress checkpoints
+SIDECAR_BUFFER_BYTES = 1 << 20
+
+
+class JsonlSidecar:
+    """Buffered NDJSON sidecar writer (sorted keys, one record per line)."""
+
+    def __init__(self, path: Path, append: bool = False, buffer_size: int = SIDECAR_BUFFER_BYTES):
+        self.path = path
+        self.count = 0
+        self._file = open(path, "a" if append else "w", encoding="utf-8", buffering=buffer_size)
+
+    def write(self, record: dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
+        self.count += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def size(self) -> int:
+        """Bytes on disk after a flush."""
+        return self.path.stat().st_size
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SortedCsvSidecar:
+    """
+    CSV sidecar whose rows are written sorted by ``key`` at close.
+
+    Rows are buffered up to ``run_size``, then spilled to a sorted run file
+    next to the output; close merges the runs. The merge is stable, so rows
+    with equal keys keep their write order, exactly like ``list.sort``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fieldnames: list[str],
+        key: Callable[[dict[str, Any]], Any],
+        run_size: int = 50_000,
+    ):
+        self.path = path
+        self.fieldnames = fieldnames
+        self.key = key
+        self.run_size = run_size
+        self.count = 0
+        self._rows: list[dict[str, Any]] = []
+        self._runs: list[Path] = []
+        self._tmpdir: tempfile.TemporaryDirectory | None = None
+
+        # Header-only file until close, so a crashed run still leaves a valid CSV
+        self._write_csv(iter(()))
+
+    def write(self, row: dict[str, Any]) -> None:
+        self._rows.append(row)
+        self.count += 1
+        if len(self._rows) >= self.run_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.TemporaryDirectory(prefix=f".{self.path.name}.", dir=self.path.parent)
+        self._rows.sort(key=self.key)
+        run_path = Path(self._tmpdir.name) / f"run-{len(self._runs):05d}.ndjson"
+        with open(run_path, "w", encoding="utf-8") as f:
+            for row in self._rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._runs.append(run_path)
+        self._rows = []
+
+    @staticmethod
+    def _read_run(run_path: Path) -> Iterator[dict[str, Any]]:
+        with open(run_path, encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def _write_csv(self, rows: Iterator[dict[str, Any]]) -> None:
+        with self.path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=self.fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def close(self) -> None:
+        if not self._runs:
+            self._rows.sort(key=self.key)
+            self._write_csv(iter(self._rows))
+            self._rows = []
+            return
+
+        if self._rows:
+            self._spill()
+        try:
+            # heapq.merge favours earlier iterables on ties, preserving write order
+            self._write_csv(heapq.merge(*(self._read_run(run) for run in self._runs), key=self.key))
+        finally:
+            if self._tmpdir is not None:
+                self._tmpdir.cleanup()
+                self._tmpdir = None
+            self._runs = []
+
+
+def truncate_to(path: Path, size: int) -> None:
+    """Cut a sidecar back to ``size`` bytes (a checkpointed offset); missing files are created empty."""
+    with open(path, "ab") as f:
+        f.truncate(min(size, f.tell()))
+
+
+def iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """Iterate records of an NDJSON file, ignoring blank lines."""
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,130 @@
+"""
+Parse-once model of a Confluence storage-format (XHTML) body.
+
+Links, media refs, normalized hrefs and Markdown are all derived from a
+single BeautifulSoup tree. Ingest records the normalize-side results
+(Markdown and hrefs) in the run's ``storage_extract.jsonl`` keyed by the
+body's sha256, so normalize can reuse them instead of parsing again.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+from bs4 import BeautifulSoup
+from markdownify import MarkdownConverter
+
+from .link_resolver import LinkInfo, classify_link, extract_anchors_from_soup
+from .media_extractor import MediaInfo, extract_media_from_soup
+
+# Per-run cache written next to confluence.ndjson by ingest, read by normalize
+STORAGE_EXTRACT_FILE = "storage_extract.jsonl"
+
+# Dropped before Markdown conversion (non-content tags/macros)
+_NON_CONTENT_TAGS = ["script", "style", "noscript"]
+
+_MARKDOWN = MarkdownConverter(heading_style="ATX", strip=_NON_CONTENT_TAGS)
+
+
+def storage_sha256(xhtml: str) -> str:
+    """Cache key of a storage body; equals the page's content_sha256 for storage pages."""
+    return hashlib.sha256(xhtml.encode("utf-8")).hexdigest()
+
+
+class StorageExtract(NamedTuple):
+    """What normalize needs from a storage body."""
+
+    text_md: str
+    links: list[str]
+
+
+class StorageDoc:
+    """A storage body parsed once; each view is computed on first use and cached."""
+
+    def __init__(self, xhtml: str | None):
+        self.xhtml = xhtml or ""
+        self._soup = BeautifulSoup(self.xhtml, "html.parser")
+        self._anchors: list[tuple[str, str]] | None = None
+        self._media: list[MediaInfo] | None = None
+        self._markdown: str | None = None
+
+    def anchors(self) -> list[tuple[str, str]]:
+        if self._anchors is None:
+            self._anchors = extract_anchors_from_soup(self._soup)
+        return self._anchors
+
+    def links(self, confluence_base_url: str) -> list[LinkInfo]:
+        """Classified links (ingest's links sidecar)."""
+        return [classify_link(raw_url, text, confluence_base_url) for raw_url, text in self.anchors()]
+
+    def hrefs(self) -> list[str]:
+        """Unique hrefs, sorted (normalize's ``links``)."""
+        return sorted(dict.fromkeys(raw_url for raw_url, _ in self.anchors()))
+
+    def media(self) -> list[MediaInfo]:
+        """Media references in document order; callers may resolve attachment ids on the result."""
+        if self._media is None:
+            self._media = extract_media_from_soup(self._soup)
+        return self._media
+
+    def markdown(self) -> str:
+        """Markdown for normalize. Converts the tree in place, so the other views are taken first."""
+        if self._markdown is None:
+            self.anchors()
+            self.media()
+            for tag in self._soup(_NON_CONTENT_TAGS):
+                tag.decompose()
+            text = _MARKDOWN.convert_soup(self._soup)
+            # normalize whitespace deterministically
+            text = re.sub(r"\r\n?", "\n", text)
+            self._markdown = re.sub(r"\n{3,}", "\n\n", text).strip()
+        return self._markdown
+
+    def extract(self) -> StorageExtract:
+        return StorageExtract(text_md=self.markdown(), links=self.hrefs())
+
+
+class StorageExtractCache:
+    """
+    Read side of ``storage_extract.jsonl``: body sha256 -> StorageExtract.
+
+    Only line offsets are held in memory; lines that fail to decode (e.g. a
+    partial line left by an interrupted run) are skipped and become misses.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.hits = 0
+        self._offsets: dict[str, int] = {}
+        self._file = None
+        if not path.exists():
+            return
+        self._file = open(path, "rb")
+        offset = 0
+        for line in self._file:
+            try:
+                key = json.loads(line)["content_sha256"]
+            except (ValueError, KeyError, TypeError):
+                key = None
+            if key:
+                self._offsets.setdefault(key, offset)
+            offset += len(line)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def get(self, key: str) -> StorageExtract | None:
+        offset = self._offsets.get(key)
+        if offset is None or self._file is None:
+            return None
+        self._file.seek(offset)
+        record = json.loads(self._file.readline())
+        self.hits += 1
+        return StorageExtract(text_md=record["text_md"], links=record["links"])
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,133 @@
+"""
+Content-addressed cache of normalized bodies, shared across runs.
+
+A body normalized by any earlier run is looked up by the sha256 of the
+source body itself (together with its ``body_repr`` and the converter
+version) instead of being converted again. Hashing the body is cheap next to
+converting it, and unlike the record's ``content_sha256`` (which also covers
+the title and other fields) it can never pair one body with another's output.
+
+Entries are small JSON files under ``var/cache/normalize/<key[:2]>/``, so
+normalize worker processes read and write them without coordination. A hit
+refreshes the entry's mtime; ``prune`` evicts least recently used entries
+once the cache outgrows its size budget. Each prune records the size it left
+behind in ``usage.json``, so a later run that stored fewer bytes than the
+remaining headroom skips walking the tree.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from ....core.paths import cache
+
+# Bump when a converter's output changes, so older entries stop matching
+NORMALIZE_CACHE_VERSION = 2
+
+
+class NormalizedBody(NamedTuple):
+    """A converted body and how long the conversion took."""
+
+    text_md: str
+    links: list[str]
+    convert_s: float
+
+
+# Size of the cache as of the last prune, plus the bytes stored since
+USAGE_FILE = "usage.json"
+
+
+def normalize_cache_key(body_repr: str | None, body: str | None) -> str | None:
+    """Cache key of a source body in representation ``body_repr``, or None when there is nothing to cache."""
+    if not body_repr or not body:
+        return None
+    digest = hashlib.sha256(f"v{NORMALIZE_CACHE_VERSION}:{body_repr}:".encode())
+    digest.update(body.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class NormalizeCache:
+    """Normalize cache backed by ``var/cache/normalize/``; counts its hits, misses, time saved and bytes stored."""
+
+    def __init__(self, root: Path | None = None):
+        self.root = root or cache() / "normalize"
+        self.hits = 0
+        self.misses = 0
+        self.saved_s = 0.0
+        self.bytes_written = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> NormalizedBody | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            body = NormalizedBody(entry["text_md"], entry["links"], float(entry["convert_s"]))
+            os.utime(path)  # LRU: mtime is the last use
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.saved_s += body.convert_s
+        return body
+
+    def put(self, key: str, body: NormalizedBody) -> None:
+        """Store ``body``; a write that fails (full disk, read-only cache) only costs a future miss."""
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            payload = json.dumps(body._asdict(), ensure_ascii=False).encode("utf-8")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        self.bytes_written += len(payload)
+
+    def _recorded_usage(self) -> int | None:
+        try:
+            return int(json.loads((self.root / USAGE_FILE).read_text(encoding="utf-8"))["bytes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _record_usage(self, total: int) -> None:
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            (self.root / USAGE_FILE).write_text(json.dumps({"bytes": total}), encoding="utf-8")
+        except OSError:
+            pass
+
+    def prune(self, max_bytes: int, added_bytes: int | None = None) -> int:
+        """Evict least recently used entries until the cache fits in ``max_bytes``; returns entries evicted.
+
+        With ``added_bytes`` (what this run stored) the tree is only walked when
+        the size recorded by the last prune plus ``added_bytes`` may exceed
+        ``max_bytes``; otherwise the recorded size is just brought up to date.
+        Overwritten entries are counted twice, which errs towards walking.
+        """
+        recorded = self._recorded_usage() if added_bytes is not None else None
+        if recorded is not None and added_bytes is not None and recorded + added_bytes <= max_bytes:
+            self._record_usage(recorded + added_bytes)
+            return 0
+
+        entries = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        self._record_usage(total)
+        return evicted
@@ -2,188 +2,49 @@ from __future__ import annotations
 
 import json
 import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md  # type: ignore
-
+from ....adapters.dita_markdown import dita_to_markdown
+from ....core.columnar import NORMALIZED_COLUMNS, open_columnar
+from ....core.config import SETTINGS
 from ....core.logging import log
+from ....core.parallel import iter_line_chunks, ordered_map
+from ..ingest.storage_doc import STORAGE_EXTRACT_FILE, StorageDoc, StorageExtractCache, storage_sha256
+from .cache import NormalizeCache, NormalizedBody, normalize_cache_key
 
 # ---------- DITA XML -> Markdown ----------
 
 
-def _to_markdown_from_dita_xml(dita_xml: str | None) -> str:
-    """Convert DITA XML body to Markdown."""
+def _dita_markdown_and_links(dita_xml: str | None) -> tuple[str, list[str]]:
+    """Markdown and external links of a DITA body from one streaming lxml pass."""
     if not dita_xml:
-        return ""
-
+        return "", []
     try:
-        from bs4 import BeautifulSoup, NavigableString
-
-        soup = BeautifulSoup(dita_xml, "xml")
-
-        def _convert_element(element) -> str:
-            if isinstance(element, NavigableString):
-                return str(element).strip()
-
-            tag = element.name.lower() if element.name else ""
-            content = ""
-
-            # Get child content recursively
-            children_content = []
-            for child in element.children:
-                child_md = _convert_element(child)
-                if child_md.strip():
-                    children_content.append(child_md)
-            content = " ".join(children_content)
-
-            # Convert DITA elements to Markdown
-            if tag in ("title", "navtitle"):
-                # Title elements - use ATX headers
-                level = 1
-                parent = element.parent
-                while parent and parent.name:
-                    if parent.name.lower() in (
-                        "section",
-                        "concept",
-                        "task",
-                        "reference",
-                    ):
-                        level += 1
-                    parent = parent.parent
-                level = min(level, 6)  # Max 6 levels
-                return f"{'#' * level} {content}\n\n"
-
-            elif tag in ("p", "shortdesc"):
-                return f"{content}\n\n"
-
-            elif tag in ("ul", "ol"):
-                # Process list items
-                items = []
-                for li in element.find_all("li", recursive=False):
-                    item_content = _convert_element(li).strip()
-                    if tag == "ul":
-                        items.append(f"- {item_content}")
-                    else:
-                        items.append(f"1. {item_content}")
-                return "\n".join(items) + "\n\n"
-
-            elif tag == "li":
-                return content  # Content handled by parent ul/ol
-
-            elif tag in ("codeblock", "codeph"):
-                if tag == "codeblock":
-                    return f"```\n{content}\n```\n\n"
-                else:
-                    return f"`{content}`"
-
-            elif tag in ("note", "important", "warning", "caution"):
-                return f"> **{tag.capitalize()}**: {content}\n\n"
-
-            elif tag in ("b", "strong"):
-                return f"**{content}**"
-
-            elif tag in ("i", "em"):
-                return f"*{content}*"
-
-            elif tag == "u":
-                return f"<u>{content}</u>"
-
-            elif tag == "xref":
-                href = element.get("href")
-                keyref = element.get("keyref")
-                if href:
-                    return f"[{content or href}]({href})"
-                elif keyref:
-                    return f"[{content or keyref}]({keyref})"
-                else:
-                    return content
-
-            elif tag == "link":
-                href = element.get("href")
-                if href:
-                    return f"[{content or href}]({href})"
-                return content
-
-            elif tag == "image":
-                href = element.get("href")
-                alt = element.get("alt") or content or "image"
-                if href:
-                    return f"![{alt}]({href})"
-                else:
-                    return f"![{alt}](#)"
-
-            elif tag in ("fig", "figure"):
-                return f"{content}\n\n"
-
-            elif tag in ("table", "simpletable"):
-                # Basic table support - could be enhanced
-                return f"{content}\n\n"
-
-            elif tag in (
-                "section",
-                "concept",
-                "task",
-                "reference",
-                "body",
-                "conbody",
-                "taskbody",
-                "refbody",
-            ):
-                # Container elements - return content
-                return content
-
-            else:
-                # Default: return content for unknown elements
-                return content
-
-        # Convert the root element
-        result = _convert_element(soup)
-
-        # Normalize whitespace
-        result = re.sub(r"\r\n?", "\n", result)
-        result = re.sub(r"\n{3,}", "\n\n", result)
-        return result.strip()
-
+        text_md, links = dita_to_markdown(dita_xml)
     except Exception as e:
         log.warning("dita_xml_conversion_failed", error=str(e))
         # Fallback: strip XML tags and return plain text
-        clean_text = re.sub(r"<[^>]+>", " ", dita_xml or "")
+        clean_text = re.sub(r"<[^>]+>", " ", dita_xml)
         clean_text = re.sub(r"\s+", " ", clean_text)
-        return clean_text.strip()
-
-
-def _extract_links_from_dita_xml(dita_xml: str | None) -> list[str]:
-    """Extract links from DITA XML."""
-    if not dita_xml:
-        return []
+        return clean_text.strip(), []
+    return text_md, links
 
-    try:
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(dita_xml, "xml")
-        links = []
-
-        # Extract from xref elements
-        for xref in soup.find_all("xref"):
-            if hasattr(xref, "get"):
-                href = xref.get("href")
-                if href and isinstance(href, str) and href.startswith(("http://", "https://")):
-                    links.append(href)
 
-        # Extract from link elements
-        for link in soup.find_all("link"):
-            if hasattr(link, "get"):
-                href = link.get("href")
-                if href and isinstance(href, str) and href.startswith(("http://", "https://")):
-                    links.append(href)
+def _to_markdown_from_dita_xml(dita_xml: str | None) -> str:
+    """Convert DITA XML body to Markdown."""
+    return _dita_markdown_and_links(dita_xml)[0]
 
-        return sorted(dict.fromkeys([link for link in links if isinstance(link, str)]))
 
-    except Exception:
-        return []
+def _extract_links_from_dita_xml(dita_xml: str | None) -> list[str]:
+    """Extract links from DITA XML."""
+    return _dita_markdown_and_links(dita_xml)[1]
 
 
 # ---------- Storage (XHTML) -> Markdown ----------
@@ -192,29 +53,24 @@ def _extract_links_from_dita_xml(dita_xml: str | None) -> list[str]:
 def _to_markdown_from_storage(xhtml: str | None) -> str:
     if not xhtml:
         return ""
-    soup = BeautifulSoup(xhtml, "html.parser")
-    # Drop non-content tags/macros (keep simple approach; advanced macro handling later)
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-    html2 = str(soup)
-    text = md(html2, heading_style="ATX", strip=["script", "style", "noscript"])
-    # normalize whitespace deterministically
-    text = re.sub(r"\r\n?", "\n", text)
-    text = re.sub(r"\n{3,}", "\n\n", text).strip()
-    return text
+    # Drops non-content tags/macros (script/style/noscript) before conversion
+    return StorageDoc(xhtml).markdown()
 
 
 def _extract_links_from_storage(xhtml: str | None) -> list[str]:
     if not xhtml:
         return []
-    soup = BeautifulSoup(xhtml, "html.parser")
-    links = []
-    for a in soup.find_all("a", href=True):
-        if hasattr(a, "get"):
-            href = a.get("href")
-            if href and isinstance(href, str):
-                links.append(href)
-    return sorted(dict.fromkeys(links))
+    return StorageDoc(xhtml).hrefs()
+
+
+def _storage_markdown_and_links(xhtml: str | None, cache: StorageExtractCache | None) -> tuple[str, list[str]]:
+    """Markdown and links of a storage body from one parse, or from ingest's extract cache when it has them."""
+    if not xhtml:
+        return "", []
+    extract = cache.get(storage_sha256(xhtml)) if cache is not None else None
+    if extract is None:
+        extract = StorageDoc(xhtml).extract()
+    return extract.text_md, extract.links
 
 
 # ---------- ADF JSON -> Markdown (minimal converter) ----------
@@ -365,7 +221,212 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def normalize_from_ingest(outdir: str, input_file: str | None = None, limit: int | None = None) -> dict[str, Any]:
+# Input lines per worker task; large enough to amortize pickling, small enough to keep workers busy
+NORMALIZE_CHUNK_LINES = 256
+
+
+def _load_page_metadata(meta_path: Path) -> dict[str, dict[str, Any]]:
+    """DITA meta.jsonl records by page_id (empty when the sidecar is absent)."""
+    metadata_by_page_id = {}
+    if meta_path.exists():
+        with meta_path.open("r", encoding="utf-8") as meta_file:
+            for line in meta_file:
+                if line.strip():
+                    meta_rec = json.loads(line)
+                    metadata_by_page_id[meta_rec["page_id"]] = meta_rec
+    return metadata_by_page_id
+
+
+class _NormalizeContext:
+    """
+    Lookup state a process needs to normalize records: DITA metadata, ingest's
+    storage extracts and, when ``cache_dir`` is set, the cross-run normalize cache.
+    """
+
+    def __init__(self, meta_path: Path, storage_extract_path: Path, cache_dir: Path | None = None):
+        self.metadata_by_page_id = _load_page_metadata(meta_path)
+        self.storage_cache = StorageExtractCache(storage_extract_path)
+        self.normalize_cache = NormalizeCache(cache_dir) if cache_dir is not None else None
+
+
+def _convert_body(rec: dict[str, Any], body_repr: str | None, ctx: _NormalizeContext) -> tuple[str, list[str]]:
+    """Markdown and links of a record's body."""
+    if body_repr == "storage":
+        return _storage_markdown_and_links(rec.get("body_storage") or rec.get("body_html"), ctx.storage_cache)
+    if body_repr == "adf":
+        return _to_markdown_from_adf(rec.get("body_adf")), _extract_links_from_adf(rec.get("body_adf"))
+    if body_repr == "dita":
+        if "body_dita_md" in rec:
+            # Converted by ingest from the parsed topic
+            return rec["body_dita_md"] or "", rec.get("body_dita_links") or []
+        return _dita_markdown_and_links(rec.get("body_dita_xml") or rec.get("body_xml"))
+    return "", []
+
+
+def _source_body(rec: dict[str, Any], body_repr: str | None) -> str | None:
+    """The body ``_convert_body`` converts, as text (None when there is nothing to convert)."""
+    if body_repr == "storage":
+        body = rec.get("body_storage") or rec.get("body_html")
+    elif body_repr == "adf":
+        body = rec.get("body_adf")
+    elif body_repr == "dita" and "body_dita_md" not in rec:
+        body = rec.get("body_dita_xml") or rec.get("body_xml")
+    else:
+        return None
+    if not body or isinstance(body, str):
+        return body or None
+    return json.dumps(body, sort_keys=True, ensure_ascii=False)
+
+
+def _cached_convert_body(rec: dict[str, Any], body_repr: str | None, ctx: _NormalizeContext) -> tuple[str, list[str]]:
+    """``_convert_body``, served from the normalize cache when an earlier run converted the same body."""
+    cache = ctx.normalize_cache
+    key = normalize_cache_key(body_repr, _source_body(rec, body_repr)) if cache is not None else None
+    if cache is None or key is None:
+        return _convert_body(rec, body_repr, ctx)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached.text_md, cached.links
+    start = time.perf_counter()
+    text_md, links = _convert_body(rec, body_repr, ctx)
+    cache.put(key, NormalizedBody(text_md, links, time.perf_counter() - start))
+    return text_md, links
+
+
+def _normalize_record(rec: dict[str, Any], ctx: _NormalizeContext) -> dict[str, Any]:
+    """Convert one ingest record to its normalized form."""
+    body_repr = rec.get("body_repr") or (
+        "adf"
+        if rec.get("body_adf")
+        else (
+            "storage"
+            if rec.get("body_storage")
+            else ("dita" if rec.get("body_dita_xml") or rec.get("body_xml") else None)
+        )
+    )
+    text_md, links = _cached_convert_body(rec, body_repr, ctx)
+
+    # Handle attachments - can be strings (DITA) or objects (Confluence)
+    raw_attachments = rec.get("attachments") or []
+    attachments = []
+    for a in raw_attachments:
+        if isinstance(a, str):
+            # DITA attachment - just a file path string
+            attachments.append({"filename": a, "url": None})
+        elif isinstance(a, dict):
+            # Confluence attachment - object with filename and download_url
+            attachments.append(
+                {
+                    "filename": a.get("filename"),
+                    "url": a.get("download_url"),
+                }
+            )
+        else:
+            # Fallback for unexpected format
+            attachments.append({"filename": str(a), "url": None})
+
+    # Get enhanced metadata for DITA records
+    enhanced_meta = ctx.metadata_by_page_id.get(rec.get("id") or "", {})
+
+    out_rec = {
+        "id": rec.get("id"),
+        "title": rec.get("title"),
+        "space_key": rec.get("space_key"),
+        "space_id": rec.get("space_id"),
+        "url": rec.get("url"),
+        "version": rec.get("version"),
+        "created_at": rec.get("created_at"),
+        "updated_at": rec.get("updated_at"),
+        "body_repr": body_repr,
+        "text_md": text_md,
+        "links": sorted(dict.fromkeys(links)),
+        "attachments": attachments,
+        "source_system": rec.get("source_system", "confluence"),
+        "source": rec.get("source_system", "confluence"),  # Updated for DITA support
+        # Enhanced traceability preservation
+        "labels": enhanced_meta.get("labels", rec.get("labels", [])),
+        "content_sha256": rec.get("content_sha256"),
+    }
+
+    # Add DITA-specific metadata fields if available
+    if enhanced_meta:
+        if enhanced_meta.get("collection"):
+            out_rec["collection"] = enhanced_meta["collection"]
+        if enhanced_meta.get("path_tags"):
+            out_rec["path_tags"] = enhanced_meta["path_tags"]
+        if enhanced_meta.get("meta"):
+            out_rec["meta"] = enhanced_meta["meta"]
+
+    # Add breadcrumbs if available (optional)
+    if rec.get("ancestors"):
+        breadcrumbs = []
+        space_name = rec.get("space_name")
+        if space_name:
+            breadcrumbs.append(space_name)
+        for ancestor in rec.get("ancestors", []):
+            breadcrumbs.append(ancestor.get("title", ""))
+        breadcrumbs.append(rec.get("title", ""))
+        out_rec["breadcrumbs"] = breadcrumbs
+
+    return out_rec
+
+
+def _normalize_lines(ctx: _NormalizeContext, lines: list[str]) -> tuple[list[str], Counter[str], float]:
+    """Normalize a chunk of ingest NDJSON lines into output lines, metric counters and cache seconds saved."""
+    out_lines = []
+    counts: Counter[str] = Counter()
+    hits_before = ctx.storage_cache.hits
+    cache = ctx.normalize_cache
+    cache_before = (cache.hits, cache.misses, cache.bytes_written, cache.saved_s) if cache is not None else None
+    saved_s = 0.0
+    for line in lines:
+        out_rec = _normalize_record(json.loads(line), ctx)
+        text_md = out_rec["text_md"]
+        if not text_md:
+            counts["empty_bodies"] += 1
+        counts["attachments"] += len(out_rec["attachments"])
+        counts["chars"] += len(text_md)
+        counts["pages"] += 1
+        out_lines.append(json.dumps(out_rec, ensure_ascii=False) + "\n")
+    counts["storage_extract_hits"] += ctx.storage_cache.hits - hits_before
+    if cache is not None and cache_before is not None:
+        counts["normalize_cache_hits"] += cache.hits - cache_before[0]
+        counts["normalize_cache_misses"] += cache.misses - cache_before[1]
+        counts["normalize_cache_bytes_written"] += cache.bytes_written - cache_before[2]
+        saved_s = cache.saved_s - cache_before[3]
+    return out_lines, counts, saved_s
+
+
+# Set in each pool worker by _init_normalize_worker
+_worker_ctx: _NormalizeContext | None = None
+
+
+def _init_normalize_worker(meta_path: Path, storage_extract_path: Path, cache_dir: Path | None) -> None:
+    global _worker_ctx
+    _worker_ctx = _NormalizeContext(meta_path, storage_extract_path, cache_dir)
+
+
+def _normalize_lines_in_worker(lines: list[str]) -> tuple[list[str], Counter[str], float]:
+    assert _worker_ctx is not None, "normalize worker not initialized"
+    return _normalize_lines(_worker_ctx, lines)
+
+
+def normalize_from_ingest(
+    outdir: str,
+    input_file: str | None = None,
+    limit: int | None = None,
+    workers: int | None = None,
+    use_cache: bool | None = None,
+) -> dict[str, Any]:
+    """Normalize an ingest NDJSON file to normalized.ndjson.
+
+    With ``workers`` > 1 (default: NORMALIZE_WORKERS) records are converted on
+    a process pool in chunks and written back in input order, so the output
+    is identical to a single-process run.
+
+    With ``use_cache`` (default: NORMALIZE_CACHE) bodies an earlier run
+    already converted are taken from ``var/cache/normalize``.
+    """
     out_dir = Path(outdir)
     out_dir.mkdir(parents=True, exist_ok=True)
     run_id = Path(outdir).parent.name
@@ -377,131 +438,71 @@ def normalize_from_ingest(outdir: str, input_file: str | None = None, limit: int
     metrics_path = out_dir / "metrics.json"
     manifest_path = out_dir / "manifest.json"
 
-    # Load DITA metadata if available
-    metadata_by_page_id = {}
-    ingest_dir = Path(outdir).parent / "ingest"
-    meta_path = ingest_dir / "meta.jsonl"
-    if meta_path.exists():
-        with meta_path.open("r", encoding="utf-8") as meta_file:
-            for line in meta_file:
-                if line.strip():
-                    meta_rec = json.loads(line)
-                    metadata_by_page_id[meta_rec["page_id"]] = meta_rec
-
-    total = empty = chars = atts_count = 0
-
-    with (
-        inp.open("r", encoding="utf-8") as fin,
-        nd_out.open("w", encoding="utf-8") as fout,
-    ):
-        for line in fin:
-            if not line.strip():
-                continue
-            rec = json.loads(line)
-
-            body_repr = rec.get("body_repr") or (
-                "adf"
-                if rec.get("body_adf")
-                else (
-                    "storage"
-                    if rec.get("body_storage")
-                    else ("dita" if rec.get("body_dita_xml") or rec.get("body_xml") else None)
+    # DITA metadata, and the Markdown/links ingest already derived from storage bodies (keyed by body sha256)
+    meta_path = Path(outdir).parent / "ingest" / "meta.jsonl"
+    storage_extract_path = inp.parent / STORAGE_EXTRACT_FILE
+
+    workers = max(1, workers if workers is not None else SETTINGS.NORMALIZE_WORKERS)
+    use_cache = SETTINGS.NORMALIZE_CACHE if use_cache is None else use_cache
+    normalize_cache = NormalizeCache() if use_cache else None
+    cache_dir = normalize_cache.root if normalize_cache is not None else None
+    totals: Counter[str] = Counter()
+    cache_saved_s = 0.0
+
+    with ExitStack() as stack:
+        fin = stack.enter_context(inp.open("r", encoding="utf-8"))
+        fout = stack.enter_context(nd_out.open("w", encoding="utf-8"))
+        columnar = open_columnar(nd_out, NORMALIZED_COLUMNS)
+        if columnar is not None:
+            stack.enter_context(columnar)
+        chunks = iter_line_chunks(fin, NORMALIZE_CHUNK_LINES, limit)
+
+        results: Iterator[tuple[list[str], Counter[str], float]]
+        if workers > 1:
+            pool = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_normalize_worker,
+                    initargs=(meta_path, storage_extract_path, cache_dir),
                 )
             )
-            links: list[str] = []
-            if body_repr == "storage":
-                text_md = _to_markdown_from_storage(rec.get("body_storage") or rec.get("body_html"))
-                links = _extract_links_from_storage(rec.get("body_storage") or rec.get("body_html"))
-            elif body_repr == "adf":
-                text_md = _to_markdown_from_adf(rec.get("body_adf"))
-                links = _extract_links_from_adf(rec.get("body_adf"))
-            elif body_repr == "dita":
-                text_md = _to_markdown_from_dita_xml(rec.get("body_dita_xml") or rec.get("body_xml"))
-                links = _extract_links_from_dita_xml(rec.get("body_dita_xml") or rec.get("body_xml"))
-            else:
-                text_md = ""
-
-            # Handle attachments - can be strings (DITA) or objects (Confluence)
-            raw_attachments = rec.get("attachments") or []
-            attachments = []
-            for a in raw_attachments:
-                if isinstance(a, str):
-                    # DITA attachment - just a file path string
-                    attachments.append({"filename": a, "url": None})
-                elif isinstance(a, dict):
-                    # Confluence attachment - object with filename and download_url
-                    attachments.append(
-                        {
-                            "filename": a.get("filename"),
-                            "url": a.get("download_url"),
-                        }
-                    )
-                else:
-                    # Fallback for unexpected format
-                    attachments.append({"filename": str(a), "url": None})
-
-            # Get enhanced metadata for DITA records
-            enhanced_meta = metadata_by_page_id.get(rec.get("id"), {})
-
-            out_rec = {
-                "id": rec.get("id"),
-                "title": rec.get("title"),
-                "space_key": rec.get("space_key"),
-                "space_id": rec.get("space_id"),
-                "url": rec.get("url"),
-                "version": rec.get("version"),
-                "created_at": rec.get("created_at"),
-                "updated_at": rec.get("updated_at"),
-                "body_repr": body_repr,
-                "text_md": text_md,
-                "links": sorted(dict.fromkeys(links)),
-                "attachments": attachments,
-                "source_system": rec.get("source_system", "confluence"),
-                "source": rec.get("source_system", "confluence"),  # Updated for DITA support
-                # Enhanced traceability preservation
-                "labels": enhanced_meta.get("labels", rec.get("labels", [])),
-                "content_sha256": rec.get("content_sha256"),
-            }
-
-            # Add DITA-specific metadata fields if available
-            if enhanced_meta:
-                if enhanced_meta.get("collection"):
-                    out_rec["collection"] = enhanced_meta["collection"]
-                if enhanced_meta.get("path_tags"):
-                    out_rec["path_tags"] = enhanced_meta["path_tags"]
-                if enhanced_meta.get("meta"):
-                    out_rec["meta"] = enhanced_meta["meta"]
-
-            # Add breadcrumbs if available (optional)
-            if rec.get("ancestors"):
-                breadcrumbs = []
-                space_name = rec.get("space_name")
-                if space_name:
-                    breadcrumbs.append(space_name)
-                for ancestor in rec.get("ancestors", []):
-                    breadcrumbs.append(ancestor.get("title", ""))
-                breadcrumbs.append(rec.get("title", ""))
-                out_rec["breadcrumbs"] = breadcrumbs
-
-            if not text_md:
-                empty += 1
-            atts_count += len(attachments)
-            chars += len(text_md)
-            total += 1
-            fout.write(json.dumps(out_rec, ensure_ascii=False) + "\n")
-            if limit and total >= limit:
-                break
-
+            results = ordered_map(pool, _normalize_lines_in_worker, chunks, window=workers * 2)
+        else:
+            ctx = _NormalizeContext(meta_path, storage_extract_path, cache_dir)
+            stack.callback(ctx.storage_cache.close)
+            results = (_normalize_lines(ctx, chunk) for chunk in chunks)
+
+        for out_lines, counts, saved_s in results:
+            fout.writelines(out_lines)
+            if columnar is not None:
+                columnar.write_lines(out_lines)
+            totals.update(counts)
+            cache_saved_s += saved_s
+
+    total = totals["pages"]
     metrics = {
         "run_id": run_id,
         "input": str(inp),
         "output": str(nd_out),
         "pages": total,
-        "empty_bodies": empty,
-        "attachments": atts_count,
-        "avg_chars": (chars // total) if total else 0,
+        "empty_bodies": totals["empty_bodies"],
+        "attachments": totals["attachments"],
+        "avg_chars": (totals["chars"] // total) if total else 0,
+        "storage_extract_hits": totals["storage_extract_hits"],
+        "workers": workers,
         "completed_at": _now_iso(),
     }
+    if normalize_cache is not None:
+        lookups = totals["normalize_cache_hits"] + totals["normalize_cache_misses"]
+        metrics["normalize_cache"] = {
+            "hits": totals["normalize_cache_hits"],
+            "misses": totals["normalize_cache_misses"],
+            "hit_ratio": round(totals["normalize_cache_hits"] / lookups, 4) if lookups else 0.0,
+            "saved_s": round(cache_saved_s, 3),
+            "evicted": normalize_cache.prune(
+                SETTINGS.NORMALIZE_CACHE_MAX_MB * 1024 * 1024, added_bytes=totals["normalize_cache_bytes_written"]
+            ),
+        }
     metrics_path.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
     manifest = {
         "phase": "normalize",
@@ -8,7 +8,7 @@ EXPECTED_COUNT_4 = 4
 import pytest
 
 # Mark all tests as unit tests (no database needed)
-pytestmark = pytest.mark.unit
+pytestmark = [pytest.mark.unit, pytest.mark.usefixtures("tmp_workspace")]
 
 
 def test_cli_runner_embed_preflight_mapping(cli_runner):
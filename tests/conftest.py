@@ -100,6 +100,28 @@ def setup_test_db(test_db_url, monkeypatch, request):
             raise
 
 
+@pytest.fixture(autouse=True)
+def isolated_normalize_cache(tmp_path_factory, monkeypatch):
+    """Keep the normalize cache out of the real var/cache/ (tests that patch ROOT keep theirs)."""
+    from trailblazer.core import paths
+    from trailblazer.pipeline.steps.normalize import cache as normalize_cache
+
+    real_workdir = paths.workdir()
+    test_cache = tmp_path_factory.mktemp("cache")
+
+    def cache_dir():
+        return test_cache if paths.workdir() == real_workdir else paths.cache()
+
+    monkeypatch.setattr(normalize_cache, "cache", cache_dir)
+
+
+@pytest.fixture
+def tmp_workspace(tmp_path):
+    """Resolve the workspace (var/, data/) under tmp_path instead of the repo root."""
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        yield tmp_path
+
+
 @pytest.fixture
 def cli_runner():
     """Provide a CLI runner with compatibility for old command patterns."""
@@ -16,7 +16,7 @@ from typer.testing import CliRunner
 from trailblazer.cli.main import app
 
 # Mark all tests as integration tests (need database)
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.usefixtures("tmp_workspace")]
 
 
 @pytest.fixture
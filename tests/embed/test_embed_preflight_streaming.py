@@ -0,0 +1,165 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for streaming, cached and parallel embed preflight."""
+
+import io
+import json
+import os
+import random
+import statistics
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+from trailblazer.core import quantiles
+from trailblazer.pipeline.steps.embed import preflight
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def workspace(tmp_path, monkeypatch):
+    """Runs under tmp_path, a quiet log, and a tokenizer check that needs no download."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(preflight, "log", structlog.wrap_logger(structlog.PrintLogger(io.StringIO())))
+    monkeypatch.setattr(preflight, "validate_tokenizer_config", lambda provider, model, dimension: (True, []))
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        yield tmp_path
+
+
+def _write_run(root: Path, run_id: str, scores: list[float], chunks: bool = True) -> Path:
+    run_dir = root / "var" / "runs" / run_id
+    (run_dir / "enrich").mkdir(parents=True)
+    docs = [{"id": f"{run_id}-doc{n}", "quality_score": score} for n, score in enumerate(scores)]
+    (run_dir / "enrich" / "enriched.jsonl").write_text("".join(json.dumps(d) + "\n" for d in docs), encoding="utf-8")
+    if chunks:
+        (run_dir / "chunk").mkdir()
+        lines = [json.dumps({"chunk_id": f"{d['id']}:0000", "doc_id": d["id"], "token_count": 10}) for d in docs]
+        (run_dir / "chunk" / "chunks.ndjson").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return run_dir
+
+
+def _exact_stats(scores: list[float], min_quality: float) -> dict:
+    """Quality statistics as computed from every score held in memory."""
+    skipped = [s for s in scores if s < min_quality]
+    return {
+        "p50": statistics.median(scores),
+        "p90": statistics.quantiles(scores, n=10)[8] if len(scores) >= 10 else max(scores),  # noqa: PLR2004
+        "belowThresholdPct": len(skipped) / len(scores),
+        "minQuality": min_quality,
+        "maxBelowThresholdPct": 0.2,
+    }
+
+
+@pytest.mark.parametrize("count", [1, EXPECTED_COUNT_4, 10, 257])
+def test_streamed_stats_and_skiplist_match_in_memory_results(workspace, count):
+    rng = random.Random(count)
+    scores = [round(rng.random(), 3) for _ in range(count)]
+    run_dir = _write_run(workspace, "r1", scores)
+
+    result = preflight.run_preflight_check("r1")
+
+    skipped_ids = [f"r1-doc{n}" for n, score in enumerate(scores) if score < 0.6]  # noqa: PLR2004
+    assert result["quality"] == _exact_stats(scores, 0.6)
+    assert result["docTotals"] == {"all": count, "embeddable": count - len(skipped_ids), "skipped": len(skipped_ids)}
+    assert result["tokens"] == 10 * count
+    assert (run_dir / "preflight" / preflight.PREFLIGHT_CACHE_FILE).exists()  # cached by default
+    assert preflight.compute_embeddable_docs("r1")[2] == skipped_ids
+    skiplist = run_dir / "preflight" / "doc_skiplist.json"
+    if skipped_ids:
+        expected = {
+            "skip": skipped_ids,
+            "reason": "quality_below_min",
+            "min_quality": 0.6,
+            "total_docs": count,
+            "skipped_count": len(skipped_ids),
+        }
+        assert skiplist.read_text() == json.dumps(expected, indent=2)
+    else:
+        assert not skiplist.exists()
+
+
+def test_large_runs_use_online_quantile_estimates(workspace, monkeypatch):
+    monkeypatch.setattr(quantiles, "EXACT_MAX_VALUES", 100)
+    rng = random.Random(5)
+    scores = [rng.betavariate(5, EXPECTED_COUNT_2) for _ in range(5000)]
+    _write_run(workspace, "r1", scores)
+
+    stats = preflight.run_preflight_check("r1", use_cache=False)["quality"]
+
+    exact = _exact_stats(scores, 0.6)
+    assert stats["p50"] == pytest.approx(exact["p50"], abs=0.01)
+    assert stats["p90"] == pytest.approx(exact["p90"], abs=0.01)
+    assert stats["belowThresholdPct"] == exact["belowThresholdPct"]
+
+
+def test_cache_reuses_scan_until_artifacts_change(workspace):
+    run_dir = _write_run(workspace, "r1", [0.9, 0.3, 0.8])
+    enriched = run_dir / "enrich" / "enriched.jsonl"
+
+    first = preflight.run_preflight_check("r1", use_cache=True)
+    with patch.object(preflight, "_scan_quality", wraps=preflight._scan_quality) as scan:
+        # Unchanged: nothing is read
+        again = preflight.run_preflight_check("r1", use_cache=True)
+        assert scan.call_count == 0
+
+        # Touched, different content, then a different threshold: scan again
+        os.utime(enriched, ns=(1, 1))
+        touched = preflight.run_preflight_check("r1", use_cache=True)
+        enriched.write_text(enriched.read_text().replace("0.3", "0.7"), encoding="utf-8")
+        changed = preflight.run_preflight_check("r1", use_cache=True)
+        assert not (run_dir / "preflight" / "doc_skiplist.json").exists()
+        stricter = preflight.run_preflight_check("r1", min_quality=0.85, use_cache=True)
+        assert scan.call_count == EXPECTED_COUNT_3
+
+    assert first["cached"] is touched["cached"] is False
+    assert again["cached"] is True
+    assert touched["docTotals"] == first["docTotals"]
+    assert again["docTotals"] == first["docTotals"] == {"all": 3, "embeddable": 2, "skipped": 1}
+    assert changed["docTotals"]["skipped"] == 0
+    assert stricter["docTotals"]["skipped"] == EXPECTED_COUNT_2
+
+
+def _plan(root: Path, run_ids: list[str]) -> Path:
+    plan_file = root / "plan.txt"
+    plan_file.write_text("".join(f"var/runs/{run_id}\n" for run_id in run_ids), encoding="utf-8")
+    return plan_file
+
+
+def _outputs(out_dir: Path) -> dict[str, str]:
+    (bundle,) = out_dir.iterdir()
+    return {name: (bundle / name).read_text() for name in ("ready.txt", "blocked.txt", "plan_preflight.csv")}
+
+
+def test_parallel_plan_matches_serial_and_reuses_cached_runs(workspace):
+    run_ids = [f"run{n}" for n in range(6)]
+    for n, run_id in enumerate(run_ids):
+        # run1 has no chunks and run4 has no embeddable docs: both blocked
+        scores = [0.1] if n == EXPECTED_COUNT_4 else [0.9, 0.2 * n, 0.7]
+        _write_run(workspace, run_id, scores, chunks=n != 1)
+    plan_file = _plan(workspace, run_ids)
+
+    serial = preflight.run_plan_preflight(str(plan_file), out_dir="serial", use_cache=False)
+    parallel = preflight.run_plan_preflight(
+        str(plan_file), out_dir="parallel", workers=EXPECTED_COUNT_3, use_cache=True
+    )
+
+    assert _outputs(workspace / "parallel") == _outputs(workspace / "serial")
+    assert parallel["runs_detail"] == serial["runs_detail"]
+    assert _outputs(workspace / "serial")["blocked.txt"].splitlines() == [
+        "var/runs/run1 # MISSING_CHUNKS_NDJSON",
+        "var/runs/run4 # EMBEDDABLE_DOCS=0",
+    ]
+    assert parallel["total_tokens"] == 10 * 13  # noqa: PLR2004
+
+    # Adding a run rechecks only that run
+    _write_run(workspace, "run6", [0.9])
+    again = preflight.run_plan_preflight(str(_plan(workspace, [*run_ids, "run6"])), out_dir="again", use_cache=True)
+    assert again["cached_runs"] == len(run_ids)
+    assert again["ready_runs"] == parallel["ready_runs"] + 1
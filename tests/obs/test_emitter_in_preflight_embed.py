@@ -71,10 +71,7 @@ def test_preflight_uses_event_emitter():
 
         # Patch paths and EventEmitter
         with (
-            patch(
-                "trailblazer.core.paths.runs",
-                return_value=temp_path / "var" / "runs",
-            ),
+            patch("trailblazer.core.paths.ROOT", temp_path),
             patch("trailblazer.pipeline.steps.embed.preflight.EventEmitter") as mock_event_emitter,
         ):
             # Set up mock EventEmitter
@@ -125,10 +122,7 @@ def test_plan_preflight_uses_event_emitter():
 
         # Patch paths and EventEmitter
         with (
-            patch(
-                "trailblazer.core.paths.runs",
-                return_value=temp_path / "var" / "runs",
-            ),
+            patch("trailblazer.core.paths.ROOT", temp_path),
             patch("trailblazer.pipeline.steps.embed.preflight.EventEmitter") as mock_event_emitter,
         ):
             # Set up mock EventEmitter for both preflight calls and plan-preflight
@@ -187,10 +181,7 @@ def test_embed_loader_uses_event_emitter():
 
         # Patch dependencies
         with (
-            patch(
-                "trailblazer.core.paths.runs",
-                return_value=temp_path / "var" / "runs",
-            ),
+            patch("trailblazer.core.paths.ROOT", temp_path),
             patch(
                 "trailblazer.pipeline.steps.embed.loader.get_session_factory",
                 return_value=mock_session_factory,
@@ -234,10 +225,7 @@ def test_event_emitter_consistent_fields():
 
         # Patch paths and capture events
         with (
-            patch(
-                "trailblazer.core.paths.runs",
-                return_value=temp_path / "var" / "runs",
-            ),
+            patch("trailblazer.core.paths.ROOT", temp_path),
             patch("trailblazer.pipeline.steps.embed.preflight.EventEmitter") as mock_event_emitter,
         ):
             # Set up mock to capture events
@@ -291,10 +279,7 @@ def test_event_emitter_error_handling(mock_tokenizer):
         create_test_run(temp_path, run_id)
 
         # Patch paths
-        with patch(
-            "trailblazer.core.paths.runs",
-            return_value=temp_path / "var" / "runs",
-        ):
+        with patch("trailblazer.core.paths.ROOT", temp_path):
             # Should handle validation error gracefully and propagate it
             with pytest.raises(Exception, match="Tokenizer validation failed"):
                 run_preflight_check(
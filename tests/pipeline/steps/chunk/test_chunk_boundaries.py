@@ -0,0 +1,175 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for the single-pass markdown lexer and boundary helpers."""
+
+import io
+
+import pytest
+import structlog
+
+import trailblazer.pipeline.steps.chunk.boundaries as boundaries
+from trailblazer.pipeline.steps.chunk.boundaries import (
+    ChunkType,
+    detect_content_type,
+    heading_sections,
+    lex_markdown,
+    split_by_headings,
+)
+from trailblazer.pipeline.steps.chunk.engine import _is_orphan_heading, chunk_document
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+SAMPLE_MD = """# Title
+
+Intro paragraph
+continues here
+
+```bash
+# not a heading
+echo hi
+```
+
+| a | b | c |
+|---|---|---|
+
+- item one
+  continued
+- item two
+
+## Second
+Closing text"""
+
+
+@pytest.fixture(autouse=True)
+def offline_tokens(monkeypatch):
+    """Use the character-based token estimate so tests run offline, warning to a private buffer."""
+    monkeypatch.setattr(boundaries, "tiktoken", None)
+    monkeypatch.setattr(boundaries, "log", structlog.wrap_logger(structlog.PrintLogger(io.StringIO())))
+
+
+class TestLexMarkdown:
+    """Test block lexing."""
+
+    def test_block_kinds_in_order(self):
+        kinds = [block.kind for block in lex_markdown(SAMPLE_MD)]
+        assert kinds == ["heading", "paragraph", "fence", "table", "list", "heading", "paragraph"]
+
+    def test_offsets_slice_original_text(self):
+        blocks = lex_markdown(SAMPLE_MD)
+        assert SAMPLE_MD[blocks[0].start : blocks[0].end] == "# Title"
+        assert SAMPLE_MD[blocks[2].start : blocks[2].end].startswith("```bash")
+        assert SAMPLE_MD[blocks[2].start : blocks[2].end].endswith("```")
+        assert SAMPLE_MD[blocks[-1].start : blocks[-1].end] == "Closing text"
+
+    def test_unterminated_fence_runs_to_end(self):
+        text = "Intro\n\n```\n# inside\nstill inside"
+        blocks = lex_markdown(text)
+        assert blocks[-1].kind == "fence"
+        assert blocks[-1].end == len(text)
+
+    def test_empty_text(self):
+        assert lex_markdown("") == []
+
+
+class TestHeadingSections:
+    """Test heading-delimited sections."""
+
+    def test_sections_cover_text(self):
+        sections = heading_sections(SAMPLE_MD)
+        assert sections[0][0] == 0
+        assert sections[-1][1] == len(SAMPLE_MD)
+        assert len(sections) == EXPECTED_COUNT_2
+
+    def test_fenced_hash_lines_do_not_split(self):
+        chunks = split_by_headings(SAMPLE_MD)
+        assert len(chunks) == EXPECTED_COUNT_2
+        assert "# not a heading" in chunks[0][0]
+        assert chunks[1][0] == "## Second\nClosing text"
+
+
+class TestDetectContentType:
+    """Test content type detection."""
+
+    def test_markdown_table(self):
+        text = "| a | b | c |\n|---|---|---|\n| 1 | 2 | 3 |"
+        assert detect_content_type(text) == (ChunkType.TABLE, {"estimated_rows": 3})
+
+    def test_html_table(self):
+        content_type, _ = detect_content_type("<TABLE><tr><td>x</td></tr></TABLE>")
+        assert content_type == ChunkType.TABLE
+
+    def test_code_block(self):
+        text = "```python\nprint('x')\n```"
+        assert detect_content_type(text) == (ChunkType.CODE, {"language": "python"})
+
+    def test_macro_heavy(self):
+        content_type, meta = detect_content_type("{info} {note} [info:x] <!-- c --> {warn}")
+        assert content_type == ChunkType.MACRO
+        assert meta["macro_count"] == 5
+
+    def test_plain_text(self):
+        assert detect_content_type("Just some prose.") == (ChunkType.TEXT, {})
+
+
+def test_orphan_heading_detection():
+    assert _is_orphan_heading("")
+    assert _is_orphan_heading("  ## Lonely heading  ")
+    assert _is_orphan_heading("See Also")
+    assert not _is_orphan_heading("# Heading\nwith body")
+    assert not _is_orphan_heading("A normal sentence.")
+
+
+def test_heading_split_offsets_are_exact():
+    sections = "\n\n".join(f"## Section {i}\n\n" + ("word " * 300).strip() for i in range(4))
+    chunks = chunk_document(doc_id="doc", text_md=sections, hard_max_tokens=400, soft_min_tokens=0)
+    assert len(chunks) == EXPECTED_COUNT_4
+    for chunk in chunks:
+        assert chunk.split_strategy == "heading"
+        assert sections[chunk.char_start : chunk.char_end] == chunk.text_md
+
+
+class OfflineTiktoken:
+    """An installed tiktoken that cannot download its BPE files."""
+
+    def __init__(self):
+        self.loads = 0
+
+    def encoding_for_model(self, model):
+        self.loads += 1
+        raise ConnectionError("no network")
+
+    def get_encoding(self, name):
+        raise ConnectionError("no network")
+
+
+@pytest.fixture
+def offline_tiktoken(monkeypatch):
+    offline = OfflineTiktoken()
+    monkeypatch.setattr(boundaries, "tiktoken", offline)
+    monkeypatch.setattr(boundaries, "_estimated_models", set())
+    boundaries._load_encoding.cache_clear()
+    yield offline
+    boundaries._load_encoding.cache_clear()
+
+
+def test_count_tokens_raises_when_encoding_unavailable(offline_tiktoken):
+    """Production chunking must not silently undercount tokens."""
+    with pytest.raises(ConnectionError):
+        boundaries.count_tokens("x" * 40)
+
+
+def test_count_tokens_estimates_when_opted_in(offline_tiktoken, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(boundaries, "ALLOW_TOKEN_ESTIMATE", True)
+    monkeypatch.setattr(boundaries.log, "warning", lambda event, **kw: warnings.append((event, kw["model"])))
+
+    assert boundaries.count_tokens("x" * 40) == 10  # noqa: PLR2004
+    assert boundaries.count_tokens_batch(["x" * 8, "y" * 12]) == [EXPECTED_COUNT_2, EXPECTED_COUNT_3]
+
+    # One load attempt and one warning per model
+    assert offline_tiktoken.loads == 1
+    assert warnings == [("chunk.token_count_estimated", "text-embedding-3-small")]
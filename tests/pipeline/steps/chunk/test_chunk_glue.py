@@ -0,0 +1,141 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for the glue pass: equivalence with pairwise merging and linear tokenization."""
+
+import random
+
+import pytest
+
+import trailblazer.pipeline.steps.chunk.engine as engine
+from trailblazer.pipeline.steps.chunk.engine import Chunk, _is_orphan_heading, apply_glue_pass
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+
+def word_tokens(text: str, model: str = "") -> int:
+    """Additive token counter: the separator costs nothing and counts sum exactly."""
+    return len(text.split())
+
+
+@pytest.fixture(autouse=True)
+def additive_tokens(monkeypatch):
+    monkeypatch.setattr(engine, "count_tokens", word_tokens)
+
+
+def _legacy_merge(chunk1: Chunk, chunk2: Chunk) -> Chunk:
+    combined_text = chunk1.text_md + "\n\n" + chunk2.text_md
+    combined_meta = dict(chunk1.meta or {})
+    combined_meta.update(chunk2.meta or {})
+    combined_meta["glued_from"] = [chunk1.chunk_id, chunk2.chunk_id]
+    return chunk1._replace(
+        text_md=combined_text,
+        char_count=len(combined_text),
+        token_count=word_tokens(combined_text),
+        split_strategy=chunk1.split_strategy + "+glue",
+        char_end=chunk2.char_end,
+        token_end=chunk2.token_end,
+        meta=combined_meta,
+    )
+
+
+def _legacy_glue_pass(chunks, soft_min, hard_min, hard_max, orphan_merge, tail_merge):
+    """Reference implementation: re-tokenizes after every pairwise merge."""
+    glued: list[Chunk] = []
+    i = 0
+    while i < len(chunks):
+        current = chunks[i]
+        tokens = current.token_count
+        if tokens < soft_min or (orphan_merge and _is_orphan_heading(current.text_md)):
+            merged = None
+            if i + 1 < len(chunks):
+                nxt = chunks[i + 1]
+                if tokens + nxt.token_count <= hard_max:
+                    merged = _legacy_merge(current, nxt)
+                    i += 2
+                else:
+                    if glued and glued[-1].token_count + tokens <= hard_max:
+                        glued[-1] = _legacy_merge(glued[-1], current)
+                        i += 1
+                        continue
+                    merged = current
+                    i += 1
+            else:
+                if glued and glued[-1].token_count + tokens <= hard_max:
+                    glued[-1] = _legacy_merge(glued[-1], current)
+                    i += 1
+                    continue
+                if tail_merge and tokens < hard_min:
+                    merged = current._replace(meta={**(current.meta or {}), "tail_small": True})
+                else:
+                    merged = current
+                i += 1
+            glued.append(merged)
+        else:
+            glued.append(current)
+            i += 1
+    return glued
+
+
+def _make_chunks(sizes: list[int]) -> list[Chunk]:
+    chunks = []
+    pos = 0
+    for ord_num, size in enumerate(sizes):
+        text = " ".join(f"w{ord_num}_{n}" for n in range(size)) if size else "# Heading"
+        chunks.append(
+            Chunk(
+                chunk_id=f"doc:{ord_num:04d}",
+                text_md=text,
+                char_count=len(text),
+                token_count=word_tokens(text),
+                ord=ord_num,
+                meta={"source": ord_num},
+                split_strategy="heading",
+                char_start=pos,
+                char_end=pos + len(text),
+                doc_id="doc",
+            )
+        )
+        pos += len(text) + 2
+    return chunks
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_glue_matches_pairwise_merging(seed):
+    rnd = random.Random(seed)
+    sizes = [rnd.choice([0, 1, 3, 20, 90, 150, 300, 700]) for _ in range(rnd.randint(1, 60))]
+    chunks = _make_chunks(sizes)
+    args = (200, 80, 800, True, True)
+    assert apply_glue_pass(chunks, *args, model="m") == _legacy_glue_pass(chunks, *args)
+
+
+def test_cascading_merge_into_previous_folds_metadata():
+    chunks = _make_chunks([100, 10, 795, 10])
+    glued = apply_glue_pass(chunks, 200, 80, 800, True, True, model="m")
+    assert glued == _legacy_glue_pass(chunks, 200, 80, 800, True, True)
+    assert len(glued) == EXPECTED_COUNT_3
+    assert glued[0].split_strategy == "heading+glue"
+    assert glued[0].meta["glued_from"] == ["doc:0000", "doc:0001"]
+
+
+def test_tokenizes_each_merged_group_once(monkeypatch):
+    calls = []
+
+    def counting_tokens(text, model=""):
+        calls.append(text)
+        return word_tokens(text)
+
+    monkeypatch.setattr(engine, "count_tokens", counting_tokens)
+    chunks = _make_chunks([1] * 1000)
+    glued = apply_glue_pass(chunks, 200, 80, 800, False, True, model="m")
+
+    assert len(glued) == 500
+    # One call for the separator cost plus one per merged group
+    assert len(calls) == 1 + len(glued)
+
+
+def test_empty_input():
+    assert apply_glue_pass([], 200, 80, 800, True, True, model="m") == []
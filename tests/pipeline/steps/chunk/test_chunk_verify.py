@@ -0,0 +1,110 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for the columnar chunk verification pass."""
+
+import io
+import json
+import random
+
+import numpy as np
+import pytest
+import structlog
+
+import trailblazer.pipeline.steps.chunk.boundaries as boundaries
+from trailblazer.pipeline.steps.chunk.boundaries import count_tokens, count_tokens_batch
+from trailblazer.pipeline.steps.chunk.engine import Chunk, calculate_coverage
+from trailblazer.pipeline.steps.chunk.verify import coverage_columns, verify_chunks
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def offline_tokens(monkeypatch):
+    """Use the character-based token estimate so tests run offline, warning to a private buffer."""
+    monkeypatch.setattr(boundaries, "tiktoken", None)
+    monkeypatch.setattr(boundaries, "log", structlog.wrap_logger(structlog.PrintLogger(io.StringIO())))
+
+
+def _chunk(start: int, end: int) -> Chunk:
+    return Chunk(chunk_id="c", text_md="", char_count=0, token_count=0, ord=0, char_start=start, char_end=end)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_coverage_columns_matches_calculate_coverage(seed):
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(50):
+        ranges = []
+        for _ in range(rng.randint(0, 8)):
+            start = rng.randint(0, 500)
+            ranges.append((start, start + rng.randint(-5, 120)))
+        length = max([end for _, end in ranges] + [0]) + rng.randint(0, 30)
+        docs.append((ranges, length))
+
+    doc_idx = np.array([d for d, (ranges, _) in enumerate(docs) for _ in ranges], dtype=np.int64)
+    starts = np.array([s for ranges, _ in docs for s, _ in ranges], dtype=np.int64)
+    ends = np.array([e for ranges, _ in docs for _, e in ranges], dtype=np.int64)
+    lengths = np.array([length for _, length in docs], dtype=np.int64)
+
+    result = coverage_columns(doc_idx, starts, ends, lengths)
+
+    for d, (ranges, length) in enumerate(docs):
+        if length == 0:
+            continue
+        expected_pct, expected_gaps = calculate_coverage([_chunk(s, e) for s, e in ranges], length)
+        assert result.coverage_pct[d] == expected_pct
+        assert result.gaps(d, length) == expected_gaps
+
+
+def test_overlap_ratio_counts_doubly_covered_chars():
+    doc_idx = np.array([0, 0, 1], dtype=np.int64)
+    starts = np.array([0, 80, 0], dtype=np.int64)
+    ends = np.array([100, 200, 50], dtype=np.int64)
+
+    result = coverage_columns(doc_idx, starts, ends, np.array([200, 50], dtype=np.int64))
+
+    assert result.coverage_pct.tolist() == [100.0, 100.0]
+    assert result.overlap_ratio[0] == pytest.approx(20 / 200)
+    assert result.overlap_ratio[1] == 0.0
+
+
+def test_count_tokens_batch_matches_count_tokens():
+    texts = ["", "short", "a longer piece of text " * 20]
+    assert count_tokens_batch(texts) == [count_tokens(text) for text in texts]
+
+
+def test_verify_chunks_reports_violations(tmp_path):
+    chunk_dir = tmp_path / "runs" / "run-1" / "chunk"
+    chunk_dir.mkdir(parents=True)
+    base = {"doc_id": "doc-1", "title": "Doc", "url": "u", "source_system": "confluence", "split_strategy": "paragraph"}
+    records = [
+        {**base, "chunk_id": "doc-1:0000", "text_md": "x" * 4000, "char_start": 0, "char_end": 100},
+        {**base, "chunk_id": "doc-1:0001", "text_md": "x" * 400, "char_start": 150, "char_end": 300},
+        {**base, "chunk_id": "doc-1:0002", "text_md": "tiny", "char_start": 250, "char_end": 300, "source_system": ""},
+    ]
+    (chunk_dir / "chunks.ndjson").write_text("".join(json.dumps(r) + "\n" for r in records))
+
+    report = verify_chunks(str(tmp_path / "runs" / "*"), max_tokens=800, out_dir=str(tmp_path / "verify"))
+
+    stats = report["statistics"]
+    assert report["status"] == "FAIL"
+    assert stats["total_chunks"] == EXPECTED_COUNT_3
+    assert stats["token_stats"]["max"] == 1000
+    assert report["violations"] == {
+        "oversize_chunks": 1,
+        "missing_traceability": 1,
+        "small_chunks": 1,
+        "docs_with_gaps": 1,
+    }
+    assert stats["coverage_stats"]["min_coverage_pct"] == pytest.approx(250 / 300 * 100)
+    assert stats["coverage_stats"]["max_overlap_ratio"] == pytest.approx(50 / 250)
+
+    verify_dir = next((tmp_path / "verify").iterdir())
+    gaps = json.loads((verify_dir / "gaps.json").read_text())
+    assert gaps[0]["gaps"] == [[100, 150]]
+    small = json.loads((verify_dir / "small_chunks.json").read_text())
+    assert small[0]["reason"] == "tiny_doc"
@@ -0,0 +1,110 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for indexed suggested-edge generation (Aho-Corasick titles, bounded inverted keyword index)."""
+
+import random
+
+import pytest
+
+from trailblazer.pipeline.steps.enrich import edges, enricher
+from trailblazer.pipeline.steps.enrich.enricher import DocumentEnricher
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+WORDS = ["alpha", "beta", "setup", "guide", "install", "config", "api", "the", "user", "Über", "naïve"]
+
+
+def _pairwise_edges(docs: list[dict]) -> list[dict]:
+    """The edges of comparing every ordered pair, as generate_suggested_edges used to."""
+    reference = DocumentEnricher(llm_enabled=True)
+    found = []
+    for i, doc1 in enumerate(docs):
+        for doc2 in docs[i + 1 :]:
+            edge = reference._suggest_edge_between_docs(doc1, doc2)
+            if edge:
+                found.append(edge)
+    return found
+
+
+@pytest.mark.parametrize("seed", range(EXPECTED_COUNT_4))
+def test_title_matcher_finds_every_substring_title(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        titles = ["".join(rng.choice("abc ") for _ in range(rng.randint(0, 5))) for _ in range(rng.randint(0, 8))]
+        text = "".join(rng.choice("abc ") for _ in range(rng.randint(0, 40)))
+
+        assert edges.TitleMatcher(titles).matches(text) == {t for t in titles if t and t in text}
+
+
+def test_edges_match_pairwise_comparison():
+    rng = random.Random(7)
+    for _ in range(50):
+        docs = [
+            {
+                # Some repeated ids, which never get an edge between them
+                "id": f"d{rng.randint(0, 5) if rng.random() < 0.2 else n}",
+                "title": " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, EXPECTED_COUNT_2))),
+                "text_md": " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 15))),
+            }
+            for n in range(rng.randint(0, 40))
+        ]
+        generator = DocumentEnricher(llm_enabled=True)
+
+        assert generator.generate_suggested_edges(docs) == _pairwise_edges(docs)
+        assert generator.suggested_edges_count == len(_pairwise_edges(docs))
+
+
+@pytest.mark.parametrize("count", [1000, 1001])
+def test_keywords_in_too_many_documents_relate_nothing(count):
+    # Every document shares the same common keywords, and each pair of neighbours three rarer ones
+    common = " ".join(f"common{n}" for n in range(edges.MIN_SHARED_KEYWORDS))
+    docs = [
+        {"id": f"d{n}", "title": f"Page {n}", "text_md": f"{common} " + " ".join(f"rare{n // 2}x{k}" for k in range(3))}
+        for n in range(count)
+    ]
+
+    found = DocumentEnricher(llm_enabled=True).generate_suggested_edges(docs)
+
+    # Only the neighbours are related, whatever the input size
+    assert [(e["from"], e["to"]) for e in found] == [(f"d{n}", f"d{n + 1}") for n in range(0, count - 1, 2)]
+    assert all("common" not in e["evidence"] for e in found)
+
+
+def test_related_documents_are_capped_per_document(monkeypatch):
+    # d0 shares three keywords with everyone, and one more with each of d20..d39
+    docs = [{"id": "d0", "title": "", "text_md": "alpha bravo charlie delta"}]
+    docs += [
+        {"id": f"d{n}", "title": "", "text_md": "alpha bravo charlie" + (" delta" if n >= 20 else "")}  # noqa: PLR2004
+        for n in range(1, 40)
+    ]
+    monkeypatch.setattr(enricher, "MAX_RELATED_PER_DOC", 20)
+
+    found = DocumentEnricher(llm_enabled=True).generate_suggested_edges(docs)
+
+    assert [e["to"] for e in found if e["from"] == "d0"] == [f"d{n}" for n in range(20, 40)]
+    assert all(sum(e["from"] == doc["id"] for e in found) <= 20 for doc in docs)  # noqa: PLR2004
+
+
+def test_streamed_texts_give_the_same_edges():
+    rng = random.Random(3)
+    topics = [[f"topic{t}word{n}" for n in range(40)] for t in range(EXPECTED_COUNT_3)]
+    docs = [
+        {"id": f"d{n}", "title": f"Page {n}", "text_md": " ".join(rng.sample(topics[n % EXPECTED_COUNT_3], 5))}
+        for n in range(30)
+    ]
+    docs[1]["text_md"] += " as described on page 29."
+
+    generator = DocumentEnricher(llm_enabled=True)
+    streamed = list(
+        generator.iter_suggested_edges([edges.edge_doc(doc) for doc in docs], (doc["text_md"] for doc in docs))
+    )
+
+    assert streamed == _pairwise_edges(docs)
+    assert ("d1", "d29", "REFERENCES") in {(e["from"], e["to"], e["type"]) for e in streamed}
+    # Documents of different topics share no keywords
+    related = {(e["from"], e["to"]) for e in streamed if e["type"] == "RELATES_TO"}
+    assert all(int(a[1:]) % EXPECTED_COUNT_3 == int(b[1:]) % EXPECTED_COUNT_3 for a, b in related)
@@ -0,0 +1,109 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for incremental enrichment reusing an earlier run's records by input hash."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from trailblazer.pipeline.steps.embed import loader
+from trailblazer.pipeline.steps.enrich import enricher
+from trailblazer.pipeline.steps.enrich.incremental import CHANGED_DOCS_FILE
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+DOCS = 20
+
+
+def _doc(n: int, text: str | None = None) -> dict:
+    text = text if text is not None else f"# Page {n}\n\nSetup guide for the agent.\n\n- install\n- configure {n}"
+    return {"id": f"doc{n}", "title": f"Page {n}", "text_md": text, "source_system": "confluence"}
+
+
+def _write_run(root, run_id: str, docs: list[dict]) -> None:
+    normalize = root / "var" / "runs" / run_id / "normalize"
+    normalize.mkdir(parents=True)
+    (normalize / "normalized.ndjson").write_text("".join(json.dumps(d) + "\n" for d in docs), encoding="utf-8")
+
+
+def _outputs(root, run_id: str) -> dict[str, str]:
+    enrich_dir = root / "var" / "runs" / run_id / "enrich"
+    return {name: (enrich_dir / name).read_text(encoding="utf-8") for name in ("enriched.jsonl", "fingerprints.jsonl")}
+
+
+def _comparable(stats: dict) -> dict:
+    return {k: v for k, v in stats.items() if k not in ("run_id", "duration_seconds", "completed_at", "incremental")}
+
+
+@pytest.mark.parametrize("workers", [1, EXPECTED_COUNT_2])
+def test_unchanged_documents_are_reused(tmp_path, monkeypatch, workers):
+    monkeypatch.setattr(enricher, "ENRICH_CHUNK_LINES", EXPECTED_COUNT_3)
+    before = [_doc(n) for n in range(DOCS)]
+    after = [_doc(n) for n in range(1, DOCS)]  # doc0 removed
+    after[EXPECTED_COUNT_4] = _doc(5, "Edited")  # doc5 changed
+    after.append(_doc(DOCS))  # new document
+
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        _write_run(tmp_path, "r1", before)
+        _write_run(tmp_path, "r2", after)
+        _write_run(tmp_path, "fresh", after)
+        enricher.enrich_from_normalized("r1")
+        fresh = enricher.enrich_from_normalized("fresh")
+        with patch.object(enricher, "_enrich_lines", wraps=enricher._enrich_lines) as enrich_lines:
+            incremental = enricher.enrich_from_normalized("r2", previous_run_id="r1", workers=workers)
+
+    # Byte-identical to enriching every document again
+    assert _outputs(tmp_path, "r2") == _outputs(tmp_path, "fresh")
+    assert _comparable(incremental) == _comparable(fresh)
+    assert incremental["incremental"] == {
+        "previous_run": "r1",
+        "docs_reused": DOCS - EXPECTED_COUNT_2,
+        "docs_new": 1,
+        "docs_changed": 1,
+        "docs_removed": 1,
+    }
+    changes = (tmp_path / "var" / "runs" / "r2" / "enrich" / CHANGED_DOCS_FILE).read_text(encoding="utf-8")
+    assert [json.loads(line) for line in changes.splitlines()] == [
+        {"id": "doc5", "change": "changed"},
+        {"id": f"doc{DOCS}", "change": "new"},
+        {"id": "doc0", "change": "removed"},
+    ]
+    if workers == 1:
+        assert sum(len(call.args[1]) for call in enrich_lines.call_args_list) == EXPECTED_COUNT_2
+
+
+def test_changed_enrichment_settings_reuse_nothing(tmp_path):
+    docs = [_doc(n) for n in range(EXPECTED_COUNT_3)]
+
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        _write_run(tmp_path, "r1", docs)
+        _write_run(tmp_path, "r2", docs)
+        enricher.enrich_from_normalized("r1")
+        stats = enricher.enrich_from_normalized("r2", previous_run_id="r1", llm_enabled=True)
+
+    assert stats["incremental"]["docs_reused"] == 0
+    assert stats["incremental"]["docs_changed"] == EXPECTED_COUNT_3
+    assert stats["docs_llm"] == EXPECTED_COUNT_3
+
+
+def test_missing_previous_run_is_an_error(tmp_path):
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        _write_run(tmp_path, "r2", [_doc(1)])
+        with pytest.raises(FileNotFoundError, match="Previous enrichment not found"):
+            enricher.enrich_from_normalized("r2", previous_run_id="r1")
+
+
+def test_embed_changed_only_uses_changed_docs_sidecar(tmp_path):
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        _write_run(tmp_path, "r1", [_doc(n) for n in range(EXPECTED_COUNT_3)])
+        _write_run(tmp_path, "r2", [_doc(0), _doc(1, "Edited"), _doc(EXPECTED_COUNT_3)])
+        enricher.enrich_from_normalized("r1")
+        enricher.enrich_from_normalized("r2", previous_run_id="r1")
+
+        assert loader._determine_changed_docs("r1", changed_only=True) == {"doc0", "doc1", "doc2"}
+        assert loader._determine_changed_docs("r2", changed_only=True) == {"doc1", "doc3"}
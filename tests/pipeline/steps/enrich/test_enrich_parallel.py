@@ -0,0 +1,151 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for multiprocess enrich_from_normalized and enrich-all run concurrency."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from trailblazer.cli import main as cli
+from trailblazer.pipeline.steps.enrich import enricher
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+DOCS = 120
+
+
+def _doc(n: int) -> dict:
+    kind = n % EXPECTED_COUNT_4
+    if kind == 0:
+        text = f"# Setup {n}\n\nInstall the agent and configure authentication.\n\n- step one\n- step two"
+    elif kind == 1:
+        text = f"![diagram {n}](d.png)"
+    elif kind == EXPECTED_COUNT_2:
+        text = ""
+    else:
+        text = f"Short {n} [broken]()"
+    return {"id": f"doc{n}", "title": f"Doc {n}", "text_md": text, "source_system": "confluence", "links": []}
+
+
+def _write_run(root, run_id: str, docs: list[dict]) -> None:
+    run = root / "var" / "runs" / run_id
+    (run / "ingest").mkdir(parents=True)
+    (run / "normalize").mkdir()
+    (run / "normalize" / "normalized.ndjson").write_text(
+        "".join(json.dumps(doc) + "\n\n" for doc in docs), encoding="utf-8"
+    )
+
+
+def _enrich(root, run_id: str, **kwargs) -> tuple[dict, dict[str, str], list[tuple]]:
+    events: list[tuple] = []
+    stats = enricher.enrich_from_normalized(
+        run_id, emit_event=lambda name, **fields: events.append((name, fields.get("doc_id"))), **kwargs
+    )
+    enrich_dir = root / "var" / "runs" / run_id / "enrich"
+    outputs = {path.name: path.read_text(encoding="utf-8") for path in sorted(enrich_dir.glob("*.jsonl"))}
+    for key in ("duration_seconds", "completed_at"):
+        stats.pop(key)
+    return stats, outputs, [event for event in events if event[0] != "enrich.end"]
+
+
+@pytest.mark.parametrize("llm_enabled", [False, True])
+def test_parallel_output_and_stats_match_sequential(tmp_path, monkeypatch, llm_enabled):
+    # Small chunks so several are in flight at once
+    monkeypatch.setattr(enricher, "ENRICH_CHUNK_LINES", EXPECTED_COUNT_3)
+    docs = [_doc(n) for n in range(DOCS)]
+
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        _write_run(tmp_path, "seq", docs)
+        _write_run(tmp_path, "par", docs)
+        sequential, seq_out, seq_events = _enrich(tmp_path, "seq", workers=1, llm_enabled=llm_enabled)
+        parallel, par_out, par_events = _enrich(tmp_path, "par", workers=EXPECTED_COUNT_3, llm_enabled=llm_enabled)
+
+    assert par_out == seq_out
+    enriched_ids = [json.loads(line)["id"] for line in par_out["enriched.jsonl"].splitlines()]
+    assert enriched_ids == [f"doc{n}" for n in range(DOCS)]
+    assert parallel | {"run_id": "seq"} == sequential
+    assert par_events == seq_events
+    assert ("enrich.doc", "doc99") in par_events
+    assert parallel["docs_total"] == DOCS
+    assert set(parallel["quality_flags_counts"]) >= {"empty_body", "too_short", "broken_links"}
+    if llm_enabled:
+        assert parallel["suggested_edges_total"] > 0
+
+
+def test_parallel_respects_max_docs(tmp_path):
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        _write_run(tmp_path, "r1", [_doc(n) for n in range(DOCS)])
+        stats, outputs, _ = _enrich(tmp_path, "r1", workers=EXPECTED_COUNT_2, max_docs=7)
+
+    assert stats["docs_total"] == len(outputs["fingerprints.jsonl"].splitlines()) == 7  # noqa: PLR2004
+
+
+def test_take_and_merge_stats_round_trip():
+    worker_a, worker_b, total = enricher.DocumentEnricher(), enricher.DocumentEnricher(), enricher.DocumentEnricher()
+    worker_a.enrich_document(_doc(1))
+    worker_b.enrich_document(_doc(EXPECTED_COUNT_2))
+    worker_b.enrich_document(_doc(EXPECTED_COUNT_3))
+
+    for worker in (worker_a, worker_b):
+        total.merge_stats(worker.take_stats())
+
+    assert total.docs_processed == EXPECTED_COUNT_3
+    assert len(total.quality_scores) == EXPECTED_COUNT_3
+    assert sum(total.quality_flags_counts.values()) >= EXPECTED_COUNT_3
+    assert worker_b.docs_processed == 0
+    assert worker_b.quality_scores == []
+
+
+def _invoke_enrich_all(tmp_path, monkeypatch, args: list[str]) -> tuple[object, dict[str, tuple[int, int]]]:
+    """Run enrich-all over three runs; returns the result and each run's (workers, pid)."""
+    runs = [f"2025-08-0{n}" for n in range(1, EXPECTED_COUNT_4)]
+
+    def fake_enrich(run_id, workers, **kwargs):
+        # Runs are enriched in child processes, so report back through the filesystem
+        (tmp_path / f"{run_id}.call").write_text(f"{workers} {os.getpid()}", encoding="utf-8")
+
+    monkeypatch.setattr(enricher, "enrich_from_normalized", fake_enrich)
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        for run_id in runs:
+            _write_run(tmp_path, run_id, [])
+        result = CliRunner().invoke(cli.app, ["enrich-all", *args])
+
+    calls = {}
+    for run_id in runs:
+        workers, pid = (tmp_path / f"{run_id}.call").read_text(encoding="utf-8").split()
+        calls[run_id] = (int(workers), int(pid))
+    return result, calls
+
+
+def test_enrich_all_splits_worker_cap_across_runs(tmp_path, monkeypatch):
+    result, calls = _invoke_enrich_all(tmp_path, monkeypatch, ["--parallel-runs", "2", "--max-workers", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert {workers for workers, _ in calls.values()} == {EXPECTED_COUNT_2}
+    assert all(pid != os.getpid() for _, pid in calls.values())
+    assert f"[{EXPECTED_COUNT_3}/{EXPECTED_COUNT_3}] ENRICHED" in result.output
+    assert "⚠️" not in result.output
+
+
+def test_enrich_all_defaults_to_one_worker_per_parallel_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli.SETTINGS, "ENRICH_MAX_WORKERS", None)
+    result, calls = _invoke_enrich_all(tmp_path, monkeypatch, ["--parallel-runs", "3"])
+
+    assert result.exit_code == 0, result.output
+    assert {workers for workers, _ in calls.values()} == {1}
+    assert "⚠️" not in result.output
+
+
+def test_enrich_all_warns_when_worker_cap_limits_parallel_runs(tmp_path, monkeypatch):
+    result, calls = _invoke_enrich_all(tmp_path, monkeypatch, ["--parallel-runs", "3", "--max-workers", "2"])
+
+    assert result.exit_code == 0, result.output
+    assert {workers for workers, _ in calls.values()} == {1}
+    assert "Worker cap 2 allows only 2 of 3 parallel runs" in result.output
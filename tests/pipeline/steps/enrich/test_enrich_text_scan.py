@@ -0,0 +1,116 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Golden tests for the single-pass Markdown scan behind rule-based enrichment."""
+
+import hashlib
+import json
+import random
+import re
+
+import pytest
+
+from trailblazer.pipeline.steps.enrich.enricher import DocumentEnricher
+from trailblazer.pipeline.steps.enrich.text_scan import scan_markdown
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+# Line fragments chosen for the regex edge cases the scan has to reproduce: markers ending a
+# line, indented items after them, 7+ hashes, CRLF, link targets split across lines, ...
+FRAGMENTS = [
+    "#", "##", "# ", "## Title", "####### x", " # indented", "#\tTab", "-", "- ", "-  ", "* item", "+", "+\t",
+    "  - nested", "\t* t", "1. one", "1. ", "1.", "2.\t", "  4. ", "12.x", "", " ", "\t", "\r", "text words here",
+    "[a](b)", "[a]()", "[a]( \n )", "[x](#)", "![img](p.png)", "![alt]", "![", "](", "[l] x [y](z)", "| a | b |",
+    "|x", "a|b|c", "```", "````", "```py", "__init__ (x) `code` *b*", " ", "# nb ", "**", "end.",
+]  # fmt: skip
+
+# sha256 over the enriched documents and enrichment fingerprints of golden_docs(), as produced
+# by the enricher before the single-pass scan (one regex pass per metric)
+GOLDEN_SHA256 = "46a1cff6afb9801c23f97cf080a5cbf2c757ee05c4484255e113374807fbca9c"
+
+
+def _text(rng: random.Random) -> str:
+    lines = []
+    for _ in range(rng.randint(0, 30)):
+        if rng.random() < 0.6:
+            line = rng.choice(FRAGMENTS)
+            if rng.random() < 0.3:
+                line += " " + rng.choice(FRAGMENTS)
+        else:
+            words = ["alpha", "beta", "#x", "-", "[a]", "(b)", "|", "`", "_", ""]
+            line = " ".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+        lines.append(line)
+    text = rng.choice(["\n", "\n", "\n\n", "\r\n"]).join(lines)
+    if rng.random() < 0.1:
+        text = "#" + text
+    if rng.random() < 0.1:
+        text += "\n"
+    return text
+
+
+def golden_docs(count: int = 400) -> list[dict]:
+    rng = random.Random(2024)
+    return [
+        {
+            "id": f"d{n}",
+            "title": f"T{n}",
+            "text_md": _text(rng),
+            "url": "https://example.atlassian.net/wiki/spaces/DEV/pages/1/T",
+            "attachments": [{"filename": "a.png"}] * rng.randint(0, 3),
+            "links": ["https://a"] * rng.randint(0, 4),
+            "source_system": "confluence",
+            "breadcrumbs": ["Space", "Parent Page", f"T{n}"],
+        }
+        for n in range(count)
+    ]
+
+
+def test_enrichment_matches_golden_outputs():
+    enricher = DocumentEnricher()
+    digest = hashlib.sha256()
+    for doc in golden_docs():
+        enriched = enricher.enrich_document(doc)
+        digest.update(json.dumps(enriched, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+        digest.update(enricher.compute_enrichment_fingerprint(enriched).encode("ascii"))
+
+    assert digest.hexdigest() == GOLDEN_SHA256
+
+
+def test_counts_match_whole_text_patterns():
+    """Each count equals the regex the enricher used to run over the whole text."""
+    for doc in golden_docs():
+        text = doc["text_md"]
+        scan = scan_markdown(text)
+
+        assert scan.words == len(text.split())
+        assert scan.headings == len(re.findall(r"^#+\s", text, re.MULTILINE))
+        assert scan.list_items == len(re.findall(r"^[\s]*[-*+]\s+", text, re.MULTILINE))
+        assert scan.images == len(re.findall(r"!\[.*?\]", text))
+        assert scan.md_links == len(re.findall(r"\[.*?\]\(.*?\)", text))
+        assert scan.tables == len(re.findall(r"\|.*\|", text))
+        assert scan.fences == len(re.findall(r"```", text))
+        assert scan.paragraphs == len([p for p in re.split(r"\n\s*\n|^#", text) if p.strip()])
+        assert scan.collapsed == re.sub(r"\s+", " ", text.strip())
+
+
+def test_list_item_marker_ending_a_line_swallows_next_indent():
+    # The pattern's trailing \s+ runs into the next line, so "  - b" cannot start a match
+    assert scan_markdown("- \n  - b").list_items == 1
+    assert scan_markdown("- \n- b").list_items == EXPECTED_COUNT_2
+    assert scan_markdown("-\n\n  * b\n+ c").list_items == EXPECTED_COUNT_2
+
+
+def test_sections_and_soft_boundaries():
+    text = "# Intro\nSome text\n\nMore text\n\n\n## Steps\n- one\n2. two\n####### not a heading"
+
+    scan = scan_markdown(text)
+
+    assert [(s["heading"], s["level"], s["startChar"], s["endChar"]) for s in scan.sections] == [
+        ("Intro", 1, 0, 8),
+        ("Steps", EXPECTED_COUNT_2, 31, 40),
+    ]
+    # Headings, the single blank line between paragraphs, and list items
+    assert scan.soft_boundaries == [0, 18, 31, 40, 46]
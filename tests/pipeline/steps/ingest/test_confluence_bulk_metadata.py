@@ -0,0 +1,160 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for bulk label/ancestor harvesting via CQL expand."""
+
+import json
+from collections import Counter
+
+import pytest
+
+from trailblazer.pipeline.steps.ingest import confluence as step
+from trailblazer.pipeline.steps.ingest.confluence import CQL_PAGE_SIZE, _page_metadata_from_result, _search_pages
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+PAGE_IDS = [f"p{i}" for i in range(CQL_PAGE_SIZE + 7)]
+
+
+def _labels(page_id: str) -> list[dict]:
+    return [{"name": f"label-{page_id}"}, {"name": "shared"}]
+
+
+def _ancestors(page_id: str) -> list[dict]:
+    return [{"id": "root", "title": "Root", "_links": {"webui": "/spaces/DEV/pages/root"}}]
+
+
+class FakeClient:
+    """Confluence client that counts requests per endpoint."""
+
+    site_base = "https://example.atlassian.net/wiki"
+
+    def __init__(self, uncovered: frozenset[str] = frozenset()):
+        self.calls: Counter[str] = Counter()
+        self.uncovered = uncovered
+
+    def _page(self, page_id: str) -> dict:
+        return {
+            "id": page_id,
+            "title": f"Title {page_id}",
+            "spaceId": "111",
+            "version": {"number": 1, "createdAt": "2025-08-10T12:00:00Z"},
+            "_links": {"webui": f"/spaces/DEV/pages/{page_id}"},
+            "body": {"storage": {"value": f"<p>{page_id}</p>"}},
+        }
+
+    def get_spaces(self, keys=None, limit=100):
+        yield {"id": "111", "key": "DEV"}
+
+    def get_pages(self, space_id=None, body_format=None, limit=100):
+        for page_id in PAGE_IDS:
+            yield self._page(page_id)
+
+    def get_page_by_id(self, page_id, body_format=None):
+        return self._page(page_id)
+
+    def get_page_labels(self, page_id):
+        self.calls["labels"] += 1
+        return _labels(page_id)
+
+    def get_page_ancestors(self, page_id):
+        self.calls["ancestors"] += 1
+        return _ancestors(page_id)
+
+    def get_attachments_for_page(self, page_id, limit=100):
+        return []
+
+    def search_cql(self, cql, start=0, limit=50, expand=None):
+        self.calls["search"] += 1
+        results = []
+        for page_id in PAGE_IDS[start : start + limit]:
+            result: dict = {"id": page_id, "type": "page"}
+            if expand and page_id not in self.uncovered:
+                result["metadata"] = {"labels": {"results": _labels(page_id), "size": 2, "_links": {}}}
+                result["ancestors"] = _ancestors(page_id)
+            results.append(result)
+        return {"results": results}
+
+
+def _ingest(tmp_path, monkeypatch, client, **kwargs) -> list[dict]:
+    monkeypatch.setattr(step, "ConfluenceClient", lambda: client)
+    out = tmp_path / "out"
+    step.ingest_confluence(str(out), space_keys=["DEV"], body_format="storage", fetch_workers=1, **kwargs)
+    lines = (out / "confluence.ndjson").read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines]
+
+
+def test_full_space_scan_uses_harvested_metadata(tmp_path, monkeypatch):
+    client = FakeClient()
+    bulk = _ingest(tmp_path / "bulk", monkeypatch, client)
+
+    assert client.calls["labels"] == 0
+    assert client.calls["ancestors"] == 0
+    assert client.calls["search"] == EXPECTED_COUNT_2
+
+    per_page = _ingest(tmp_path / "per-page", monkeypatch, FakeClient(), bulk_metadata=False)
+    assert bulk == per_page
+    assert bulk[0]["labels"] == ["label-p0", "shared"]
+    assert bulk[0]["ancestors"][0]["url"] == "https://example.atlassian.net/wiki/spaces/DEV/pages/root"
+
+    metrics = json.loads((tmp_path / "bulk" / "out" / "metrics.json").read_text())
+    assert metrics["bulk_metadata_pages"] == len(PAGE_IDS)
+
+
+def test_since_mode_reuses_prefilter_search(tmp_path, monkeypatch):
+    client = FakeClient()
+    records = _ingest(tmp_path, monkeypatch, client, since=step.datetime(2025, 1, 1, tzinfo=step.timezone.utc))
+
+    assert [r["id"] for r in records] == PAGE_IDS
+    assert client.calls == Counter({"search": EXPECTED_COUNT_2})
+
+
+def test_uncovered_pages_fall_back_to_per_page_calls(tmp_path, monkeypatch):
+    client = FakeClient(uncovered=frozenset({"p3", "p4"}))
+    records = _ingest(tmp_path, monkeypatch, client)
+
+    assert client.calls["labels"] == EXPECTED_COUNT_2
+    assert client.calls["ancestors"] == EXPECTED_COUNT_2
+    assert records[3]["labels"] == ["label-p3", "shared"]
+
+
+def test_page_capped_run_skips_space_wide_harvest(tmp_path, monkeypatch):
+    client = FakeClient()
+    records = _ingest(tmp_path, monkeypatch, client, max_pages=EXPECTED_COUNT_3)
+
+    assert client.calls == Counter({"labels": EXPECTED_COUNT_3, "ancestors": EXPECTED_COUNT_3})
+    assert [r["id"] for r in records] == PAGE_IDS[:EXPECTED_COUNT_3]
+    assert records[0]["labels"] == ["label-p0", "shared"]
+
+
+def test_run_capped_at_a_search_page_still_harvests(tmp_path, monkeypatch):
+    client = FakeClient()
+    records = _ingest(tmp_path, monkeypatch, client, max_pages=CQL_PAGE_SIZE)
+
+    assert client.calls == Counter({"search": EXPECTED_COUNT_2})
+    assert len(records) == CQL_PAGE_SIZE
+
+
+def test_truncated_label_expansion_is_not_trusted():
+    result = {
+        "id": "p1",
+        "metadata": {"labels": {"results": [{"name": "a"}], "_links": {"next": "/rest/api/..."}}},
+        "ancestors": [],
+    }
+
+    meta = _page_metadata_from_result(result)
+
+    assert meta.labels is None
+    assert meta.ancestors == []
+
+
+def test_search_pages_without_metadata_skips_expand():
+    client = FakeClient()
+
+    ids, metadata = _search_pages(client, "type=page", with_metadata=False)
+
+    assert ids == PAGE_IDS
+    assert metadata == {}
@@ -0,0 +1,233 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for version-based delta Confluence ingest and the page-version store."""
+
+import json
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from trailblazer.pipeline.steps.ingest import confluence as step
+from trailblazer.pipeline.steps.ingest.page_versions import PageVersionStore
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+PAGE_IDS = [f"p{i}" for i in range(6)]
+OUTPUT_FILES = ["confluence.ndjson", "pages.csv", "links.jsonl", "edges.jsonl", "labels.jsonl", "breadcrumbs.jsonl"]
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path):
+    """Keep the page-version store and run logs under tmp_path."""
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        yield
+
+
+class FakeClient:
+    """Confluence client with per-page versions; records which calls carried bodies."""
+
+    site_base = "https://example.atlassian.net/wiki"
+
+    def __init__(self, versions: dict[str, int] | None = None, labels: dict[str, str] | None = None):
+        self.versions = {page_id: 1 for page_id in PAGE_IDS} | (versions or {})
+        self.labels = {page_id: f"label-{page_id}" for page_id in PAGE_IDS} | (labels or {})
+        self.calls: Counter[str] = Counter()
+        self.list_formats: list[str | None] = []
+
+    def _page(self, page_id: str, with_body: bool = True) -> dict:
+        version = self.versions[page_id]
+        page = {
+            "id": page_id,
+            "title": f"Title {page_id}",
+            "spaceId": "111",
+            "version": {"number": version, "createdAt": f"2025-08-{10 + version:02d}T12:00:00Z"},
+            "_links": {"webui": f"/spaces/DEV/pages/{page_id}"},
+        }
+        if with_body:
+            body = f'<p>{page_id} v{version} <a href="https://example.com/{page_id}">x</a></p>'
+            page["body"] = {"storage": {"value": body}}
+        return page
+
+    def get_spaces(self, keys=None, limit=100):
+        yield {"id": "111", "key": "DEV"}
+
+    def get_page_batches(self, space_id=None, body_format=None, limit=100, cursor=None):
+        self.list_formats.append(body_format)
+        yield None, [self._page(page_id, with_body=body_format is not None) for page_id in PAGE_IDS]
+
+    def get_page_by_id(self, page_id, body_format=None):
+        self.calls["body"] += 1
+        return self._page(page_id)
+
+    def get_page_labels(self, page_id):
+        return [{"name": self.labels[page_id]}]
+
+    def get_page_ancestors(self, page_id):
+        return []
+
+    def get_attachments_for_page(self, page_id, limit=100):
+        self.calls["attachments"] += 1
+        return []
+
+    def search_cql(self, cql, start=0, limit=50, expand=None):
+        self.calls["search"] += 1
+        if start:
+            return {"results": []}
+        results = []
+        for page_id in PAGE_IDS:
+            result: dict = {"id": page_id}
+            if "version" in (expand or ""):
+                result["version"] = {"number": self.versions[page_id]}
+            if "metadata.labels" in (expand or ""):
+                result["metadata"] = {"labels": {"results": self.get_page_labels(page_id)}}
+                result["ancestors"] = []
+            results.append(result)
+        return {"results": results}
+
+
+def _run(tmp_path, monkeypatch, client, run_id, **kwargs) -> dict:
+    monkeypatch.setattr(step, "ConfluenceClient", lambda: client)
+    kwargs = {"delta": True, "bulk_metadata": False, **kwargs}
+    return step.ingest_confluence(
+        str(tmp_path / "runs" / run_id),
+        space_keys=["DEV"],
+        body_format="storage",
+        run_id=run_id,
+        fetch_workers=1,
+        **kwargs,
+    )
+
+
+def _assert_same_output(run, baseline):
+    for name in OUTPUT_FILES:
+        assert (run / name).read_text(encoding="utf-8") == (baseline / name).read_text(encoding="utf-8"), name
+
+
+def test_unchanged_pages_are_carried_forward(tmp_path, monkeypatch):
+    first = FakeClient()
+    _run(tmp_path, monkeypatch, first, "r1")
+    assert first.list_formats == ["storage"]  # empty store: list with bodies as before
+
+    changed = {"p2": EXPECTED_COUNT_2}
+    second = FakeClient(changed)
+    metrics = _run(tmp_path, monkeypatch, second, "r2")
+
+    # Bodies listed without content; only the changed page is fetched by id
+    assert second.list_formats == [None]
+    assert second.calls["body"] == 1
+    assert second.calls["attachments"] == 1
+    assert metrics["delta"] == {"carried_forward": len(PAGE_IDS) - 1, "fetched": 1}
+
+    _run(tmp_path, monkeypatch, FakeClient(changed), "fresh", delta=False)
+    _assert_same_output(tmp_path / "runs" / "r2", tmp_path / "runs" / "fresh")
+
+    events = [json.loads(line) for line in (tmp_path / "logs" / "r2.ndjson").read_text().splitlines()]
+    kinds = Counter(event.get("event_type") or event.get("event") for event in events)
+    assert kinds["delta.skip"] == len(PAGE_IDS) - 1
+    assert kinds["delta.fetch"] == 1
+
+
+def test_store_points_at_latest_run(tmp_path, monkeypatch):
+    _run(tmp_path, monkeypatch, FakeClient(), "r1")
+    _run(tmp_path, monkeypatch, FakeClient(), "r2")
+
+    # r1 can be deleted: everything now lives in r2
+    (tmp_path / "runs" / "r1" / "confluence.ndjson").unlink()
+    third = FakeClient()
+    _run(tmp_path, monkeypatch, third, "r3")
+
+    assert third.calls["body"] == 0
+    store = PageVersionStore()
+    assert {store.get(page_id).run_id for page_id in PAGE_IDS} == {"r3"}
+    assert store.get("p0").version == 1
+
+
+def test_missing_previous_output_falls_back_to_fetch(tmp_path, monkeypatch):
+    _run(tmp_path, monkeypatch, FakeClient(), "r1")
+    (tmp_path / "runs" / "r1" / "confluence.ndjson").write_text("", encoding="utf-8")
+
+    second = FakeClient()
+    metrics = _run(tmp_path, monkeypatch, second, "r2")
+
+    assert second.calls["body"] == len(PAGE_IDS)
+    assert metrics["delta"] == {"carried_forward": 0, "fetched": len(PAGE_IDS)}
+    _run(tmp_path, monkeypatch, FakeClient(), "fresh", delta=False)
+    _assert_same_output(tmp_path / "runs" / "r2", tmp_path / "runs" / "fresh")
+
+
+def test_pruned_previous_runs_are_listed_with_bodies(tmp_path, monkeypatch):
+    _run(tmp_path, monkeypatch, FakeClient(), "r1")
+    (tmp_path / "runs" / "r1" / "confluence.ndjson").unlink()
+
+    second = FakeClient()
+    metrics = _run(tmp_path, monkeypatch, second, "r2")
+
+    # Nothing can be carried, so bodies come with the listing instead of one GET per page
+    assert second.list_formats == ["storage"]
+    assert second.calls["body"] == 0
+    assert metrics["delta"] == {"carried_forward": 0, "fetched": len(PAGE_IDS)}
+
+
+def test_space_unknown_to_store_is_listed_with_bodies(tmp_path, monkeypatch):
+    _run(tmp_path, monkeypatch, FakeClient(), "r1")
+    # The store only knows another space's pages
+    store = PageVersionStore()
+    store.save({page_id: store.get(page_id)._replace(space_key="OPS") for page_id in PAGE_IDS})
+
+    second = FakeClient()
+    _run(tmp_path, monkeypatch, second, "r2")
+
+    assert second.list_formats == ["storage"]
+    assert second.calls["body"] == 0
+    assert PageVersionStore().carryable_share("DEV") == 1.0
+    assert PageVersionStore().carryable_share("QA") == 0.0
+
+
+def test_carried_pages_get_harvested_labels(tmp_path, monkeypatch):
+    _run(tmp_path, monkeypatch, FakeClient(), "r1", bulk_metadata=True)
+
+    relabeled = {"p1": "relabeled"}
+    second = FakeClient(labels=relabeled)
+    metrics = _run(tmp_path, monkeypatch, second, "r2", bulk_metadata=True)
+
+    # A label change doesn't bump the version: still carried, with the new label
+    assert second.calls["body"] == 0
+    assert metrics["delta"] == {"carried_forward": len(PAGE_IDS), "fetched": 0}
+    _run(tmp_path, monkeypatch, FakeClient(labels=relabeled), "fresh", delta=False, bulk_metadata=True)
+    _assert_same_output(tmp_path / "runs" / "r2", tmp_path / "runs" / "fresh")
+
+
+def test_since_mode_skips_bodies_of_unchanged_candidates(tmp_path, monkeypatch):
+    since = step.datetime(2025, 1, 1, tzinfo=step.timezone.utc)
+    _run(tmp_path, monkeypatch, FakeClient(), "r1", since=since)
+
+    second = FakeClient({"p4": EXPECTED_COUNT_3})
+    metrics = _run(tmp_path, monkeypatch, second, "r2", since=since)
+
+    assert second.calls["body"] == 1
+    assert metrics["delta"] == {"carried_forward": len(PAGE_IDS) - 1, "fetched": 1}
+    records = [json.loads(line) for line in (tmp_path / "runs" / "r2" / "confluence.ndjson").read_text().splitlines()]
+    assert [r["id"] for r in records] == PAGE_IDS
+    assert records[EXPECTED_COUNT_4]["version"] == EXPECTED_COUNT_3
+
+
+def test_no_delta_without_run_id(tmp_path, monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(step, "ConfluenceClient", lambda: client)
+    metrics = step.ingest_confluence(
+        str(tmp_path / "out"), space_keys=["DEV"], body_format="storage", fetch_workers=1, delta=True
+    )
+
+    assert "delta" not in metrics
+    assert not PageVersionStore().path.exists()
+
+
+def test_delta_is_off_by_default(tmp_path, monkeypatch):
+    _run(tmp_path, monkeypatch, FakeClient(), "r1", delta=None)
+
+    assert not PageVersionStore().path.exists()
@@ -0,0 +1,103 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for Confluence transport tuning and per-endpoint HTTP counters."""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+import trailblazer.adapters.confluence_api as confluence_api
+from trailblazer.adapters.http_stats import HttpStats, InstrumentedTransport, endpoint_key
+from trailblazer.core.config import SETTINGS
+from trailblazer.pipeline.steps.ingest import confluence as step
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+
+def test_endpoint_key_templates_ids():
+    request = httpx.Request("GET", "https://example.atlassian.net/wiki/api/v2/pages/12345/labels?limit=10")
+
+    assert endpoint_key(request) == "GET /api/v2/pages/{id}/labels"
+
+
+def test_transport_counts_compressed_bytes_per_endpoint():
+    payload = json.dumps({"results": [{"id": str(n)} for n in range(200)]}).encode()
+    compressed = gzip.compress(payload)
+
+    def handler(request):
+        # A stream (not content=) so the body is consumed like a real network response
+        return httpx.Response(200, headers={"Content-Encoding": "gzip"}, stream=httpx.ByteStream(compressed))
+
+    stats = HttpStats()
+    transport = InstrumentedTransport(httpx.MockTransport(handler), stats)
+    with httpx.Client(transport=transport, base_url="https://example.atlassian.net/wiki") as client:
+        for page_id in ("1", "2", "3"):
+            assert len(client.get(f"/api/v2/pages/{page_id}").json()["results"]) == 200
+        client.get("/api/v2/spaces")
+
+    snapshot = stats.snapshot()
+    pages = snapshot["endpoints"]["GET /api/v2/pages/{id}"]
+    assert pages["requests"] == EXPECTED_COUNT_3
+    assert pages["bytes"] == EXPECTED_COUNT_3 * len(compressed)
+    assert pages["errors"] == 0
+    assert snapshot["requests"] == EXPECTED_COUNT_4
+    assert snapshot["http_versions"] == {"HTTP/1.1": EXPECTED_COUNT_4}
+
+
+def test_error_responses_are_counted():
+    stats = HttpStats()
+    transport = InstrumentedTransport(
+        httpx.MockTransport(lambda request: httpx.Response(404, stream=httpx.ByteStream(b""))), stats
+    )
+    with httpx.Client(transport=transport) as client:
+        client.get("https://example.test/api/v2/pages/9")
+
+    assert stats.snapshot()["endpoints"]["GET /api/v2/pages/{id}"]["errors"] == 1
+
+
+def test_client_applies_transport_settings(monkeypatch):
+    monkeypatch.setattr(SETTINGS, "CONFLUENCE_ACCEPT_ENCODING", "br, gzip, bogus")
+    monkeypatch.setattr(SETTINGS, "CONFLUENCE_TIMEOUT", 12.5)
+    monkeypatch.setattr(SETTINGS, "CONFLUENCE_HTTP2", True)
+    monkeypatch.setattr(confluence_api, "_installed", lambda *modules: False)
+
+    client = confluence_api.ConfluenceClient(base_url="https://example.atlassian.net", email="e", token="t")
+
+    # Without brotli/h2 installed: br dropped, HTTP/1.1 used
+    assert client._client.headers["Accept-Encoding"] == "gzip"
+    assert client._client.timeout.read == 12.5
+    assert confluence_api._http2_enabled() is False
+
+
+class FakeClient:
+    site_base = "https://example.atlassian.net/wiki"
+
+    def __init__(self):
+        self.http_stats = HttpStats()
+        self.http_stats.record("GET /api/v2/pages", 200, 1000, 0.25, "HTTP/2")
+
+    def get_spaces(self, keys=None, limit=100):
+        yield {"id": "111", "key": "DEV"}
+
+    def get_pages(self, space_id=None, body_format=None, limit=100):
+        return []
+
+    def search_cql(self, cql, start=0, limit=50, expand=None):
+        return {"results": []}
+
+
+def test_ingest_metrics_include_http_counters(tmp_path, monkeypatch):
+    monkeypatch.setattr(step, "ConfluenceClient", FakeClient)
+
+    step.ingest_confluence(str(tmp_path), space_keys=["DEV"], body_format="storage", fetch_workers=1)
+
+    http = json.loads((tmp_path / "metrics.json").read_text())["http"]
+    assert http["endpoints"]["GET /api/v2/pages"]["avg_ms"] == 250.0
+    assert http["bytes"] == 1000
+    assert http["http_versions"] == {"HTTP/2": 1}
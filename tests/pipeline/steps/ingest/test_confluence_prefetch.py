@@ -0,0 +1,132 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for concurrent per-page prefetch during Confluence ingest."""
+
+import json
+import random
+import threading
+import time
+
+import pytest
+
+from trailblazer.pipeline.steps.ingest import confluence as step
+from trailblazer.pipeline.steps.ingest.confluence import _prefetch_in_order
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+PAGE_IDS = [f"p{i}" for i in range(20)]
+
+
+class FakeClient:
+    """Confluence client whose per-page calls sleep for a random, seeded latency."""
+
+    site_base = "https://example.atlassian.net/wiki"
+
+    def __init__(self, seed: int = 0):
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.threads: set[str] = set()
+
+    def _latency(self) -> None:
+        with self._lock:
+            delay = self._rng.uniform(0, 0.01)
+            self.threads.add(threading.current_thread().name)
+        time.sleep(delay)
+
+    def _page(self, page_id: str) -> dict:
+        return {
+            "id": page_id,
+            "title": f"Title {page_id}",
+            "spaceId": "111",
+            "version": {"number": 1, "createdAt": "2025-08-10T12:00:00Z"},
+            "_links": {"webui": f"/spaces/DEV/pages/{page_id}"},
+            "body": {"storage": {"value": f"<p>{page_id}</p>"}},
+        }
+
+    def get_spaces(self, keys=None, limit=100):
+        yield {"id": "111", "key": "DEV"}
+
+    def get_pages(self, space_id=None, body_format=None, limit=100):
+        for page_id in PAGE_IDS:
+            yield self._page(page_id)
+
+    def get_page_by_id(self, page_id, body_format=None):
+        self._latency()
+        return self._page(page_id)
+
+    def get_page_labels(self, page_id):
+        self._latency()
+        return [{"name": f"label-{page_id}"}]
+
+    def get_page_ancestors(self, page_id):
+        self._latency()
+        return [{"id": "root", "title": "Root", "_links": {"webui": "/spaces/DEV/pages/root"}}]
+
+    def get_attachments_for_page(self, page_id, limit=100):
+        self._latency()
+        return [{"id": f"a-{page_id}", "title": f"{page_id}.png", "_links": {"download": f"/dl/{page_id}.png"}}]
+
+    def search_cql(self, cql, start=0, limit=50, expand=None):
+        if start:
+            return {"results": []}
+        return {"results": [{"id": page_id} for page_id in reversed(PAGE_IDS)]}
+
+
+def _ingest(tmp_path, monkeypatch, client, **kwargs) -> list[dict]:
+    monkeypatch.setattr(step, "ConfluenceClient", lambda: client)
+    out = tmp_path / "out"
+    step.ingest_confluence(str(out), space_keys=["DEV"], body_format="storage", **kwargs)
+    lines = (out / "confluence.ndjson").read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_output_order_is_independent_of_fetch_latency(tmp_path, monkeypatch, seed):
+    client = FakeClient(seed)
+    records = _ingest(tmp_path, monkeypatch, client, fetch_workers=6)
+
+    assert [r["id"] for r in records] == PAGE_IDS
+    assert all(r["labels"] == [f"label-{r['id']}"] for r in records)
+    assert all(r["attachments"][0]["filename"] == f"{r['id']}.png" for r in records)
+    assert all(r["ancestors"][0]["id"] == "root" for r in records)
+    assert len(client.threads) > 1
+
+
+def test_concurrent_output_matches_sequential(tmp_path, monkeypatch):
+    sequential = _ingest(tmp_path / "seq", monkeypatch, FakeClient(), fetch_workers=1)
+    concurrent = _ingest(tmp_path / "par", monkeypatch, FakeClient(), fetch_workers=8)
+
+    assert concurrent == sequential
+
+
+def test_since_mode_keeps_candidate_order_and_max_pages(tmp_path, monkeypatch):
+    records = _ingest(
+        tmp_path,
+        monkeypatch,
+        FakeClient(),
+        since=step.datetime(2025, 1, 1, tzinfo=step.timezone.utc),
+        max_pages=EXPECTED_COUNT_4,
+        fetch_workers=4,
+    )
+
+    assert [r["id"] for r in records] == list(reversed(PAGE_IDS))[:EXPECTED_COUNT_4]
+
+
+def test_prefetch_stops_consuming_when_caller_stops():
+    consumed = []
+
+    def items():
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    results = _prefetch_in_order(items(), lambda x: x * 2, workers=4, window=8)
+    assert [next(results) for _ in range(EXPECTED_COUNT_3)] == [0, 2, 4]
+    results.close()
+
+    # Only a bounded window was read ahead
+    assert len(consumed) <= EXPECTED_COUNT_3 + 8
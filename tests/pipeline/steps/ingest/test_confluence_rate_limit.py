@@ -0,0 +1,175 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for the shared Confluence rate limiter and the parallel multi-space scheduler."""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from trailblazer.adapters.confluence_api import ConfluenceClient, _not_rate_limited
+from trailblazer.adapters.rate_limit import RateLimitedTransport, TokenBucket, parse_retry_after
+from trailblazer.core.config import SETTINGS
+from trailblazer.core.progress import ProgressRenderer
+from trailblazer.pipeline.steps.ingest import confluence as step
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+    for _ in range(EXPECTED_COUNT_3):
+        assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(0.5)
+
+
+def test_pause_blocks_until_deadline():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100.0, capacity=10, clock=clock, sleep=clock.sleep)
+
+    bucket.pause(4.0)
+    bucket.acquire()
+
+    assert clock.now >= 4.0
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None, default=2.5) == 2.5
+    assert parse_retry_after("Wed, 01 Jan 2025 12:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after("garbage", default=1.0) == 1.0
+
+
+def test_transport_honors_retry_after_on_429():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1000.0, capacity=10, clock=clock, sleep=clock.sleep)
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(429, headers={"Retry-After": "5"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+    )
+    transport = RateLimitedTransport(httpx.MockTransport(lambda request: next(responses)), bucket)
+
+    with httpx.Client(transport=transport, base_url="https://example.test") as client:
+        response = client.get("/api/v2/pages")
+
+    assert response.json() == {"ok": True}
+    assert clock.now == pytest.approx(8.0)
+
+
+def test_transport_gives_up_after_max_retries():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1000.0, capacity=10, clock=clock, sleep=clock.sleep)
+    transport = RateLimitedTransport(
+        httpx.MockTransport(lambda request: httpx.Response(429, headers={"Retry-After": "1"})),
+        bucket,
+        max_retries=EXPECTED_COUNT_2,
+    )
+
+    with httpx.Client(transport=transport, base_url="https://example.test") as client:
+        response = client.get("/x")
+
+    assert response.status_code == 429
+    assert clock.now == pytest.approx(2.0)
+    # The client-level tenacity retry must not add blind backoff on top
+    error = httpx.HTTPStatusError("rate limited", request=response.request, response=response)
+    assert not _not_rate_limited(error)
+
+
+def test_429s_are_retried_with_the_limiter_disabled(monkeypatch):
+    monkeypatch.setattr(SETTINGS, "CONFLUENCE_RATE_LIMIT_RPS", 0)
+    transport = ConfluenceClient(base_url="https://example.atlassian.net")._client._transport
+    assert isinstance(transport, RateLimitedTransport)
+    assert transport.limiter is None
+
+    sleeps: list[float] = []
+    responses = iter([httpx.Response(429, headers={"Retry-After": "3"}), httpx.Response(200, json={"ok": True})])
+    transport = RateLimitedTransport(httpx.MockTransport(lambda request: next(responses)), None, sleep=sleeps.append)
+
+    with httpx.Client(transport=transport, base_url="https://example.test") as client:
+        response = client.get("/api/v2/pages")
+
+    assert response.json() == {"ok": True}
+    assert sleeps == [3.0]
+
+
+class FakeClient:
+    site_base = "https://example.atlassian.net/wiki"
+    spaces = {"DEV": "1", "OPS": "2", "QA": "3"}
+
+    def __init__(self):
+        self._space_key = None
+
+    def get_spaces(self, keys=None, limit=100):
+        for key in keys or []:
+            yield {"id": self.spaces[key], "key": key}
+
+    def get_pages(self, space_id=None, body_format=None, limit=100):
+        key = next(k for k, v in self.spaces.items() if v == space_id)
+        for n in range(EXPECTED_COUNT_3):
+            yield {
+                "id": f"{key}-{n}",
+                "title": f"{key} page {n}",
+                "spaceId": space_id,
+                "version": {"number": 1, "createdAt": "2025-08-10T12:00:00Z"},
+                "_links": {"webui": f"/spaces/{key}/pages/{n}"},
+                "body": {"storage": {"value": "<p>x</p>"}},
+            }
+
+    def get_attachments_for_page(self, page_id, limit=100):
+        return []
+
+    def search_cql(self, cql, start=0, limit=50, expand=None):
+        return {"results": []}
+
+
+def test_parallel_spaces_write_separate_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(step, "ConfluenceClient", FakeClient)
+    renderer = ProgressRenderer(enabled=False)
+
+    with (
+        patch("trailblazer.core.paths.ROOT", tmp_path),
+        patch("trailblazer.core.progress._progress", renderer),
+    ):
+        results = step.ingest_confluence_spaces(["DEV", "OPS", "QA"], max_parallel=EXPECTED_COUNT_3, fetch_workers=1)
+
+    assert list(results) == ["DEV", "OPS", "QA"]
+    assert len({r["run_id"] for r in results.values()}) == EXPECTED_COUNT_3
+    for key, result in results.items():
+        assert result["error"] is None
+        ndjson = tmp_path / "var" / "runs" / result["run_id"] / "ingest" / "confluence.ndjson"
+        ids = [json.loads(line)["id"] for line in ndjson.read_text(encoding="utf-8").splitlines()]
+        assert ids == [f"{key}-{n}" for n in range(EXPECTED_COUNT_3)]
+
+    assert {k: (row["status"], row["pages"]) for k, row in renderer.space_throughput.items()} == {
+        "DEV": ("done", EXPECTED_COUNT_3),
+        "OPS": ("done", EXPECTED_COUNT_3),
+        "QA": ("done", EXPECTED_COUNT_3),
+    }
+    assert renderer.throughput_table().row_count == EXPECTED_COUNT_3
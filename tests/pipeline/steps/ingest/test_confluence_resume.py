@@ -0,0 +1,163 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for resuming an interrupted Confluence ingest from its progress checkpoint."""
+
+import json
+
+import pytest
+
+from trailblazer.pipeline.steps.ingest import confluence as step
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+PAGE_IDS = [f"p{i:02d}" for i in range(11)]
+OUTPUT_FILES = [
+    "confluence.ndjson",
+    "pages.csv",
+    "attachments.csv",
+    "links.jsonl",
+    "ingest_media.jsonl",
+    "edges.jsonl",
+    "labels.jsonl",
+    "breadcrumbs.jsonl",
+    "attachments_manifest.jsonl",
+]
+
+
+class Crash(Exception):
+    pass
+
+
+class FakeClient:
+    """Cursor-paginated client (3 pages per batch) that can crash on a chosen batch or page."""
+
+    site_base = "https://example.atlassian.net/wiki"
+
+    def __init__(self, crash_on_cursor=None, crash_on_page=None):
+        self.crash_on_cursor = crash_on_cursor
+        self.crash_on_page = crash_on_page
+        self.start_cursors: list[str | None] = []
+        self.fetched: list[str] = []
+
+    def _page(self, page_id: str) -> dict:
+        return {
+            "id": page_id,
+            "title": f"Title {page_id}",
+            "spaceId": "111",
+            "version": {"number": 1, "createdAt": "2025-08-10T12:00:00Z"},
+            "_links": {"webui": f"/spaces/DEV/pages/{page_id}"},
+            "body": {"storage": {"value": f'<p>{page_id} <a href="https://example.com/{page_id}">x</a></p>'}},
+        }
+
+    def get_spaces(self, keys=None, limit=100):
+        yield {"id": "111", "key": "DEV"}
+
+    def get_page_batches(self, space_id=None, body_format=None, limit=100, cursor=None):
+        self.start_cursors.append(cursor)
+        batches = [PAGE_IDS[i : i + EXPECTED_COUNT_3] for i in range(0, len(PAGE_IDS), EXPECTED_COUNT_3)]
+        cursors = [None] + [f"c{n}" for n in range(1, len(batches))]
+        start = cursors.index(cursor)
+        for batch_cursor, batch in zip(cursors[start:], batches[start:], strict=True):
+            if batch_cursor is not None and batch_cursor == self.crash_on_cursor:
+                raise Crash(batch_cursor)
+            yield batch_cursor, [self._page(page_id) for page_id in batch]
+
+    def get_page_by_id(self, page_id, body_format=None):
+        if page_id == self.crash_on_page:
+            raise Crash(page_id)
+        return self._page(page_id)
+
+    def get_page_labels(self, page_id):
+        return [{"name": f"label-{page_id}"}]
+
+    def get_page_ancestors(self, page_id):
+        return []
+
+    def get_attachments_for_page(self, page_id, limit=100):
+        self.fetched.append(page_id)
+        return []
+
+    def search_cql(self, cql, start=0, limit=50, expand=None):
+        if start:
+            return {"results": []}
+        return {"results": [{"id": page_id} for page_id in PAGE_IDS]}
+
+
+def _run(monkeypatch, outdir, client, **kwargs) -> dict:
+    monkeypatch.setattr(step, "ConfluenceClient", lambda: client)
+    return step.ingest_confluence(
+        str(outdir),
+        space_keys=["DEV"],
+        body_format="storage",
+        progress_every=EXPECTED_COUNT_4,
+        fetch_workers=1,
+        bulk_metadata=False,
+        **kwargs,
+    )
+
+
+def _assert_same_output(resumed, baseline):
+    for name in OUTPUT_FILES:
+        assert (resumed / name).read_text(encoding="utf-8") == (baseline / name).read_text(encoding="utf-8"), name
+    assert json.loads((resumed / "DEV_seen_page_ids.json").read_text()) == PAGE_IDS
+
+
+def test_resume_continues_from_cursor_without_refetching(tmp_path, monkeypatch):
+    _run(monkeypatch, tmp_path / "baseline", FakeClient())
+
+    crashing = FakeClient(crash_on_cursor="c2")
+    with pytest.raises(Crash):
+        _run(monkeypatch, tmp_path / "run", crashing)
+    checkpoint = json.loads((tmp_path / "run" / "progress.json").read_text())
+    assert checkpoint["pages_processed"] == EXPECTED_COUNT_4
+    assert checkpoint["cursor"] == "c1"
+
+    resumed = FakeClient()
+    _run(monkeypatch, tmp_path / "run", resumed, resume=True)
+
+    # Listing restarts at the checkpointed batch; only pages past the checkpoint are fetched
+    assert resumed.start_cursors == ["c1"]
+    assert resumed.fetched == PAGE_IDS[EXPECTED_COUNT_4:]
+    _assert_same_output(tmp_path / "run", tmp_path / "baseline")
+    summary = json.loads((tmp_path / "run" / "summary.json").read_text())
+    baseline = json.loads((tmp_path / "baseline" / "summary.json").read_text())
+    for key in ("total_pages", "links_total", "links_external", "media_refs_total", "labels_total", "spaces"):
+        assert summary[key] == baseline[key], key
+    assert summary["resume_from"] == PAGE_IDS[EXPECTED_COUNT_4 - 1]
+
+
+def test_resume_in_since_mode_skips_written_ids(tmp_path, monkeypatch):
+    since = step.datetime(2025, 1, 1, tzinfo=step.timezone.utc)
+    _run(monkeypatch, tmp_path / "baseline", FakeClient(), since=since)
+
+    with pytest.raises(Crash):
+        _run(monkeypatch, tmp_path / "run", FakeClient(crash_on_page="p06"), since=since)
+
+    resumed = FakeClient()
+    metrics = _run(monkeypatch, tmp_path / "run", resumed, since=since, resume=True)
+
+    assert resumed.fetched == PAGE_IDS[EXPECTED_COUNT_4:]
+    assert metrics["pages"] == len(PAGE_IDS)
+    _assert_same_output(tmp_path / "run", tmp_path / "baseline")
+
+
+def test_resume_of_completed_run_is_a_no_op(tmp_path, monkeypatch):
+    metrics = _run(monkeypatch, tmp_path / "run", FakeClient())
+
+    resumed = FakeClient()
+    assert _run(monkeypatch, tmp_path / "run", resumed, resume=True)["pages"] == metrics["pages"]
+    assert resumed.fetched == []
+
+
+def test_resume_without_checkpoint_starts_over(tmp_path, monkeypatch):
+    (tmp_path / "run").mkdir()
+    (tmp_path / "run" / "confluence.ndjson").write_text('{"id": "stale"}\n', encoding="utf-8")
+
+    metrics = _run(monkeypatch, tmp_path / "run", FakeClient(), resume=True)
+
+    assert metrics["pages"] == len(PAGE_IDS)
+    assert "stale" not in (tmp_path / "run" / "confluence.ndjson").read_text(encoding="utf-8")
@@ -0,0 +1,129 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for incremental DITA ingest driven by the var/state/dita file manifest."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from trailblazer.pipeline.steps.ingest import dita as step
+from trailblazer.pipeline.steps.ingest.dita_manifest import DitaFileManifest
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+OUTPUT_FILES = ["dita.ndjson", "edges.jsonl", "labels.jsonl", "links.jsonl", "meta.jsonl", "breadcrumbs.jsonl"]
+TOPICS = EXPECTED_COUNT_2 * EXPECTED_COUNT_3
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path):
+    """Keep the file manifest under tmp_path."""
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        yield
+
+
+def _topic(topic_id: str, text: str) -> str:
+    return (
+        '<?xml version="1.0"?>\n'
+        '<!DOCTYPE concept PUBLIC "-//OASIS//DTD DITA Concept//EN" "concept.dtd">\n'
+        f'<concept id="{topic_id}"><title>Title {topic_id}</title>'
+        f"<prolog><metadata><keywords><keyword>{topic_id}</keyword></keywords></metadata></prolog>"
+        f'<conbody><p>{text}</p><p><image href="../images/{topic_id}.png"/></p>'
+        f'<p><xref href="topic0.dita">first</xref></p></conbody></concept>'
+    )
+
+
+@pytest.fixture
+def dita_tree(tmp_path):
+    root = tmp_path / "tree"
+    for section in ("alpha", "beta"):
+        (root / section).mkdir(parents=True)
+        for n in range(EXPECTED_COUNT_3):
+            (root / section / f"topic{n}.dita").write_text(_topic(f"{section}{n}", "Body text."), encoding="utf-8")
+    refs = "".join(f'<topicref href="alpha/topic{n}.dita"/>' for n in range(EXPECTED_COUNT_3))
+    (root / "guide.ditamap").write_text(f"<map><title>Guide</title>{refs}</map>", encoding="utf-8")
+    return root
+
+
+def _run(tmp_path, root, name, **kwargs) -> dict:
+    return step.ingest_dita(str(tmp_path / "runs" / name), str(root), run_id=name, **kwargs)
+
+
+def _assert_same_output(tmp_path, run, baseline):
+    for name in OUTPUT_FILES:
+        expected = (tmp_path / "runs" / baseline / name).read_text(encoding="utf-8")
+        assert (tmp_path / "runs" / run / name).read_text(encoding="utf-8") == expected, name
+
+
+def test_unchanged_tree_reuses_every_file(tmp_path, dita_tree):
+    first = _run(tmp_path, dita_tree, "r1", incremental=True)
+    assert first["incremental"] == {"reused": 0, "parsed": TOPICS + 1}
+
+    with patch.object(step, "parse_topic", side_effect=AssertionError("re-parsed")):
+        second = _run(tmp_path, dita_tree, "r2", incremental=True)
+
+    assert second["incremental"] == {"reused": TOPICS + 1, "parsed": 0}
+    assert second["topics"] == TOPICS
+    _assert_same_output(tmp_path, "r2", "r1")
+
+
+def test_changed_files_are_parsed_and_output_matches_full_run(tmp_path, dita_tree):
+    _run(tmp_path, dita_tree, "r1", incremental=True)
+
+    # Grown file (size differs), same-size edit (hash differs), and a touch (hash unchanged)
+    (dita_tree / "alpha" / "topic1.dita").write_text(_topic("alpha1", "Body text, now longer."), encoding="utf-8")
+    (dita_tree / "beta" / "topic2.dita").write_text(_topic("beta2", "Body TEXT."), encoding="utf-8")
+    touched = dita_tree / "beta" / "topic0.dita"
+    stats = touched.stat()
+    os.utime(touched, ns=(stats.st_atime_ns, stats.st_mtime_ns + 10**9))
+    (dita_tree / "alpha" / "topic2.dita").unlink()
+
+    summary = _run(tmp_path, dita_tree, "r2", incremental=True)
+    assert summary["incremental"] == {"reused": TOPICS - EXPECTED_COUNT_2, "parsed": EXPECTED_COUNT_2}
+
+    _run(tmp_path, dita_tree, "full", incremental=False)
+    _assert_same_output(tmp_path, "r2", "full")
+    assert DitaFileManifest(dita_tree).get("alpha/topic2.dita") is None
+
+
+def test_missing_previous_docs_fall_back_to_parse(tmp_path, dita_tree):
+    _run(tmp_path, dita_tree, "r1", incremental=True)
+    (tmp_path / "runs" / "r1" / "dita_docs.jsonl").unlink()
+
+    summary = _run(tmp_path, dita_tree, "r2", incremental=True)
+
+    assert summary["incremental"] == {"reused": 0, "parsed": TOPICS + 1}
+    _assert_same_output(tmp_path, "r2", "r1")
+    manifest = DitaFileManifest(dita_tree)
+    assert manifest.get("guide.ditamap").run_id == "r2"
+
+
+def test_full_mode_leaves_no_manifest(tmp_path, dita_tree):
+    summary = _run(tmp_path, dita_tree, "r1", incremental=False)
+
+    assert "incremental" not in summary
+    assert not (tmp_path / "runs" / "r1" / "dita_docs.jsonl").exists()
+    assert not DitaFileManifest(dita_tree).path.exists()
+
+
+def test_lines_from_an_older_format_are_misses(tmp_path, dita_tree):
+    _run(tmp_path, dita_tree, "r1", incremental=True)
+    manifest = DitaFileManifest(dita_tree)
+    entry = manifest.get("alpha/topic0.dita")
+    assert manifest.read("alpha/topic0.dita", entry) is not None
+
+    # The same line as written before lines were versioned (and before records carried body_dita_md)
+    line, cached = manifest.read("alpha/topic0.dita", entry)
+    del cached["format"]
+    del cached["record"]["body_dita_md"]
+    legacy = tmp_path / "legacy.jsonl"
+    legacy.write_text(json.dumps(cached) + "\n", encoding="utf-8")
+    legacy_entry = entry._replace(path=str(legacy), offset=0, length=legacy.stat().st_size)
+    assert manifest.read("alpha/topic0.dita", legacy_entry) is None
+    manifest.close()
@@ -0,0 +1,79 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for process-pool DITA parsing in ingest_dita."""
+
+import json
+
+import pytest
+
+from trailblazer.pipeline.steps.ingest import dita as step
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+SIDECARS = ["dita.ndjson", "edges.jsonl", "labels.jsonl", "links.jsonl", "meta.jsonl", "ingest_media.jsonl"]
+
+
+def _topic(topic_id: str, title: str, xref: str | None = None) -> str:
+    link = f'<p><xref href="{xref}">see</xref></p>' if xref else ""
+    return (
+        '<?xml version="1.0"?>\n'
+        '<!DOCTYPE concept PUBLIC "-//OASIS//DTD DITA Concept//EN" "concept.dtd">\n'
+        f'<concept id="{topic_id}"><title>{title}</title>'
+        f"<prolog><metadata><keywords><keyword>{topic_id}</keyword></keywords></metadata></prolog>"
+        f'<conbody><p>Body of {title}.</p><p><image href="../images/{topic_id}.png"/></p>{link}</conbody></concept>'
+    )
+
+
+@pytest.fixture
+def dita_tree(tmp_path):
+    root = tmp_path / "tree"
+    for section in ("zeta", "alpha", "mid"):
+        directory = root / section
+        directory.mkdir(parents=True)
+        for n in range(EXPECTED_COUNT_4):
+            (directory / f"topic{n}.dita").write_text(
+                _topic(f"{section}{n}", f"{section} topic {n}", xref=f"topic{(n + 1) % EXPECTED_COUNT_4}.dita"),
+                encoding="utf-8",
+            )
+    refs = "".join(f'<topicref href="alpha/topic{n}.dita"/>' for n in range(EXPECTED_COUNT_4))
+    (root / "guide.ditamap").write_text(
+        f'<?xml version="1.0"?>\n<!DOCTYPE map PUBLIC "-//OASIS//DTD DITA Map//EN" "map.dtd">\n'
+        f"<map><title>Guide</title>{refs}</map>",
+        encoding="utf-8",
+    )
+    return root
+
+
+def test_parallel_output_matches_sequential(tmp_path, dita_tree):
+    sequential = step.ingest_dita(str(tmp_path / "seq"), str(dita_tree), workers=1)
+    parallel = step.ingest_dita(str(tmp_path / "par"), str(dita_tree), workers=EXPECTED_COUNT_3)
+
+    for name in SIDECARS:
+        seq_path, par_path = tmp_path / "seq" / name, tmp_path / "par" / name
+        if seq_path.exists():
+            assert par_path.read_text(encoding="utf-8") == seq_path.read_text(encoding="utf-8"), name
+    assert parallel["topics"] == sequential["topics"] == EXPECTED_COUNT_3 * EXPECTED_COUNT_4
+    assert parallel["maps"] == 1
+    assert parallel["workers"] == EXPECTED_COUNT_3
+
+
+def test_records_are_in_sorted_path_order(tmp_path, dita_tree):
+    step.ingest_dita(str(tmp_path / "out"), str(dita_tree), workers=EXPECTED_COUNT_2)
+
+    records = [json.loads(line) for line in (tmp_path / "out" / "dita.ndjson").read_text().splitlines()]
+    topic_paths = [r["source_path"] for r in records if r["doctype"] != "map"]
+    assert topic_paths == sorted(topic_paths)
+    assert topic_paths[0] == "alpha/topic0.dita"
+    assert records[-1]["source_path"] == "guide.ditamap"
+
+
+def test_parse_failures_are_skipped_in_workers(tmp_path, dita_tree):
+    (dita_tree / "alpha" / "broken.dita").write_text("", encoding="utf-8")
+
+    summary = step.ingest_dita(str(tmp_path / "out"), str(dita_tree), workers=EXPECTED_COUNT_2)
+
+    assert summary["files_found"] == summary["files_processed"] + 1
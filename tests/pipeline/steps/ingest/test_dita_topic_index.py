@@ -0,0 +1,115 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for the path-keyed topic index used to resolve DITA map refs and links."""
+
+import json
+
+import pytest
+
+from trailblazer.adapters.dita import LinkRef, MapDoc, MapRef, TopicDoc
+from trailblazer.pipeline.steps.ingest import dita as step
+from trailblazer.pipeline.steps.ingest.dita import (
+    _build_hierarchy_and_write_edges,
+    _index_topics_by_path,
+    _write_links_sidecar,
+)
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+
+def _topic(topic_id: str, links: list[LinkRef] | None = None) -> TopicDoc:
+    return TopicDoc(
+        id=topic_id,
+        title=f"Title {topic_id}",
+        doctype="concept",
+        body_xml="<conbody/>",
+        prolog_metadata={},
+        images=[],
+        xrefs=[],
+        keyrefs=[],
+        conrefs=[],
+        labels=[],
+        links=links or [],
+        enhanced_metadata={},
+    )
+
+
+def _map(map_id: str, hrefs: list[str]) -> MapDoc:
+    refs = [MapRef(href=href, navtitle=None, type=None, scope=None, processing_role=None) for href in hrefs]
+    return MapDoc(
+        id=map_id, title=f"Map {map_id}", keydefs={}, hierarchy=refs, labels=[], links=[], enhanced_metadata={}
+    )
+
+
+def _dita_link(target: str) -> LinkRef:
+    return LinkRef(
+        href="x.dita",
+        keyref=None,
+        conref=None,
+        target_type="dita",
+        target_page_id=target,
+        target_url=None,
+        anchor=None,
+        text=None,
+        element_type="xref",
+    )
+
+
+def test_index_groups_topics_by_path_without_element_id():
+    topics = [_topic("topic:guide/intro#intro"), _topic("topic:guide/setup"), _topic("topic:guide/intro")]
+
+    index = _index_topics_by_path(topics)
+
+    assert [t.id for t in index["guide/intro"]] == ["topic:guide/intro#intro", "topic:guide/intro"]
+    assert [t.id for t in index["guide/setup"]] == ["topic:guide/setup"]
+
+
+def test_hierarchy_resolves_hrefs_and_updates_records(tmp_path):
+    topics = [_topic("topic:guide/intro#intro"), _topic("topic:guide/setup")]
+    records = [{"id": t.id, "ancestors": [], "ancestor_count": 0} for t in topics]
+    maps = [_map("map:guide", ["guide/Intro.dita", "guide/setup.dita", "guide/missing.dita"])]
+
+    total = _build_hierarchy_and_write_edges(tmp_path, maps, topics, records, tmp_path)
+
+    edges = [json.loads(line) for line in (tmp_path / "edges.jsonl").read_text().splitlines()]
+    assert [e["dst"] for e in edges] == ["topic:guide/intro#intro", "topic:guide/setup"]
+    assert total == EXPECTED_COUNT_2
+    assert records[0]["ancestors"] == ["Map map:guide"]
+
+
+def test_links_to_topic_paths_resolve_to_ingested_ids(tmp_path):
+    source = _topic(
+        "topic:guide/setup",
+        links=[_dita_link("topic:guide/intro"), _dita_link("topic:guide/gone"), _dita_link("topic:guide/intro#x")],
+    )
+    docs = [_topic("topic:guide/intro#intro"), source]
+
+    _write_links_sidecar(tmp_path, docs, tmp_path)
+
+    targets = [json.loads(line)["target_page_id"] for line in (tmp_path / "links.jsonl").read_text().splitlines()]
+    assert targets == ["topic:guide/intro#intro", "topic:guide/gone", "topic:guide/intro#x"]
+
+
+def test_map_titles_reach_every_topic_at_a_path(tmp_path):
+    root = tmp_path / "tree"
+    (root / "guide").mkdir(parents=True)
+    for name in ("intro.dita", "setup.dita"):
+        (root / "guide" / name).write_text(
+            f'<?xml version="1.0"?>\n<concept id="{name[:-5]}"><title>{name}</title><conbody><p>x</p></conbody></concept>',
+            encoding="utf-8",
+        )
+    for title in ("Guide", "Admin"):
+        (root / f"{title.lower()}.ditamap").write_text(
+            f'<map><title>{title}</title><topicref href="guide/intro.dita"/><topicref href="guide/setup.dita"/></map>',
+            encoding="utf-8",
+        )
+
+    step.ingest_dita(str(tmp_path / "out"), str(root))
+
+    meta = {r["page_id"]: r for r in map(json.loads, (tmp_path / "out" / "meta.jsonl").read_text().splitlines())}
+    assert meta["topic:guide/intro#intro"]["meta"]["map_titles"] == ["Admin", "Guide"]
+    assert meta["topic:guide/setup#setup"]["meta"]["map_titles"] == ["Admin", "Guide"]
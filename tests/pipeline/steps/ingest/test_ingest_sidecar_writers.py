@@ -0,0 +1,108 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for streaming ingest sidecar writers."""
+
+import csv
+import io
+import json
+import random
+
+import pytest
+import structlog
+
+from trailblazer.pipeline.steps.ingest import confluence as step
+from trailblazer.pipeline.steps.ingest.sidecars import JsonlSidecar, SortedCsvSidecar
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+FIELDS = ["group", "name", "n"]
+
+
+def _read_csv(path) -> list[dict]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.mark.parametrize("run_size", [3, 1000])
+def test_sorted_csv_matches_stable_in_memory_sort(tmp_path, run_size):
+    rng = random.Random(run_size)
+    rows = [{"group": rng.choice("abc"), "name": rng.choice("xyz"), "n": i} for i in range(50)]
+    path = tmp_path / "out.csv"
+
+    sidecar = SortedCsvSidecar(path, FIELDS, key=lambda r: (r["group"], r["name"]), run_size=run_size)
+    for row in rows:
+        sidecar.write(row)
+    sidecar.close()
+
+    expected = sorted(rows, key=lambda r: (r["group"], r["name"]))
+    assert _read_csv(path) == [{k: str(v) for k, v in row.items()} for row in expected]
+    # Spill runs are removed after the merge
+    assert [p.name for p in tmp_path.iterdir()] == ["out.csv"]
+
+
+def test_sorted_csv_is_valid_before_close(tmp_path):
+    path = tmp_path / "out.csv"
+    sidecar = SortedCsvSidecar(path, FIELDS, key=lambda r: r["n"])
+    sidecar.write({"group": "a", "name": "x", "n": 1})
+
+    assert _read_csv(path) == []
+    assert path.read_text(encoding="utf-8").strip() == "group,name,n"
+
+
+def test_jsonl_sidecar_flush_makes_records_visible(tmp_path):
+    path = tmp_path / "out.jsonl"
+    sidecar = JsonlSidecar(path)
+    sidecar.write({"b": 1, "a": "é"})
+    sidecar.flush()
+
+    assert path.read_text(encoding="utf-8") == '{"a": "é", "b": 1}\n'
+    sidecar.close()
+
+
+class CrashingClient:
+    """Serves five pages, then fails mid-space."""
+
+    site_base = "https://example.atlassian.net/wiki"
+
+    def get_spaces(self, keys=None, limit=100):
+        yield {"id": "1", "key": "DEV"}
+
+    def get_pages(self, space_id=None, body_format=None, limit=100):
+        for n in range(5):
+            yield {
+                "id": f"p{n}",
+                "title": f"Page {n}",
+                "spaceId": "1",
+                "version": {"number": 1, "createdAt": "2025-08-10T12:00:00Z"},
+                "_links": {"webui": f"/spaces/DEV/pages/p{n}"},
+                "body": {"storage": {"value": "<p>x</p>"}},
+            }
+        raise RuntimeError("connection reset")
+
+    def get_page_labels(self, page_id):
+        return [{"name": "guide"}]
+
+    def get_attachments_for_page(self, page_id, limit=100):
+        return []
+
+    def search_cql(self, cql, start=0, limit=50, expand=None):
+        return {"results": []}
+
+
+def test_sidecars_survive_a_crash_up_to_last_checkpoint(tmp_path, monkeypatch):
+    monkeypatch.setattr(step, "log", structlog.wrap_logger(structlog.PrintLogger(io.StringIO())))
+    monkeypatch.setattr(step, "ConfluenceClient", CrashingClient)
+    out = tmp_path / "out"
+
+    with pytest.raises(RuntimeError):
+        step.ingest_confluence(str(out), space_keys=["DEV"], body_format="storage", progress_every=2, fetch_workers=1)
+
+    progress = json.loads((out / "progress.json").read_text())
+    labels = (out / "labels.jsonl").read_text(encoding="utf-8").splitlines()
+    assert progress["pages_processed"] == EXPECTED_COUNT_4
+    assert len(labels) >= progress["pages_processed"]
+    assert len(_read_csv(out / "pages.csv")) == len((out / "confluence.ndjson").read_text().splitlines())
@@ -0,0 +1,133 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for the parse-once storage XHTML model and the ingest -> normalize extract cache."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from trailblazer.pipeline.steps.ingest import confluence as step
+from trailblazer.pipeline.steps.ingest.link_resolver import extract_links_from_storage_with_classification
+from trailblazer.pipeline.steps.ingest.media_extractor import extract_media_from_storage
+from trailblazer.pipeline.steps.ingest.storage_doc import (
+    STORAGE_EXTRACT_FILE,
+    StorageDoc,
+    StorageExtractCache,
+    storage_sha256,
+)
+from trailblazer.pipeline.steps.normalize.html_to_md import normalize_from_ingest
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+SITE = "https://example.atlassian.net/wiki"
+
+BODY = (
+    "<h1>Setup</h1>"
+    '<p>See <a href="https://example.atlassian.net/wiki/spaces/DEV/pages/123/Intro#top">intro</a> and '
+    '<a href="https://docs.example.com/x?utm_source=wiki&amp;id=2">docs</a>.</p>'
+    '<p><ac:image ac:alt="diagram"><ri:attachment ri:filename="flow.png" /></ac:image></p>'
+    '<ac:structured-macro ac:name="code"><ac:plain-text-body><![CDATA[a < b]]></ac:plain-text-body>'
+    "</ac:structured-macro>"
+    '<noscript><a href="https://tracker.example.com/">pixel</a></noscript><script>var x = 1;</script>'
+    '<p><img src="https://cdn.example.com/img/logo.png" alt="logo" /></p>'
+)
+
+
+def test_views_match_separate_extractors_in_any_order():
+    doc = StorageDoc(BODY)
+
+    # Markdown first: it rewrites the tree, which must not affect links/media taken afterwards
+    text_md = doc.markdown()
+    links = [vars(link) for link in doc.links(SITE)]
+    media = [vars(item) for item in doc.media()]
+
+    assert links == [vars(link) for link in extract_links_from_storage_with_classification(BODY, SITE)]
+    assert media == [vars(item) for item in extract_media_from_storage(BODY)]
+    assert links[0]["target_page_id"] == "123"
+    assert len(links) == EXPECTED_COUNT_3  # the <noscript> link still counts for traceability
+    assert [item["filename"] for item in media] == ["flow.png", "logo.png"]
+    assert "# Setup" in text_md
+    assert "var x" not in text_md
+    assert "pixel" not in text_md
+    assert doc.hrefs() == sorted(link["raw_url"] for link in links)
+
+
+def test_extract_cache_skips_partial_lines(tmp_path):
+    path = tmp_path / STORAGE_EXTRACT_FILE
+    extract = StorageDoc(BODY).extract()
+    key = storage_sha256(BODY)
+    path.write_text(
+        json.dumps({"content_sha256": key, "links": extract.links, "text_md": extract.text_md}) + "\n"
+        '{"content_sha256": "deadbeef", "links": [',
+        encoding="utf-8",
+    )
+
+    cache = StorageExtractCache(path)
+
+    assert len(cache) == 1
+    assert cache.get(key) == extract
+    assert cache.get("deadbeef") is None
+    assert cache.hits == 1
+    cache.close()
+
+
+class FakeClient:
+    """Single-space client serving storage bodies; two pages share one body."""
+
+    site_base = SITE
+
+    def get_spaces(self, keys=None, limit=100):
+        yield {"id": "111", "key": "DEV"}
+
+    def get_page_batches(self, space_id=None, body_format=None, limit=100, cursor=None):
+        bodies = {"p1": BODY, "p2": BODY, "p3": "<p>Plain <b>text</b></p>"}
+        yield (
+            None,
+            [
+                {
+                    "id": page_id,
+                    "title": f"Title {page_id}",
+                    "spaceId": "111",
+                    "version": {"number": 1, "createdAt": "2025-08-10T12:00:00Z"},
+                    "_links": {"webui": f"/spaces/DEV/pages/{page_id}"},
+                    "body": {"storage": {"value": body}},
+                }
+                for page_id, body in bodies.items()
+            ],
+        )
+
+    def get_page_labels(self, page_id):
+        return []
+
+    def get_page_ancestors(self, page_id):
+        return []
+
+    def get_attachments_for_page(self, page_id, limit=100):
+        return []
+
+
+def test_normalize_reuses_ingest_extracts(tmp_path, monkeypatch):
+    ingest_dir = tmp_path / "var" / "runs" / "r1" / "ingest"
+    monkeypatch.setattr(step, "ConfluenceClient", FakeClient)
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        step.ingest_confluence(
+            str(ingest_dir), space_keys=["DEV"], body_format="storage", fetch_workers=1, bulk_metadata=False
+        )
+
+        extracts = (ingest_dir / STORAGE_EXTRACT_FILE).read_text(encoding="utf-8").splitlines()
+        assert len(extracts) == EXPECTED_COUNT_2  # one per distinct body
+
+        cached = normalize_from_ingest(str(ingest_dir.parent / "normalize"), use_cache=False)
+        assert cached["storage_extract_hits"] == EXPECTED_COUNT_3
+        with_cache = (ingest_dir.parent / "normalize" / "normalized.ndjson").read_text(encoding="utf-8")
+
+        (ingest_dir / STORAGE_EXTRACT_FILE).unlink()
+        parsed = normalize_from_ingest(str(ingest_dir.parent / "normalize"), use_cache=False)
+        assert parsed["storage_extract_hits"] == 0
+
+    assert (ingest_dir.parent / "normalize" / "normalized.ndjson").read_text(encoding="utf-8") == with_cache
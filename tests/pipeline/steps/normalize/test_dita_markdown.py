@@ -0,0 +1,112 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for the streaming lxml DITA -> Markdown converter shared by ingest and normalize."""
+
+import json
+
+import pytest
+from lxml import etree
+
+from trailblazer.adapters.dita import parse_topic
+from trailblazer.adapters.dita_markdown import dita_to_markdown, element_to_markdown
+from trailblazer.pipeline.steps.normalize import html_to_md
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+BODY = """<conbody>
+  <p>Intro with <b>bold</b>, <codeph>x = 1</codeph> and <xref href="https://docs.example.com/a">docs</xref>.</p>
+  <section>
+    <title>Install <i>now</i></title>
+    <ul><li>first</li><li><xref keyref="k-setup"/></li>stray text</ul>
+    <note>Back up first<!-- reviewer comment --></note>
+    <codeblock>make install</codeblock>
+    <section><title>Nested</title><ol><li>one</li></ol></section>
+  </section>
+  <fig><image href="flow.png" alt="Flow"/></fig>
+  <related-links><link href="http://example.org/ref"/><link href="other.dita">Other</link></related-links>
+</conbody>
+"""
+
+EXPECTED_MD = (
+    "Intro with **bold** , `x = 1` and [docs](https://docs.example.com/a) .\n\n"
+    " ## Install *now*\n\n"
+    " - first\n- [k-setup](k-setup)\n\n"
+    " > **Note**: Back up first\n\n"
+    " ```\nmake install\n```\n\n"
+    " ### Nested\n\n"
+    " 1. one\n\n"
+    " ![Flow](flow.png)\n\n"
+    " [http://example.org/ref](http://example.org/ref) [Other](other.dita)"
+)
+
+
+def test_converts_body_and_collects_external_links():
+    text_md, links = dita_to_markdown(BODY)
+
+    # Section titles gain a level per enclosing section
+    assert text_md == EXPECTED_MD
+    assert links == ["http://example.org/ref", "https://docs.example.com/a"]
+    assert html_to_md._to_markdown_from_dita_xml(BODY) == EXPECTED_MD
+    assert html_to_md._extract_links_from_dita_xml(BODY) == links
+
+
+def test_parsed_tree_converts_identically_and_is_left_intact():
+    body = etree.fromstring(BODY.encode())
+    before = etree.tostring(body)
+
+    assert element_to_markdown(body) == dita_to_markdown(BODY)
+    assert etree.tostring(body) == before
+
+
+def test_deep_nesting_is_linear_and_caps_heading_level():
+    depth = 200  # libxml2 caps nesting at 256 without huge_tree
+    xml = "<body>" + "<section><title>t</title>" * depth + "</section>" * depth + "</body>"
+
+    text_md, _ = dita_to_markdown(xml)
+
+    headings = [line.strip() for line in text_md.splitlines() if line.strip()]
+    assert len(headings) == depth
+    assert headings[:EXPECTED_COUNT_3] == ["## t", "### t", "#### t"]
+    assert set(headings[EXPECTED_COUNT_4:]) == {"###### t"}
+
+
+def test_unparseable_body_falls_back_to_plain_text(monkeypatch):
+    def fail(_):
+        raise etree.XMLSyntaxError("boom", None, 1, 1)
+
+    monkeypatch.setattr(html_to_md, "dita_to_markdown", fail)
+
+    assert html_to_md._dita_markdown_and_links("<p>Some <b>text</b></p>") == ("Some text", [])
+
+
+def test_normalize_uses_markdown_converted_at_ingest(tmp_path):
+    # Longer than the 10k chars of body_dita_xml an ingest record keeps
+    paragraphs = "".join(f"<p>Paragraph {n} of the topic.</p>" for n in range(600))
+    topic_file = tmp_path / "long.dita"
+    topic_file.write_text(
+        f'<concept id="long"><title>Long</title><conbody>{paragraphs}<p>The end.</p></conbody></concept>',
+        encoding="utf-8",
+    )
+    topic = parse_topic(topic_file)
+    assert topic.body_md.endswith("The end.")
+
+    rec = {
+        "id": topic.id,
+        "body_repr": "dita",
+        "body_dita_xml": topic.body_xml[:10000],
+        "body_dita_md": topic.body_md,
+        "body_dita_links": topic.body_links,
+    }
+    ingest = tmp_path / "runs" / "r1" / "ingest"
+    ingest.mkdir(parents=True)
+    (ingest / "dita.ndjson").write_text(json.dumps(rec) + "\n", encoding="utf-8")
+
+    html_to_md.normalize_from_ingest(str(ingest.parent / "normalize"), input_file=str(ingest / "dita.ndjson"))
+
+    out = json.loads((ingest.parent / "normalize" / "normalized.ndjson").read_text(encoding="utf-8"))
+    assert out["text_md"] == topic.body_md
+    assert out["text_md"] == dita_to_markdown(topic.body_xml).text_md
@@ -0,0 +1,133 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for the cross-run, content-addressed normalize cache."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from trailblazer.pipeline.steps.normalize import html_to_md
+from trailblazer.pipeline.steps.normalize.cache import NormalizeCache, NormalizedBody, normalize_cache_key
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+
+def _write_run(root, run_id: str, records: list[dict]):
+    ingest = root / "var" / "runs" / run_id / "ingest"
+    ingest.mkdir(parents=True)
+    (ingest / "confluence.ndjson").write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+    return ingest / "confluence.ndjson"
+
+
+def _storage(page_id: str, body: str, sha: str) -> dict:
+    return {"id": page_id, "title": page_id, "body_repr": "storage", "body_storage": body, "content_sha256": sha}
+
+
+def _normalize(root, run_id: str, records: list[dict], **kwargs) -> tuple[dict, list[dict]]:
+    inp = _write_run(root, run_id, records)
+    outdir = inp.parent.parent / "normalize"
+    metrics = html_to_md.normalize_from_ingest(str(outdir), input_file=str(inp), use_cache=True, **kwargs)
+    lines = (outdir / "normalized.ndjson").read_text(encoding="utf-8").splitlines()
+    return metrics, [json.loads(line) for line in lines]
+
+
+def test_second_run_reuses_unchanged_bodies(tmp_path):
+    first = [
+        _storage("p1", "<h1>One</h1><p><a href='https://a/1'>x</a></p>", "sha-1"),
+        _storage("p2", "<p>Two</p>", "sha-2"),
+        {"id": "d1", "body_repr": "dita", "body_dita_xml": "<topic><title>T</title></topic>", "content_sha256": "d"},
+    ]
+    changed = _storage("p2", "<p>Two, edited</p>", "sha-2b")
+
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        cold, cold_docs = _normalize(tmp_path, "r1", first)
+        with patch.object(html_to_md, "_convert_body", wraps=html_to_md._convert_body) as convert:
+            warm, warm_docs = _normalize(tmp_path, "r2", [first[0], changed, first[2]])
+
+    assert cold["normalize_cache"]["hits"] == 0
+    assert cold["normalize_cache"]["misses"] == EXPECTED_COUNT_3
+    assert warm["normalize_cache"]["hits"] == EXPECTED_COUNT_2
+    assert warm["normalize_cache"]["hit_ratio"] == round(2 / 3, 4)
+    assert warm["normalize_cache"]["saved_s"] >= 0
+    assert convert.call_count == 1  # only the edited page is converted again
+    assert warm_docs[0] == cold_docs[0]
+    assert warm_docs[2] == cold_docs[2]
+    assert warm_docs[1]["text_md"] == "Two, edited"
+    assert any((tmp_path / "var" / "cache" / "normalize").glob("*/*.json"))
+
+
+def test_cache_key_separates_repr_and_skips_empty_bodies(tmp_path):
+    assert normalize_cache_key("storage", "abc") != normalize_cache_key("adf", "abc")
+    assert normalize_cache_key("storage", None) is None
+    assert normalize_cache_key(None, "abc") is None
+
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        metrics, docs = _normalize(tmp_path, "r1", [_storage("p1", "", "sha-1")])
+
+    assert docs[0]["text_md"] == ""
+    assert metrics["normalize_cache"]["hits"] + metrics["normalize_cache"]["misses"] == 0
+
+
+def test_key_follows_the_body_not_content_sha256(tmp_path):
+    # Records sharing a content_sha256 (or lacking one) are still told apart by their bodies
+    records = [
+        _storage("p1", "<p>One</p>", "same"),
+        _storage("p2", "<p>Two</p>", "same"),
+        _storage("p3", "<p>One</p>", ""),
+    ]
+
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        metrics, docs = _normalize(tmp_path, "r1", records)
+
+    assert [doc["text_md"] for doc in docs] == ["One", "Two", "One"]
+    assert (metrics["normalize_cache"]["hits"], metrics["normalize_cache"]["misses"]) == (1, EXPECTED_COUNT_2)
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = NormalizeCache(tmp_path)
+    key = normalize_cache_key("storage", "abc")
+    cache.put(key, NormalizedBody("text", ["https://a"], 0.5))
+    assert cache.get(key) == NormalizedBody("text", ["https://a"], 0.5)
+
+    next(tmp_path.glob("*/*.json")).write_text('{"text_md": ', encoding="utf-8")
+
+    assert cache.get(key) is None
+    assert (cache.hits, cache.misses, cache.saved_s) == (1, 1, 0.5)
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    cache = NormalizeCache(tmp_path)
+    keys = [normalize_cache_key("adf", str(n)) for n in range(EXPECTED_COUNT_4)]
+    for age, key in enumerate(keys):
+        cache.put(key, NormalizedBody("x" * 100, [], 0.0))
+        path = cache._path(key)
+        os.utime(path, (1000 + age, 1000 + age))
+    cache.get(keys[0])  # oldest write, but most recently used
+    entry_size = cache._path(keys[1]).stat().st_size
+
+    evicted = cache.prune(max_bytes=entry_size * EXPECTED_COUNT_2)
+
+    assert evicted == EXPECTED_COUNT_2
+    assert [cache._path(key).exists() for key in keys] == [True, False, False, True]
+
+
+def test_prune_walks_the_tree_only_when_the_budget_may_be_exceeded(tmp_path):
+    cache = NormalizeCache(tmp_path)
+    cache.put(normalize_cache_key("adf", "a"), NormalizedBody("x" * 100, [], 0.0))
+    budget = cache.bytes_written * EXPECTED_COUNT_3
+
+    with patch.object(type(tmp_path), "glob", autospec=True, side_effect=type(tmp_path).glob) as walk:
+        # No recorded size yet, then well inside the budget, then over it
+        assert cache.prune(budget, added_bytes=cache.bytes_written) == 0
+        assert cache.prune(budget, added_bytes=cache.bytes_written) == 0
+        assert walk.call_count == 1
+        for n in range(EXPECTED_COUNT_3):
+            cache.put(normalize_cache_key("adf", str(n)), NormalizedBody("x" * 100, [], 0.0))
+        assert cache.prune(budget, added_bytes=cache.bytes_written) > 0
+        assert walk.call_count == EXPECTED_COUNT_2
@@ -0,0 +1,136 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for multiprocess normalize_from_ingest and normalize-all run concurrency."""
+
+import json
+import subprocess
+import threading
+
+import pytest
+from typer.testing import CliRunner
+
+from trailblazer.cli import main as cli
+from trailblazer.pipeline.steps.normalize import html_to_md
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+RECORDS = 40
+
+
+def _record(n: int) -> dict:
+    kind = n % EXPECTED_COUNT_3
+    rec = {"id": f"doc{n}", "title": f"Doc {n}", "attachments": [{"filename": f"{n}.png"}] * (n % EXPECTED_COUNT_2)}
+    if kind == 0:
+        rec |= {"body_repr": "storage", "body_storage": f"<h1>S{n}</h1><p><a href='https://x/{n}'>l</a></p>"}
+    elif kind == 1:
+        paragraph = {"type": "paragraph", "content": [{"type": "text", "text": f"adf {n}"}]}
+        rec |= {"body_repr": "adf", "body_adf": {"type": "doc", "content": [paragraph]}}
+    elif n % EXPECTED_COUNT_4:
+        rec |= {
+            "body_repr": "dita",
+            "body_dita_xml": f"<concept><title>D{n}</title><conbody><p>x</p></conbody></concept>",
+        }
+    else:
+        rec |= {"body_repr": "storage", "body_storage": ""}  # empty body
+    return rec
+
+
+@pytest.fixture
+def ingest_file(tmp_path, monkeypatch):
+    # Small chunks so several are in flight at once
+    monkeypatch.setattr(html_to_md, "NORMALIZE_CHUNK_LINES", EXPECTED_COUNT_3)
+    ingest = tmp_path / "runs" / "r1" / "ingest"
+    ingest.mkdir(parents=True)
+    path = ingest / "confluence.ndjson"
+    path.write_text("".join(json.dumps(_record(n)) + "\n\n" for n in range(RECORDS)), encoding="utf-8")
+    (ingest / "meta.jsonl").write_text(json.dumps({"page_id": "doc2", "labels": ["tagged"]}) + "\n", encoding="utf-8")
+    return path
+
+
+def _normalize(ingest_file, name, **kwargs) -> tuple[dict, str]:
+    outdir = ingest_file.parent.parent / name
+    metrics = html_to_md.normalize_from_ingest(str(outdir), input_file=str(ingest_file), **kwargs)
+    return metrics, (outdir / "normalized.ndjson").read_text(encoding="utf-8")
+
+
+def test_parallel_output_and_metrics_match_sequential(ingest_file):
+    sequential, seq_out = _normalize(ingest_file, "seq", workers=1)
+    parallel, par_out = _normalize(ingest_file, "par", workers=EXPECTED_COUNT_3)
+
+    assert par_out == seq_out
+    assert [json.loads(line)["id"] for line in par_out.splitlines()] == [f"doc{n}" for n in range(RECORDS)]
+    for key in ("pages", "empty_bodies", "attachments", "avg_chars", "storage_extract_hits"):
+        assert parallel[key] == sequential[key], key
+    assert parallel["pages"] == RECORDS
+    assert parallel["empty_bodies"] > 0
+    assert parallel["workers"] == EXPECTED_COUNT_3
+    assert json.loads(par_out.splitlines()[EXPECTED_COUNT_2])["labels"] == ["tagged"]
+
+
+def test_parallel_respects_limit(ingest_file):
+    metrics, out = _normalize(ingest_file, "lim", workers=EXPECTED_COUNT_2, limit=7)
+
+    assert metrics["pages"] == len(out.splitlines()) == 7  # noqa: PLR2004 - limit under test
+
+
+def _invoke_normalize_all(monkeypatch, args: list[str], fail: str | None = None) -> tuple[object, list[list[str]]]:
+    """Run normalize-all over three runs with subprocesses faked; ``fail`` names a run whose subprocess fails."""
+    runs = [f"run-{n}" for n in range(EXPECTED_COUNT_3)]
+    monkeypatch.setattr(cli, "_validate_workspace_only", lambda: None)
+    monkeypatch.setattr(cli, "_get_runs_needing_normalization", lambda: runs)
+
+    commands: list[list[str]] = []
+    lock = threading.Lock()
+
+    def fake_run(cmd, check, capture_output, text):
+        with lock:
+            commands.append(cmd)
+        if cmd[cmd.index("--run-id") + 1] == fail:
+            raise subprocess.CalledProcessError(1, cmd, output="", stderr="Traceback: ingest file not found\n")
+
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+    result = CliRunner().invoke(cli.app, ["normalize-all", *args])
+    assert sorted(cmd[cmd.index("--run-id") + 1] for cmd in commands) == runs
+    return result, commands
+
+
+def _workers(commands: list[list[str]]) -> set[str]:
+    return {cmd[cmd.index("--workers") + 1] for cmd in commands}
+
+
+def test_normalize_all_splits_worker_cap_across_runs(monkeypatch):
+    result, commands = _invoke_normalize_all(monkeypatch, ["--parallel-runs", "2", "--max-workers", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert _workers(commands) == {str(EXPECTED_COUNT_2)}
+    assert f"{EXPECTED_COUNT_3}/{EXPECTED_COUNT_3} successful" in result.output
+    assert "⚠️" not in result.output
+
+
+def test_normalize_all_defaults_to_one_worker_per_parallel_run(monkeypatch):
+    monkeypatch.setattr(cli.SETTINGS, "NORMALIZE_MAX_WORKERS", None)
+    result, commands = _invoke_normalize_all(monkeypatch, ["--parallel-runs", "3"])
+
+    assert result.exit_code == 0, result.output
+    assert _workers(commands) == {"1"}
+    assert "⚠️" not in result.output
+
+
+def test_normalize_all_warns_when_worker_cap_limits_parallel_runs(monkeypatch):
+    result, commands = _invoke_normalize_all(monkeypatch, ["--parallel-runs", "3", "--max-workers", "2"])
+
+    assert result.exit_code == 0, result.output
+    assert _workers(commands) == {"1"}
+    assert "Worker cap 2 allows only 2 of 3 parallel runs" in result.output
+
+
+def test_normalize_all_echoes_captured_output_of_failed_runs(monkeypatch):
+    result, _ = _invoke_normalize_all(monkeypatch, ["--parallel-runs", "2", "--max-workers", "2"], fail="run-1")
+
+    assert "❌ Failed: run-1 (exit 1)" in result.output
+    assert "Traceback: ingest file not found" in result.output
+    assert f"{EXPECTED_COUNT_2}/{EXPECTED_COUNT_3} successful" in result.output
@@ -0,0 +1,175 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for chunk artifact storage, compression and the doc_id offset index."""
+
+import gzip
+import json
+
+import pytest
+
+from trailblazer.core.chunk_store import (
+    CHUNKS_FILE,
+    CHUNKS_GZ_FILE,
+    ChunkWriter,
+    iter_chunk_lines,
+    iter_chunks,
+    iter_numbered_chunk_lines,
+    load_chunk_index,
+    read_doc_chunks,
+    resolve_chunks_file,
+)
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+
+def _doc_chunks(doc_id: str, count: int) -> list[dict]:
+    return [
+        {
+            "chunk_id": f"{doc_id}:{i:04d}",
+            "doc_id": doc_id,
+            "title": f"Title {doc_id}",
+            "url": f"https://example.com/{doc_id}",
+            "source_system": "confluence",
+            "labels": ["a", "b"],
+            "space": "DEV",
+            "media_refs": [],
+            "text_md": f"chunk {i} of {doc_id}",
+            "token_count": 4,
+            "ord": i,
+        }
+        for i in range(count)
+    ]
+
+
+def _write(chunk_dir, compress: bool) -> dict[str, list[dict]]:
+    docs = {"doc-a": _doc_chunks("doc-a", 2), "doc-b": _doc_chunks("doc-b", 3), "doc-c": _doc_chunks("doc-c", 1)}
+    with ChunkWriter(chunk_dir, compress=compress) as writer:
+        for doc_id, chunks in docs.items():
+            writer.write_doc(doc_id, chunks)
+    return docs
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip_preserves_records(tmp_path, compress):
+    docs = _write(tmp_path, compress)
+    chunks_path = resolve_chunks_file(tmp_path)
+
+    assert chunks_path.name == (CHUNKS_GZ_FILE if compress else CHUNKS_FILE)
+    expected = [chunk for chunks in docs.values() for chunk in chunks]
+    assert list(iter_chunks(chunks_path)) == expected
+
+
+def test_compressed_file_is_a_valid_gzip_stream(tmp_path):
+    _write(tmp_path, compress=True)
+
+    with gzip.open(tmp_path / CHUNKS_GZ_FILE, "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    # One header line per document plus slimmed chunk lines
+    headers = [r for r in records if "_doc" in r]
+    assert len(headers) == EXPECTED_COUNT_3
+    assert all("title" not in r for r in records if "_doc" not in r)
+
+
+def test_differing_doc_field_is_kept_on_chunk(tmp_path):
+    chunks = _doc_chunks("doc-a", 2)
+    chunks[1]["title"] = "Override"
+    with ChunkWriter(tmp_path, compress=True) as writer:
+        writer.write_doc("doc-a", chunks)
+
+    assert [c["title"] for c in iter_chunks(tmp_path / CHUNKS_GZ_FILE)] == ["Title doc-a", "Override"]
+
+
+def test_compressed_records_equal_plain_records_key_order_included(tmp_path):
+    chunks = _doc_chunks("doc-a", EXPECTED_COUNT_4)
+    # No doc field missing from a record may come back as null, and key order must survive
+    del chunks[0]["media_refs"]
+    del chunks[1]["labels"]
+    chunks[2] = {"text_md": chunks[2].pop("text_md"), **chunks[2]}
+    chunks[3]["extra"] = True
+    for compress, name in ((False, "plain"), (True, "gz")):
+        with ChunkWriter(tmp_path / name, compress=compress) as writer:
+            writer.write_doc("doc-a", chunks)
+
+    plain = [json.dumps(c) for c in iter_chunks(tmp_path / "plain" / CHUNKS_FILE)]
+    compressed = [json.dumps(c) for c in iter_chunks(tmp_path / "gz" / CHUNKS_GZ_FILE)]
+    assert compressed == plain == [json.dumps(c) for c in chunks]
+    assert "media_refs" not in next(iter_chunks(tmp_path / "gz" / CHUNKS_GZ_FILE))
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_index_seeks_to_single_document(tmp_path, compress):
+    docs = _write(tmp_path, compress)
+    chunks_path = resolve_chunks_file(tmp_path)
+    index = load_chunk_index(tmp_path)
+
+    assert list(index) == ["doc-a", "doc-b", "doc-c"]
+    assert index["doc-b"]["chunks"] == EXPECTED_COUNT_3
+    assert read_doc_chunks(chunks_path, index["doc-b"]) == docs["doc-b"]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_iter_chunk_lines_skips_documents(tmp_path, compress):
+    _write(tmp_path, compress)
+    chunks_path = resolve_chunks_file(tmp_path)
+
+    lines = list(iter_chunk_lines(chunks_path, skip_doc_ids={"doc-b"}))
+
+    assert [json.loads(line)["chunk_id"] for line in lines] == ["doc-a:0000", "doc-a:0001", "doc-c:0000"]
+    # Indexed and full reads yield the same lines, none with a line terminator
+    unindexed = [line for line in iter_chunk_lines(chunks_path) if json.loads(line)["doc_id"] != "doc-b"]
+    assert lines == unindexed
+    assert not any(line.endswith("\n") for line in lines)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_numbered_lines_keep_file_line_numbers_when_documents_are_skipped(tmp_path, compress):
+    _write(tmp_path, compress)
+    chunks_path = resolve_chunks_file(tmp_path)
+
+    numbered = list(iter_numbered_chunk_lines(chunks_path, skip_doc_ids={"doc-b"}))
+
+    assert [line_num for line_num, _ in numbered] == [1, EXPECTED_COUNT_2, 6]
+    unindexed = dict(iter_numbered_chunk_lines(chunks_path))
+    assert all(unindexed[line_num] == line for line_num, line in numbered)
+    if not compress:
+        file_lines = (tmp_path / CHUNKS_FILE).read_text(encoding="utf-8").splitlines()
+        assert all(file_lines[line_num - 1] == line for line_num, line in numbered)
+
+
+def test_index_without_chunk_counts_is_ignored(tmp_path):
+    _write(tmp_path, compress=False)
+    index_path = tmp_path / "chunks.index.ndjson"
+    entries = [json.loads(line) for line in index_path.read_text(encoding="utf-8").splitlines()]
+    index_path.write_text("".join(json.dumps({k: v for k, v in e.items() if k != "chunks"}) + "\n" for e in entries))
+
+    assert load_chunk_index(tmp_path) == {}
+    assert [n for n, _ in iter_numbered_chunk_lines(tmp_path / CHUNKS_FILE, skip_doc_ids={"doc-b"})] == list(
+        range(1, 7)
+    )
+
+
+def test_stale_index_is_ignored(tmp_path):
+    _write(tmp_path, compress=False)
+    chunks_path = tmp_path / CHUNKS_FILE
+
+    # Rewrite the chunks file without updating the index
+    with open(chunks_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"chunk_id": "doc-d:0000", "doc_id": "doc-d"}) + "\n")
+
+    assert load_chunk_index(tmp_path) == {}
+    # Without a usable index every line is yielded and filtering is left to the caller
+    assert len(list(iter_chunk_lines(chunks_path, skip_doc_ids={"doc-b"}))) == 7
+
+
+def test_switching_layout_removes_stale_file(tmp_path):
+    _write(tmp_path, compress=True)
+    _write(tmp_path, compress=False)
+
+    assert (tmp_path / CHUNKS_FILE).exists()
+    assert not (tmp_path / CHUNKS_GZ_FILE).exists()
+    assert len(load_chunk_index(tmp_path)) == EXPECTED_COUNT_3
@@ -0,0 +1,146 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for optional Parquet copies of phase artifacts and the readers that project from them."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from trailblazer.core import columnar
+from trailblazer.core.assurance import AssuranceReportGenerator
+from trailblazer.core.config import SETTINGS
+from trailblazer.obs.assurance import ChunkAssurance, EnrichAssurance
+from trailblazer.pipeline.steps.embed.preflight import compute_embeddable_docs
+from trailblazer.pipeline.steps.enrich import enricher
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+DOCS = 12
+
+
+def _doc(n: int) -> dict:
+    # Every third document is too short to pass the quality threshold
+    text = "Tiny" if n % EXPECTED_COUNT_3 == 0 else f"# Guide {n}\n\n" + "Install and configure the agent. " * 20
+    return {"id": f"doc{n}", "title": f"Doc {n}", "text_md": text, "source_system": "confluence"}
+
+
+def _enrich_run(root, run_id: str = "r1") -> None:
+    normalize = root / "var" / "runs" / run_id / "normalize"
+    normalize.mkdir(parents=True)
+    (normalize / "normalized.ndjson").write_text(
+        "".join(json.dumps(_doc(n)) + "\n" for n in range(DOCS)), encoding="utf-8"
+    )
+    enricher.enrich_from_normalized(run_id)
+
+
+def _chunks(path, doc_ids: list[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for n, doc_id in enumerate(doc_ids):
+            f.write(json.dumps({"chunk_id": f"{doc_id}:{n:04d}", "doc_id": doc_id, "token_count": 10 * (n + 1)}) + "\n")
+
+
+def test_parquet_copy_names():
+    assert columnar.parquet_copy(Path("run/enrich/enriched.jsonl")).name == "enriched.parquet"
+    assert columnar.parquet_copy(Path("run/chunk/chunks.ndjson.gz")).name == "chunks.parquet"
+    assert columnar.parquet_copy(Path("run/enrich/fingerprints.jsonl")) is None
+
+
+def test_without_pyarrow_writers_skip_and_remove_stale_copies(tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar, "pa", None)
+    monkeypatch.setattr(columnar, "pq", None)
+    artifact = tmp_path / "enriched.jsonl"
+    artifact.write_text(json.dumps({"id": "a", "quality_score": 0.1}) + "\n", encoding="utf-8")
+    stale = tmp_path / "enriched.parquet"
+    stale.write_bytes(b"stale")
+
+    assert columnar.open_columnar(artifact, columnar.ENRICHED_COLUMNS, enabled=True) is None
+    assert not stale.exists()
+    assert columnar.read_columns(artifact, ["id"]) is None
+    assert columnar.count_rows(artifact) is None
+
+
+def test_quality_readers_fall_back_to_ndjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar, "pq", None)
+    monkeypatch.chdir(tmp_path)
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        _enrich_run(tmp_path)
+        total, embeddable, skipped, stats = compute_embeddable_docs("r1", min_quality=0.5)
+
+    assert total == DOCS
+    assert skipped == [f"doc{n}" for n in range(0, DOCS, EXPECTED_COUNT_3)]
+    assert embeddable == DOCS - len(skipped)
+    assert stats["belowThresholdPct"] == len(skipped) / DOCS
+
+    chunks_file = tmp_path / "var" / "runs" / "r1" / "chunk" / "chunks.ndjson"
+    _chunks(chunks_file, ["doc1", "doc1", "doc2"])
+    assurance = ChunkAssurance("r1")
+    assurance.check_chunking_quality(chunks_file, chunks_file)
+    assert assurance.metrics["documents_chunked"] == EXPECTED_COUNT_2
+    assert assurance.metrics["orphan_chunks"] == 0
+    assert assurance.metrics["max_tokens"] == 30  # noqa: PLR2004
+
+
+def test_assurance_report_streams_records(tmp_path):
+    outdir = tmp_path / "ingest"
+    outdir.mkdir()
+    records = [
+        {"id": "1", "space_key": "A", "body_repr": "storage", "body_storage": "<p>x</p>", "attachment_count": 0},
+        {"id": "2", "space_key": "A", "body_repr": "storage", "body_storage": ""},
+        {"id": "3", "space_key": "B", "body_repr": "adf", "body_adf": {"type": "doc"}},
+    ]
+    lines = [json.dumps(record) for record in records]
+    (outdir / "confluence.ndjson").write_text("\n".join([*lines[:2], "{not json", lines[2]]) + "\n", encoding="utf-8")
+
+    generator = AssuranceReportGenerator("r1", "confluence", outdir)
+    generator._analyze_main_data()
+
+    assert generator.report_data["totals"]["pages"] == EXPECTED_COUNT_3
+    assert generator.report_data["spaces"]["A"]["zero_body_pages"] == 1
+    assert generator.report_data["spaces"]["B"]["pages"] == 1
+
+
+def test_parquet_copies_match_ndjson(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SETTINGS, "ARTIFACTS_PARQUET", True)
+    monkeypatch.setattr(columnar, "ROW_GROUP_ROWS", EXPECTED_COUNT_4)
+    with patch("trailblazer.core.paths.ROOT", tmp_path):
+        _enrich_run(tmp_path)
+        from_parquet = compute_embeddable_docs("r1", min_quality=0.5)
+        with patch.object(columnar, "pq", None):
+            from_ndjson = compute_embeddable_docs("r1", min_quality=0.5)
+
+    enrich_dir = tmp_path / "var" / "runs" / "r1" / "enrich"
+    enriched = [json.loads(line) for line in (enrich_dir / "enriched.jsonl").read_text(encoding="utf-8").splitlines()]
+    columns = columnar.read_columns(enrich_dir / "enriched.jsonl", ["id", "quality_score", "quality_flags"])
+    assert columns == {
+        "id": [doc["id"] for doc in enriched],
+        "quality_score": [doc["quality_score"] for doc in enriched],
+        "quality_flags": [doc["quality_flags"] for doc in enriched],
+    }
+    assert from_parquet == from_ndjson
+
+    normalized = tmp_path / "var" / "runs" / "r1" / "normalize" / "normalized.ndjson"
+    assurance = EnrichAssurance("r1")
+    assurance.check_enrichment_quality(normalized, enrich_dir / "enriched.jsonl", enrich_dir / "fingerprints.jsonl")
+    assert assurance.metrics["enriched_documents"] == DOCS
+    assert assurance.metrics["coverage_percent"] == 100  # noqa: PLR2004
+
+    chunks_file = tmp_path / "chunks.ndjson"
+    _chunks(chunks_file, ["doc1", "doc1", "doc2"])
+    with columnar.open_columnar(chunks_file, columnar.CHUNK_COLUMNS) as writer:
+        writer.write_lines(chunks_file.read_text(encoding="utf-8").splitlines())
+    assert columnar.count_rows(chunks_file) == EXPECTED_COUNT_3
+    projected = ChunkAssurance("r1")
+    projected.check_chunking_quality(chunks_file, chunks_file)
+    with patch.object(columnar, "pq", None):
+        scanned = ChunkAssurance("r1")
+        scanned.check_chunking_quality(chunks_file, chunks_file)
+    assert projected.metrics == scanned.metrics
@@ -0,0 +1,52 @@
+# Test constants for magic numbers
+EXPECTED_COUNT_2 = 2
+EXPECTED_COUNT_3 = 3
+EXPECTED_COUNT_4 = 4
+
+"""Tests for the order-preserving pool helpers shared by the parallel phases."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from trailblazer.core.parallel import iter_line_chunks, ordered_map, ordered_map_tagged
+
+# Mark all tests as unit tests (no database needed)
+pytestmark = pytest.mark.unit
+
+
+def _slow_square(n: int) -> int:
+    # Earlier items finish last, so completion order is the reverse of input order
+    time.sleep(0.01 * max(0, EXPECTED_COUNT_4 - n))
+    return n * n
+
+
+def test_iter_line_chunks_skips_blank_lines_and_honours_limit():
+    lines = ["a\n", "\n", "b\n", "  \n", "c\n", "d\n", "e\n"]
+
+    assert list(iter_line_chunks(lines, EXPECTED_COUNT_2)) == [["a\n", "b\n"], ["c\n", "d\n"], ["e\n"]]
+    assert list(iter_line_chunks(lines, EXPECTED_COUNT_2, limit=EXPECTED_COUNT_3)) == [["a\n", "b\n"], ["c\n"]]
+
+
+@pytest.mark.parametrize("window", [1, EXPECTED_COUNT_2, 10])
+def test_results_keep_input_order(window):
+    with ThreadPoolExecutor(max_workers=EXPECTED_COUNT_4) as pool:
+        assert list(ordered_map(pool, _slow_square, range(EXPECTED_COUNT_4), window)) == [0, 1, 4, 9]
+        tagged = ordered_map_tagged(pool, _slow_square, [("a", 1), ("b", 2), ("c", 3)], window)
+        assert list(tagged) == [("a", 1), ("b", 4), ("c", 9)]
+
+
+def test_window_bounds_items_in_flight():
+    pulled = []
+
+    def items():
+        for n in range(10):
+            pulled.append(n)
+            yield n
+
+    with ThreadPoolExecutor(max_workers=EXPECTED_COUNT_2) as pool:
+        results = ordered_map(pool, _slow_square, items(), window=EXPECTED_COUNT_3)
+        assert next(results) == 0
+        assert len(pulled) == EXPECTED_COUNT_3
+        results.close()